@@ -0,0 +1,125 @@
+"""
+Baseline Module
+
+This module stores benchmark results as JSON baselines and compares new
+results against them to detect regressions.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional
+
+BASELINE_DIR = os.path.join("benchmarks", "baselines")
+
+
+@dataclass
+class Regression:
+    """A metric that got slower than its baseline allows."""
+
+    key: str
+    statistic: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current value relative to baseline (1.25 = 25% slower)."""
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.key} {self.statistic}: {self.baseline:.3f}s -> {self.current:.3f}s "
+            f"(+{(self.ratio - 1) * 100:.1f}%)"
+        )
+
+
+def baseline_path(name: str, baseline_dir: str = BASELINE_DIR) -> str:
+    """
+    Get the baseline file path for a benchmark name.
+
+    Args:
+        name: Benchmark name (e.g., 'registration_flow_chrome')
+        baseline_dir: Directory holding baseline files
+
+    Returns:
+        Path to the JSON baseline
+    """
+    return os.path.join(baseline_dir, f"{name}.json")
+
+
+def load_baseline(path: str) -> Optional[dict]:
+    """
+    Load a stored baseline.
+
+    Args:
+        path: Baseline JSON path
+
+    Returns:
+        Baseline dictionary, or None if no baseline has been recorded yet
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_results(path: str, metrics: Dict[str, Dict[str, float]], **metadata) -> dict:
+    """
+    Write benchmark results (also used to record a new baseline).
+
+    Args:
+        path: Output JSON path
+        metrics: Mapping of metric key to summary statistics
+        **metadata: Extra fields stored alongside the metrics (browser, iterations, ...)
+
+    Returns:
+        The written document
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    document = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        **metadata,
+        "metrics": metrics,
+    }
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return document
+
+
+def find_regressions(baseline: dict, metrics: Dict[str, Dict[str, float]], threshold: float = 0.20,
+                     min_delta: float = 0.05, statistics: tuple = ("median", "p95")) -> List[Regression]:
+    """
+    Compare results against a baseline.
+
+    A metric regresses when it is both more than `threshold` (relative) and more
+    than `min_delta` seconds (absolute) slower than the baseline. The absolute floor
+    keeps millisecond-level page object calls from failing the gate on noise.
+
+    Args:
+        baseline: Baseline document (as returned by load_baseline)
+        metrics: Current metric summaries
+        threshold: Allowed relative slowdown (0.20 = 20%)
+        min_delta: Allowed absolute slowdown in seconds
+        statistics: Summary statistics to compare
+
+    Returns:
+        List of regressions (empty if within budget)
+    """
+    regressions = []
+    for key, base_stats in baseline.get("metrics", {}).items():
+        current_stats = metrics.get(key)
+        if not current_stats:
+            continue
+        for stat in statistics:
+            base_value = base_stats.get(stat, 0.0)
+            current_value = current_stats.get(stat, 0.0)
+            if (current_value > base_value * (1 + threshold)
+                    and current_value - base_value > min_delta):
+                regressions.append(Regression(key, stat, base_value, current_value))
+    return regressions
@@ -0,0 +1,172 @@
+"""
+FlowBenchmark Module
+
+This module runs the registration flow N times and records per-step and
+per-page-object timings (median/p95). Results are compared against a JSON
+baseline stored in benchmarks/baselines/ and the run fails when a metric
+regresses beyond the configured threshold.
+
+Usage:
+    python -m benchmarks.flow_benchmark --iterations 10 --stand-in
+    python -m benchmarks.flow_benchmark --iterations 10 --update-baseline
+    python -m benchmarks.flow_benchmark --base-url http://127.0.0.1:8000 --threshold 0.15
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from config.settings import Config
+from benchmarks.baseline import baseline_path, load_baseline, save_results, find_regressions
+from flows.registration_flow import FlowContext, REGISTRATION_FLOW, load_test_data, run_flow
+from stand_in.server import ensure_running
+from utils.driver_manager import DriverManager
+from utils.logger import setup_logger
+from utils.timing import TimingRecorder
+
+logger = setup_logger(__name__)
+
+
+def benchmark_config(base_url: str, browser: str, headless: bool):
+    """
+    Build a Config subclass for benchmark runs (screenshots off, custom target).
+
+    Args:
+        base_url: Site under test
+        browser: Browser name
+        headless: Run headless
+
+    Returns:
+        Config subclass
+    """
+    return type("BenchmarkConfig", (Config,), {
+        "BASE_URL": base_url,
+        "BROWSER": browser,
+        "HEADLESS": headless,
+        "ENABLE_SCREENSHOTS": False,
+    })
+
+
+def run_iteration(config, recorder: TimingRecorder, test_data_path: str) -> None:
+    """
+    Run one complete registration flow in a fresh browser session.
+
+    Args:
+        config: Config class for this run
+        recorder: Recorder collecting the timings
+        test_data_path: Path to test data JSON
+    """
+    driver_manager = DriverManager(browser=config.BROWSER, headless=config.HEADLESS,
+                                   page_load_strategy=config.PAGE_LOAD_STRATEGY)
+    driver = driver_manager.get_driver()
+    try:
+        driver.set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+        ctx = FlowContext(
+            driver=driver,
+            config=config,
+            data=load_test_data(test_data_path),
+            page_hooks=[recorder.instrument],
+        )
+        with recorder.measure("flow:registration"):
+            run_flow(ctx, REGISTRATION_FLOW, recorder)
+    finally:
+        driver_manager.quit_driver()
+
+
+def print_summary(metrics: dict) -> None:
+    """Print a fixed-width table of metric summaries."""
+    print(f"{'metric':<60} {'n':>4} {'median':>9} {'p95':>9}")
+    for key, stats in metrics.items():
+        print(f"{key:<60} {stats['count']:>4} {stats['median']:>8.3f}s {stats['p95']:>8.3f}s")
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point.
+
+    Returns:
+        Process exit code (0 = within budget, 1 = regression or failed iteration)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the registration flow against a baseline")
+    parser.add_argument("--iterations", type=int, default=5, help="Number of flow runs")
+    parser.add_argument("--base-url", default=Config.BASE_URL, help="Site under test")
+    parser.add_argument("--stand-in", action="store_true",
+                        help="Serve the local stand-in site in-process and benchmark against it (offline)")
+    parser.add_argument("--browser", default=Config.BROWSER, help="chrome, firefox, edge")
+    parser.add_argument("--headed", action="store_true", help="Run with a visible browser")
+    parser.add_argument("--test-data", default=Config.TEST_DATA_PATH, help="Test data JSON path")
+    parser.add_argument("--baseline", help="Baseline JSON (default: benchmarks/baselines/registration_flow_<browser>[_stand_in].json)")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.20, help="Allowed relative slowdown (0.20 = 20%%)")
+    parser.add_argument("--min-delta", type=float, default=0.05, help="Allowed absolute slowdown in seconds")
+    parser.add_argument("--output", help="Write this run's results to a JSON file")
+    args = parser.parse_args(argv)
+
+    stand_in_server = None
+    if args.stand_in:
+        stand_in_server = ensure_running(Config.STAND_IN_URL)
+        args.base_url = Config.STAND_IN_URL
+
+    config = benchmark_config(args.base_url, args.browser, not args.headed)
+    suffix = "_stand_in" if args.stand_in else ""
+    baseline_file = args.baseline or baseline_path(f"registration_flow_{args.browser}{suffix}")
+    recorder = TimingRecorder()
+
+    failures = 0
+    for iteration in range(1, args.iterations + 1):
+        logger.info(f"Benchmark iteration {iteration}/{args.iterations}")
+        start = time.perf_counter()
+        try:
+            run_iteration(config, recorder, args.test_data)
+        except Exception as e:
+            failures += 1
+            logger.error(f"Iteration {iteration} failed: {e}")
+        logger.info(f"Iteration {iteration} took {time.perf_counter() - start:.2f}s")
+
+    if stand_in_server:
+        stand_in_server.shutdown()
+
+    metrics = recorder.summary()
+    print_summary(metrics)
+    metadata = {
+        "flow": "registration",
+        "browser": args.browser,
+        "base_url": args.base_url,
+        "iterations": args.iterations,
+        "failures": failures,
+    }
+
+    if args.output:
+        save_results(args.output, metrics, **metadata)
+
+    if failures:
+        logger.error(f"{failures}/{args.iterations} iterations failed - results not compared")
+        return 1
+
+    if args.update_baseline:
+        save_results(baseline_file, metrics, **metadata)
+        logger.info(f"Baseline updated: {baseline_file}")
+        return 0
+
+    baseline = load_baseline(baseline_file)
+    if baseline is None:
+        logger.warning(f"No baseline at {baseline_file} - rerun with --update-baseline to record one")
+        return 0
+
+    regressions = find_regressions(baseline, metrics, args.threshold, args.min_delta)
+    if regressions:
+        logger.error(f"{len(regressions)} metric(s) regressed beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            logger.error(f"  {regression}")
+        return 1
+
+    logger.info(f"All metrics within {args.threshold:.0%} of baseline {os.path.basename(baseline_file)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+"""
+ImportBenchmark Module
+
+This module measures how long the suite takes to start: the import time of
+conftest, page objects, flows and driver helpers, and the wall time of
+`pytest --collect-only`. Each measurement runs N times in a fresh interpreter.
+Results are compared against benchmarks/baselines/import_time.json, and the
+run fails when a metric regresses beyond the threshold.
+
+It also checks that the modules in DEFERRED_MODULES (Selenium's remote
+WebDriver, webdriver_manager, PIL) stay out of collection: they are imported on
+first use only.
+
+Usage:
+    python -m benchmarks.import_benchmark --update-baseline
+    python -m benchmarks.import_benchmark --iterations 10 --threshold 0.25
+    python -m benchmarks.import_benchmark --profile tests.conftest     # slowest imports of one module
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Sequence
+
+from benchmarks.baseline import baseline_path, find_regressions, load_baseline, save_results
+from utils.logger import setup_logger
+from utils.timing import summarize
+
+logger = setup_logger(__name__)
+
+# Modules whose import time is measured (pytest is imported first: it is always loaded already)
+IMPORT_TARGETS = (
+    "tests.conftest",
+    "pages.base_page",
+    "pages.order_summary_page",
+    "flows.registration_flow",
+    "utils.driver_manager",
+    "utils.screenshot_helper",
+    "utils.logger",
+)
+
+# Heavy modules that collection must not import (loaded when a test starts a browser)
+DEFERRED_MODULES = (
+    "selenium.webdriver.remote.webdriver",
+    "selenium.webdriver.support.wait",
+    "webdriver_manager",
+    "PIL.Image",
+)
+
+_IMPORT_SCRIPT = """
+import sys, time
+import pytest
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+
+def _python(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args, "-c", code], capture_output=True, text=True, check=True)
+
+
+def time_import(module: str) -> float:
+    """Seconds to import a module in a fresh interpreter."""
+    return float(_python(_IMPORT_SCRIPT.format(module=module)).stdout.strip())
+
+
+def time_collection(paths: Sequence[str] = ("tests",)) -> float:
+    """Wall time of `pytest --collect-only -q` in a fresh interpreter."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", *paths],
+                   capture_output=True, check=True)
+    return time.perf_counter() - start
+
+
+def loaded_deferred_modules(modules: Sequence[str] = IMPORT_TARGETS) -> List[str]:
+    """
+    DEFERRED_MODULES that importing the given modules loads.
+
+    Args:
+        modules: Modules to import in a fresh interpreter
+
+    Returns:
+        Deferred modules found in sys.modules (empty when imports stay lazy)
+    """
+    code = (f"import sys\nfor name in {list(modules)!r}: __import__(name)\n"
+            f"print(' '.join(m for m in {list(DEFERRED_MODULES)!r} if m in sys.modules))")
+    return _python(code).stdout.split()
+
+
+def profile(module: str, top: int = 15) -> List[str]:
+    """
+    Slowest imports (cumulative) when importing a module, from `python -X importtime`.
+
+    Args:
+        module: Module to import
+        top: Number of lines
+
+    Returns:
+        importtime lines, slowest first
+    """
+    stderr = _python(f"import pytest\nimport {module}", "-X", "importtime").stderr
+    rows = [line for line in stderr.splitlines() if line.startswith("import time:") and "|" in line]
+    rows = [row for row in rows if row.split("|")[1].strip().isdigit()]
+    # Skip the interpreter start-up and pytest itself
+    pytest_rows = [i for i, row in enumerate(rows) if row.split("|")[2].strip() == "pytest"]
+    rows = rows[pytest_rows[-1] + 1:] if pytest_rows else rows
+    return sorted(rows, key=lambda row: -int(row.split("|")[1]))[:top]
+
+
+def run_benchmark(iterations: int, targets: Sequence[str] = IMPORT_TARGETS) -> Dict[str, Dict[str, float]]:
+    """
+    Measure every import target and the collection.
+
+    Args:
+        iterations: Fresh-interpreter runs per metric
+        targets: Modules to time
+
+    Returns:
+        Metric key ('import:<module>', 'collect:tests') -> summary statistics
+    """
+    samples: Dict[str, List[float]] = {f"import:{module}": [] for module in targets}
+    samples["collect:tests"] = []
+    for iteration in range(1, iterations + 1):
+        logger.info(f"Import benchmark iteration {iteration}/{iterations}")
+        for module in targets:
+            samples[f"import:{module}"].append(time_import(module))
+        samples["collect:tests"].append(time_collection())
+    return {key: summarize(values) for key, values in samples.items()}
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point.
+
+    Returns:
+        Process exit code (0 = within budget, 1 = regression or eagerly imported heavy modules)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark suite startup (imports, collection) against a baseline")
+    parser.add_argument("--iterations", type=int, default=5, help="Fresh-interpreter runs per metric")
+    parser.add_argument("--baseline", default=baseline_path("import_time"), help="Baseline JSON")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative slowdown (0.25 = 25%%)")
+    parser.add_argument("--min-delta", type=float, default=0.02, help="Allowed absolute slowdown in seconds")
+    parser.add_argument("--profile", metavar="MODULE", help="Only print the slowest imports of MODULE")
+    args = parser.parse_args(argv)
+
+    if args.profile:
+        for line in profile(args.profile):
+            print(line)
+        return 0
+
+    eager = loaded_deferred_modules()
+    if eager:
+        logger.error(f"Imported during collection (should be deferred): {', '.join(eager)}")
+
+    metrics = run_benchmark(args.iterations)
+    print(f"{'metric':<40} {'n':>4} {'median':>9} {'p95':>9}")
+    for key, stats in metrics.items():
+        print(f"{key:<40} {stats['count']:>4} {stats['median'] * 1000:>7.1f}ms {stats['p95'] * 1000:>7.1f}ms")
+
+    if args.update_baseline:
+        save_results(args.baseline, metrics, python=sys.version.split()[0], iterations=args.iterations)
+        logger.info(f"Baseline updated: {args.baseline}")
+        return 1 if eager else 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        logger.warning(f"No baseline at {args.baseline} - rerun with --update-baseline to record one")
+        return 1 if eager else 0
+
+    regressions = find_regressions(baseline, metrics, args.threshold, args.min_delta)
+    for regression in regressions:
+        logger.error(f"  {regression}")
+    if not regressions:
+        logger.info(f"All metrics within {args.threshold:.0%} of baseline {os.path.basename(args.baseline)}")
+    return 1 if regressions or eager else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,8 +13,13 @@ import os
 class Config:
     """Configuration class for test framework settings."""
 
+    # Local stand-in site (python -m stand_in) replaces the live site when enabled.
+    # "dutch.com.localhost" resolves to loopback in Chrome/Firefox and keeps URL checks valid.
+    USE_STAND_IN = os.getenv("USE_STAND_IN", "false").lower() == "true"
+    STAND_IN_URL = os.getenv("STAND_IN_URL", "http://dutch.com.localhost:8000")
+
     # Base configuration
-    BASE_URL = "https://dutch.com"
+    BASE_URL = STAND_IN_URL if USE_STAND_IN else os.getenv("BASE_URL", "https://dutch.com")
 
     # Browser settings
     BROWSER = os.getenv("BROWSER", "chrome")  # chrome, firefox, edge
@@ -24,16 +29,80 @@ class Config:
     EXPLICIT_WAIT = 15           # Standard wait for interactions (click, type, select)
     PAGE_LOAD_TIMEOUT = 30       # Long operations (page loads, network calls)
 
+    # Page loads: "normal" (driver.get waits for 'load', incl. third-party scripts), "eager"
+    # (DOMContentLoaded) or "none"; pages then wait for their ready_locators (utils/readiness.py)
+    PAGE_LOAD_STRATEGY = os.getenv("PAGE_LOAD_STRATEGY", "eager").lower()
+    NETWORK_QUIET_MS = int(os.getenv("NETWORK_QUIET_MS", "0"))  # > 0: ready only after this long without requests
+    NETWORK_QUIET_IGNORE = [part for part in os.getenv(
+        "NETWORK_QUIET_IGNORE",
+        "google-analytics.com,googletagmanager.com,doubleclick.net,facebook.net,hotjar.com,/assets/tracker.js"
+    ).split(",") if part]
+
     # Paths
     SCREENSHOT_PATH = "screenshots"
     REPORT_PATH = "reports"
     TEST_DATA_PATH = "config/test_data.json"
 
+    # Record/replay proxy: "off", "record" (capture real traffic) or "replay" (serve archive, no network)
+    REPLAY_MODE = os.getenv("REPLAY_MODE", "off").lower()
+    REPLAY_ARCHIVE = os.getenv("REPLAY_ARCHIVE", "recordings/registration_flow.zip")
+
     # Screenshot settings
     ENABLE_SCREENSHOTS = os.getenv("ENABLE_SCREENSHOTS", "true").lower() == "true"
 
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
-    # Test execution
-    PARALLEL_WORKERS = int(os.getenv("PARALLEL_WORKERS", "1"))
+    # Combinatorial scenarios (tests/e2e/test_registration_scenarios.py): 2 = pairwise, 3 = 3-wise
+    SCENARIO_STRENGTH = int(os.getenv("SCENARIO_STRENGTH", "2"))
+
+    # Flow prefix sharing (plugins/flow_prefix.py): one browser per worker walks all declared flow paths
+    FLOW_PREFIX_SHARING = os.getenv("FLOW_PREFIX_SHARING", "true").lower() == "true"
+    FLOW_GROUP_DEPTH = int(os.getenv("FLOW_GROUP_DEPTH", "0"))  # 0 = split groups at the first branch
+
+    # Step-level retries (flows/step_runner.py): extra attempts per flow step after a transient failure
+    STEP_RETRIES = int(os.getenv("STEP_RETRIES", "1"))
+
+    # Test impact analysis (plugins/impact.py): "off", "record" (write the map) or "select" (run affected tests)
+    IMPACT_MODE = os.getenv("IMPACT_MODE", "off").lower()
+    IMPACT_BASE = os.getenv("IMPACT_BASE", "origin/main")
+    IMPACT_MAP = os.getenv("IMPACT_MAP", ".impact/impact_map.json")
+    IMPACT_MAX_AGE_DAYS = float(os.getenv("IMPACT_MAX_AGE_DAYS", "14"))
+
+    # Test history (plugins/history.py): results database, flake detection and lanes.
+    # On by default; only browser tests are recorded and reordered, and --collect-only never opens the database
+    HISTORY_ENABLED = os.getenv("HISTORY_ENABLED", "true").lower() == "true"
+    HISTORY_DB = os.getenv("HISTORY_DB", ".history/test_history.sqlite3")
+    HISTORY_WINDOW = int(os.getenv("HISTORY_WINDOW", "50"))       # Recent runs per test considered
+    HISTORY_MIN_RUNS = int(os.getenv("HISTORY_MIN_RUNS", "5"))    # Runs before a test can be quarantined
+    FLAKY_THRESHOLD = float(os.getenv("FLAKY_THRESHOLD", "0.2"))  # Flip rate that quarantines a test
+    TEST_LANE = os.getenv("TEST_LANE", "all").lower()             # all, main (no flaky tests), quarantine
+
+    # xdist scheduling (plugins/lpt_scheduler.py): "lpt" (duration history, longest first) or "default"
+    XDIST_SCHEDULER = os.getenv("XDIST_SCHEDULER", "lpt").lower()
+
+    # Settle detection (utils/settle.py) after scrolls/animations instead of fixed sleeps
+    SETTLE_FRAMES = int(os.getenv("SETTLE_FRAMES", "2"))        # Consecutive unchanged animation frames
+    SETTLE_TIMEOUT = float(os.getenv("SETTLE_TIMEOUT", "2.0"))  # Seconds before giving up (never fails)
+
+    # Web performance samples per flow page (utils/web_perf.py): "off", "warn" or "fail" on budget violations
+    WEB_PERF = os.getenv("WEB_PERF", "off").lower()
+    WEB_PERF_BUDGETS = os.getenv("WEB_PERF_BUDGETS", "config/perf_budgets.json")
+
+    # Browser process tree monitor (utils/resource_monitor.py, Linux /proc): "off" or "on"
+    RESOURCE_MONITOR = os.getenv("RESOURCE_MONITOR", "off").lower()
+    RESOURCE_SAMPLE_INTERVAL = float(os.getenv("RESOURCE_SAMPLE_INTERVAL", "0.5"))  # Seconds between samples
+    RESOURCE_GROWTH_MB = float(os.getenv("RESOURCE_GROWTH_MB", "100"))  # Session RSS rise flagged as growth
+
+    # Locator lint (utils/locator_lint.py) before any browser starts: "off", "warn" or "fail"
+    LOCATOR_LINT = os.getenv("LOCATOR_LINT", "warn").lower()
+    LOCATOR_SNAPSHOTS = os.getenv("LOCATOR_SNAPSHOTS", "snapshots")
+
+    # Test execution: xdist workers as a number, or "auto" - sized from host capacity (CPUs, memory,
+    # cgroup limits) and the measured browser footprint (utils/worker_sizing.py, also used for -n auto)
+    PARALLEL_WORKERS = os.getenv("PARALLEL_WORKERS", "1").lower()
+    WORKER_MAX = int(os.getenv("WORKER_MAX", "16"))                                # Upper bound for auto
+    WORKER_MEMORY_RESERVE_MB = int(os.getenv("WORKER_MEMORY_RESERVE_MB", "1024"))  # Kept free for the OS
+    WORKER_CALIBRATION = os.getenv("WORKER_CALIBRATION", "off").lower()            # Measure without history
+    # Share of memory in use at which the LPT scheduler pauses a worker mid-run (0 = never)
+    WORKER_PRESSURE_THRESHOLD = float(os.getenv("WORKER_PRESSURE_THRESHOLD", "0.9"))
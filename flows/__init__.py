@@ -0,0 +1 @@
+"""Flows package initialization."""
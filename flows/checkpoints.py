@@ -0,0 +1,277 @@
+"""
+Checkpoints Module
+
+This module snapshots browser state (cookies, localStorage, sessionStorage and
+URL) after a named flow step and restores it later, so tests of late pages
+(CheckoutPage, OrderSummaryPage, PaymentComponent) can deep-link straight to
+their step instead of replaying the whole registration flow.
+
+Checkpoints are cached per test run (in memory and as JSON files in the run
+folder, shared by pytest-xdist workers). A restore is validated - same URL
+path after loading and the target step's readiness check - and falls back to
+a full replay through the UI when it fails.
+
+Each checkpoint also keeps the page object symbols the impact plugin recorded
+while it was produced; restoring it adds them to the restoring test, so the
+impact map still links the test to the steps it skipped.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from flows.registration_flow import FlowContext, FlowStep, REGISTRATION_FLOW, run_flow
+from plugins.impact import inherit_symbols, traced_symbols
+from utils.logger import setup_logger
+from utils.readiness import time_origin, wait_until_ready
+
+logger = setup_logger(__name__)
+
+# Web storage of the current origin as two JSON objects
+CAPTURE_STORAGE_SCRIPT = """
+function dump(storage) {
+    const items = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+}
+return [dump(window.localStorage), dump(window.sessionStorage)];
+"""
+
+RESTORE_STORAGE_SCRIPT = """
+const [local, session] = arguments;
+window.localStorage.clear();
+window.sessionStorage.clear();
+for (const [key, value] of Object.entries(local)) { window.localStorage.setItem(key, value); }
+for (const [key, value] of Object.entries(session)) { window.sessionStorage.setItem(key, value); }
+"""
+
+# Cookie fields accepted by WebDriver's add_cookie
+COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+@dataclass
+class Checkpoint:
+    """Browser state captured after a flow step."""
+
+    step: str
+    url: str
+    cookies: List[dict]
+    local_storage: Dict[str, str]
+    session_storage: Dict[str, str]
+    data: dict = field(default_factory=dict)
+    created: float = field(default_factory=time.time)
+    symbols: List[str] = field(default_factory=list)
+
+
+def capture_checkpoint(ctx: FlowContext, step: str) -> Checkpoint:
+    """
+    Capture the browser state of a flow context.
+
+    Args:
+        ctx: Flow context (its test data is stored with the checkpoint)
+        step: Name of the step that just completed
+
+    Returns:
+        Checkpoint
+    """
+    local_storage, session_storage = ctx.driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+    return Checkpoint(
+        step=step,
+        url=ctx.driver.current_url,
+        cookies=ctx.driver.get_cookies(),
+        local_storage=local_storage,
+        session_storage=session_storage,
+        data=copy.deepcopy(ctx.data),
+        symbols=traced_symbols(),
+    )
+
+
+def _load(ctx, url: str) -> None:
+    # With PAGE_LOAD_STRATEGY=none driver.get returns before the new document exists
+    since = time_origin(ctx.driver) if ctx.config.PAGE_LOAD_STRATEGY == "none" else None
+    ctx.driver.get(url)
+    if since is not None:
+        wait_until_ready(ctx.driver, {}, ctx.config.PAGE_LOAD_TIMEOUT, since=since)
+
+
+def restore_checkpoint(ctx: FlowContext, checkpoint: Checkpoint, next_step: Optional[FlowStep] = None,
+                       landing_path: str = "/robots.txt") -> bool:
+    """
+    Restore a checkpoint into the context's browser and validate it.
+
+    Cookies and storage can only be set for the current origin, so the browser
+    first opens a cheap page on the checkpoint's origin, then loads the
+    checkpoint URL.
+
+    Args:
+        ctx: Flow context
+        checkpoint: Checkpoint to restore
+        next_step: Step that will run next (its ready check validates the page)
+        landing_path: Lightweight path on the origin used to set cookies/storage
+
+    Returns:
+        True if the browser is at the checkpoint and the page is ready (the
+        running test then inherits the checkpoint's impact symbols), False otherwise
+    """
+    driver = ctx.driver
+    target = urlsplit(checkpoint.url)
+    try:
+        _load(ctx, f"{target.scheme}://{target.netloc}{landing_path}")
+        driver.delete_all_cookies()
+        host = target.hostname or ""
+        for cookie in checkpoint.cookies:
+            domain = cookie.get("domain", host).lstrip(".")
+            if host != domain and not host.endswith(f".{domain}"):
+                logger.debug(f"Checkpoint cookie '{cookie.get('name')}' for {domain} skipped (not {host})")
+                continue
+            driver.add_cookie({k: v for k, v in cookie.items() if k in COOKIE_FIELDS})
+        driver.execute_script(RESTORE_STORAGE_SCRIPT, checkpoint.local_storage, checkpoint.session_storage)
+        _load(ctx, checkpoint.url)
+    except WebDriverException as e:
+        logger.warning(f"Checkpoint '{checkpoint.step}' restore failed: {e.msg}")
+        return False
+
+    current = urlsplit(driver.current_url)
+    if current.path.rstrip("/") != target.path.rstrip("/"):
+        logger.warning(f"Checkpoint '{checkpoint.step}' invalid: redirected to {driver.current_url}")
+        return False
+    if next_step and next_step.ready and not next_step.ready(ctx):
+        logger.warning(f"Checkpoint '{checkpoint.step}' invalid: '{next_step.name}' page not ready")
+        return False
+    inherit_symbols(checkpoint.symbols)
+    return True
+
+
+class CheckpointStore:
+    """Per-run checkpoint cache (memory + JSON files shared by xdist workers)."""
+
+    def __init__(self, directory: str, flow: str = "registration", max_age: Optional[float] = None):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Folder for checkpoint files (normally inside the run folder)
+            flow: Flow name used in file names
+            max_age: Seconds after which a checkpoint is ignored (None = valid for the whole run)
+        """
+        self.directory = directory
+        self.flow = flow
+        self.max_age = max_age
+        self._checkpoints: Dict[str, Checkpoint] = {}
+        self._lock = threading.Lock()
+
+    def path(self, step: str) -> str:
+        """File path of a step's checkpoint."""
+        return os.path.join(self.directory, f"{self.flow}-{step}.json")
+
+    def get(self, step: str) -> Optional[Checkpoint]:
+        """
+        Get the checkpoint captured after a step (memory first, then disk).
+
+        Args:
+            step: Step name
+
+        Returns:
+            Checkpoint or None if missing or expired
+        """
+        with self._lock:
+            checkpoint = self._checkpoints.get(step)
+            if checkpoint is None and os.path.exists(self.path(step)):
+                with open(self.path(step), "r") as f:
+                    checkpoint = Checkpoint(**json.load(f))
+                self._checkpoints[step] = checkpoint
+        if checkpoint and self.max_age is not None and time.time() - checkpoint.created > self.max_age:
+            return None
+        return checkpoint
+
+    def put(self, checkpoint: Checkpoint) -> None:
+        """Store a checkpoint (file written atomically)."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(checkpoint.step)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(asdict(checkpoint), f, indent=2)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        with self._lock:
+            self._checkpoints[checkpoint.step] = checkpoint
+
+    def invalidate(self, step: str) -> None:
+        """Drop a checkpoint that failed to restore."""
+        with self._lock:
+            self._checkpoints.pop(step, None)
+            if os.path.exists(self.path(step)):
+                os.remove(self.path(step))
+
+    def capture(self, ctx: FlowContext, step: str) -> None:
+        """
+        Capture a checkpoint after a step unless one is already cached.
+
+        Called by run_flow after every step when a store is passed to it.
+        """
+        if self.get(step) is None:
+            try:
+                self.put(capture_checkpoint(ctx, step))
+            except WebDriverException as e:
+                logger.warning(f"Checkpoint capture after '{step}' failed: {e.msg}")
+
+
+def advance_to(ctx: FlowContext, step: str, store: CheckpointStore,
+               steps: Optional[List[FlowStep]] = None, recorder=None) -> bool:
+    """
+    Bring the browser to the start of a step.
+
+    Restores the checkpoint of the preceding step when available and valid;
+    otherwise replays the preceding steps through the UI (capturing checkpoints
+    for later tests).
+
+    Args:
+        ctx: Flow context (its data is replaced by the checkpoint's data on restore)
+        step: Name of the step to advance to (not run)
+        store: Checkpoint store
+        steps: Flow (defaults to REGISTRATION_FLOW)
+        recorder: Optional TimingRecorder for replayed steps
+
+    Returns:
+        True if restored from a checkpoint, False if the flow was replayed
+
+    Raises:
+        KeyError: If the step is not part of the flow
+    """
+    steps = steps or REGISTRATION_FLOW
+    names = [s.name for s in steps]
+    if step not in names:
+        raise KeyError(f"Unknown flow step: {step}")
+    index = names.index(step)
+    if index == 0:
+        return False
+
+    previous = steps[index - 1].name
+    checkpoint = store.get(previous)
+    if checkpoint is not None:
+        if restore_checkpoint(ctx, checkpoint, steps[index]):
+            ctx.data = copy.deepcopy(checkpoint.data)
+            logger.info(f"Restored checkpoint '{previous}' - starting at '{step}'")
+            return True
+        store.invalidate(previous)
+        ctx.driver.delete_all_cookies()
+        logger.warning(f"Falling back to full replay up to '{step}'")
+
+    run_flow(ctx, steps[:index], recorder, checkpoints=store)
+    return False
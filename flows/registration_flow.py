@@ -0,0 +1,263 @@
+"""
+RegistrationFlow Module
+
+This module describes the Dutch.com registration flow (home page → payment form)
+as an ordered list of named steps built on top of the page objects.
+
+The end-to-end test runs these steps through StepRunner (flows/step_runner.py);
+tooling that needs to run the same journey repeatedly (benchmarks, runners)
+uses the same step definitions.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from pages.home_page import HomePage
+from pages.pet_info_page import PetInfoPage
+from pages.issues_page import IssuesPage
+from pages.registration_page import RegistrationPage
+from pages.checkout_page import CheckoutPage
+from pages.order_summary_page import OrderSummaryPage
+from pages.components.need_info_component import NeedInfoComponent
+from pages.components.we_can_help_component import WeCanHelpComponent
+from utils.enums import PetType, PetName, USState
+from utils.logger import setup_logger
+from utils.run_context import unique_stamp
+
+logger = setup_logger(__name__)
+
+
+def load_test_data(path: str = os.path.join("config", "test_data.json"), unique_email: bool = True) -> dict:
+    """
+    Load test data from JSON file, optionally stamping a unique email alias.
+
+    Args:
+        path: Path to the test data JSON file
+        unique_email: Insert a unique timestamp alias (see unique_stamp) into the first user's email
+
+    Returns:
+        Test data dictionary
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+
+    if unique_email and data.get('test_users'):
+        timestamp = unique_stamp()
+        email_parts = data['test_users'][0]['email'].split('@')
+        data['test_users'][0]['email'] = f"{email_parts[0]}+{timestamp}@{email_parts[1]}"
+
+    return data
+
+
+@dataclass
+class FlowContext:
+    """
+    Everything a flow step needs: driver, config, test data and page objects.
+
+    Page objects are created on first use and cached, so every step of one run
+    shares the same instances (and any instrumentation applied to them).
+    """
+
+    driver: object
+    config: object
+    data: dict
+    screenshot_helper: object = None
+    page_hooks: List[Callable] = field(default_factory=list)
+    _pages: Dict[type, object] = field(default_factory=dict, repr=False)
+
+    def page(self, page_class):
+        """
+        Get (or create) the page object instance for a page class.
+
+        Args:
+            page_class: BasePage subclass
+
+        Returns:
+            Page object bound to this context's driver
+        """
+        if page_class not in self._pages:
+            page = page_class(self.driver, self.screenshot_helper, self.config)
+            for hook in self.page_hooks:
+                hook(page)
+            self._pages[page_class] = page
+        return self._pages[page_class]
+
+
+@dataclass(frozen=True)
+class FlowStep:
+    """
+    A single named step of a flow.
+
+    ready (optional) checks that the browser is on the page the step starts
+    from; checkpoint restores use it to validate a deep-linked state.
+    retries (optional) overrides the StepRunner retry budget; 0 marks steps
+    that must not be repeated.
+    """
+
+    name: str
+    description: str
+    action: Callable[[FlowContext], None]
+    ready: Optional[Callable[[FlowContext], bool]] = None
+    retries: Optional[int] = None
+
+
+# ==================== STEP ACTIONS ====================
+
+def _navigate_home(ctx: FlowContext) -> None:
+    home_page = ctx.page(HomePage)
+    home_page.navigate_to_home(ctx.config.BASE_URL)
+    assert home_page.verify_home_page_loaded(), "Home page did not load"
+
+
+def _click_cta(ctx: FlowContext) -> None:
+    ctx.page(HomePage).click_primary_cta()
+
+
+def _fill_pet_info(ctx: FlowContext) -> None:
+    pet_info_page = ctx.page(PetInfoPage)
+    pet_data = ctx.data['pet_info']
+    assert pet_info_page.verify_pet_info_page_loaded(), "Pet info page did not load"
+    state = USState[pet_data['state']]
+    pet_info_page.fill_pet_info_form(
+        PetType[pet_data['pet_type'].upper()],
+        PetName[pet_data['pet_name']].value,
+        state
+    )
+    pet_info_page.click_continue()
+
+    # Washington requires vet info first (NeedInfoComponent modal)
+    if state == USState.WA:
+        ctx.page(NeedInfoComponent).handle_if_present(IssuesPage.issues_page_continue_button)
+
+
+def _select_issues(ctx: FlowContext) -> None:
+    issues_page = ctx.page(IssuesPage)
+    assert issues_page.verify_issues_page_loaded(), "Issues page did not load"
+    issues_page.select_multiple_issues(ctx.data['issues'])
+    issues_page.click_continue()
+
+
+def _handle_modal(ctx: FlowContext) -> None:
+    ctx.page(WeCanHelpComponent).handle_modal_if_present(RegistrationPage.registration_page_register_button)
+    ctx.page(RegistrationPage).wait_for_page_load()
+
+
+def _register(ctx: FlowContext) -> None:
+    registration_page = ctx.page(RegistrationPage)
+    user_data = ctx.data['test_users'][0]
+    registration_page.fill_registration_form(user_data['email'], user_data['password'])
+    registration_page.submit_registration()
+
+
+def _select_plan(ctx: FlowContext) -> None:
+    checkout_page = ctx.page(CheckoutPage)
+    checkout_page.wait_for_page_load()
+    checkout_page.select_1year_plan()
+    checkout_page.click_continue()
+
+
+def _select_2year_plan(ctx: FlowContext) -> None:
+    checkout_page = ctx.page(CheckoutPage)
+    checkout_page.wait_for_page_load()
+    checkout_page.select_2year_plan()
+    checkout_page.click_continue()
+
+
+def _fill_payment(ctx: FlowContext) -> None:
+    order_summary_page = ctx.page(OrderSummaryPage)
+    assert order_summary_page.verify_order_summary_page_loaded(), "Order summary page did not load"
+    order_summary_page.payment.enter_phone_number(ctx.data['contact_info']['phone'])
+    order_summary_page.payment.select_card_payment()
+    order_summary_page.payment.accept_terms()
+
+
+# ==================== STEP READINESS CHECKS ====================
+
+def _home_ready(ctx: FlowContext) -> bool:
+    return ctx.page(HomePage).wait_for_page_load()
+
+
+def _pet_info_ready(ctx: FlowContext) -> bool:
+    return ctx.page(PetInfoPage).verify_pet_info_page_loaded()
+
+
+def _issues_ready(ctx: FlowContext) -> bool:
+    return ctx.page(IssuesPage).verify_issues_page_loaded()
+
+
+def _registration_ready(ctx: FlowContext) -> bool:
+    return ctx.page(RegistrationPage).wait_for_page_load()
+
+
+def _plan_ready(ctx: FlowContext) -> bool:
+    return ctx.page(CheckoutPage).wait_for_page_load()
+
+
+def _payment_ready(ctx: FlowContext) -> bool:
+    return ctx.page(OrderSummaryPage).verify_order_summary_page_loaded()
+
+
+# Mirrors test_complete_registration_to_checkout (stops before order submission)
+REGISTRATION_FLOW: List[FlowStep] = [
+    FlowStep("home", "Navigate to home page", _navigate_home),
+    FlowStep("cta", "Click CTA to start flow", _click_cta, _home_ready),
+    FlowStep("pet_info", "Fill pet information form", _fill_pet_info, _pet_info_ready),
+    FlowStep("issues", "Select health issues", _select_issues, _issues_ready),
+    FlowStep("modal", "Handle 'We Can Help' modal", _handle_modal),
+    # Not retried: a second submit would hit the account created by the first
+    FlowStep("registration", "Fill registration form", _register, _registration_ready, retries=0),
+    FlowStep("plan", "Select membership plan", _select_plan, _plan_ready),
+    FlowStep("payment", "Fill checkout/payment form", _fill_payment, _payment_ready),
+]
+
+# Alternative branches of the flow (used in declared flow paths, e.g. pytest.mark.flow_path)
+ALTERNATE_STEPS: List[FlowStep] = [
+    FlowStep("plan_2year", "Select 2-year membership plan", _select_2year_plan, _plan_ready),
+]
+
+
+def get_step(name: str, steps: Optional[List[FlowStep]] = None) -> FlowStep:
+    """
+    Look up a step by name.
+
+    Args:
+        name: Step name (e.g., 'pet_info')
+        steps: Flow to search (defaults to REGISTRATION_FLOW and ALTERNATE_STEPS)
+
+    Returns:
+        Matching FlowStep
+
+    Raises:
+        KeyError: If no step has that name
+    """
+    for step in steps or REGISTRATION_FLOW + ALTERNATE_STEPS:
+        if step.name == name:
+            return step
+    raise KeyError(f"Unknown flow step: {name}")
+
+
+def run_flow(ctx: FlowContext, steps: Optional[List[FlowStep]] = None, recorder=None,
+             checkpoints=None) -> None:
+    """
+    Run flow steps in order.
+
+    Args:
+        ctx: Flow context
+        steps: Steps to run (defaults to REGISTRATION_FLOW)
+        recorder: Optional TimingRecorder; each step is timed as 'step:<name>'
+        checkpoints: Optional CheckpointStore; browser state is captured after each step
+    """
+    for step in steps or REGISTRATION_FLOW:
+        logger.info(f"Flow step '{step.name}': {step.description}")
+        if recorder:
+            with recorder.step(step.name):
+                step.action(ctx)
+        else:
+            step.action(ctx)
+        if checkpoints is not None:
+            checkpoints.capture(ctx, step.name)
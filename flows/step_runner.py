@@ -0,0 +1,166 @@
+"""
+StepRunner Module
+
+This module runs flow steps as retryable units. Before a step with a retry
+budget runs, the browser state is captured (see flows/checkpoints.py); when
+the step fails with an assertion or WebDriver error, that state is restored
+and only the failed step is tried again. A transient failure late in the flow
+(e.g. the Stripe iframe loading late on the payment step) then costs one step
+instead of the whole test.
+
+Every attempt is recorded so retries stay visible in the HTML report and
+results.json.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import copy
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from flows.checkpoints import capture_checkpoint, restore_checkpoint
+from flows.registration_flow import FlowContext, FlowStep, REGISTRATION_FLOW
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Failures worth retrying (anything else is a bug in the test and fails immediately)
+RETRYABLE_ERRORS = (AssertionError, WebDriverException)
+
+
+@dataclass
+class StepAttempt:
+    """One attempt of a flow step."""
+
+    step: str
+    attempt: int
+    passed: bool
+    duration: float
+    error: Optional[str] = None
+
+
+class StepRunner:
+    """
+    Run flow steps with per-step retry budgets.
+
+    Example:
+        runner = StepRunner(ctx, retries=1)
+        runner.run()                       # REGISTRATION_FLOW
+        runner.retried_steps()             # e.g. ['payment']
+    """
+
+    def __init__(self, ctx: FlowContext, retries: int = 1, recorder=None, perf=None, monitor=None):
+        """
+        Initialize the runner.
+
+        Args:
+            ctx: Flow context
+            retries: Default extra attempts per step (FlowStep.retries overrides it)
+            recorder: Optional TimingRecorder; each attempt is timed as 'step:<name>'
+            perf: Optional WebPerfCollector; the page is sampled after each passed step
+            monitor: Optional ResourceMonitor; browser resources are accounted per step
+        """
+        self.ctx = ctx
+        self.retries = retries
+        self.recorder = recorder
+        self.perf = perf
+        self.monitor = monitor
+        self.attempts: List[StepAttempt] = []
+
+    def budget(self, step: FlowStep) -> int:
+        """Extra attempts allowed for a step."""
+        return self.retries if step.retries is None else step.retries
+
+    def _capture_before(self, step: FlowStep, previous: Optional[FlowStep]):
+        # Before the first step there is no page state worth restoring
+        if previous is None or self.budget(step) <= 0:
+            return None
+        try:
+            return capture_checkpoint(self.ctx, previous.name)
+        except WebDriverException as e:
+            logger.warning(f"State before '{step.name}' not captured, retries disabled: {e.msg}")
+            return None
+
+    def _attempt(self, step: FlowStep) -> None:
+        if self.monitor:
+            self.monitor.mark(step.name)
+        if self.recorder:
+            with self.recorder.step(step.name):
+                step.action(self.ctx)
+        else:
+            step.action(self.ctx)
+
+    def run_step(self, step: FlowStep, previous: Optional[FlowStep] = None) -> None:
+        """
+        Run one step, retrying it from the state captured before it.
+
+        Args:
+            step: Step to run
+            previous: Step that ran before it (None for the first step)
+
+        Raises:
+            AssertionError, WebDriverException: When the last attempt fails or
+                the state before the step cannot be restored
+        """
+        before = self._capture_before(step, previous)
+        budget = self.budget(step) if before is not None or previous is None else 0
+
+        for attempt in range(1, budget + 2):
+            logger.info(f"Flow step '{step.name}': {step.description}"
+                        f"{f' (retry {attempt - 1}/{budget})' if attempt > 1 else ''}")
+            start = time.perf_counter()
+            try:
+                self._attempt(step)
+            except RETRYABLE_ERRORS as e:
+                message = str(getattr(e, 'msg', None) or e).strip()
+                error = f"{type(e).__name__}: {message.splitlines()[0] if message else ''}"
+                self.attempts.append(StepAttempt(step.name, attempt, False, time.perf_counter() - start, error))
+                if attempt > budget:
+                    raise
+                logger.warning(f"Flow step '{step.name}' failed ({error}), retrying")
+                if self.ctx.screenshot_helper:
+                    self.ctx.screenshot_helper.capture(f"retry_{step.name}_{attempt}", subfolder="retries")
+                if before is not None:
+                    if not restore_checkpoint(self.ctx, before, step):
+                        logger.error(f"State before '{step.name}' could not be restored")
+                        raise
+                    self.ctx.data = copy.deepcopy(before.data)
+                continue
+            self.attempts.append(StepAttempt(step.name, attempt, True, time.perf_counter() - start))
+            if self.perf:
+                self.perf.sample(self.ctx.driver, step.name)
+            return
+
+    def run(self, steps: Optional[List[FlowStep]] = None) -> None:
+        """
+        Run steps in order (defaults to REGISTRATION_FLOW).
+
+        Args:
+            steps: Steps to run
+        """
+        previous = None
+        for step in steps or REGISTRATION_FLOW:
+            self.run_step(step, previous)
+            previous = step
+        if self.monitor:
+            self.monitor.mark(None)
+
+    def retried_steps(self) -> List[str]:
+        """Names of steps that needed more than one attempt."""
+        return sorted({attempt.step for attempt in self.attempts if attempt.attempt > 1})
+
+    def summary(self) -> List[dict]:
+        """
+        Failed attempts for reports.
+
+        Returns:
+            List of {'step', 'attempt', 'error', 'duration'} for every failed attempt
+        """
+        return [
+            {"step": a.step, "attempt": a.attempt, "error": a.error, "duration": round(a.duration, 3)}
+            for a in self.attempts if not a.passed
+        ]
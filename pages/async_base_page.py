@@ -0,0 +1,372 @@
+"""
+AsyncBasePage Module
+
+This module contains the AsyncBasePage class, the asyncio counterpart of BasePage.
+
+It offers the same generic utility methods (click, type, wait, select, ...) as
+coroutines on top of AsyncWebDriver, so one event loop can drive many sessions
+for synthetic-load and monitoring workloads. Async page objects reuse the
+locators of the synchronous page objects.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional, Tuple
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+
+from utils.async_webdriver import AsyncWebDriver, AsyncWebElement, xpath_literal
+
+# Exceptions that mean "not there yet" while polling
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+class AsyncBasePage:
+    """
+    AsyncBasePage class containing generic async utility methods.
+
+    Mirrors BasePage method names and semantics; waits poll with asyncio.sleep
+    so waiting sessions never block each other.
+    """
+
+    POLL_INTERVAL = 0.25
+
+    def __init__(self, driver: AsyncWebDriver, config=None):
+        """
+        Initialize AsyncBasePage with an AsyncWebDriver session.
+
+        Args:
+            driver: AsyncWebDriver session
+            config: Optional config object for timeouts
+        """
+        self.driver = driver
+        self.config = config
+        self.explicit_wait = config.EXPLICIT_WAIT if config else 15
+
+    async def _wait_until(self, condition: Callable[[], Awaitable], timeout: float, message: str):
+        """
+        Poll an async condition until it returns a truthy value.
+
+        Args:
+            condition: Coroutine function returning a value (falsy = keep waiting)
+            timeout: Maximum wait time in seconds
+            message: TimeoutException message
+
+        Returns:
+            The condition's truthy value
+
+        Raises:
+            TimeoutException: If the condition is not met within timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                value = await condition()
+                if value:
+                    return value
+            except IGNORED_EXCEPTIONS:
+                pass
+            if time.monotonic() >= deadline:
+                raise TimeoutException(message)
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+    # ==================== ELEMENT CONDITIONS ====================
+
+    async def _present(self, locator: Tuple) -> AsyncWebElement:
+        return await self.driver.find_element(locator)
+
+    async def _visible(self, locator: Tuple) -> Optional[AsyncWebElement]:
+        element = await self.driver.find_element(locator)
+        return element if await element.is_displayed() else None
+
+    async def _clickable(self, locator: Tuple) -> Optional[AsyncWebElement]:
+        element = await self._visible(locator)
+        return element if element and await element.is_enabled() else None
+
+    async def _invisible(self, locator: Tuple) -> bool:
+        try:
+            return not await (await self.driver.find_element(locator)).is_displayed()
+        except IGNORED_EXCEPTIONS:
+            return True
+
+    # ==================== GENERIC UTILITY METHODS ====================
+
+    async def click_element(self, locator: Tuple, timeout: int = 10) -> None:
+        """
+        Click an element with explicit wait and scroll into view.
+        Retries with JavaScript click if regular click is intercepted.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            timeout: Maximum wait time in seconds
+
+        Raises:
+            TimeoutException: If element not clickable within timeout
+        """
+        element = await self._wait_until(
+            lambda: self._clickable(locator), timeout, f"Element {locator} not clickable after {timeout}s"
+        )
+        await self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        try:
+            await element.click()
+        except (ElementClickInterceptedException, ElementNotInteractableException):
+            await self.driver.execute_script("arguments[0].click();", element)
+
+    async def enter_text(self, locator: Tuple, text: str, timeout: int = 10) -> None:
+        """
+        Clear and enter text into an input field.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            text: Text to enter
+            timeout: Maximum wait time in seconds
+
+        Raises:
+            TimeoutException: If element not visible within timeout
+        """
+        element = await self._wait_until(
+            lambda: self._visible(locator), timeout, f"Element {locator} not visible after {timeout}s"
+        )
+        await element.clear()
+        await element.send_keys(text)
+
+    async def select_dropdown_by_value(self, locator: Tuple, value: str, timeout: int = 10) -> None:
+        """
+        Select dropdown option by value attribute.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            value: Value attribute of option to select
+            timeout: Maximum wait time in seconds
+        """
+        select = await self._wait_until(
+            lambda: self._present(locator), timeout, f"Element {locator} not present after {timeout}s"
+        )
+        option = await select.find_element((By.XPATH, f".//option[@value={xpath_literal(value)}]"))
+        if not await option.is_selected():
+            await option.click()
+
+    async def select_dropdown_by_text(self, locator: Tuple, text: str, timeout: int = 10) -> None:
+        """
+        Select dropdown option by visible text.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            text: Visible text of option to select
+            timeout: Maximum wait time in seconds
+        """
+        select = await self._wait_until(
+            lambda: self._present(locator), timeout, f"Element {locator} not present after {timeout}s"
+        )
+        option = await select.find_element((By.XPATH, f".//option[normalize-space(.)={xpath_literal(text)}]"))
+        if not await option.is_selected():
+            await option.click()
+
+    async def wait_for_element(self, locator: Tuple, timeout: int = 10) -> bool:
+        """
+        Wait for element to be present in DOM.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if element found, False otherwise
+        """
+        try:
+            await self._wait_until(lambda: self._present(locator), timeout, "")
+            return True
+        except TimeoutException:
+            return False
+
+    async def wait_for_element_visible(self, locator: Tuple, timeout: int = 10) -> bool:
+        """
+        Wait for element to be visible.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if element visible, False otherwise
+        """
+        try:
+            await self._wait_until(lambda: self._visible(locator), timeout, "")
+            return True
+        except TimeoutException:
+            return False
+
+    async def wait_for_element_invisible(self, locator: Tuple, timeout: int = 10) -> bool:
+        """
+        Wait for element to become invisible.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if element invisible, False otherwise
+        """
+        try:
+            await self._wait_until(lambda: self._invisible(locator), timeout, "")
+            return True
+        except TimeoutException:
+            return False
+
+    async def is_element_visible(self, locator: Tuple, timeout: int = 5) -> bool:
+        """
+        Check if element is visible.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if visible, False otherwise
+        """
+        return await self.wait_for_element_visible(locator, timeout)
+
+    async def is_element_present(self, locator: Tuple, timeout: int = 5) -> bool:
+        """
+        Check if element is present in DOM.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if present, False otherwise
+        """
+        return await self.wait_for_element(locator, timeout)
+
+    async def is_element_enabled(self, locator: Tuple, timeout: int = 5) -> bool:
+        """
+        Check if element is enabled.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if enabled, False otherwise
+        """
+        try:
+            element = await self._wait_until(lambda: self._present(locator), timeout, "")
+            return await element.is_enabled()
+        except (TimeoutException, NoSuchElementException):
+            return False
+
+    async def is_element_selected(self, locator: Tuple, timeout: int = 5) -> bool:
+        """
+        Check if element is selected (checkbox/radio).
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if selected, False otherwise
+        """
+        try:
+            element = await self._wait_until(lambda: self._present(locator), timeout, "")
+            return await element.is_selected()
+        except (TimeoutException, NoSuchElementException):
+            return False
+
+    async def get_element_text(self, locator: Tuple, timeout: int = 10) -> str:
+        """
+        Get text content of element.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            Element text content
+
+        Raises:
+            TimeoutException: If element not found within timeout
+        """
+        element = await self._wait_until(
+            lambda: self._present(locator), timeout, f"Element {locator} not present after {timeout}s"
+        )
+        return await element.text()
+
+    async def get_element_attribute(self, locator: Tuple, attribute: str, timeout: int = 10) -> Optional[str]:
+        """
+        Get attribute value of element.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            attribute: Attribute name to retrieve
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            Attribute value or None if not found
+        """
+        try:
+            element = await self._wait_until(lambda: self._present(locator), timeout, "")
+            return await element.get_attribute(attribute)
+        except (TimeoutException, NoSuchElementException):
+            return None
+
+    async def navigate_to(self, url: str) -> None:
+        """
+        Navigate to specified URL.
+
+        Args:
+            url: URL to navigate to
+        """
+        await self.driver.get(url)
+
+    async def get_current_url(self) -> str:
+        """
+        Get current page URL.
+
+        Returns:
+            Current URL string
+        """
+        return await self.driver.current_url()
+
+    async def verify_url_contains(self, expected_url: str, timeout: int = 10) -> bool:
+        """
+        Verify current URL contains expected text.
+
+        Args:
+            expected_url: Expected URL fragment
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if URL contains text, False otherwise
+        """
+        async def url_matches():
+            return expected_url in await self.driver.current_url()
+
+        try:
+            await self._wait_until(url_matches, timeout, "")
+            return True
+        except TimeoutException:
+            return False
+
+    async def execute_javascript(self, script: str, *args):
+        """
+        Execute JavaScript in browser.
+
+        Args:
+            script: JavaScript code to execute
+            *args: Arguments to pass to script
+
+        Returns:
+            Script execution result
+        """
+        return await self.driver.execute_script(script, *args)
@@ -0,0 +1,73 @@
+"""
+AsyncIssuesPage Module
+
+This module contains the AsyncIssuesPage class, the asyncio counterpart of
+IssuesPage. Locators are shared with IssuesPage so both stay in sync.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from typing import List
+
+from selenium.webdriver.common.by import By
+from pages.async_base_page import AsyncBasePage
+from pages.issues_page import IssuesPage
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AsyncIssuesPage(AsyncBasePage):
+    """Async Page Object Model for Dutch.com Issues/Symptoms Selection Page."""
+
+    # Locators shared with IssuesPage
+    issues_page_allergy_card = IssuesPage.issues_page_allergy_card
+    issues_page_continue_button = IssuesPage.issues_page_continue_button
+    issues_page_cards_container = IssuesPage.issues_page_cards_container
+
+    async def select_issue_by_id(self, issue_name: str) -> None:
+        """
+        Select an issue by clicking its card (uses ID).
+
+        Args:
+            issue_name: Issue name (e.g., 'Allergy', 'Anxiety')
+        """
+        await self.click_element((By.ID, issue_name))
+
+    async def select_multiple_issues(self, issue_names: List[str]) -> None:
+        """
+        Select multiple issues by their names.
+
+        Args:
+            issue_names: List of issue names to select
+        """
+        for issue_name in issue_names:
+            await self.select_issue_by_id(issue_name)
+        logger.info(f"Selected issues: {', '.join(issue_names)}")
+
+    async def is_issue_selected(self, issue_name: str) -> bool:
+        """
+        Check if an issue is selected.
+
+        Args:
+            issue_name: Issue name to check
+
+        Returns:
+            True if selected, False otherwise
+        """
+        return await self.is_element_selected((By.ID, f"checkbox-{issue_name}"))
+
+    async def click_continue(self) -> None:
+        """Click the continue button."""
+        await self.click_element(self.issues_page_continue_button)
+        logger.info("Issues selection submitted")
+
+    async def verify_issues_page_loaded(self) -> bool:
+        """
+        Verify issues page has loaded by checking for Continue button.
+
+        Returns:
+            True if loaded, False otherwise
+        """
+        return await self.is_element_visible(self.issues_page_continue_button)
@@ -0,0 +1,87 @@
+"""
+AsyncPetInfoPage Module
+
+This module contains the AsyncPetInfoPage class, the asyncio counterpart of
+PetInfoPage. Locators are shared with PetInfoPage so both stay in sync.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from pages.async_base_page import AsyncBasePage
+from pages.pet_info_page import PetInfoPage
+from utils.enums import PetType, USState
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AsyncPetInfoPage(AsyncBasePage):
+    """Async Page Object Model for the Pet Information registration page."""
+
+    # Locators shared with PetInfoPage
+    pet_info_page_dog_radio_button = PetInfoPage.pet_info_page_dog_radio_button
+    pet_info_page_cat_radio_button = PetInfoPage.pet_info_page_cat_radio_button
+    pet_info_page_pet_name_input = PetInfoPage.pet_info_page_pet_name_input
+    pet_info_page_state_dropdown = PetInfoPage.pet_info_page_state_dropdown
+    pet_info_page_continue_button = PetInfoPage.pet_info_page_continue_button
+
+    async def select_dog(self) -> None:
+        """Select dog as pet type."""
+        await self.click_element(self.pet_info_page_dog_radio_button)
+
+    async def select_cat(self) -> None:
+        """Select cat as pet type."""
+        await self.click_element(self.pet_info_page_cat_radio_button)
+
+    async def enter_pet_name(self, name: str) -> None:
+        """
+        Enter pet name.
+
+        Args:
+            name: Pet's name
+        """
+        await self.enter_text(self.pet_info_page_pet_name_input, name)
+
+    async def select_state(self, state: USState) -> None:
+        """
+        Select pet's home state.
+
+        Args:
+            state: US state (USState enum)
+        """
+        await self.select_dropdown_by_value(self.pet_info_page_state_dropdown, state.value)
+
+    async def fill_pet_info_form(self, pet_type: PetType, pet_name: str, state: USState) -> None:
+        """
+        Fill complete pet info form.
+
+        Args:
+            pet_type: Pet type (PetType.DOG or PetType.CAT)
+            pet_name: Pet's name
+            state: US state (USState enum)
+        """
+        if pet_type == PetType.DOG:
+            await self.select_dog()
+        elif pet_type == PetType.CAT:
+            await self.select_cat()
+        else:
+            raise ValueError(f"Invalid pet type: {pet_type}. Must be PetType.DOG or PetType.CAT")
+
+        await self.enter_pet_name(pet_name)
+        await self.select_state(state)
+        logger.info(f"Pet info filled: {pet_name} ({pet_type.value}) in {state.value}")
+
+    async def click_continue(self) -> None:
+        """Click the continue button."""
+        await self.click_element(self.pet_info_page_continue_button)
+        logger.info("Pet info form submitted")
+
+    async def verify_pet_info_page_loaded(self) -> bool:
+        """
+        Verify pet info page has loaded by checking for Continue button.
+
+        Returns:
+            True if loaded, False otherwise
+        """
+        return await self.is_element_visible(self.pet_info_page_continue_button)
@@ -8,20 +8,73 @@ Author: Claude AI
 Date: 2025-10-19
 """
 
-from selenium.webdriver.support.ui import WebDriverWait, Select
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
     ElementNotInteractableException,
     ElementClickInterceptedException
 )
-from typing import Tuple, Optional
-import time
+from contextlib import contextmanager
+from typing import Dict, Tuple, Optional
+from datetime import datetime
+from operator import attrgetter
+import functools
+import inspect
+import threading
 import os
 
+from utils.frame_locator import FrameLocator
+from utils.lazy_import import lazy_module
+from utils.logger import setup_logger
+from utils.readiness import time_origin, wait_until_ready
+from utils.settle import SettleResult, wait_until_settled
+from utils.variant_locator import located, resolve_first, to_queries
+
+# Imported on first use: they pull in Selenium's remote WebDriver, which collection does not need
+ui = lazy_module("selenium.webdriver.support.ui")
+EC = lazy_module("selenium.webdriver.support.expected_conditions")
+action_chains = lazy_module("selenium.webdriver.common.action_chains")
+
+logger = setup_logger(__name__)
+
+_RAISE = object()
+
+
+def frame_aware(missing=_RAISE):
+    """
+    Let a BasePage method take FrameLocators: the call runs inside the locator's frames.
+
+    Args:
+        missing: Value returned when a frame is not available (default: raise TimeoutException)
+    """
+    def decorate(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, locator, *args, **kwargs):
+            if not isinstance(locator, FrameLocator):
+                return method(self, locator, *args, **kwargs)
+            timeout = signature.bind(self, locator, *args, **kwargs).arguments.get(
+                "timeout", signature.parameters["timeout"].default
+            )
+            previous = self._frame_path
+            try:
+                self._switch_to_frame_path(locator.frames, timeout)
+            except TimeoutException:
+                self._switch_to_frame_path(previous, timeout)
+                if missing is _RAISE:
+                    raise
+                return missing
+            try:
+                return method(self, locator.locator, *args, **kwargs)
+            finally:
+                self._switch_to_frame_path(previous, timeout)
+        return wrapper
+    return decorate
+
 
 class BasePage:
     """
@@ -32,9 +85,19 @@ class BasePage:
     - Universal UI elements (generic loading spinners, error messages that appear site-wide)
 
     Component-specific elements (headers, footers, navigation) belong in separate component classes.
+
+    Every locator argument may also be a VariantLocator (utils/variant_locator.py):
+    its A/B alternatives are tried in order by one injected script per poll. Element
+    methods also take a FrameLocator (utils/frame_locator.py) and run inside its
+    frames - see in_frame.
     """
 
+    # Locator attributes (dotted for components, e.g. 'payment.payment_component_phone_input')
+    # that must be visible before the page is usable - see wait_until_ready
+    ready_locators: Tuple[str, ...] = ()
+
     _screenshot_counter = 0  # Class variable for sequential numbering
+    _screenshot_counter_lock = threading.Lock()  # Sessions may run on several threads
 
     def __init__(self, driver, screenshot_helper=None, config=None):
         """
@@ -49,10 +112,13 @@ class BasePage:
         # Use config timeouts if provided, otherwise use defaults
         explicit_wait = config.EXPLICIT_WAIT if config else 15
         page_load_timeout = config.PAGE_LOAD_TIMEOUT if config else 30
-        self.wait = WebDriverWait(driver, explicit_wait)
-        self.long_wait = WebDriverWait(driver, page_load_timeout)
+        self.wait = ui.WebDriverWait(driver, explicit_wait)
+        self.long_wait = ui.WebDriverWait(driver, page_load_timeout)
         self.screenshot_helper = screenshot_helper
         self.config = config
+        # Frame the driver is switched to (locators, outermost first) and frame elements by path
+        self._frame_path: Tuple = ()
+        self._frame_handles: Dict[Tuple, object] = {}
 
     def _auto_screenshot(self, action_name: str, element_name: str = "") -> None:
         """
@@ -63,15 +129,34 @@ class BasePage:
             element_name: Optional element identifier
         """
         if self.screenshot_helper and self.config and self.config.ENABLE_SCREENSHOTS:
-            BasePage._screenshot_counter += 1
+            with BasePage._screenshot_counter_lock:
+                BasePage._screenshot_counter += 1
+                counter = BasePage._screenshot_counter
             # Create screenshot name: counter_action_element
-            counter_str = f"{BasePage._screenshot_counter:03d}"
+            counter_str = f"{counter:03d}"
             element_part = f"_{element_name}" if element_name else ""
             screenshot_name = f"{counter_str}_{action_name}{element_part}"
             self.screenshot_helper.capture(screenshot_name)
 
     # ==================== GENERIC UTILITY METHODS ====================
 
+    def wait_until_settled(self, element=None) -> SettleResult:
+        """
+        Wait until scrolling and CSS animations stop (replaces fixed sleeps).
+
+        Returns within a frame or two when nothing is moving; never raises.
+
+        Args:
+            element: Optional WebElement whose position must be stable
+
+        Returns:
+            SettleResult
+        """
+        stable_frames = self.config.SETTLE_FRAMES if self.config else 2
+        timeout = self.config.SETTLE_TIMEOUT if self.config else 2.0
+        return wait_until_settled(self.driver, [element] if element is not None else [], stable_frames, timeout)
+
+    @frame_aware()
     def click_element(self, locator: Tuple, timeout: int = 10) -> None:
         """
         Click an element with explicit wait and scroll into view.
@@ -85,19 +170,18 @@ class BasePage:
             TimeoutException: If element not clickable within timeout
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
+            element = ui.WebDriverWait(self.driver, timeout).until(
+                located(locator, "clickable")
             )
             # Scroll element into view to avoid interception
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+            self.wait_until_settled(element)
 
             try:
                 element.click()
             except ElementClickInterceptedException:
-                # If click is intercepted, wait for element to be stable and retry with JS click
-                WebDriverWait(self.driver, 3).until(
-                    EC.element_to_be_clickable(locator)
-                )
+                # If click is intercepted (e.g. by an animating overlay), wait for the page to settle and retry with JS click
+                self.wait_until_settled(element)
                 self.driver.execute_script("arguments[0].click();", element)
 
             # Auto-screenshot after click
@@ -108,6 +192,37 @@ class BasePage:
                 f"Element {locator} not clickable after {timeout}s"
             )
 
+    @frame_aware()
+    def js_click_element(self, locator: Tuple, state: str = "present", timeout: int = 10) -> None:
+        """
+        Click an element with JavaScript, without scrolling.
+
+        For inputs covered by another element (styled radios and checkboxes)
+        and buttons inside modals that must not scroll.
+
+        Args:
+            locator: Tuple of (By.TYPE, "value")
+            state: State to wait for before clicking: 'present', 'visible' or 'clickable'
+            timeout: Maximum wait time in seconds
+
+        Raises:
+            TimeoutException: If element not in that state within timeout
+        """
+        try:
+            element = ui.WebDriverWait(self.driver, timeout).until(
+                located(locator, state)
+            )
+        except TimeoutException:
+            raise TimeoutException(
+                f"Element {locator} not {state} after {timeout}s"
+            )
+        self.driver.execute_script("arguments[0].click();", element)
+
+        # Auto-screenshot after click
+        element_name = str(locator[1])[:30] if len(locator) > 1 else "element"
+        self._auto_screenshot("click", element_name)
+
+    @frame_aware()
     def enter_text(self, locator: Tuple, text: str, timeout: int = 10) -> None:
         """
         Clear and enter text into an input field.
@@ -121,8 +236,8 @@ class BasePage:
             TimeoutException: If element not visible within timeout
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
+            element = ui.WebDriverWait(self.driver, timeout).until(
+                located(locator, "visible")
             )
             element.clear()
             element.send_keys(text)
@@ -134,6 +249,7 @@ class BasePage:
                 f"Element {locator} not visible after {timeout}s"
             )
 
+    @frame_aware()
     def select_dropdown_by_text(self, locator: Tuple, text: str, timeout: int = 10) -> None:
         """
         Select dropdown option by visible text.
@@ -143,15 +259,16 @@ class BasePage:
             text: Visible text of option to select
             timeout: Maximum wait time in seconds
         """
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(locator)
+        element = ui.WebDriverWait(self.driver, timeout).until(
+            located(locator, "present")
         )
-        select = Select(element)
+        select = ui.Select(element)
         select.select_by_visible_text(text)
         # Auto-screenshot after selection
         element_name = str(locator[1])[:30] if len(locator) > 1 else "dropdown"
         self._auto_screenshot("select_dropdown", element_name)
 
+    @frame_aware()
     def select_dropdown_by_value(self, locator: Tuple, value: str, timeout: int = 10) -> None:
         """
         Select dropdown option by value attribute.
@@ -161,15 +278,16 @@ class BasePage:
             value: Value attribute of option to select
             timeout: Maximum wait time in seconds
         """
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(locator)
+        element = ui.WebDriverWait(self.driver, timeout).until(
+            located(locator, "present")
         )
-        select = Select(element)
+        select = ui.Select(element)
         select.select_by_value(value)
         # Auto-screenshot after selection
         element_name = str(locator[1])[:30] if len(locator) > 1 else "dropdown"
         self._auto_screenshot("select_dropdown", element_name)
 
+    @frame_aware(missing=False)
     def wait_for_element(self, locator: Tuple, timeout: int = 10) -> bool:
         """
         Wait for element to be present in DOM.
@@ -182,13 +300,14 @@ class BasePage:
             True if element found, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
+            ui.WebDriverWait(self.driver, timeout).until(
+                located(locator, "present")
             )
             return True
         except TimeoutException:
             return False
 
+    @frame_aware(missing=False)
     def wait_for_element_visible(self, locator: Tuple, timeout: int = 10) -> bool:
         """
         Wait for element to be visible.
@@ -201,13 +320,14 @@ class BasePage:
             True if element visible, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
+            ui.WebDriverWait(self.driver, timeout).until(
+                located(locator, "visible")
             )
             return True
         except TimeoutException:
             return False
 
+    @frame_aware(missing=False)
     def wait_for_element_invisible(self, locator: Tuple, timeout: int = 10) -> bool:
         """
         Wait for element to become invisible.
@@ -220,13 +340,47 @@ class BasePage:
             True if element invisible, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
+            ui.WebDriverWait(self.driver, timeout).until(
                 EC.invisibility_of_element_located(locator)
             )
             return True
         except TimeoutException:
             return False
 
+    def wait_for_first_of(self, outcomes: Dict[str, Tuple], timeout: int = 10,
+                          state: str = "visible") -> Optional[str]:
+        """
+        Wait for several outcomes at once and return the one that happens first.
+
+        All locators are checked by one injected script per poll, in the given
+        order, so an optional modal costs nothing when the next page shows up
+        instead.
+
+        Args:
+            outcomes: Outcome name -> locator (tuple or VariantLocator)
+            timeout: Maximum wait time in seconds
+            state: 'present', 'visible' or 'clickable'
+
+        Returns:
+            Name of the first outcome, or None if none happened within timeout
+
+        Example:
+            outcome = self.wait_for_first_of({"modal": modal_locator, "next_page": next_page_locator})
+        """
+        names, queries = [], []
+        for name, locator in outcomes.items():
+            for query in to_queries(locator):
+                names.append(name)
+                queries.append(query)
+        try:
+            _, index = ui.WebDriverWait(self.driver, timeout).until(
+                lambda driver: resolve_first(driver, queries, state) or False
+            )
+        except TimeoutException:
+            return None
+        return names[index]
+
+    @frame_aware()
     def scroll_to_element(self, locator: Tuple, timeout: int = 10) -> None:
         """
         Scroll element into view.
@@ -235,11 +389,11 @@ class BasePage:
             locator: Tuple of (By.TYPE, "value")
             timeout: Maximum wait time in seconds
         """
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(locator)
+        element = ui.WebDriverWait(self.driver, timeout).until(
+            located(locator, "present")
         )
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)  # Brief pause after scroll
+        self.wait_until_settled(element)
         # Auto-screenshot after scroll
         element_name = str(locator[1])[:30] if len(locator) > 1 else "element"
         self._auto_screenshot("scroll_to_element", element_name)
@@ -247,14 +401,14 @@ class BasePage:
     def scroll_to_bottom(self) -> None:
         """Scroll to bottom of page."""
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(0.5)
+        self.wait_until_settled()
         # Auto-screenshot after scroll
         self._auto_screenshot("scroll_to_bottom")
 
     def scroll_to_top(self) -> None:
         """Scroll to top of page."""
         self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(0.5)
+        self.wait_until_settled()
         # Auto-screenshot after scroll
         self._auto_screenshot("scroll_to_top")
 
@@ -270,11 +424,10 @@ class BasePage:
             Full path to saved screenshot
         """
         # Ensure screenshots directory exists
-        if not os.path.exists(path):
-            os.makedirs(path)
+        os.makedirs(path, exist_ok=True)
 
-        # Generate filename with timestamp
-        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        # Generate filename with timestamp (microseconds keep rapid captures unique)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         filename = f"{name}_{timestamp}.png"
         filepath = os.path.join(path, filename)
 
@@ -289,10 +442,50 @@ class BasePage:
         Args:
             url: URL to navigate to
         """
+        # With the 'none' strategy driver.get returns at once: tell the new document from this one
+        since = time_origin(self.driver) if self._page_load_strategy() == "none" else None
         self.driver.get(url)
+        self._reset_frames()
+        # Only wait for the new document; ready_locators are left to the page's verify/wait methods
+        if since is not None:
+            timeout = self.config.PAGE_LOAD_TIMEOUT if self.config else 30
+            if not wait_until_ready(self.driver, {}, timeout, since=since).ready:
+                logger.warning(f"No new document after {timeout}s navigating to {url}")
         # Auto-screenshot after navigation
         self._auto_screenshot("navigate_to", url.split('//')[-1][:30])
 
+    def _page_load_strategy(self) -> str:
+        return self.config.PAGE_LOAD_STRATEGY if self.config else "normal"
+
+    def wait_until_ready(self, timeout: Optional[float] = None, since: Optional[float] = None) -> bool:
+        """
+        Wait until the page is usable: DOMContentLoaded fired, every ready_locators
+        element visible and, with NETWORK_QUIET_MS, no recent requests.
+
+        All conditions are checked by one injected script per poll, so pages can
+        be used before slow third-party scripts fire the 'load' event.
+
+        Args:
+            timeout: Maximum wait time in seconds (default PAGE_LOAD_TIMEOUT)
+            since: performance.timeOrigin of the previous document, when navigating
+
+        Returns:
+            True if the page became ready, False otherwise
+        """
+        checks = {name: attrgetter(name)(self) for name in self.ready_locators}
+        if timeout is None:
+            timeout = self.config.PAGE_LOAD_TIMEOUT if self.config else 30
+        state = wait_until_ready(
+            self.driver, checks, timeout,
+            network_quiet_ms=self.config.NETWORK_QUIET_MS if self.config else 0,
+            ignore=self.config.NETWORK_QUIET_IGNORE if self.config else (),
+            since=since
+        )
+        if not state.ready:
+            logger.warning(f"{type(self).__name__} not ready after {timeout}s: {state.describe()}")
+        return state.ready
+
+    @frame_aware(missing=False)
     def is_element_visible(self, locator: Tuple, timeout: int = 5) -> bool:
         """
         Check if element is visible.
@@ -305,13 +498,14 @@ class BasePage:
             True if visible, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(locator)
+            ui.WebDriverWait(self.driver, timeout).until(
+                located(locator, "visible")
             )
             return True
         except (TimeoutException, NoSuchElementException):
             return False
 
+    @frame_aware(missing=False)
     def is_element_present(self, locator: Tuple, timeout: int = 5) -> bool:
         """
         Check if element is present in DOM.
@@ -324,13 +518,14 @@ class BasePage:
             True if present, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
+            ui.WebDriverWait(self.driver, timeout).until(
+                located(locator, "present")
             )
             return True
         except (TimeoutException, NoSuchElementException):
             return False
 
+    @frame_aware(missing=False)
     def is_element_enabled(self, locator: Tuple, timeout: int = 5) -> bool:
         """
         Check if element is enabled.
@@ -343,13 +538,14 @@ class BasePage:
             True if enabled, False otherwise
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
+            element = ui.WebDriverWait(self.driver, timeout).until(
+                located(locator, "present")
             )
             return element.is_enabled()
         except (TimeoutException, NoSuchElementException):
             return False
 
+    @frame_aware(missing=False)
     def is_element_selected(self, locator: Tuple, timeout: int = 5) -> bool:
         """
         Check if element is selected (checkbox/radio).
@@ -362,13 +558,14 @@ class BasePage:
             True if selected, False otherwise
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
+            element = ui.WebDriverWait(self.driver, timeout).until(
+                located(locator, "present")
             )
             return element.is_selected()
         except (TimeoutException, NoSuchElementException):
             return False
 
+    @frame_aware()
     def get_element_text(self, locator: Tuple, timeout: int = 10) -> str:
         """
         Get text content of element.
@@ -383,11 +580,12 @@ class BasePage:
         Raises:
             TimeoutException: If element not found within timeout
         """
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(locator)
+        element = ui.WebDriverWait(self.driver, timeout).until(
+            located(locator, "present")
         )
         return element.text
 
+    @frame_aware(missing=None)
     def get_element_attribute(self, locator: Tuple, attribute: str, timeout: int = 10) -> Optional[str]:
         """
         Get attribute value of element.
@@ -401,8 +599,8 @@ class BasePage:
             Attribute value or None if not found
         """
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(locator)
+            element = ui.WebDriverWait(self.driver, timeout).until(
+                located(locator, "present")
             )
             return element.get_attribute(attribute)
         except (TimeoutException, NoSuchElementException):
@@ -420,7 +618,7 @@ class BasePage:
             True if title matches, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
+            ui.WebDriverWait(self.driver, timeout).until(
                 EC.title_is(expected_title)
             )
             return True
@@ -439,7 +637,7 @@ class BasePage:
             True if title contains text, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
+            ui.WebDriverWait(self.driver, timeout).until(
                 EC.title_contains(partial_title)
             )
             return True
@@ -458,7 +656,7 @@ class BasePage:
             True if URL contains text, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
+            ui.WebDriverWait(self.driver, timeout).until(
                 EC.url_contains(expected_url)
             )
             return True
@@ -474,6 +672,7 @@ class BasePage:
         """
         return self.driver.current_url
 
+    @frame_aware()
     def hover_over_element(self, locator: Tuple, timeout: int = 10) -> None:
         """
         Hover mouse over element.
@@ -482,15 +681,16 @@ class BasePage:
             locator: Tuple of (By.TYPE, "value")
             timeout: Maximum wait time in seconds
         """
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(locator)
+        element = ui.WebDriverWait(self.driver, timeout).until(
+            located(locator, "present")
         )
-        actions = ActionChains(self.driver)
+        actions = action_chains.ActionChains(self.driver)
         actions.move_to_element(element).perform()
         # Auto-screenshot after hover
         element_name = str(locator[1])[:30] if len(locator) > 1 else "element"
         self._auto_screenshot("hover", element_name)
 
+    @frame_aware()
     def double_click_element(self, locator: Tuple, timeout: int = 10) -> None:
         """
         Double-click an element.
@@ -499,15 +699,16 @@ class BasePage:
             locator: Tuple of (By.TYPE, "value")
             timeout: Maximum wait time in seconds
         """
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(locator)
+        element = ui.WebDriverWait(self.driver, timeout).until(
+            located(locator, "clickable")
         )
-        actions = ActionChains(self.driver)
+        actions = action_chains.ActionChains(self.driver)
         actions.double_click(element).perform()
         # Auto-screenshot after double-click
         element_name = str(locator[1])[:30] if len(locator) > 1 else "element"
         self._auto_screenshot("double_click", element_name)
 
+    @frame_aware()
     def press_key(self, locator: Tuple, key, timeout: int = 10) -> None:
         """
         Press keyboard key on element.
@@ -517,8 +718,8 @@ class BasePage:
             key: Keyboard key from Keys class (e.g., Keys.ENTER)
             timeout: Maximum wait time in seconds
         """
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(locator)
+        element = ui.WebDriverWait(self.driver, timeout).until(
+            located(locator, "present")
         )
         element.send_keys(key)
         # Auto-screenshot after key press
@@ -533,9 +734,10 @@ class BasePage:
             locator: Tuple of (By.TYPE, "value")
             timeout: Maximum wait time in seconds
         """
-        iframe = WebDriverWait(self.driver, timeout).until(
+        iframe = ui.WebDriverWait(self.driver, timeout).until(
             EC.frame_to_be_available_and_switch_to_it(locator)
         )
+        self._frame_path += (tuple(locator),)
         # Auto-screenshot after switching to iframe
         element_name = str(locator[1])[:30] if len(locator) > 1 else "iframe"
         self._auto_screenshot("switch_to_iframe", element_name)
@@ -543,22 +745,105 @@ class BasePage:
     def switch_to_default_content(self) -> None:
         """Switch driver context back to main page."""
         self.driver.switch_to.default_content()
+        self._frame_path = ()
+
+    @contextmanager
+    def in_frame(self, *frames: Tuple, timeout: int = 10):
+        """
+        Run a block inside a (nested) iframe and switch back afterwards.
+
+        Frame elements are found once per page object and cached; only the switches
+        between the current and the wanted frame are sent, so element methods given
+        a FrameLocator of the same frames send none inside the block. The previous
+        context is restored on exit, also when the block raises.
+
+        Args:
+            *frames: Frame locators relative to the current frame, outermost first
+            timeout: Maximum wait time in seconds per frame
+
+        Raises:
+            TimeoutException: If a frame is not available within timeout
+
+        Example:
+            with self.in_frame(self.payment_component_card_number_frame):
+                brand = self.driver.find_element(By.CSS_SELECTOR, "[data-card-brand]")
+        """
+        previous = self._frame_path
+        try:
+            self._switch_to_frame_path(previous + frames, timeout)
+            yield
+        finally:
+            self._switch_to_frame_path(previous, timeout)
+
+    def _switch_to_frame_path(self, path: Tuple, timeout: float) -> None:
+        current = self._frame_path
+        if path == current:
+            return
+        common = 0
+        while common < min(len(path), len(current)) and path[common] == current[common]:
+            common += 1
+        try:
+            # Leave by parent_frame per level, or by one default_content and re-entering the common frames
+            up = len(current) - common
+            if up <= common + 1:
+                for _ in range(up):
+                    self.driver.switch_to.parent_frame()
+            else:
+                self.driver.switch_to.default_content()
+                common = 0
+            self._frame_path = path[:common]
+            for depth in range(common + 1, len(path) + 1):
+                self._enter_frame(path[:depth], timeout)
+                self._frame_path = path[:depth]
+        except Exception:
+            # Leave the driver in a known context
+            self._frame_path = ()
+            self.driver.switch_to.default_content()
+            raise
+
+    def _enter_frame(self, path: Tuple, timeout: float) -> None:
+        # The driver is in path[:-1]; a cached frame element goes stale when its document reloads
+        frame = self._frame_handles.get(path)
+        if frame is not None:
+            try:
+                self.driver.switch_to.frame(frame)
+                return
+            except (StaleElementReferenceException, NoSuchFrameException):
+                del self._frame_handles[path]
+
+        def available(driver):
+            element = located(path[-1], "present")(driver)
+            if element:
+                driver.switch_to.frame(element)
+            return element
+
+        self._frame_handles[path] = ui.WebDriverWait(
+            self.driver, timeout, ignored_exceptions=(NoSuchFrameException, StaleElementReferenceException)
+        ).until(available)
+
+    def _reset_frames(self) -> None:
+        # Navigation returns the driver to the top-level document and drops every frame element
+        self._frame_path = ()
+        self._frame_handles.clear()
 
     def refresh_page(self) -> None:
         """Refresh current page."""
         self.driver.refresh()
+        self._reset_frames()
         # Auto-screenshot after page refresh
         self._auto_screenshot("refresh_page")
 
     def go_back(self) -> None:
         """Navigate back in browser history."""
         self.driver.back()
+        self._reset_frames()
         # Auto-screenshot after navigation back
         self._auto_screenshot("go_back")
 
     def go_forward(self) -> None:
         """Navigate forward in browser history."""
         self.driver.forward()
+        self._reset_frames()
         # Auto-screenshot after navigation forward
         self._auto_screenshot("go_forward")
 
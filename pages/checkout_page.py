@@ -31,6 +31,9 @@ class CheckoutPage(BasePage):
     checkout_page_faq_vet_calls = (By.ID, "radix-vue-accordion-trigger-v-0")
     checkout_page_faq_medication_cost = (By.ID, "radix-vue-accordion-trigger-v-2")
 
+    # Elements that make the page usable (BasePage.wait_until_ready)
+    ready_locators = ("checkout_page_continue_button",)
+
     def select_1year_plan(self) -> None:
         """Select the 1-year subscription plan."""
         # Click the parent label since radio button is hidden
@@ -78,7 +81,7 @@ class CheckoutPage(BasePage):
         Returns:
             True if page loaded, False otherwise
         """
-        loaded = self.wait_for_element_visible(self.checkout_page_continue_button, timeout)
+        loaded = self.wait_until_ready(timeout)
         if loaded:
             logger.info("Checkout/plan selection page loaded")
         return loaded
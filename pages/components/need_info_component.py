@@ -8,8 +8,13 @@ Author: Claude AI
 Date: 2025-10-19
 """
 
+from typing import Optional, Tuple
+
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
 
 
 class NeedInfoComponent(BasePage):
@@ -92,3 +97,27 @@ class NeedInfoComponent(BasePage):
             True if component loaded, False otherwise
         """
         return self.wait_for_element_visible(self.need_info_component_continue_button, timeout)
+
+    def handle_if_present(self, next_page_locator: Optional[Tuple] = None, timeout: int = 5) -> bool:
+        """
+        Continue past the component if it appears.
+
+        Waits for the component and the next page at the same time, so states
+        without the component do not wait for the full timeout.
+
+        Args:
+            next_page_locator: Optional locator marking the page after the component
+            timeout: Maximum wait time in seconds for either outcome
+
+        Returns:
+            True if the component was handled, False if it didn't appear
+        """
+        outcomes = {"need_info": self.need_info_component_continue_button}
+        if next_page_locator:
+            outcomes["next_page"] = next_page_locator
+        if self.wait_for_first_of(outcomes, timeout) != "need_info":
+            logger.info("'Need Info' component did not appear - continuing directly")
+            return False
+        self.click_continue()
+        logger.info("'Need Info' component continued")
+        return True
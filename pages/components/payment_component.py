@@ -9,10 +9,10 @@ Date: 2025-10-19
 """
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
+from utils.frame_locator import FrameLocator
 from utils.logger import setup_logger
+from utils.variant_locator import VariantLocator
 
 logger = setup_logger(__name__)
 
@@ -35,10 +35,30 @@ class PaymentComponent(BasePage):
     payment_component_text_updates_dropdown = (By.ID, "cstm_fld_TGJZYOzkWaUTMh")
 
     # Payment Methods
-    payment_component_card_payment_radio = (By.ID, "payment-method-accordion-item-title-card")
+    # The card radio is covered by an accordion button in some variants
+    payment_component_card_payment_option = VariantLocator(
+        (By.XPATH, "//button[@aria-label='Pay with card' or @data-testid='card-accordion-item-button']"),
+        (By.ID, "payment-method-accordion-item-title-card"),
+        labels=("accordion-button", "radio")
+    )
     payment_component_klarna_payment_radio = (By.ID, "payment-method-accordion-item-title-klarna")
     payment_component_amazon_pay_radio = (By.ID, "payment-method-accordion-item-title-amazon_pay")
 
+    # Card Details (each Stripe field is a separate iframe)
+    payment_component_card_number_frame = (
+        By.CSS_SELECTOR,
+        "iframe[name^='__privateStripeFrame'][title*='card number' i]"
+    )
+    payment_component_card_expiry_frame = (
+        By.CSS_SELECTOR,
+        "iframe[name^='__privateStripeFrame'][title*='expiration' i]"
+    )
+    payment_component_card_cvc_frame = (By.CSS_SELECTOR, "iframe[name^='__privateStripeFrame'][title*='cvc' i]")
+    payment_component_card_number_input = FrameLocator((By.NAME, "cardnumber"), payment_component_card_number_frame)
+    payment_component_card_expiry_input = FrameLocator((By.NAME, "exp-date"), payment_component_card_expiry_frame)
+    payment_component_card_cvc_input = FrameLocator((By.NAME, "cvc"), payment_component_card_cvc_frame)
+    payment_component_billing_zip_input = (By.ID, "billingPostalCode")
+
     # Terms and Submission
     payment_component_terms_checkbox = (By.ID, "termsOfServiceConsentCheckbox")
     payment_component_terms_of_service_link = (
@@ -80,36 +100,16 @@ class PaymentComponent(BasePage):
         logger.info(f"Phone number entered: {phone}")
 
     def select_card_payment(self) -> None:
-        """Select card payment method using the accordion button."""
-        # The radio input is covered by a button, so click the button instead
-        try:
-            button = self.driver.find_element(By.XPATH, "//button[@aria-label='Pay with card' or @data-testid='card-accordion-item-button']")
-            # Use JavaScript click to avoid interception
-            self.driver.execute_script("arguments[0].click();", button)
-        except Exception:
-            # Fallback to original method
-            self.click_element(self.payment_component_card_payment_radio)
-
+        """Select card payment method (accordion button, or the radio when there is none)."""
+        # JavaScript click: the radio input is covered by the button
+        self.js_click_element(self.payment_component_card_payment_option)
         logger.info("Card payment option selected")
 
     def accept_terms(self) -> None:
         """Check the terms and conditions checkbox."""
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located(self.payment_component_terms_checkbox)
-            )
-
-            checkbox = self.driver.find_element(*self.payment_component_terms_checkbox)
-
-            # Check if already selected
-            if not checkbox.is_selected():
-                # Use JavaScript click to avoid interception issues
-                self.driver.execute_script("arguments[0].click();", checkbox)
-        except Exception:
-            # Fallback to original method
-            if not self.is_element_selected(self.payment_component_terms_checkbox):
-                self.click_element(self.payment_component_terms_checkbox)
-
+        if not self.is_element_selected(self.payment_component_terms_checkbox, timeout=10):
+            # JavaScript click avoids interception issues
+            self.js_click_element(self.payment_component_terms_checkbox)
         logger.info("Terms and conditions accepted")
 
     def click_subscribe(self) -> None:
@@ -137,62 +137,21 @@ class PaymentComponent(BasePage):
             zip_code: Billing ZIP code (optional)
         """
         try:
-            # Find and switch to card number iframe
-            card_number_iframe = WebDriverWait(self.driver, 10).until(
-                EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe[name^='__privateStripeFrame'][title*='card number' i]"))
-            )
-
-            # Enter card number
-            card_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "cardnumber"))
-            )
-            card_input.send_keys(card_number)
-
-            # Switch back to main content
-            self.driver.switch_to.default_content()
-
-            # Find and switch to expiry iframe
-            expiry_iframe = WebDriverWait(self.driver, 10).until(
-                EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe[name^='__privateStripeFrame'][title*='expiration' i]"))
-            )
-
-            # Enter expiry date (MM/YY format)
-            expiry_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "exp-date"))
-            )
-            expiry_year_short = expiry_year[-2:]  # Get last 2 digits
-            expiry_input.send_keys(f"{expiry_month}/{expiry_year_short}")
-
-            # Switch back to main content
-            self.driver.switch_to.default_content()
-
-            # Find and switch to CVC iframe
-            cvc_iframe = WebDriverWait(self.driver, 10).until(
-                EC.frame_to_be_available_and_switch_to_it((By.CSS_SELECTOR, "iframe[name^='__privateStripeFrame'][title*='cvc' i]"))
-            )
-
-            # Enter CVC
-            cvc_input = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "cvc"))
-            )
-            cvc_input.send_keys(cvv)
-
-            # Switch back to main content
-            self.driver.switch_to.default_content()
-
-            # Fill ZIP code if present (may not be in iframe)
-            if zip_code:
-                try:
-                    zip_input = self.driver.find_element(By.ID, "billingPostalCode")
-                    zip_input.send_keys(zip_code)
-                except:
-                    pass  # ZIP field may not be required
-
+            # Frames are found once and cached; each field costs one switch in and one out
+            self.enter_text(self.payment_component_card_number_input, card_number)
+            # Expiry date in MM/YY format
+            self.enter_text(self.payment_component_card_expiry_input, f"{expiry_month}/{expiry_year[-2:]}")
+            self.enter_text(self.payment_component_card_cvc_input, cvv)
         except Exception as e:
-            # Make sure we're back to main content even if there's an error
-            self.driver.switch_to.default_content()
             raise Exception(f"Error filling card details: {e}") from e
 
+        # Fill ZIP code if present (may not be in iframe)
+        if zip_code:
+            try:
+                self.driver.find_element(*self.payment_component_billing_zip_input).send_keys(zip_code)
+            except Exception:
+                pass  # ZIP field may not be required
+
     def wait_for_component_load(self, timeout: int = 15) -> bool:
         """
         Wait for payment component to fully load.
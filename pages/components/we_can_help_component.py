@@ -8,9 +8,9 @@ Author: Claude AI
 Date: 2025-10-19
 """
 
+from typing import Optional, Tuple
+
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from pages.base_page import BasePage
 from utils.logger import setup_logger
 
@@ -67,13 +67,8 @@ class WeCanHelpComponent(BasePage):
 
     def click_continue(self) -> None:
         """Click the continue button using JavaScript to avoid modal overlay issues."""
-        # Wait for button to be present and visible (ensures modal animation completed)
-        button = WebDriverWait(self.driver, 10).until(
-            EC.element_to_be_clickable(self.we_can_help_component_continue_button)
-        )
-
-        # Use JavaScript click (no scrolling - button is already in modal view)
-        self.driver.execute_script("arguments[0].click();", button)
+        # Waiting until clickable ensures the modal animation completed; no scrolling, the button is in view
+        self.js_click_element(self.we_can_help_component_continue_button, state="clickable")
         logger.info("'We Can Help' modal continue button clicked")
 
     def click_back(self) -> None:
@@ -113,15 +108,26 @@ class WeCanHelpComponent(BasePage):
         """
         return self.wait_for_element_visible(self.we_can_help_component_continue_button, timeout)
 
-    def handle_modal_if_present(self) -> bool:
+    def handle_modal_if_present(self, next_page_locator: Optional[Tuple] = None, timeout: int = 5) -> bool:
         """
         Handle the 'We Can Help' modal if it appears by dismissing it.
 
+        Waits for the modal and the next page at the same time, so when the
+        modal is not served the flow continues as soon as the next page shows.
+
+        Args:
+            next_page_locator: Optional locator marking the page after the modal
+            timeout: Maximum wait time in seconds for either outcome
+
         Returns:
             True if modal was handled, False if modal didn't appear
         """
+        outcomes = {"modal": self.we_can_help_component_modal_container}
+        if next_page_locator:
+            outcomes["next_page"] = next_page_locator
         try:
-            if self.is_modal_visible():
+            if self.wait_for_first_of(outcomes, timeout) == "modal":
+                logger.info("'We Can Help' modal appeared")
                 self.click_continue()
                 logger.info("'We Can Help' modal dismissed successfully")
                 return True
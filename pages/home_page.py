@@ -10,6 +10,7 @@ Date: 2025-10-19
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 from utils.logger import setup_logger
+from utils.variant_locator import VariantLocator
 
 logger = setup_logger(__name__)
 
@@ -27,12 +28,21 @@ class HomePage(BasePage):
     # - Some regions: href="/account/register"
     # - Other regions: href="https://register.dutch.com/"
     # Targeting the header Join Now button with specific classes to avoid hidden elements
-    home_page_primary_cta_button = (By.XPATH, "//a[contains(@class, 'button') and contains(@class, 'px-4') and contains(text(), 'Join Now')]")
+    home_page_primary_cta_button = VariantLocator(
+        (By.XPATH, "//a[contains(@class, 'button') and contains(@class, 'px-4') and contains(text(), 'Join Now')"
+                   " and @href='/account/register']"),
+        (By.XPATH, "//a[contains(@class, 'button') and contains(@class, 'px-4') and contains(text(), 'Join Now')"
+                   " and not(@href='/account/register')]"),
+        labels=("account-register", "register-site")
+    )
     home_page_get_started_button = (
         By.XPATH,
         "//a[@href='/account/register' and contains(@class, 'rounded-full') and contains(., 'Get started')]"
     )
 
+    # Elements that make the page usable (BasePage.wait_until_ready)
+    ready_locators = ("home_page_primary_cta_button",)
+
     # Footer Elements
     home_page_footer_newsletter_email_input = (By.ID, "newsletter_footer-email")
     home_page_footer_newsletter_submit_button = (By.ID, "Subscribe")
@@ -67,7 +77,7 @@ class HomePage(BasePage):
         Returns:
             True if page loaded, False otherwise
         """
-        return self.wait_for_element_visible(self.home_page_primary_cta_button, timeout)
+        return self.wait_until_ready(timeout)
 
     def navigate_to_home(self, base_url: str) -> None:
         """
@@ -35,6 +35,9 @@ class IssuesPage(BasePage):
     )
     issues_page_cards_container = (By.XPATH, "//form[@id='reg-flow-issues-form']/ul")
 
+    # Continue button (visible, but disabled until the form is valid) and issue cards
+    ready_locators = ("issues_page_continue_button", "issues_page_allergy_card")
+
     def select_issue_by_id(self, issue_name: str) -> None:
         """
         Select an issue by clicking its card (uses ID).
@@ -102,8 +105,4 @@ class IssuesPage(BasePage):
         Returns:
             True if page loaded, False otherwise
         """
-        # Verify button is visible (critical interactive element)
-        button_ready = self.wait_for_element_visible(self.issues_page_continue_button, timeout)
-        # Verify issue cards are visible (form inputs ready)
-        cards_ready = self.is_element_visible(self.issues_page_allergy_card, timeout=1)
-        return button_ready and cards_ready
+        return self.wait_until_ready(timeout)
@@ -28,6 +28,9 @@ class OrderSummaryPage(BasePage):
     order_summary_page_plan_name_text = (By.CSS_SELECTOR, "span[data-testid='product-summary-name']")
     order_summary_page_plan_price_text = (By.ID, "ProductSummary-totalAmount")
 
+    # Plan name (page content loaded) and phone input (form inputs ready)
+    ready_locators = ("order_summary_page_plan_name_text", "payment.payment_component_phone_input")
+
     def __init__(self, driver, screenshot_helper=None, config=None):
         """
         Initialize OrderSummaryPage with component composition.
@@ -108,8 +111,4 @@ class OrderSummaryPage(BasePage):
         Returns:
             True if page loaded, False otherwise
         """
-        # Verify plan name is visible (page content loaded)
-        content_ready = self.wait_for_element_visible(self.order_summary_page_plan_name_text, timeout)
-        # Verify phone input is visible (form inputs ready)
-        input_ready = self.is_element_visible(self.payment.payment_component_phone_input, timeout=1)
-        return content_ready and input_ready
+        return self.wait_until_ready(timeout)
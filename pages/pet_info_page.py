@@ -11,6 +11,7 @@ from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 from utils.logger import setup_logger
 from utils.enums import PetType, USState
+from utils.variant_locator import VariantLocator
 
 logger = setup_logger(__name__)
 
@@ -24,8 +25,7 @@ class PetInfoPage(BasePage):
 
     # Input Fields
     # NOTE: Dutch.com A/B testing serves different IDs: "pet-name" OR "petName"
-    # Using XPath to match either variation
-    pet_info_page_pet_name_input = (By.XPATH, "//input[@id='pet-name' or @id='petName']")
+    pet_info_page_pet_name_input = VariantLocator((By.ID, "pet-name"), (By.ID, "petName"))
     pet_info_page_state_dropdown = (By.ID, "state")
 
     # Buttons
@@ -36,6 +36,9 @@ class PetInfoPage(BasePage):
         "//button[@type='submit' and contains(text(), 'Continue')]"
     )
 
+    # Continue button (visible, but disabled until the form is valid) and form inputs
+    ready_locators = ("pet_info_page_continue_button", "pet_info_page_dog_radio_button")
+
     def select_dog(self) -> None:
         """Select dog as pet type."""
         self.click_element(self.pet_info_page_dog_radio_button)
@@ -106,8 +109,4 @@ class PetInfoPage(BasePage):
         Returns:
             True if page loaded, False otherwise
         """
-        # Verify button is visible (critical interactive element)
-        button_ready = self.wait_for_element_visible(self.pet_info_page_continue_button, timeout)
-        # Verify dog radio and pet name input are visible (form inputs ready)
-        input_ready = self.is_element_visible(self.pet_info_page_dog_radio_button, timeout=1)
-        return button_ready and input_ready
+        return self.wait_until_ready(timeout)
@@ -38,6 +38,9 @@ class RegistrationPage(BasePage):
     # Form Container
     registration_page_form_container = (By.ID, "input_0")
 
+    # Register button (visible, but disabled until the form is valid) and form inputs
+    ready_locators = ("registration_page_register_button", "registration_page_email_input")
+
     def fill_registration_form(self, email: str, password: str) -> None:
         """
         Fill the registration form.
@@ -74,11 +77,7 @@ class RegistrationPage(BasePage):
         Returns:
             True if page loaded, False otherwise
         """
-        # Verify button is visible (critical interactive element)
-        button_ready = self.wait_for_element_visible(self.registration_page_register_button, timeout)
-        # Verify email input is visible (form inputs ready)
-        input_ready = self.is_element_visible(self.registration_page_email_input, timeout=1)
-        loaded = button_ready and input_ready
+        loaded = self.wait_until_ready(timeout)
         if loaded:
             logger.info("Registration page loaded")
         return loaded
@@ -0,0 +1 @@
+"""Pytest plugins package initialization."""
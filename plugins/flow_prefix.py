@@ -0,0 +1,309 @@
+"""
+Flow Prefix Plugin
+
+This pytest plugin schedules tests by their declared flow path so tests that
+share opening steps run on one browser session.
+
+Tests declare their path with the flow_path marker and use the flow_session
+fixture:
+
+    @pytest.mark.flow_path(until="issues")
+    def test_issue_cards(flow_session): ...
+
+    @pytest.mark.flow_path("plan_2year", until="registration")
+    def test_two_year_plan(flow_session): ...
+
+The plugin builds a prefix tree of all paths, orders tests depth-first and
+tags every branch of the tree with an xdist_group (switching '--dist load' to
+'loadgroup'), so each branch runs on one worker. Within a worker one browser
+is shared: after every step a checkpoint is captured, and the next test
+restores the checkpoint of its longest cached prefix and runs only its
+divergent tail. Browser time then scales with the number of unique steps
+instead of tests x path length.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import copy
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pytest
+
+from config.settings import Config
+from flows.registration_flow import ALTERNATE_STEPS, REGISTRATION_FLOW, FlowContext, get_step
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+Path = Tuple[str, ...]
+
+# Step order used for depth-first test ordering (main flow first, then alternatives)
+STEP_ORDER = {step.name: index for index, step in enumerate(REGISTRATION_FLOW + ALTERNATE_STEPS)}
+
+# Steps declared vs. executed by flow tests of this run (collected from test reports)
+_stats = {"tests": 0, "declared": 0, "run": 0, "restored": 0}
+
+
+def resolve_path(mark) -> Path:
+    """
+    Resolve a flow_path marker to step names.
+
+    Args:
+        mark: flow_path marker; 'until' expands to REGISTRATION_FLOW up to and
+            including that step, positional args are appended
+
+    Returns:
+        Tuple of step names
+
+    Raises:
+        KeyError: If a step name is unknown
+    """
+    path: List[str] = []
+    until = mark.kwargs.get("until")
+    if until:
+        names = [step.name for step in REGISTRATION_FLOW]
+        if until not in names:
+            raise KeyError(f"Unknown flow step: {until}")
+        path += names[:names.index(until) + 1]
+    path += list(mark.args)
+    for name in path:
+        get_step(name)
+    return tuple(path)
+
+
+def assign_groups(paths: Sequence[Path], depth: int = 0) -> Dict[Path, str]:
+    """
+    Group paths by prefix for xdist load groups.
+
+    With depth 0 the prefix tree is followed from the root while it does not
+    branch; every branch below that point becomes one group (tests ending at
+    or before the branch point share the trunk group).
+
+    Args:
+        paths: Declared flow paths
+        depth: Fixed prefix length for groups (0 = split at the first branch)
+
+    Returns:
+        Mapping of path -> group name
+    """
+    if depth <= 0:
+        tree: Dict = {}
+        for path in paths:
+            node = tree
+            for step in path:
+                node = node.setdefault(step, {})
+            node[None] = True  # A test ends here
+
+        trunk: List[str] = []
+        node = tree
+        while len(node) == 1 and None not in node:
+            step, node = next(iter(node.items()))
+            trunk.append(step)
+        depth = len(trunk) + 1
+
+    return {path: "flow:" + ">".join(path[:depth]) for path in paths}
+
+
+class SharedFlowSession:
+    """One browser per worker, moved between flow paths through step checkpoints."""
+
+    def __init__(self, screenshots_dir: str):
+        """
+        Initialize the session (the browser starts with the first flow test).
+
+        Args:
+            screenshots_dir: Folder for this worker's screenshots
+        """
+        self.screenshots_dir = screenshots_dir
+        self.driver_manager = None
+        self.screenshot_helper = None
+        self.ctx: Optional[FlowContext] = None
+        self.checkpoints: Dict[Path, object] = {}
+
+    def _start_browser(self) -> None:
+        from utils.driver_manager import DriverManager
+        from utils.screenshot_helper import ScreenshotHelper
+
+        self.driver_manager = DriverManager(
+            browser=Config.BROWSER,
+            headless=Config.HEADLESS,
+            replay_mode=Config.REPLAY_MODE,
+            replay_archive=Config.REPLAY_ARCHIVE,
+            page_load_strategy=Config.PAGE_LOAD_STRATEGY
+        )
+        driver = self.driver_manager.get_driver()
+        driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
+        self.screenshot_helper = ScreenshotHelper(driver, self.screenshots_dir)
+
+    def _new_context(self, data: dict) -> FlowContext:
+        return FlowContext(driver=self.driver_manager.driver, config=Config, data=data,
+                           screenshot_helper=self.screenshot_helper)
+
+    def prepare(self, path: Path, data: dict) -> Tuple[FlowContext, int, bool]:
+        """
+        Bring the shared browser to the end of a path.
+
+        Checkpoints are tried from the longest cached prefix down; one that
+        fails to restore is dropped with its descendants and the next shorter
+        one is tried. Only when none restores does the flow start from home.
+
+        Args:
+            path: Step names
+            data: Fresh test data (unique user from the shared DataFactory), used
+                when no checkpoint restores - a restore brings the checkpoint's data
+
+        Returns:
+            Tuple of (flow context, steps executed, restored from checkpoint)
+        """
+        from flows.checkpoints import capture_checkpoint, restore_checkpoint
+
+        if self.driver_manager is None:
+            self._start_browser()
+        self.screenshot_helper.captured = []
+
+        cached = 0
+        for length in range(len(path), 0, -1):
+            checkpoint = self.checkpoints.get(path[:length])
+            if checkpoint is None:
+                continue
+            next_step = get_step(path[length]) if length < len(path) else None
+            self.ctx = self._new_context(copy.deepcopy(checkpoint.data))
+            if restore_checkpoint(self.ctx, checkpoint, next_step):
+                cached = length
+                break
+            for prefix in [p for p in self.checkpoints if p[:length] == path[:length]]:
+                del self.checkpoints[prefix]
+        restored = cached > 0
+        if not restored:
+            self.driver_manager.driver.delete_all_cookies()
+            self.ctx = self._new_context(data)
+
+        for index in range(cached, len(path)):
+            step = get_step(path[index])
+            logger.info(f"Flow step '{step.name}': {step.description}")
+            step.action(self.ctx)
+            self.checkpoints[path[:index + 1]] = capture_checkpoint(self.ctx, step.name)
+
+        return self.ctx, len(path) - cached, restored
+
+    def close(self) -> None:
+        """Quit the browser (checkpoints stay usable by a new browser)."""
+        if self.driver_manager:
+            self.driver_manager.quit_driver()
+        self.driver_manager = None
+        self.screenshot_helper = None
+        self.ctx = None
+
+
+# ==================== HOOKS ====================
+
+def pytest_configure(config):
+    config.flow_session = None
+    # Branch groups only keep their shared state with loadgroup distribution
+    if config.getoption("dist", "no") == "load":
+        config.option.dist = "loadgroup"
+    # Workers re-parse the command line ('-n 2' alone means load), so take the mode from the controller
+    if hasattr(config, "workerinput") and config.workerinput.get("flow_loadgroup"):
+        config.option.loadgroup = True
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["flow_loadgroup"] = node.config.getoption("dist", "no") == "loadgroup"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Order flow tests depth-first along the prefix tree and tag branch groups."""
+    positions = [i for i, item in enumerate(items) if item.get_closest_marker("flow_path")]
+    if not positions:
+        return
+
+    flow_items = [items[i] for i in positions]
+    for item in flow_items:
+        item.flow_path = resolve_path(item.get_closest_marker("flow_path"))
+
+    groups = assign_groups([item.flow_path for item in flow_items], Config.FLOW_GROUP_DEPTH)
+    for item in flow_items:
+        item.add_marker(pytest.mark.xdist_group(groups[item.flow_path]))
+
+    ordered = sorted(flow_items, key=lambda item: [STEP_ORDER[name] for name in item.flow_path])
+    for position, item in zip(positions, ordered):
+        items[position] = item
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    properties = dict(report.user_properties)
+    if "flow_steps_declared" not in properties:
+        return
+    _stats["tests"] += 1
+    _stats["declared"] += properties["flow_steps_declared"]
+    _stats["run"] += properties["flow_steps_run"]
+    _stats["restored"] += int(properties["flow_restored"])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _stats["tests"] or hasattr(config, "workerinput"):
+        return
+    saved = _stats["declared"] - _stats["run"]
+    terminalreporter.write_sep("-", "flow prefix sharing")
+    terminalreporter.write_line(
+        f"{_stats['tests']} flow tests ran {_stats['run']} of {_stats['declared']} declared steps "
+        f"({saved} shared, {_stats['restored']} checkpoint restores)"
+    )
+
+
+def pytest_unconfigure(config):
+    session = getattr(config, "flow_session", None)
+    if session:
+        session.close()
+
+
+# ==================== FIXTURES ====================
+
+@pytest.fixture(scope="function")
+def flow_session(request, test_data):
+    """
+    Get a flow context positioned at the end of the test's flow_path.
+
+    The browser is shared with other flow tests in this worker. A test that
+    starts from home uses test_data (unique user and phone from DataFactory).
+
+    Yields:
+        FlowContext (driver, config, data, page objects)
+    """
+    mark = request.node.get_closest_marker("flow_path")
+    if mark is None:
+        raise pytest.UsageError(f"{request.node.nodeid} uses flow_session without @pytest.mark.flow_path")
+    path = getattr(request.node, "flow_path", None) or resolve_path(mark)
+
+    if Config.FLOW_PREFIX_SHARING:
+        if request.config.flow_session is None:
+            request.config.flow_session = SharedFlowSession(request.config.screenshots_dir)
+        session = request.config.flow_session
+    else:
+        session = SharedFlowSession(request.config.screenshots_dir)
+
+    try:
+        ctx, steps_run, restored = session.prepare(path, test_data)
+    except Exception:
+        session.close()
+        raise
+    request.node.screenshot_helper = session.screenshot_helper
+    request.node.user_properties += [
+        ("flow_steps_declared", len(path)),
+        ("flow_steps_run", steps_run),
+        ("flow_restored", restored),
+    ]
+    logger.info(f"Flow path {' > '.join(path)}: ran {steps_run}/{len(path)} steps"
+                f"{' after checkpoint restore' if restored else ''}")
+
+    yield ctx
+
+    if hasattr(request.node, 'rep_call') and request.node.rep_call.failed:
+        session.screenshot_helper.capture_on_failure(request.node.name)
+    if not Config.FLOW_PREFIX_SHARING:
+        session.close()
@@ -0,0 +1,337 @@
+"""
+History Plugin
+
+This pytest plugin keeps a local SQLite history of test results and uses it to
+order and split runs.
+
+Every browser test result (outcome, duration, browser, worker, failing flow
+step, failing locator, step retries) is written from pytest_runtest_makereport
+to HISTORY_DB. History is on by default (HISTORY_ENABLED=false turns it off);
+tests without a browser (tests/unit) are neither recorded nor reordered, and
+runs without browser tests or with --collect-only never open the database.
+
+From the last HISTORY_WINDOW runs of each test the plugin computes:
+
+- fail rate: share of failed runs
+- flip rate: how often the outcome changed between consecutive runs; runs that
+  only passed after a step retry count as a flip
+- failure likelihood: recency-weighted fail rate (new tests start at 0.5)
+
+Tests are run most-likely-to-fail first, so a broken build shows up within the
+first minutes. Tests whose flip rate reaches FLAKY_THRESHOLD (at least two flips in at
+least HISTORY_MIN_RUNS runs) are quarantined: TEST_LANE=main leaves them out,
+TEST_LANE=quarantine runs only them (e.g. as a separate, non-blocking CI job)
+and TEST_LANE=all (default) runs everything.
+
+Usage:
+    python -m plugins.history report --top 20     # worst offenders
+    python -m plugins.history quarantined         # node ids in the quarantine lane
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pytest
+
+from config.settings import Config
+from utils.logger import setup_logger
+from utils.run_context import get_worker_id, plain_nodeid
+
+logger = setup_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run TEXT PRIMARY KEY,
+    started REAL NOT NULL,
+    browser TEXT,
+    lane TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run TEXT NOT NULL,
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    duration REAL NOT NULL,
+    browser TEXT,
+    worker TEXT,
+    failing_step TEXT,
+    locator TEXT,
+    error TEXT,
+    retries INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_nodeid ON results (nodeid, id);
+"""
+
+# Locator tuples in BasePage/WebDriver error messages, e.g. ('id', 'phoneNumber')
+_LOCATOR = re.compile(
+    r"\(['\"](xpath|id|css selector|class name|name|link text|partial link text|tag name)['\"],\s*['\"](.+?)['\"]\)"
+)
+
+# Fixtures that start a browser; only tests using one are recorded and ordered
+BROWSER_FIXTURES = ("setup", "flow_session")
+
+# Weight of a run relative to the next more recent one (failure likelihood)
+RECENCY_DECAY = 0.8
+
+# Prior failure likelihood of a test without history (and its weight in runs)
+PRIOR_LIKELIHOOD = 0.5
+PRIOR_WEIGHT = 1.0
+
+
+@dataclass
+class TestStats:
+    """History statistics of one test."""
+
+    nodeid: str
+    runs: int
+    failures: int
+    flips: int
+    likelihood: float
+    mean_duration: float
+    last_step: Optional[str] = None
+    last_locator: Optional[str] = None
+
+    @property
+    def fail_rate(self) -> float:
+        return self.failures / self.runs if self.runs else 0.0
+
+    @property
+    def flip_rate(self) -> float:
+        return self.flips / (self.runs - 1) if self.runs > 1 else 0.0
+
+    @property
+    def quarantined(self) -> bool:
+        # One flip is a test that broke (or got fixed); flaky tests fail and recover
+        return (self.runs >= Config.HISTORY_MIN_RUNS and self.flips >= 2
+                and self.flip_rate >= Config.FLAKY_THRESHOLD)
+
+
+class HistoryDB:
+    """SQLite test history (safe for concurrent xdist workers)."""
+
+    def __init__(self, path: str = Config.HISTORY_DB):
+        """
+        Open (and create) the history database.
+
+        Args:
+            path: Database file
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    def start_run(self, run: str, browser: str, lane: str) -> None:
+        """Register a test run."""
+        self.connection.execute("INSERT OR IGNORE INTO runs (run, started, browser, lane) VALUES (?, ?, ?, ?)",
+                                (run, time.time(), browser, lane))
+
+    def add_result(self, run: str, nodeid: str, outcome: str, phase: str, duration: float,
+                   failing_step: Optional[str] = None, locator: Optional[str] = None,
+                   error: Optional[str] = None, retries: int = 0) -> None:
+        """Store one test result."""
+        self.connection.execute(
+            "INSERT INTO results (run, nodeid, outcome, phase, duration, browser, worker, failing_step, locator, "
+            "error, retries, created) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (run, nodeid, outcome, phase, duration, Config.BROWSER, get_worker_id(), failing_step, locator,
+             error, retries, time.time())
+        )
+
+    def stats(self, window: int = Config.HISTORY_WINDOW) -> Dict[str, TestStats]:
+        """
+        Compute statistics over the last `window` results of every test.
+
+        Returns:
+            Mapping node id -> TestStats
+        """
+        rows = self.connection.execute(
+            "SELECT nodeid, outcome, duration, retries, failing_step, locator FROM ("
+            " SELECT *, ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY id DESC) AS age FROM results"
+            ") WHERE age <= ? ORDER BY nodeid, id", (window,)
+        ).fetchall()
+
+        history: Dict[str, list] = {}
+        for row in rows:
+            history.setdefault(row[0], []).append(row[1:])
+
+        stats = {}
+        for nodeid, results in history.items():
+            failed = [outcome == "failed" for outcome, *_ in results]
+            flips = sum(1 for previous, current in zip(failed, failed[1:]) if previous != current)
+            flips += sum(1 for (outcome, _, retries, *_) in results if outcome == "passed" and retries)
+            weights = [RECENCY_DECAY ** age for age in range(len(results) - 1, -1, -1)]
+            likelihood = ((sum(w for w, f in zip(weights, failed) if f) + PRIOR_LIKELIHOOD * PRIOR_WEIGHT)
+                          / (sum(weights) + PRIOR_WEIGHT))
+            last_failure = next((r for r in reversed(results) if r[0] == "failed"), None)
+            stats[nodeid] = TestStats(
+                nodeid=nodeid,
+                runs=len(results),
+                failures=sum(failed),
+                flips=flips,
+                likelihood=likelihood,
+                mean_duration=sum(r[1] for r in results) / len(results),
+                last_step=last_failure[3] if last_failure else None,
+                last_locator=last_failure[4] if last_failure else None,
+            )
+        return stats
+
+    def durations(self, browser: str, window: int = Config.HISTORY_WINDOW) -> Dict[str, float]:
+        """
+        Mean duration of recent runs per test, preferring runs on the given browser.
+
+        Args:
+            browser: Browser name
+            window: Recent results per test and browser considered
+
+        Returns:
+            Mapping node id -> seconds
+        """
+        rows = self.connection.execute(
+            "SELECT nodeid, browser = ? AS same, AVG(duration) FROM ("
+            " SELECT *, ROW_NUMBER() OVER (PARTITION BY nodeid, browser ORDER BY id DESC) AS age FROM results"
+            " WHERE outcome != 'skipped'"
+            ") WHERE age <= ? GROUP BY nodeid, same ORDER BY same", (browser, window)
+        ).fetchall()
+        # Rows for the requested browser come last and win
+        return {nodeid: duration for nodeid, _, duration in rows}
+
+    def close(self) -> None:
+        """Close the connection."""
+        self.connection.close()
+
+
+def uses_browser(item) -> bool:
+    """Whether a test starts a browser (unit tests never enter the history)."""
+    return any(name in item.fixturenames for name in BROWSER_FIXTURES)
+
+
+def failing_locator(text: str) -> Optional[str]:
+    """
+    Find the last locator mentioned in a failure message.
+
+    Returns:
+        Locator as 'strategy=value' or None
+    """
+    matches = _LOCATOR.findall(text)
+    return f"{matches[-1][0]}={matches[-1][1]}" if matches else None
+
+
+# ==================== HOOKS ====================
+
+def pytest_configure(config):
+    config.history_db = None
+
+
+def pytest_collection_modifyitems(config, items):
+    """Split lanes and order browser tests by failure likelihood (flow_path tests keep their prefix order)."""
+    if not Config.HISTORY_ENABLED or config.option.collectonly or not any(map(uses_browser, items)):
+        return
+    # Opened where tests are collected: the controller without xdist, every worker with it
+    config.history_db = HistoryDB(Config.HISTORY_DB)
+    config.history_db.start_run(os.path.basename(config.test_run_dir), Config.BROWSER, Config.TEST_LANE)
+    stats = config.history_db.stats()
+
+    if Config.TEST_LANE in ("main", "quarantine"):
+        keep_quarantined = Config.TEST_LANE == "quarantine"
+        kept, dropped = [], []
+        for item in items:
+            entry = stats.get(plain_nodeid(item.nodeid))
+            quarantined = entry is not None and entry.quarantined
+            (kept if quarantined == keep_quarantined else dropped).append(item)
+        if dropped:
+            config.hook.pytest_deselected(items=dropped)
+            items[:] = kept
+        if not hasattr(config, "workerinput"):
+            logger.info(f"Lane '{Config.TEST_LANE}': {len(kept)} tests ({len(dropped)} in the other lane)")
+
+    def likelihood(item) -> float:
+        entry = stats.get(plain_nodeid(item.nodeid))
+        return entry.likelihood if entry else PRIOR_LIKELIHOOD
+
+    positions = [i for i, item in enumerate(items)
+                 if uses_browser(item) and not item.get_closest_marker("flow_path")]
+    ordered = sorted((items[i] for i in positions), key=likelihood, reverse=True)
+    for position, item in zip(positions, ordered):
+        items[position] = item
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    db = item.config.history_db
+    if db is None or report.skipped or not uses_browser(item):
+        return
+    if not (report.when == "call" or (report.when == "setup" and report.failed)):
+        return
+
+    runner = getattr(item, "step_runner", None)
+    failed_attempts = runner.summary() if runner else []
+    failing_step = locator = error = None
+    if report.failed:
+        text = str(report.longrepr)
+        failing_step = failed_attempts[-1]["step"] if failed_attempts else None
+        locator = failing_locator(text)
+        error = text.strip().splitlines()[-1][:500] if text.strip() else None
+    try:
+        db.add_result(os.path.basename(item.config.test_run_dir), plain_nodeid(item.nodeid), report.outcome,
+                      report.when, report.duration, failing_step, locator, error, len(failed_attempts))
+    except sqlite3.Error as e:
+        logger.warning(f"Test history not written for {item.nodeid}: {e}")
+
+
+def pytest_unconfigure(config):
+    db = getattr(config, "history_db", None)
+    if db:
+        db.close()
+
+
+# ==================== CLI ====================
+
+def main(argv=None) -> int:
+    """
+    Print history reports.
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m plugins.history", description="Test history reports")
+    parser.add_argument("command", choices=["report", "quarantined"], help="Report to print")
+    parser.add_argument("--db", default=Config.HISTORY_DB, help="History database path")
+    parser.add_argument("--top", type=int, default=20, help="Number of tests in the report")
+    parser.add_argument("--window", type=int, default=Config.HISTORY_WINDOW, help="Runs per test considered")
+    args = parser.parse_args(argv)
+
+    db = HistoryDB(args.db)
+    stats = list(db.stats(args.window).values())
+    db.close()
+
+    if args.command == "quarantined":
+        for entry in sorted(s.nodeid for s in stats if s.quarantined):
+            print(entry)
+        return 0
+
+    worst = sorted(stats, key=lambda s: (s.flip_rate, s.fail_rate, s.likelihood), reverse=True)[:args.top]
+    print(f"{'RUNS':>5} {'FAIL%':>6} {'FLIP%':>6} {'P(FAIL)':>8} {'AVG(s)':>7}  Q  TEST / LAST FAILURE")
+    for entry in worst:
+        print(f"{entry.runs:>5} {entry.fail_rate:>6.0%} {entry.flip_rate:>6.0%} {entry.likelihood:>8.2f} "
+              f"{entry.mean_duration:>7.1f}  {'Q' if entry.quarantined else ' '}  {entry.nodeid}")
+        if entry.last_step or entry.last_locator:
+            print(f"{'':>40}step={entry.last_step or '-'} locator={entry.last_locator or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,546 @@
+"""
+Impact Plugin
+
+This pytest plugin records which page objects each test touches and selects
+only the tests affected by a git diff.
+
+Recording (IMPACT_MODE=record or select): while a test runs (setup, call and
+teardown), a profiler hook notes every function called in pages/ and flows/
+('pages/checkout_page.py::CheckoutPage.select_1year_plan') and every page
+object locator passed to a BasePage method ('...::PaymentComponent.
+payment_component_card_radio'). The controller merges them into the impact
+map (IMPACT_MAP, JSON). Flow checkpoints carry the symbols recorded while
+they were produced, and a test restoring one inherits them, so tests that
+start mid-flow (flow_session, checkpoint_store) still map to the earlier
+pages.
+
+Selection (IMPACT_MODE=select): 'git diff IMPACT_BASE' is mapped to changed
+symbols with the ast module (methods, locator attributes, classes; anything
+else in a file counts as the whole file) and only tests that touched one of
+them, plus new tests and edited test files, are run. The full suite runs when
+the map is stale (older than IMPACT_MAX_AGE_DAYS or recorded on a commit that
+is not an ancestor of HEAD) or when a changed file is outside what the map
+can tell (conftest, utils, config, requirements, ...).
+
+Usage:
+    IMPACT_MODE=record pytest tests/                 # full run, writes the map
+    IMPACT_MODE=select pytest tests/                 # affected tests only
+    python -m plugins.impact --base origin/main      # print the selection
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import ast
+import importlib
+import inspect
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pytest
+
+from config.settings import Config
+from utils.logger import setup_logger
+from utils.run_context import plain_nodeid
+
+logger = setup_logger(__name__)
+
+# Packages whose functions and locators are traced
+TRACED_PACKAGES = ("pages", "flows")
+
+# Changes that never affect test behaviour
+IGNORED_SUFFIXES = (".md", ".txt", ".png", ".json.example")
+IGNORED_PATHS = ("LICENSE", ".gitignore", "requests.jsonl")
+
+# Symbols touched per test in this run (node id -> symbols), filled from test reports
+_recorded: Dict[str, List[str]] = {}
+
+# Tracer recording the running test (None between tests or when impact recording is off)
+_active: Optional["ImpactTracer"] = None
+
+_HUNK = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+def _git(*args: str, root: str = ".") -> str:
+    return subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, check=True).stdout
+
+
+# ==================== RECORDING ====================
+
+def build_locator_index(root: str = ".", packages: Iterable[str] = TRACED_PACKAGES) -> Dict[Tuple, Set[str]]:
+    """
+    Map locator tuples to the page object attributes defining them.
+
+    Args:
+        root: Repository root
+        packages: Packages to scan
+
+    Returns:
+        Mapping (By.X, "value") -> {'pages/x.py::Class.attr', ...}
+    """
+    from selenium.webdriver.common.by import By
+    strategies = {value for name, value in vars(By).items() if not name.startswith("_") and isinstance(value, str)}
+
+    index: Dict[Tuple, Set[str]] = {}
+    for package in packages:
+        for directory, _, files in os.walk(os.path.join(root, package)):
+            for filename in sorted(files):
+                if not filename.endswith(".py"):
+                    continue
+                path = os.path.relpath(os.path.join(directory, filename), root).replace(os.sep, "/")
+                module = importlib.import_module(path[:-3].replace("/", "."))
+                for cls in vars(module).values():
+                    if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                        continue
+                    for attr, value in vars(cls).items():
+                        if (isinstance(value, tuple) and len(value) == 2 and value[0] in strategies
+                                and isinstance(value[1], str)):
+                            index.setdefault(value, set()).add(f"{path}::{cls.__qualname__}.{attr}")
+    return index
+
+
+class ImpactTracer:
+    """Profiler hook recording traced functions and locators used by a test."""
+
+    def __init__(self, root: str = ".", packages: Iterable[str] = TRACED_PACKAGES):
+        """
+        Initialize the tracer.
+
+        Args:
+            root: Repository root
+            packages: Packages to trace
+        """
+        self.root = os.path.abspath(root)
+        self.prefixes = tuple(os.path.join(self.root, package) + os.sep for package in packages)
+        self.locator_index = build_locator_index(root, packages)
+        self.symbols: Set[str] = set()
+        self._files: Dict[str, Optional[str]] = {}
+        self._qualnames: Dict[object, str] = {}  # Code object -> 'Class.method'
+
+    def _relative(self, filename: str) -> Optional[str]:
+        if filename not in self._files:
+            traced = filename.startswith(self.prefixes)
+            self._files[filename] = os.path.relpath(filename, self.root).replace(os.sep, "/") if traced else None
+        return self._files[filename]
+
+    def _profile(self, frame, event, arg) -> None:
+        if event != "call":
+            return
+        code = frame.f_code
+        path = self._relative(code.co_filename)
+        if path is None:
+            return
+        self.symbols.add(f"{path}::{self._qualname(frame, code)}")
+        locator = frame.f_locals.get("locator")
+        if isinstance(locator, tuple):
+            self.symbols.update(self.locator_index.get(locator, ()))
+        if code.co_name == "wait_until_ready":
+            self._record_ready_locators(frame.f_locals.get("self"))
+
+    def _qualname(self, frame, code) -> str:
+        if code not in self._qualnames:
+            # code.co_qualname only exists from Python 3.11
+            qualname = getattr(code, "co_qualname", None)
+            self._qualnames[code] = qualname or self._method_qualname(frame, code)
+        return self._qualnames[code]
+
+    @staticmethod
+    def _method_qualname(frame, code) -> str:
+        # 'Class.method' from the bound instance; inherited methods belong to the class defining them
+        if not (code.co_argcount and code.co_varnames[0] == "self" and "self" in frame.f_locals):
+            return code.co_name
+        cls = type(frame.f_locals["self"])
+        for owner in cls.__mro__:
+            attribute = vars(owner).get(code.co_name)
+            if attribute is None:
+                continue
+            function = inspect.unwrap(getattr(attribute, "__func__", attribute))
+            if getattr(function, "__code__", None) is code:
+                return f"{owner.__qualname__}.{code.co_name}"
+        return f"{cls.__qualname__}.{code.co_name}"
+
+    def _record_ready_locators(self, page) -> None:
+        # BasePage.wait_until_ready resolves the page's ready_locators by name, not through a locator argument
+        owner = next((cls for cls in type(page).__mro__ if "ready_locators" in vars(cls)), None)
+        path = self._relative(sys.modules[owner.__module__].__file__) if owner else None
+        if path is None:
+            return
+        self.symbols.add(f"{path}::{owner.__qualname__}.ready_locators")
+        for name in page.ready_locators:
+            self.symbols.update(self.locator_index.get(attrgetter(name)(page), ()))
+
+    def start(self) -> None:
+        """Start recording (resets symbols)."""
+        global _active
+        self.symbols = set()
+        _active = self
+        threading.setprofile(self._profile)
+        sys.setprofile(self._profile)
+
+    def stop(self) -> List[str]:
+        """
+        Stop recording.
+
+        Returns:
+            Sorted symbols touched since start()
+        """
+        global _active
+        sys.setprofile(None)
+        threading.setprofile(None)
+        _active = None
+        return sorted(self.symbols)
+
+
+def traced_symbols() -> List[str]:
+    """
+    Symbols the running test has touched so far (stored with flow checkpoints).
+
+    Returns:
+        Sorted symbols, empty when impact recording is off
+    """
+    tracer = _active
+    return sorted(tracer.symbols.copy()) if tracer else []
+
+
+def inherit_symbols(symbols: Iterable[str]) -> None:
+    """
+    Add symbols touched on the test's behalf, e.g. by the steps behind a restored checkpoint.
+
+    Args:
+        symbols: Symbols recorded while the checkpoint was produced
+    """
+    tracer = _active
+    if tracer:
+        tracer.symbols.update(symbols)
+
+
+# ==================== DIFF ANALYSIS ====================
+
+@dataclass
+class FileChange:
+    """Symbols changed in one file (whole_file when a change is outside any class/function)."""
+
+    path: str
+    symbols: Set[str] = field(default_factory=set)
+    whole_file: bool = False
+
+
+def changed_symbols(source: str, lines: Set[int]) -> Tuple[Set[str], bool]:
+    """
+    Map changed line numbers of a Python source to symbols.
+
+    Args:
+        source: File contents
+        lines: Changed line numbers (1-based)
+
+    Returns:
+        Tuple of (qualified names such as 'Class.method' / 'Class.locator', whole-file change)
+    """
+    source_lines = source.splitlines()
+    lines = {n for n in lines if 0 < n <= len(source_lines)
+             and source_lines[n - 1].strip() and not source_lines[n - 1].strip().startswith("#")}
+    if not lines:
+        return set(), False
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return set(), True
+
+    symbols: Set[str] = set()
+    covered: Set[int] = set()
+
+    def span(node) -> Set[int]:
+        first = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+        return set(range(first, node.end_lineno + 1))
+
+    def visit(body, prefix: str) -> None:
+        for node in body:
+            node_lines = span(node) & lines
+            if not node_lines:
+                continue
+            if isinstance(node, ast.ClassDef):
+                visit(node.body, f"{prefix}{node.name}.")
+                rest = node_lines - covered
+                if rest:
+                    symbols.add(f"{prefix}{node.name}")
+                    covered.update(rest)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                symbols.add(f"{prefix}{node.name}")
+                covered.update(node_lines)
+            elif prefix and isinstance(node, (ast.Assign, ast.AnnAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        symbols.add(f"{prefix}{target.id}")
+                covered.update(node_lines)
+            elif node is body[0] and isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+                covered.update(node_lines)  # Module/class docstring
+
+    visit(tree.body, "")
+    return symbols, bool(lines - covered)
+
+
+def diff_changes(base: str, root: str = ".") -> Dict[str, FileChange]:
+    """
+    Changes between a git ref and the working tree.
+
+    Args:
+        base: Git ref to diff against (e.g. 'origin/main')
+        root: Repository root
+
+    Returns:
+        Mapping path -> FileChange
+    """
+    old_lines: Dict[str, Set[int]] = {}
+    new_lines: Dict[str, Set[int]] = {}
+    old_path = new_path = None
+    for line in _git("diff", "--unified=0", "--no-color", base, root=root).splitlines():
+        if line.startswith("--- "):
+            old_path = None if line == "--- /dev/null" else line[6:]
+        elif line.startswith("+++ "):
+            new_path = None if line == "+++ /dev/null" else line[6:]
+            for path in (old_path, new_path):
+                if path:
+                    old_lines.setdefault(path, set())
+                    new_lines.setdefault(path, set())
+        else:
+            match = _HUNK.match(line)
+            if match:
+                a, b, c, d = (int(g) if g is not None else 1 for g in match.groups())
+                if old_path:
+                    old_lines[old_path].update(range(a, a + b))
+                if new_path:
+                    new_lines[new_path].update(range(c, c + d) if d else {c})
+
+    changes: Dict[str, FileChange] = {}
+    for path in new_lines:
+        change = FileChange(path)
+        if path.endswith(".py"):
+            sources = []
+            if old_lines[path]:
+                try:
+                    sources.append((_git("show", f"{base}:{path}", root=root), old_lines[path]))
+                except subprocess.CalledProcessError:
+                    pass  # Added file
+            if os.path.exists(os.path.join(root, path)):
+                with open(os.path.join(root, path), "r", encoding="utf-8") as f:
+                    sources.append((f.read(), new_lines[path]))
+            for source, lines in sources:
+                symbols, whole_file = changed_symbols(source, lines)
+                change.symbols |= symbols
+                change.whole_file |= whole_file
+        else:
+            change.whole_file = True
+        changes[path] = change
+    return changes
+
+
+# ==================== IMPACT MAP ====================
+
+def load_map(path: str) -> Optional[dict]:
+    """Load the impact map (None if missing or unreadable)."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def stale_reason(impact_map: Optional[dict], max_age_days: float, root: str = ".") -> Optional[str]:
+    """
+    Check whether the impact map can be trusted.
+
+    Returns:
+        Reason the map is stale, or None if it is usable
+    """
+    if not impact_map or not impact_map.get("tests"):
+        return "no impact map recorded"
+    age_days = (time.time() - impact_map.get("created", 0)) / 86400
+    if age_days > max_age_days:
+        return f"impact map is {age_days:.0f} days old"
+    commit = impact_map.get("commit")
+    if not commit:
+        return "impact map has no commit"
+    if subprocess.run(["git", "merge-base", "--is-ancestor", commit, "HEAD"], cwd=root,
+                      capture_output=True).returncode != 0:
+        return f"impact map commit {commit[:10]} is not an ancestor of HEAD"
+    return None
+
+
+def select_tests(impact_map: dict, changes: Dict[str, FileChange],
+                 nodeids: Iterable[str]) -> Tuple[Optional[Set[str]], str]:
+    """
+    Select tests affected by changes.
+
+    Args:
+        impact_map: Recorded impact map
+        changes: Changed files (diff_changes)
+        nodeids: Collected test node ids
+
+    Returns:
+        Tuple of (selected node ids or None for the full suite, explanation)
+    """
+    nodeids = list(nodeids)
+    selected: Set[str] = set()
+    changed_keys: Set[str] = set()
+    whole_files: Set[str] = set()
+
+    for path, change in changes.items():
+        if path.endswith(IGNORED_SUFFIXES) or path in IGNORED_PATHS:
+            continue
+        if path.startswith("tests/") and path.endswith(".py") and not path.endswith("conftest.py"):
+            selected.update(n for n in nodeids if n.split("::")[0] == path)
+            continue
+        if not (path.endswith(".py") and path.split("/")[0] in TRACED_PACKAGES):
+            return None, f"{path} is outside the traced page objects"
+        if change.whole_file:
+            whole_files.add(path)
+        changed_keys.update(f"{path}::{symbol}" for symbol in change.symbols)
+
+    recorded = impact_map.get("tests", {})
+    for nodeid in nodeids:
+        if nodeid not in recorded:
+            selected.add(nodeid)  # New test: impact unknown
+            continue
+        for key in recorded[nodeid]:
+            path, _, symbol = key.partition("::")
+            if path in whole_files or key in changed_keys or any(
+                    key.startswith(f"{changed}.") for changed in changed_keys):
+                selected.add(nodeid)
+                break
+
+    return selected, f"{len(changed_keys)} changed symbols, {len(whole_files)} whole files"
+
+
+def write_map(path: str, tests: Dict[str, List[str]], root: str = ".") -> None:
+    """
+    Merge recorded tests into the impact map and stamp it with HEAD.
+
+    Args:
+        path: Impact map file
+        tests: Mapping node id -> touched symbols
+        root: Repository root
+    """
+    impact_map = load_map(path) or {}
+    if stale_reason(impact_map, Config.IMPACT_MAX_AGE_DAYS, root):
+        impact_map = {}
+    recorded = impact_map.get("tests", {})
+    recorded.update(tests)
+    try:
+        commit = _git("rev-parse", "HEAD", root=root).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"created": time.time(), "commit": commit, "tests": recorded}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+# ==================== HOOKS ====================
+
+def pytest_configure(config):
+    config.impact_tracer = None
+    if Config.IMPACT_MODE in ("record", "select"):
+        config.impact_tracer = ImpactTracer(str(config.rootpath))
+
+
+def pytest_collection_modifyitems(config, items):
+    if Config.IMPACT_MODE != "select" or hasattr(config, "workerinput"):
+        return
+    root = str(config.rootpath)
+    impact_map = load_map(Config.IMPACT_MAP)
+    reason = stale_reason(impact_map, Config.IMPACT_MAX_AGE_DAYS, root)
+    if reason:
+        logger.warning(f"Impact selection off ({reason}) - running the full suite")
+        return
+    try:
+        changes = diff_changes(Config.IMPACT_BASE, root)
+    except (OSError, subprocess.CalledProcessError) as e:
+        logger.warning(f"Impact selection off (git diff {Config.IMPACT_BASE} failed: {e}) - running the full suite")
+        return
+
+    selected, explanation = select_tests(impact_map, changes, [plain_nodeid(item.nodeid) for item in items])
+    if selected is None:
+        logger.warning(f"Impact selection off ({explanation}) - running the full suite")
+        return
+    deselected = [item for item in items if plain_nodeid(item.nodeid) not in selected]
+    logger.info(f"Impact selection vs {Config.IMPACT_BASE}: {len(items) - len(deselected)}/{len(items)} tests "
+                f"({explanation})")
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if plain_nodeid(item.nodeid) in selected]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    tracer = item.config.impact_tracer
+    if tracer:
+        tracer.start()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    tracer = item.config.impact_tracer
+    if tracer and call.when == "teardown":
+        item.user_properties.append(("impact", tracer.stop()))
+    yield
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown":
+        return
+    symbols = dict(report.user_properties).get("impact")
+    if symbols is not None:
+        _recorded[plain_nodeid(report.nodeid)] = symbols
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if config.impact_tracer is None or hasattr(config, "workerinput") or not _recorded:
+        return
+    write_map(Config.IMPACT_MAP, _recorded, str(config.rootpath))
+    logger.info(f"Impact map updated with {len(_recorded)} tests: {Config.IMPACT_MAP}")
+
+
+# ==================== CLI ====================
+
+def main(argv=None) -> int:
+    """
+    Print the tests a diff affects.
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(prog="python -m plugins.impact",
+                                     description="Select tests affected by a git diff")
+    parser.add_argument("--base", default=Config.IMPACT_BASE, help="Git ref to diff against")
+    parser.add_argument("--map", default=Config.IMPACT_MAP, help="Impact map path")
+    args = parser.parse_args(argv)
+
+    impact_map = load_map(args.map)
+    reason = stale_reason(impact_map, Config.IMPACT_MAX_AGE_DAYS)
+    if reason:
+        print(f"ALL ({reason})")
+        return 0
+    changes = diff_changes(args.base)
+    selected, explanation = select_tests(impact_map, changes, impact_map["tests"])
+    if selected is None:
+        print(f"ALL ({explanation})")
+        return 0
+    for nodeid in sorted(selected):
+        print(nodeid)
+    print(f"{len(selected)}/{len(impact_map['tests'])} recorded tests affected ({explanation})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,316 @@
+"""
+LPT Scheduler Plugin
+
+This pytest plugin replaces pytest-xdist's 'load' / 'loadgroup' distribution
+with duration-aware scheduling.
+
+Work units are single tests, or whole xdist_group groups (flow_path branches
+from plugins/flow_prefix.py stay together). Units with a duration history
+(mean of recent runs on the same browser, from plugins/history.py) are planned
+longest-processing-time-first: each unit goes to the worker with the least
+planned work, and every worker runs its plan longest first. Units without
+history form a shared pool that idle workers take from; a worker that runs out
+of both steals the shortest unsent unit of the busiest worker. The makespan
+approaches total test time / workers instead of depending on where the longest
+e2e flow happens to land.
+
+When memory in use crosses WORKER_PRESSURE_THRESHOLD mid-run, one worker at a
+time is paused: it gets no new tests, so its browser is not restarted, and the
+others steal its planned units. Paused workers resume one by one once memory
+use drops below the threshold again.
+
+The terminal summary reports busy time and utilization per worker. Set
+XDIST_SCHEDULER=default to use xdist's own scheduling.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set
+
+import pytest
+
+from config.settings import Config
+from utils.logger import setup_logger
+from utils.run_context import plain_nodeid
+from utils.worker_sizing import memory_pressure
+
+logger = setup_logger(__name__)
+
+# Seconds between memory pressure checks, and the drop below the threshold needed to resume a worker
+PRESSURE_CHECK_INTERVAL = 1.0
+PRESSURE_HYSTERESIS = 0.05
+
+
+@dataclass
+class WorkUnit:
+    """Tests that must run on one worker, in collection order."""
+
+    scope: str
+    indices: List[int]
+    estimate: Optional[float] = None  # Seconds (None = no history)
+
+
+def split_scope(nodeid: str) -> str:
+    """Scheduling scope of a node id: its xdist group, or the test itself."""
+    plain = plain_nodeid(nodeid)
+    return nodeid[len(plain) + 1:] if plain != nodeid else nodeid
+
+
+def build_units(collection: List[str], durations: Dict[str, float]) -> List[WorkUnit]:
+    """
+    Group a collection into work units with duration estimates.
+
+    Tests of a group without history are estimated at the median known duration;
+    a unit is unknown only when none of its tests has history.
+
+    Args:
+        collection: Collected node ids
+        durations: Node id -> mean duration
+
+    Returns:
+        Work units in collection order
+    """
+    units: Dict[str, WorkUnit] = {}
+    for index, nodeid in enumerate(collection):
+        scope = split_scope(nodeid)
+        units.setdefault(scope, WorkUnit(scope, [])).indices.append(index)
+
+    typical = statistics.median(durations.values()) if durations else 0.0
+    for unit in units.values():
+        known = [durations[plain_nodeid(collection[i])] for i in unit.indices
+                 if plain_nodeid(collection[i]) in durations]
+        if known:
+            unit.estimate = sum(known) + typical * (len(unit.indices) - len(known))
+    return list(units.values())
+
+
+def lpt_plan(units: List[WorkUnit], workers: List[str]) -> Dict[str, List[WorkUnit]]:
+    """
+    Assign units with estimates longest-first to the least loaded worker.
+
+    Args:
+        units: Work units (units without an estimate are ignored)
+        workers: Worker ids
+
+    Returns:
+        Worker id -> units, longest first
+    """
+    plan: Dict[str, List[WorkUnit]] = {worker: [] for worker in workers}
+    load = {worker: 0.0 for worker in workers}
+    for unit in sorted((u for u in units if u.estimate is not None), key=lambda u: -u.estimate):
+        worker = min(workers, key=lambda w: (load[w], workers.index(w)))
+        plan[worker].append(unit)
+        load[worker] += unit.estimate
+    return plan
+
+
+def _load_durations() -> Dict[str, float]:
+    if not Config.HISTORY_ENABLED:
+        return {}
+    from plugins.history import HistoryDB
+    try:
+        db = HistoryDB(Config.HISTORY_DB)
+        try:
+            return db.durations(Config.BROWSER)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.warning(f"No duration history for scheduling: {e}")
+        return {}
+
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:  # pytest-xdist not installed: nothing to schedule
+    LoadScheduling = object
+
+
+class LPTScheduling(LoadScheduling):
+    """xdist scheduler: LPT plan for known tests, shared pool and stealing for the rest."""
+
+    def __init__(self, config, log=None, durations: Optional[Dict[str, float]] = None,
+                 pressure: Optional[Callable[[], float]] = None):
+        super().__init__(config, log)
+        self.durations = durations if durations is not None else _load_durations()
+        self.queues: Dict[object, List[WorkUnit]] = {}
+        self.pool: List[WorkUnit] = []
+        self.started: Optional[float] = None
+        self.busy: Dict[str, float] = {}
+        self.tests_run: Dict[str, int] = {}
+        self.finished: Dict[str, float] = {}
+        self.planned: Dict[str, float] = {}
+        self.stolen = 0
+        self.pressure = pressure or memory_pressure
+        self.paused: Set[str] = set()
+        self.pauses = 0
+        self._pressure_checked = 0.0
+
+    def _sync_pending(self) -> None:
+        # LoadScheduling.tests_finished/has_pending look at self.pending
+        self.pending = [i for units in [*self.queues.values(), self.pool] for unit in units for i in unit.indices]
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        units = build_units(self.collection, self.durations)
+        nodes = self.nodes
+        plan = lpt_plan(units, [node.gateway.id for node in nodes])
+        self.queues = {node: plan[node.gateway.id] for node in nodes}
+        self.pool = [unit for unit in units if unit.estimate is None]
+        self.planned = {node.gateway.id: sum(u.estimate for u in plan[node.gateway.id]) for node in nodes}
+        self._sync_pending()
+        logger.info(f"LPT schedule: {len(units) - len(self.pool)} units planned, {len(self.pool)} without history")
+
+        self.started = time.monotonic()
+        for node in nodes:
+            self.check_schedule(node)
+
+    def _next_unit(self, node) -> Optional[WorkUnit]:
+        if self.queues.get(node):
+            return self.queues[node].pop(0)
+        if self.pool:
+            return self.pool.pop(0)
+        victims = [n for n in self.queues if n is not node and self.queues[n]]
+        if not victims:
+            return None
+        victim = max(victims, key=lambda n: sum(u.estimate or 0.0 for u in self.queues[n]))
+        self.stolen += 1
+        return self.queues[victim].pop()
+
+    def _adjust_for_pressure(self) -> None:
+        threshold = Config.WORKER_PRESSURE_THRESHOLD
+        now = time.monotonic()
+        if threshold <= 0 or now - self._pressure_checked < PRESSURE_CHECK_INTERVAL:
+            return
+        self._pressure_checked = now
+        pressure = self.pressure()
+        active = [node for node in self.nodes if node.gateway.id not in self.paused and not node.shutting_down]
+        if pressure >= threshold and len(active) > 1:
+            node = max(active, key=lambda n: n.gateway.id)
+            self.paused.add(node.gateway.id)
+            self.pauses += 1
+            logger.warning(f"Memory {pressure:.0%} in use: pausing worker {node.gateway.id} "
+                           f"({len(active) - 1} active)")
+        elif self.paused and (pressure < threshold - PRESSURE_HYSTERESIS or not active):
+            worker = min(self.paused)
+            self.paused.discard(worker)
+            logger.info(f"Memory {pressure:.0%} in use: resuming worker {worker}")
+            for node in self.nodes:
+                if node.gateway.id == worker:
+                    self.check_schedule(node)
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        if node.shutting_down or self.collection is None:
+            return
+        # Keep two tests on the worker: it needs the next item before finishing the current one
+        while len(self.node2pending[node]) < 2 and node.gateway.id not in self.paused:
+            unit = self._next_unit(node)
+            if unit is None:
+                break
+            self.node2pending[node].extend(unit.indices)
+            node.send_runtest_some(unit.indices)
+        self._sync_pending()
+        if not self.pending:
+            node.shutdown()
+            # Paused workers get no further check_schedule call of their own
+            for other in self.nodes:
+                if other.gateway.id in self.paused and not other.shutting_down:
+                    other.shutdown()
+
+    def mark_test_complete(self, node, item_index: int, duration: float = 0) -> None:
+        worker = node.gateway.id
+        self.busy[worker] = self.busy.get(worker, 0.0) + duration
+        self.tests_run[worker] = self.tests_run.get(worker, 0) + 1
+        self.finished[worker] = time.monotonic()
+        self.node2pending[node].remove(item_index)
+        self._adjust_for_pressure()
+        self.check_schedule(node, duration)
+
+    def mark_test_pending(self, item: str) -> None:
+        self.pool.insert(0, WorkUnit(split_scope(item), [self.collection.index(item)]))
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def remove_node(self, node) -> Optional[str]:
+        pending = self.node2pending.pop(node)
+        self.paused.discard(node.gateway.id)
+        if len(self.paused) >= len(self.nodes):
+            self.paused.clear()  # Never leave the run without an active worker
+        self.pool.extend(self.queues.pop(node, []))
+        crashitem = None
+        if pending:
+            crashitem = self.collection[pending.pop(0)]
+            if pending:
+                self.pool.append(WorkUnit(f"{node.gateway.id}-remaining", pending))
+        for other in self.nodes:
+            self.check_schedule(other)
+        self._sync_pending()
+        return crashitem
+
+    def utilization(self) -> List[dict]:
+        """
+        Per-worker busy time and utilization over the makespan.
+
+        Returns:
+            List of {'worker', 'tests', 'busy', 'planned', 'utilization'}
+        """
+        if self.started is None or not self.finished:
+            return []
+        makespan = max(self.finished.values()) - self.started
+        return [
+            {
+                "worker": worker,
+                "tests": self.tests_run.get(worker, 0),
+                "busy": self.busy.get(worker, 0.0),
+                "planned": self.planned.get(worker, 0.0),
+                "utilization": self.busy.get(worker, 0.0) / makespan if makespan > 0 else 0.0,
+            }
+            for worker in sorted(set(self.planned) | set(self.busy))
+        ]
+
+
+# ==================== HOOKS ====================
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if Config.XDIST_SCHEDULER != "lpt" or config.getoption("dist", "no") not in ("load", "loadgroup"):
+        return None
+    scheduler = LPTScheduling(config, log)
+    config.lpt_scheduler = scheduler
+    return scheduler
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    scheduler = getattr(config, "lpt_scheduler", None)
+    rows = scheduler.utilization() if scheduler else []
+    if not rows:
+        return
+    makespan = max(scheduler.finished.values()) - scheduler.started
+    total = sum(row["busy"] for row in rows)
+    terminalreporter.write_sep("-", "worker utilization (LPT scheduling)")
+    for row in rows:
+        terminalreporter.write_line(
+            f"{row['worker']:>6}: {row['tests']:>4} tests, busy {row['busy']:7.1f}s "
+            f"(planned {row['planned']:7.1f}s), utilization {row['utilization']:.0%}"
+        )
+    terminalreporter.write_line(
+        f"makespan {makespan:.1f}s, ideal {total / len(rows):.1f}s (total / workers), "
+        f"{scheduler.stolen} units stolen"
+    )
+    if scheduler.pauses:
+        terminalreporter.write_line(
+            f"{scheduler.pauses} worker pauses under memory pressure "
+            f"(threshold {Config.WORKER_PRESSURE_THRESHOLD:.0%})"
+        )
@@ -0,0 +1,120 @@
+"""
+Resources Plugin
+
+This pytest plugin reports what each browser session costs the host when
+RESOURCE_MONITOR=on (see utils/resource_monitor.py): peak RSS, CPU time and
+process count of the driver process tree, per test and per flow step.
+
+- Each test's usage is added to its report (user property 'resources').
+- A session whose memory keeps growing across the tests it runs is logged and
+  flagged (user property 'resource_growth'). This only applies once sessions
+  are reused: a session that ran a single test cannot grow.
+- At the end of the run the controller writes resources_summary.json: usage per
+  test, percentiles per session and per step, and the growing sessions. Use it
+  to size PARALLEL_WORKERS.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import json
+import os
+from typing import Dict, List
+
+import pytest
+
+from config.settings import Config
+from utils.logger import setup_logger
+from utils.resource_monitor import memory_growth
+from utils.run_context import is_xdist_worker
+from utils.timing import percentile
+
+logger = setup_logger(__name__)
+
+_session_rss: Dict[str, List[float]] = {}  # Session id -> RSS (MB) after each of its tests (this process)
+_tests: Dict[str, dict] = {}               # Node id -> usage reported to this process
+
+
+def _percentiles(values: List[float]) -> dict:
+    return {f"p{pct}": round(percentile(values, pct), 2) for pct in (50, 95)} | {"max": round(max(values), 2)}
+
+
+def summarize_usage(tests: Dict[str, dict]) -> dict:
+    """
+    Per-session and per-step percentiles of test usage.
+
+    Args:
+        tests: Node id -> usage from ResourceMonitor.report()
+
+    Returns:
+        {'sessions': {metric: percentiles}, 'steps': {step: {metric: percentiles}}}
+    """
+    usages = list(tests.values())
+    if not usages:
+        return {"sessions": {}, "steps": {}}
+    metrics = ("peak_rss_mb", "cpu_s", "max_processes")
+    steps: Dict[str, List[dict]] = {}
+    for usage in usages:
+        for step, step_usage in usage["steps"].items():
+            steps.setdefault(step, []).append(step_usage)
+    return {
+        "sessions": {metric: _percentiles([u[metric] for u in usages]) for metric in metrics},
+        "steps": {step: {metric: _percentiles([u[metric] for u in group]) for metric in metrics}
+                  for step, group in steps.items()},
+    }
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+    monitor = getattr(item, "resource_monitor", None)
+    if rep.when != "call" or not monitor:
+        return
+    usage = monitor.report()
+    rep.user_properties.append(("resources", usage))
+    history = _session_rss.setdefault(monitor.session, [])
+    history.append(usage["end_rss_mb"])
+    growth = memory_growth(history, Config.RESOURCE_GROWTH_MB)
+    if growth:
+        logger.warning(f"Browser session {monitor.session} grew {growth:.0f} MB over {len(history)} tests")
+        rep.user_properties.append(("resource_growth", round(growth, 2)))
+
+
+def pytest_runtest_logreport(report):
+    properties = dict(report.user_properties)
+    if "resources" in properties:
+        _tests[report.nodeid] = {**properties["resources"], "growth_mb": properties.get("resource_growth")}
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if Config.RESOURCE_MONITOR == "off" or is_xdist_worker(config) or not _tests:
+        return
+    config.resource_summary = summarize_usage(_tests)
+    with open(os.path.join(config.test_run_dir, "resources_summary.json"), "w") as f:
+        json.dump({
+            "browser": Config.BROWSER,
+            **config.resource_summary,
+            "growing": {nodeid: usage["growth_mb"] for nodeid, usage in _tests.items() if usage["growth_mb"]},
+            "tests": _tests,
+        }, f, indent=2)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    summary = getattr(config, "resource_summary", None)
+    if not summary or not summary["sessions"]:
+        return
+    sessions = summary["sessions"]
+    terminalreporter.write_sep("-", f"browser resources ({len(_tests)} tests)")
+    terminalreporter.write_line(
+        f"per session: peak RSS p50 {sessions['peak_rss_mb']['p50']:.0f} MB, "
+        f"max {sessions['peak_rss_mb']['max']:.0f} MB; CPU p50 {sessions['cpu_s']['p50']:.1f} s; "
+        f"up to {sessions['max_processes']['max']:.0f} processes"
+    )
+    for step, usage in sorted(summary["steps"].items(), key=lambda item: -item[1]["peak_rss_mb"]["p95"]):
+        terminalreporter.write_line(f"  {step}: peak RSS p95 {usage['peak_rss_mb']['p95']:.0f} MB, "
+                                    f"CPU p95 {usage['cpu_s']['p95']:.2f} s")
+    for nodeid, usage in _tests.items():
+        if usage["growth_mb"]:
+            terminalreporter.write_line(f"GROWING {nodeid}: session {usage['session']} +{usage['growth_mb']:.0f} MB")
@@ -0,0 +1,89 @@
+"""
+WebPerf Plugin
+
+This pytest plugin reports the web performance samples that the step_runner
+fixture collects when WEB_PERF is 'warn' or 'fail' (see utils/web_perf.py).
+
+- Budget violations of a test are logged and added to its report
+  (user property 'web_perf_budget'); with WEB_PERF=fail a passing test fails.
+- At the end of the run the controller merges the per-worker time series
+  (web_perf_<worker>.jsonl) into web_perf_summary.json: p50/p75/p95 per page
+  and cache state, plus the budget violations.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import json
+import os
+
+import pytest
+
+from config.settings import Config
+from utils.logger import setup_logger
+from utils.run_context import is_xdist_worker
+from utils.web_perf import load_budgets, load_samples, summarize_samples
+
+logger = setup_logger(__name__)
+
+_violations = []  # (nodeid, message) reported to this process
+
+
+def pytest_configure(config):
+    config.web_perf_budgets = load_budgets(Config.WEB_PERF_BUDGETS) if Config.WEB_PERF != "off" else {}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    rep = outcome.get_result()
+    runner = getattr(item, "step_runner", None)
+    if rep.when != "call" or not runner or not runner.perf:
+        return
+    violations = runner.perf.violations()
+    if not violations:
+        return
+    rep.user_properties.append(("web_perf_budget", violations))
+    for message in violations:
+        logger.warning(f"Web performance budget exceeded: {message}")
+    if Config.WEB_PERF == "fail" and rep.passed:
+        rep.outcome = "failed"
+        rep.longrepr = "Web performance budgets exceeded:\n" + "\n".join(f"  {m}" for m in violations)
+
+
+def pytest_runtest_logreport(report):
+    for message in dict(report.user_properties).get("web_perf_budget", []):
+        _violations.append((report.nodeid, message))
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if Config.WEB_PERF == "off" or is_xdist_worker(config):
+        return
+    samples = load_samples(config.test_run_dir)
+    if not samples:
+        return
+    config.web_perf_summary = summarize_samples(samples)
+    with open(os.path.join(config.test_run_dir, "web_perf_summary.json"), "w") as f:
+        json.dump({
+            "samples": len(samples),
+            "budgets": config.web_perf_budgets,
+            "violations": [{"test": nodeid, "violation": message} for nodeid, message in _violations],
+            "pages": config.web_perf_summary,
+        }, f, indent=2)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    summary = getattr(config, "web_perf_summary", None)
+    if not summary:
+        return
+    terminalreporter.write_sep("-", "web performance (p75 per page)")
+    for page, states in summary.items():
+        for state, entry in states.items():
+            metrics = ", ".join(
+                f"{metric} {entry[metric]['p75']:.4g}"
+                for metric in ("ttfb_ms", "lcp_ms", "cls", "tbt_ms") if metric in entry
+            )
+            terminalreporter.write_line(f"{page} [{state}, n={entry['count']}]: {metrics}")
+    for nodeid, message in _violations:
+        terminalreporter.write_line(f"BUDGET {nodeid}: {message}")
@@ -0,0 +1 @@
+"""Replay package initialization."""
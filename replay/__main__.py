@@ -0,0 +1,58 @@
+"""
+Replay Proxy Entry Point
+
+Run the record/replay proxy standalone or inspect an archive.
+
+Usage:
+    python -m replay record --archive recordings/registration_flow.zip --port 8899
+    python -m replay replay --archive recordings/registration_flow.zip --port 8899
+    python -m replay inspect --archive recordings/registration_flow.zip
+
+Tests do not need this entry point: DriverManager starts the proxy itself when
+REPLAY_MODE is 'record' or 'replay'.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import sys
+from collections import Counter
+from urllib.parse import urlsplit
+
+from replay.archive import DEFAULT_VOLATILE_PARAMS, MatchRules, ReplayArchive
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m replay", description="HTTP record/replay proxy")
+    parser.add_argument("mode", choices=["record", "replay", "inspect"])
+    parser.add_argument("--archive", required=True, help="Archive file (.zip)")
+    parser.add_argument("--port", type=int, default=8899, help="Proxy listen port")
+    parser.add_argument("--ignore-param", action="append", default=[], metavar="REGEX",
+                        help="Extra volatile query parameter pattern ignored when matching")
+    args = parser.parse_args(argv)
+
+    rules = MatchRules(volatile_params=DEFAULT_VOLATILE_PARAMS + args.ignore_param)
+    archive = ReplayArchive(args.archive, rules).load()
+
+    if args.mode == "inspect":
+        hosts = Counter(urlsplit(key.partition(" ")[2]).netloc for key in archive.index)
+        print(f"{args.archive}: {len(archive.index)} request keys")
+        for host, count in hosts.most_common():
+            print(f"  {count:>5}  {host}")
+        return 0
+
+    from replay.proxy import ReplayProxy
+    proxy = ReplayProxy(args.mode, archive, port=args.port)
+    print(f"Replay proxy ({args.mode}) on {proxy.address} - CA certificate: {proxy.ca.ca_cert_path}", flush=True)
+    try:
+        proxy.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
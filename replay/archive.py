@@ -0,0 +1,257 @@
+"""
+ReplayArchive Module
+
+This module stores recorded HTTP exchanges in a compact, indexed archive and
+looks them up again during replay.
+
+Archive format (a single zip file):
+    index.json       Request key -> list of recorded responses (status, headers, body hash)
+    bodies/<sha1>    Response bodies, deduplicated by content hash
+
+Already-compressed bodies (gzip/br responses, images, fonts) are stored as-is;
+everything else is deflated.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import zipfile
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+# Query parameters that change on every page load (cache busters, tracking ids)
+DEFAULT_VOLATILE_PARAMS = [
+    r"^_$", r"^_\d*$", r"^t$", r"^ts$", r"^timestamp$", r"^cb$", r"^cachebust(er)?$", r"^rand(om)?$",
+    r"^nonce$", r"^utm_.*$", r"^gclid$", r"^fbclid$", r"^_ga$", r"^_gl$", r"^session_?id$", r"^guid$",
+]
+
+_COMPRESSED_TYPES = ("image/", "font/", "video/", "audio/", "application/zip", "application/wasm")
+
+
+@dataclass
+class MatchRules:
+    """Rules turning a request into a stable lookup key."""
+
+    volatile_params: List[str] = field(default_factory=lambda: list(DEFAULT_VOLATILE_PARAMS))
+    match_post_body: bool = False
+
+    def __post_init__(self):
+        self._patterns = [re.compile(p, re.IGNORECASE) for p in self.volatile_params]
+
+    def is_volatile(self, name: str) -> bool:
+        """Check if a query parameter is ignored for matching."""
+        return any(p.match(name) for p in self._patterns)
+
+    def key(self, method: str, url: str, body: bytes = b"") -> str:
+        """
+        Build the exact-match key for a request.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            body: Request body (only used when match_post_body is set)
+
+        Returns:
+            Key string: 'METHOD scheme://host/path?sorted-stable-query[#body-hash]'
+        """
+        parts = urlsplit(url)
+        query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if not self.is_volatile(k))
+        key = f"{method.upper()} {parts.scheme}://{parts.netloc.lower()}{parts.path or '/'}"
+        if query:
+            key += "?" + urlencode(query)
+        if self.match_post_body and body:
+            key += "#" + hashlib.sha1(body).hexdigest()[:12]
+        return key
+
+    @staticmethod
+    def path_key(method: str, url: str) -> str:
+        """Loose key ignoring the whole query string (fallback match)."""
+        parts = urlsplit(url)
+        return f"{method.upper()} {parts.scheme}://{parts.netloc.lower()}{parts.path or '/'}"
+
+
+@dataclass
+class RecordedResponse:
+    """A recorded HTTP response."""
+
+    status: int
+    reason: str
+    headers: List[Tuple[str, str]]
+    body: bytes
+
+
+class ReplayArchive:
+    """
+    Indexed archive of recorded HTTP responses.
+
+    Repeated requests for the same key are recorded in order and replayed in the
+    same order (the last response repeats), which keeps polling APIs deterministic.
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, path: str, rules: Optional[MatchRules] = None):
+        """
+        Initialize the archive (no I/O until load() or save()).
+
+        Args:
+            path: Archive file path
+            rules: Request matching rules
+        """
+        self.path = path
+        self.rules = rules or MatchRules()
+        self.index: Dict[str, List[dict]] = {}
+        self._bodies: Dict[str, bytes] = {}
+        self._path_index: Dict[str, str] = {}
+        self._cursors: Dict[str, int] = {}
+        self._recorded_keys = set()
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.fuzzy_hits: List[str] = []
+        self.misses: List[str] = []
+
+    # ==================== LOADING / SAVING ====================
+
+    def load(self) -> "ReplayArchive":
+        """
+        Open an existing archive; bodies are read lazily and cached.
+
+        Returns:
+            self
+        """
+        if os.path.exists(self.path):
+            self._zip = zipfile.ZipFile(self.path, "r")
+            self.index = json.loads(self._zip.read(self.INDEX_NAME))
+            self._path_index = {}
+            for key in self.index:
+                method, _, url = key.partition(" ")
+                self._path_index.setdefault(MatchRules.path_key(method, url), key)
+        return self
+
+    def save(self) -> None:
+        """Write the archive (bodies already present in an older archive are carried over)."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            entries = [entry for recorded in self.index.values() for entry in recorded]
+            hashes = {entry["body"] for entry in entries}
+            compressed = {entry["body"] for entry in entries if self._is_compressed(entry["headers"])}
+            # Unique per process and thread: two saves to the same archive never share a temp file
+            tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with zipfile.ZipFile(tmp_path, "w") as out:
+                out.writestr(self.INDEX_NAME, json.dumps(self.index, indent=1, sort_keys=True),
+                             compress_type=zipfile.ZIP_DEFLATED)
+                for digest in sorted(hashes):
+                    body = self._bodies.get(digest)
+                    if body is None:
+                        body = self._zip.read(f"bodies/{digest}")
+                    out.writestr(f"bodies/{digest}", body,
+                                 compress_type=zipfile.ZIP_STORED if digest in compressed else zipfile.ZIP_DEFLATED)
+            if self._zip:
+                self._zip.close()
+                self._zip = None
+            os.replace(tmp_path, self.path)
+
+    def close(self) -> None:
+        """Close the underlying zip file."""
+        if self._zip:
+            self._zip.close()
+            self._zip = None
+
+    @staticmethod
+    def _is_compressed(headers: List[List[str]]) -> bool:
+        for name, value in headers:
+            lname = name.lower()
+            if lname == "content-encoding" and value.lower() not in ("", "identity"):
+                return True
+            if lname == "content-type" and value.lower().startswith(_COMPRESSED_TYPES):
+                return True
+        return False
+
+    # ==================== RECORD / LOOKUP ====================
+
+    def add(self, method: str, url: str, response: RecordedResponse, request_body: bytes = b"") -> None:
+        """
+        Record a response (repeated requests for the same key keep their order).
+
+        Args:
+            method: Request method
+            url: Absolute request URL
+            response: Response to store
+            request_body: Request body (used for the key when match_post_body is set)
+        """
+        digest = hashlib.sha1(response.body).hexdigest()
+        key = self.rules.key(method, url, request_body)
+        with self._lock:
+            self._bodies.setdefault(digest, response.body)
+            # Re-recording a key replaces what an older recording stored for it
+            if key not in self._recorded_keys:
+                self._recorded_keys.add(key)
+                self.index[key] = []
+            self.index[key].append({
+                "status": response.status,
+                "reason": response.reason,
+                "headers": [list(h) for h in response.headers],
+                "body": digest,
+            })
+
+    def lookup(self, method: str, url: str, request_body: bytes = b"") -> Optional[RecordedResponse]:
+        """
+        Find the recorded response for a request.
+
+        Tries the exact key first, then falls back to the same path with any query.
+        Fallback matches and misses are tracked for the miss report.
+
+        Args:
+            method: Request method
+            url: Absolute request URL
+            request_body: Request body
+
+        Returns:
+            Recorded response, or None on a miss
+        """
+        key = self.rules.key(method, url, request_body)
+        with self._lock:
+            entries = self.index.get(key)
+            if entries is None:
+                fallback = self._path_index.get(MatchRules.path_key(method, url))
+                if fallback is None:
+                    self.misses.append(f"{method.upper()} {url}")
+                    return None
+                self.fuzzy_hits.append(f"{method.upper()} {url} -> {fallback}")
+                key, entries = fallback, self.index[fallback]
+            else:
+                self.hits += 1
+
+            cursor = self._cursors.get(key, 0)
+            entry = entries[min(cursor, len(entries) - 1)]
+            self._cursors[key] = cursor + 1
+
+            body = self._bodies.get(entry["body"])
+            if body is None:
+                body = self._zip.read(f"bodies/{entry['body']}")
+                self._bodies[entry["body"]] = body
+
+        return RecordedResponse(entry["status"], entry["reason"], [tuple(h) for h in entry["headers"]], body)
+
+    def report(self) -> dict:
+        """
+        Summarize replay matching.
+
+        Returns:
+            Dictionary with hit/fuzzy/miss counts and the unmatched requests
+        """
+        return {
+            "archive": self.path,
+            "entries": len(self.index),
+            "hits": self.hits,
+            "fuzzy_hits": self.fuzzy_hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,146 @@
+"""
+Certificates Module
+
+This module creates the local certificate authority and per-host leaf
+certificates the record/replay proxy uses to terminate HTTPS traffic.
+
+Browsers launched by DriverManager accept these certificates because the
+proxy is only enabled together with insecure-certificate acceptance.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import datetime
+import ipaddress
+import os
+import ssl
+import threading
+from typing import Dict
+
+from utils.file_lock import locked_file
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    # Other processes read the file without the lock: they see the old or the complete new one
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class CertificateAuthority:
+    """Local CA issuing leaf certificates on demand (cached on disk and in memory)."""
+
+    def __init__(self, directory: str = os.path.join(".replay", "certs")):
+        """
+        Initialize the CA, creating its key and certificate on first use.
+
+        Args:
+            directory: Directory for the CA and issued certificates
+        """
+        try:
+            from cryptography import x509  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "HTTPS record/replay requires the 'cryptography' package: pip install cryptography"
+            ) from e
+
+        self.directory = directory
+        self.ca_cert_path = os.path.join(directory, "ca.pem")
+        self.ca_key_path = os.path.join(directory, "ca-key.pem")
+        self._contexts: Dict[str, ssl.SSLContext] = {}
+        self._lock = threading.Lock()
+        self._file_lock = os.path.join(directory, "ca.lock")
+        os.makedirs(directory, exist_ok=True)
+        # Concurrent workers must not each create a CA (one would sign with a key the other overwrote)
+        with locked_file(self._file_lock):
+            self._load_or_create_ca()
+
+    def _load_or_create_ca(self) -> None:
+        from cryptography import x509
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
+        from cryptography.x509.oid import NameOID
+
+        if os.path.exists(self.ca_cert_path) and os.path.exists(self.ca_key_path):
+            with open(self.ca_key_path, "rb") as f:
+                self._ca_key = serialization.load_pem_private_key(f.read(), password=None)
+            with open(self.ca_cert_path, "rb") as f:
+                self._ca_cert = x509.load_pem_x509_certificate(f.read())
+            return
+
+        self._ca_key = ec.generate_private_key(ec.SECP256R1())
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "Dutch Automation Replay CA")])
+        now = datetime.datetime.now(datetime.timezone.utc)
+        self._ca_cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(self._ca_key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=3650))
+            .add_extension(x509.BasicConstraints(ca=True, path_length=0), critical=True)
+            .sign(self._ca_key, hashes.SHA256())
+        )
+        _write_atomic(self.ca_key_path, self._ca_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ))
+        _write_atomic(self.ca_cert_path, self._ca_cert.public_bytes(serialization.Encoding.PEM))
+
+    def context_for(self, host: str) -> ssl.SSLContext:
+        """
+        Get a server-side SSL context presenting a certificate for host.
+
+        Args:
+            host: Hostname (or IP address) the browser connected to
+
+        Returns:
+            SSLContext limited to HTTP/1.1 via ALPN
+        """
+        with self._lock:
+            if host not in self._contexts:
+                cert_path = self._issue(host)
+                context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+                context.load_cert_chain(cert_path)
+                context.set_alpn_protocols(["http/1.1"])
+                self._contexts[host] = context
+            return self._contexts[host]
+
+    def _issue(self, host: str) -> str:
+        from cryptography import x509
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
+        from cryptography.x509.oid import NameOID
+
+        safe_name = host.replace("*", "_wildcard").replace(":", "_")
+        path = os.path.join(self.directory, f"{safe_name}.pem")
+        if os.path.exists(path):
+            return path
+
+        key = ec.generate_private_key(ec.SECP256R1())
+        try:
+            alt_name = x509.IPAddress(ipaddress.ip_address(host))
+        except ValueError:
+            alt_name = x509.DNSName(host)
+        now = datetime.datetime.now(datetime.timezone.utc)
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, host[:64])]))
+            .issuer_name(self._ca_cert.subject)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=365))
+            .add_extension(x509.SubjectAlternativeName([alt_name]), critical=False)
+            .sign(self._ca_key, hashes.SHA256())
+        )
+        _write_atomic(path, key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        ) + cert.public_bytes(serialization.Encoding.PEM))
+        return path
@@ -0,0 +1,269 @@
+"""
+ReplayProxy Module
+
+This module contains the record/replay HTTP(S) proxy.
+
+Record mode forwards every request upstream and stores the response in a
+ReplayArchive. Replay mode answers from the archive only (never touching the
+network) and returns 404 for requests that were not recorded, collecting them
+for the miss report. HTTPS is terminated with certificates issued by the local
+CertificateAuthority.
+
+One proxy serves every browser session of a run, so the archive is written
+and the miss report covers the whole run exactly once: acquire_proxy starts
+it for the first session of a process and release_proxy stops it after the
+last one. Under pytest-xdist the controller starts it and publishes its
+address in REPLAY_PROXY; workers' sessions only connect to it.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import http.client
+import json
+import logging
+import os
+import socketserver
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+from replay.archive import RecordedResponse, ReplayArchive
+from replay.certs import CertificateAuthority
+
+MODES = ("record", "replay")
+
+# host:port of a proxy started by another process (the pytest controller) for the whole run
+PROXY_ENV = "REPLAY_PROXY"
+
+HOP_BY_HOP_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "proxy-connection",
+    "te", "trailers", "transfer-encoding", "upgrade",
+}
+
+
+class ProxyHandler(BaseHTTPRequestHandler):
+    """Handles plain HTTP proxy requests and requests inside CONNECT tunnels."""
+
+    protocol_version = "HTTP/1.1"
+    tunnel_netloc: Optional[str] = None  # Set once a CONNECT tunnel is established
+
+    def log_message(self, format, *args):
+        self.server.logger.debug(format % args)
+
+    def do_CONNECT(self):
+        """Terminate TLS for the tunneled host and keep serving requests on the connection."""
+        host, _, port = self.path.partition(":")
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+
+        try:
+            tls = self.server.ca.context_for(host).wrap_socket(self.connection, server_side=True)
+        except (ssl.SSLError, OSError) as e:
+            self.server.logger.debug(f"TLS handshake with browser failed for {host}: {e}")
+            self.close_connection = True
+            return
+
+        self.connection = tls
+        self.rfile = tls.makefile("rb", self.rbufsize)
+        self.wfile = socketserver._SocketWriter(tls)
+        self.tunnel_netloc = host if port in ("", "443") else f"{host}:{port}"
+        self.close_connection = False
+
+    def _handle(self):
+        url = self.path if self.tunnel_netloc is None else f"https://{self.tunnel_netloc}{self.path}"
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        if self.server.mode == "replay":
+            response = self.server.archive.lookup(self.command, url, body)
+            if response is None:
+                self.server.logger.debug(f"Replay miss: {self.command} {url}")
+                response = RecordedResponse(404, "Not Recorded", [("X-Replay-Miss", "1")], b"")
+        else:
+            try:
+                response = self.server.fetch_upstream(self.command, url, self.headers, body)
+            except (OSError, http.client.HTTPException) as e:
+                self.server.logger.warning(f"Upstream request failed: {self.command} {url}: {e}")
+                response = RecordedResponse(502, "Bad Gateway", [], b"")
+            else:
+                self.server.archive.add(self.command, url, response, body)
+
+        self.send_response(response.status, response.reason)
+        for name, value in response.headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(response.body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = _handle
+
+
+class ReplayProxy(ThreadingHTTPServer):
+    """Record/replay proxy server bound to localhost."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, mode: str, archive: ReplayArchive, port: int = 0,
+                 ca: Optional[CertificateAuthority] = None, upstream_timeout: float = 30):
+        """
+        Initialize the proxy.
+
+        Args:
+            mode: 'record' or 'replay'
+            archive: Archive to record into or replay from
+            port: Listen port (0 picks a free port)
+            ca: Certificate authority for HTTPS interception
+            upstream_timeout: Timeout for upstream requests in record mode
+
+        Raises:
+            ValueError: If mode is not 'record' or 'replay'
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unsupported replay mode: {mode}. Supported modes: {', '.join(MODES)}")
+        super().__init__(("127.0.0.1", port), ProxyHandler)
+        self.mode = mode
+        self.archive = archive
+        self.ca = ca or CertificateAuthority()
+        self.upstream_timeout = upstream_timeout
+        self.logger = logging.getLogger(__name__)
+        self._local = threading.local()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> str:
+        """host:port for browser proxy settings."""
+        return f"{self.server_address[0]}:{self.server_address[1]}"
+
+    def fetch_upstream(self, method: str, url: str, headers, body: bytes) -> RecordedResponse:
+        """
+        Forward a request upstream, reusing one keep-alive connection per host and thread.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            headers: Request headers from the browser
+            body: Request body
+
+        Returns:
+            Response with hop-by-hop headers removed (body left content-encoded)
+        """
+        parts = urlsplit(url)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        request_headers = {k: v for k, v in headers.items() if k.lower() not in HOP_BY_HOP_HEADERS}
+
+        for attempt in range(2):
+            conn = self._connection(parts.scheme, parts.netloc, fresh=attempt > 0)
+            try:
+                conn.request(method, path, body=body or None, headers=request_headers)
+                upstream = conn.getresponse()
+                data = upstream.read()
+                break
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                if attempt:
+                    raise
+
+        response_headers = [
+            (k, v) for k, v in upstream.getheaders()
+            if k.lower() not in HOP_BY_HOP_HEADERS and k.lower() != "content-length"
+        ]
+        return RecordedResponse(upstream.status, upstream.reason, response_headers, data)
+
+    def _connection(self, scheme: str, netloc: str, fresh: bool = False) -> http.client.HTTPConnection:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        key = (scheme, netloc)
+        if fresh or key not in connections:
+            if scheme == "https":
+                connections[key] = http.client.HTTPSConnection(netloc, timeout=self.upstream_timeout)
+            else:
+                connections[key] = http.client.HTTPConnection(netloc, timeout=self.upstream_timeout)
+        return connections[key]
+
+    def start(self) -> "ReplayProxy":
+        """Serve on a daemon thread and return self."""
+        self._thread = threading.Thread(target=self.serve_forever, name=f"replay-proxy-{self.mode}", daemon=True)
+        self._thread.start()
+        self.logger.info(f"Replay proxy ({self.mode}) listening on {self.address} - archive {self.archive.path}")
+        return self
+
+    def stop(self) -> dict:
+        """
+        Stop serving, then save the archive (record) or write the miss report (replay).
+
+        Returns:
+            Replay report dictionary
+        """
+        self.shutdown()
+        self.server_close()
+        report = self.archive.report()
+        if self.mode == "record":
+            self.archive.save()
+            self.logger.info(f"Recorded {len(self.archive.index)} request keys to {self.archive.path}")
+        else:
+            report_path = f"{self.archive.path}.report.json"
+            tmp_path = f"{report_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(report, f, indent=2)
+            os.replace(tmp_path, report_path)
+            if report["misses"]:
+                self.logger.warning(f"Replay missed {len(report['misses'])} request(s) - see {report_path}")
+            self.archive.close()
+        return report
+
+
+_shared: Optional[ReplayProxy] = None
+_shared_users = 0
+_shared_lock = threading.Lock()
+
+
+def acquire_proxy(mode: str, archive_path: str) -> Tuple[str, int]:
+    """
+    Address of the proxy for a new browser session.
+
+    Uses the run's proxy when REPLAY_PROXY is set; otherwise starts one proxy
+    per process on first use, shared by every session of the process.
+
+    Args:
+        mode: 'record' or 'replay'
+        archive_path: Archive file to record into or replay from
+
+    Returns:
+        (host, port)
+    """
+    global _shared, _shared_users
+    external = os.environ.get(PROXY_ENV)
+    if external:
+        host, _, port = external.rpartition(":")
+        return host, int(port)
+    with _shared_lock:
+        if _shared is None:
+            _shared = ReplayProxy(mode, ReplayArchive(archive_path).load()).start()
+        _shared_users += 1
+        return _shared.server_address[0], _shared.server_address[1]
+
+
+def release_proxy() -> Optional[dict]:
+    """
+    End a session's use of the process proxy; the last one stops it (saves the archive or writes the report).
+
+    Returns:
+        Replay report when the proxy was stopped, else None
+    """
+    global _shared, _shared_users
+    if os.environ.get(PROXY_ENV):
+        return None
+    with _shared_lock:
+        if _shared is None:
+            return None
+        _shared_users -= 1
+        if _shared_users > 0:
+            return None
+        proxy, _shared = _shared, None
+    return proxy.stop()
@@ -0,0 +1,172 @@
+"""
+AsyncSessions Module
+
+This module drives many browser sessions from one asyncio event loop using the
+async page objects (home page → pet info → issues). It is meant for synthetic
+load and monitoring of the top of the registration funnel; no account is created.
+
+Usage:
+    python -m runners.async_sessions --sessions 30 --concurrency 30 --stand-in
+    python -m runners.async_sessions --sessions 5 --browser firefox
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from config.settings import Config
+from pages.async_base_page import AsyncBasePage
+from pages.async_issues_page import AsyncIssuesPage
+from pages.async_pet_info_page import AsyncPetInfoPage
+from pages.home_page import HomePage
+from utils.async_webdriver import AsyncSessionFactory
+from utils.driver_manager import DriverManager
+from utils.enums import PetType, PetName, USState
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class AsyncSessionResult:
+    """Outcome of one async session."""
+
+    index: int
+    passed: bool
+    duration: float
+    error: Optional[str] = None
+
+
+async def run_funnel(factory: AsyncSessionFactory, config, data: dict, index: int) -> AsyncSessionResult:
+    """
+    Run home page → pet info → issues in a new session.
+
+    Args:
+        factory: Session factory
+        config: Config class
+        data: Test data dictionary
+        index: Session number
+
+    Returns:
+        AsyncSessionResult
+    """
+    start = time.perf_counter()
+    driver = None
+    try:
+        driver = await factory.new_session(page_load_timeout=config.PAGE_LOAD_TIMEOUT)
+        home_page = AsyncBasePage(driver, config)
+        await home_page.navigate_to(config.BASE_URL)
+        await home_page.click_element(HomePage.home_page_primary_cta_button)
+
+        pet_info_page = AsyncPetInfoPage(driver, config)
+        pet_data = data['pet_info']
+        assert await pet_info_page.verify_pet_info_page_loaded(), "Pet info page did not load"
+        await pet_info_page.fill_pet_info_form(
+            PetType[pet_data['pet_type'].upper()],
+            PetName[pet_data['pet_name']].value,
+            USState[pet_data['state']]
+        )
+        await pet_info_page.click_continue()
+
+        issues_page = AsyncIssuesPage(driver, config)
+        assert await issues_page.verify_issues_page_loaded(), "Issues page did not load"
+        await issues_page.select_multiple_issues(data['issues'])
+    except Exception as e:
+        logger.error(f"Async session {index} failed: {type(e).__name__}: {e}")
+        return AsyncSessionResult(index, False, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+    finally:
+        if driver:
+            await driver.quit()
+    return AsyncSessionResult(index, True, time.perf_counter() - start)
+
+
+async def run_sessions(config, sessions: int, concurrency: int, test_data_path: str) -> List[AsyncSessionResult]:
+    """
+    Run sessions with at most `concurrency` browsers open at once.
+
+    Args:
+        config: Config class
+        sessions: Total sessions
+        concurrency: Maximum concurrent sessions
+        test_data_path: Test data JSON path
+
+    Returns:
+        Results ordered by session index
+    """
+    with open(test_data_path, 'r') as f:
+        data = json.load(f)
+
+    factory = AsyncSessionFactory(DriverManager(
+        browser=config.BROWSER,
+        headless=config.HEADLESS,
+        replay_mode=config.REPLAY_MODE,
+        replay_archive=config.REPLAY_ARCHIVE,
+        page_load_strategy=config.PAGE_LOAD_STRATEGY
+    ))
+    limit = asyncio.Semaphore(concurrency)
+
+    async def limited(index: int) -> AsyncSessionResult:
+        async with limit:
+            return await run_funnel(factory, config, data, index)
+
+    try:
+        return await asyncio.gather(*(limited(i) for i in range(1, sessions + 1)))
+    finally:
+        await factory.close()
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point.
+
+    Returns:
+        Process exit code (0 = all sessions passed)
+    """
+    parser = argparse.ArgumentParser(prog="python -m runners.async_sessions",
+                                     description="Drive many browser sessions from one event loop")
+    parser.add_argument("--sessions", type=int, default=10, help="Total number of sessions")
+    parser.add_argument("--concurrency", type=int, default=10, help="Maximum concurrent sessions")
+    parser.add_argument("--stand-in", action="store_true", help="Run against the local stand-in site")
+    parser.add_argument("--browser", default=Config.BROWSER, help="chrome, firefox, edge")
+    parser.add_argument("--headed", action="store_true", help="Run with visible browsers")
+    parser.add_argument("--test-data", default=Config.TEST_DATA_PATH, help="Test data JSON path")
+    args = parser.parse_args(argv)
+
+    stand_in_server = None
+    base_url = Config.BASE_URL
+    if args.stand_in:
+        from stand_in.server import ensure_running
+        stand_in_server = ensure_running(Config.STAND_IN_URL)
+        base_url = Config.STAND_IN_URL
+
+    config = type("AsyncRunConfig", (Config,), {
+        "BASE_URL": base_url,
+        "BROWSER": args.browser,
+        "HEADLESS": not args.headed,
+    })
+    start = time.perf_counter()
+    try:
+        results = asyncio.run(run_sessions(config, args.sessions, args.concurrency, args.test_data))
+    finally:
+        if stand_in_server:
+            stand_in_server.shutdown()
+            stand_in_server.server_close()
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if not r.passed]
+    for result in failed:
+        print(f"FAILED session {result.index}: {result.error}")
+    print(f"{len(results) - len(failed)}/{len(results)} sessions passed "
+          f"(concurrency {args.concurrency}) in {elapsed:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,379 @@
+"""
+LoadRunner Module
+
+This module load-tests a site (staging or the local stand-in) with browser
+sessions replaying the registration flow page objects (HomePage →
+OrderSummaryPage by default).
+
+Virtual users (VUs) are spread over a process pool, so browser drivers and the
+Python work driving them scale across cores; inside a process every VU is a
+thread with its own browser. VUs start evenly over the ramp-up period, then
+repeat the flow until the duration ends. Each iteration clears cookies and
+storage and gets a new user from DataFactory, so it starts as a new visitor
+with an email unique across processes; a failed iteration restarts the VU's
+browser. A browser that fails to start counts as a failed iteration and the VU
+backs off before retrying. Screenshots are off, and REPLAY_MODE is rejected:
+a load run must reach the site under load. On Linux the RSS of each browser process tree is
+read after every iteration, and sessions whose memory keeps growing are listed.
+
+The report (printed and written to reports/load_run_<timestamp>/load_report.json)
+covers throughput, per-step latency percentiles and error rates per step.
+
+Usage:
+    python -m runners.load --concurrency 8 --ramp-up 30 --duration 120 --stand-in
+    python -m runners.load --concurrency 20 --processes 4 --steps home,cta,pet_info,issues
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+from config.settings import Config
+from flows.registration_flow import FlowContext, REGISTRATION_FLOW, get_step, load_test_data
+from utils.data_factory import DataFactory
+from utils.logger import setup_logger
+from utils.resource_monitor import memory_growth
+from utils.run_context import new_run_timestamp
+from utils.timing import percentile
+
+logger = setup_logger(__name__)
+
+CLEAR_STORAGE_SCRIPT = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+# failed_step of iterations whose browser did not start
+BROWSER_START_STEP = "browser_start"
+
+# Seconds a VU waits after a failed browser start (doubling per consecutive failure, capped)
+BROWSER_START_BACKOFF = 1.0
+BROWSER_START_BACKOFF_MAX = 30.0
+
+
+@dataclass
+class LoadSettings:
+    """Settings shared by every load process (must be picklable)."""
+
+    base_url: str
+    browser: str
+    headless: bool
+    steps: List[str]
+    concurrency: int
+    ramp_up: float
+    duration: float
+    start_at: float  # Epoch seconds when VU 0 starts (same clock in every process)
+    test_data_path: str = Config.TEST_DATA_PATH
+
+
+@dataclass
+class Iteration:
+    """One flow run of one virtual user."""
+
+    vu: int
+    started: float
+    duration: float
+    passed: bool
+    steps: Dict[str, float] = field(default_factory=dict)  # Step -> seconds (attempted steps)
+    failed_step: Optional[str] = None
+    error: Optional[str] = None
+    session: str = ""                 # Browser session (a VU restarts its browser after a failure)
+    rss_mb: Optional[float] = None    # Browser process tree RSS after the iteration (Linux only)
+
+
+def ramp_offsets(concurrency: int, ramp_up: float) -> List[float]:
+    """
+    Start offsets of the VUs, evenly spread over the ramp-up.
+
+    Args:
+        concurrency: Number of virtual users
+        ramp_up: Seconds until the last VU starts
+
+    Returns:
+        Offset in seconds per VU
+    """
+    if concurrency <= 1:
+        return [0.0] * concurrency
+    return [ramp_up * vu / (concurrency - 1) for vu in range(concurrency)]
+
+
+def split_vus(concurrency: int, processes: int) -> List[List[int]]:
+    """
+    Deal VUs round-robin over processes, so every process ramps up at the same pace.
+
+    Args:
+        concurrency: Number of virtual users
+        processes: Number of processes
+
+    Returns:
+        VU indexes per process (empty processes dropped)
+    """
+    shares = [list(range(p, concurrency, processes)) for p in range(max(1, processes))]
+    return [share for share in shares if share]
+
+
+def _load_config(settings: LoadSettings):
+    return type("LoadRunConfig", (Config,), {
+        "BASE_URL": settings.base_url,
+        "BROWSER": settings.browser,
+        "HEADLESS": settings.headless,
+        "ENABLE_SCREENSHOTS": False,
+    })
+
+
+def _start_browser(config):
+    """Start a VU's browser (never through the replay proxy); cleans up if the start fails."""
+    from utils.driver_manager import DriverManager
+
+    driver_manager = DriverManager(
+        browser=config.BROWSER,
+        headless=config.HEADLESS,
+        replay_mode="off",
+        page_load_strategy=config.PAGE_LOAD_STRATEGY
+    )
+    try:
+        driver_manager.get_driver().set_page_load_timeout(config.PAGE_LOAD_TIMEOUT)
+    except Exception:
+        driver_manager.quit_driver()
+        raise
+    return driver_manager
+
+
+def _error(e: Exception) -> str:
+    return f"{type(e).__name__}: {str(e).strip()[:200]}"
+
+
+def _run_vu(vu: int, settings: LoadSettings) -> List[Iteration]:
+    """Run one VU: wait for its ramp-up slot, then repeat the flow until the duration ends."""
+    from selenium.common.exceptions import WebDriverException
+    from utils import resource_monitor
+
+    config = _load_config(settings)
+    steps = [get_step(name) for name in settings.steps]
+    base_data = load_test_data(settings.test_data_path, unique_email=False)
+    factory = DataFactory.for_test_data(base_data)
+    start = settings.start_at + ramp_offsets(settings.concurrency, settings.ramp_up)[vu]
+    end = settings.start_at + settings.ramp_up + settings.duration
+    time.sleep(max(0.0, start - time.time()))
+
+    iterations: List[Iteration] = []
+    driver_manager = None
+    start_failures = 0
+    try:
+        while time.time() < end:
+            if driver_manager is None:
+                try:
+                    driver_manager = _start_browser(config)
+                    start_failures = 0
+                except Exception as e:
+                    start_failures += 1
+                    iterations.append(Iteration(vu, time.time(), 0.0, False, failed_step=BROWSER_START_STEP,
+                                                error=_error(e)))
+                    logger.debug(traceback.format_exc())
+                    backoff = min(BROWSER_START_BACKOFF * 2 ** (start_failures - 1), BROWSER_START_BACKOFF_MAX)
+                    time.sleep(max(0.0, min(backoff, end - time.time())))
+                    continue
+            driver = driver_manager.driver
+            ctx = FlowContext(driver=driver, config=config, data=factory.test_data(base_data))
+            iteration = Iteration(vu, time.time(), 0.0, True, session=driver.session_id)
+            began = time.perf_counter()
+            for step in steps:
+                step_start = time.perf_counter()
+                try:
+                    step.action(ctx)
+                except Exception as e:
+                    iteration.passed = False
+                    iteration.failed_step = step.name
+                    iteration.error = _error(e)
+                    logger.debug(traceback.format_exc())
+                    break
+                finally:
+                    iteration.steps[step.name] = time.perf_counter() - step_start
+            iteration.duration = time.perf_counter() - began
+            root_pid = resource_monitor.driver_root_pid(driver)
+            if resource_monitor.available() and root_pid:
+                iteration.rss_mb = round(resource_monitor.tree_rss_mb(root_pid), 2)
+            iterations.append(iteration)
+
+            restart = not iteration.passed  # The failure may have left the browser unusable
+            if not restart:
+                try:
+                    driver.delete_all_cookies()
+                    driver.execute_script(CLEAR_STORAGE_SCRIPT)
+                except WebDriverException:
+                    restart = True
+            if restart:
+                driver_manager.quit_driver()
+                driver_manager = None
+    finally:
+        if driver_manager:
+            driver_manager.quit_driver()
+    return iterations
+
+
+def run_process(vus: List[int], settings: LoadSettings) -> List[dict]:
+    """
+    Run a process's share of VUs, one thread (and browser) each.
+
+    Args:
+        vus: VU indexes for this process
+        settings: Load settings
+
+    Returns:
+        Iterations as dictionaries (picklable)
+    """
+    with ThreadPoolExecutor(max_workers=len(vus), thread_name_prefix="vu") as pool:
+        results = pool.map(lambda vu: _run_vu(vu, settings), vus)
+        return [asdict(iteration) for iterations in results for iteration in iterations]
+
+
+def summarize(iterations: List[dict], steps: List[str], window: float,
+              growth_mb: float = Config.RESOURCE_GROWTH_MB) -> dict:
+    """
+    Aggregate iterations into throughput, latency percentiles and error rates.
+
+    Browser sessions whose memory keeps growing over their iterations are
+    listed under 'growing' (session -> MB).
+
+    Args:
+        iterations: Iterations from run_process
+        steps: Step names in flow order
+        window: Seconds of load (ramp-up + duration) throughput is measured over
+        growth_mb: RSS rise over a session's iterations flagged as growth
+
+    Returns:
+        Report dictionary
+    """
+    passed = [it for it in iterations if it["passed"]]
+    report = {
+        "iterations": len(iterations),
+        "passed": len(passed),
+        "error_rate": round(1 - len(passed) / len(iterations), 4) if iterations else 0.0,
+        "throughput_per_min": round(len(passed) / window * 60, 2) if window > 0 else 0.0,
+        "flow": {},
+        "steps": {},
+        "errors": dict(Counter(f"{it['failed_step']}: {it['error'].split(':')[0]}"
+                               for it in iterations if it["error"]).most_common()),
+    }
+    for name, durations in [("flow", [it["duration"] for it in passed])] + [
+            (step, [it["steps"][step] for it in iterations if step in it["steps"]]) for step in steps]:
+        stats = {"count": len(durations)}
+        stats.update({f"p{pct}": round(percentile(durations, pct), 3) for pct in (50, 90, 95, 99)})
+        if name == "flow":
+            report["flow"] = stats
+            continue
+        failures = sum(1 for it in iterations if it["failed_step"] == name)
+        stats["error_rate"] = round(failures / len(durations), 4) if durations else 0.0
+        report["steps"][name] = stats
+
+    sessions: Dict[str, List[float]] = {}
+    for it in iterations:
+        if it.get("rss_mb") is not None:
+            sessions.setdefault(it["session"], []).append(it["rss_mb"])
+    report["growing"] = {}
+    for session, values in sessions.items():
+        growth = memory_growth(values, growth_mb)
+        if growth:
+            report["growing"][session] = round(growth, 2)
+    return report
+
+
+def run_load(settings: LoadSettings, processes: int) -> List[dict]:
+    """
+    Run the load test on a process pool.
+
+    Args:
+        settings: Load settings (start_at is filled in here)
+        processes: Number of processes
+
+    Returns:
+        All iterations
+    """
+    shares = split_vus(settings.concurrency, processes)
+    # Give the processes time to start before the first VU is due
+    settings.start_at = time.time() + 2.0
+    with ProcessPoolExecutor(max_workers=len(shares)) as pool:
+        futures = [pool.submit(run_process, share, settings) for share in shares]
+        return [iteration for future in futures for iteration in future.result()]
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point.
+
+    Returns:
+        Process exit code (0 = error rate within --max-error-rate)
+    """
+    parser = argparse.ArgumentParser(prog="python -m runners.load",
+                                     description="Load-test the site with browser sessions replaying the flow")
+    parser.add_argument("--concurrency", type=int, default=4, help="Target concurrent virtual users (browsers)")
+    parser.add_argument("--ramp-up", type=float, default=30.0, help="Seconds until all VUs run")
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds at full concurrency")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1,
+                        help="Processes the VUs are spread over (default: CPU count)")
+    parser.add_argument("--steps", default=",".join(step.name for step in REGISTRATION_FLOW),
+                        help="Comma-separated flow steps (default: the whole registration flow)")
+    parser.add_argument("--stand-in", action="store_true", help="Run against the local stand-in site")
+    parser.add_argument("--base-url", default=Config.BASE_URL, help="Site under load (e.g. staging)")
+    parser.add_argument("--browser", default=Config.BROWSER, help="chrome, firefox, edge")
+    parser.add_argument("--headed", action="store_true", help="Run with visible browsers")
+    parser.add_argument("--test-data", default=Config.TEST_DATA_PATH, help="Test data JSON path")
+    parser.add_argument("--max-error-rate", type=float, default=0.0, help="Exit 1 above this error rate")
+    args = parser.parse_args(argv)
+
+    if Config.REPLAY_MODE != "off":
+        parser.error(f"REPLAY_MODE={Config.REPLAY_MODE} would serve the load from the replay archive; unset it")
+    steps = [name.strip() for name in args.steps.split(",") if name.strip()]
+    for name in steps:
+        get_step(name)  # Fail fast on unknown step names
+
+    stand_in_server = None
+    base_url = args.base_url
+    if args.stand_in:
+        from stand_in.server import ensure_running
+        stand_in_server = ensure_running(Config.STAND_IN_URL)
+        base_url = Config.STAND_IN_URL
+
+    settings = LoadSettings(base_url=base_url, browser=args.browser, headless=not args.headed, steps=steps,
+                            concurrency=args.concurrency, ramp_up=args.ramp_up, duration=args.duration,
+                            start_at=0.0, test_data_path=args.test_data)
+    processes = max(1, min(args.processes, args.concurrency))
+    logger.info(f"Load: {args.concurrency} VUs over {processes} processes, ramp-up {args.ramp_up:.0f}s, "
+                f"duration {args.duration:.0f}s against {base_url}")
+    try:
+        iterations = run_load(settings, processes)
+    finally:
+        if stand_in_server:
+            stand_in_server.shutdown()
+            stand_in_server.server_close()
+
+    report = summarize(iterations, steps, args.ramp_up + args.duration)
+    report["settings"] = {**asdict(settings), "processes": processes}
+    run_dir = os.path.join(Config.REPORT_PATH, f"load_run_{new_run_timestamp()}")
+    os.makedirs(run_dir, exist_ok=True)
+    with open(os.path.join(run_dir, "load_report.json"), "w") as f:
+        json.dump({**report, "samples": iterations}, f, indent=2)
+
+    print(f"{report['passed']}/{report['iterations']} iterations passed, "
+          f"{report['throughput_per_min']:.1f} flows/min, error rate {report['error_rate']:.1%}")
+    print(f"{'step':<14}{'n':>6}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'errors':>9}")
+    for name, stats in [*report["steps"].items(), ("flow", {**report["flow"], "error_rate": report["error_rate"]})]:
+        print(f"{name:<14}{stats['count']:>6}{stats['p50']:>9.2f}{stats['p90']:>9.2f}"
+              f"{stats['p95']:>9.2f}{stats['p99']:>9.2f}{stats['error_rate']:>9.1%}")
+    for error, count in report["errors"].items():
+        print(f"  {count:>4} x {error}")
+    for session, growth in report["growing"].items():
+        print(f"GROWING browser session {session}: +{growth:.0f} MB")
+    print(f"Report: {os.path.join(run_dir, 'load_report.json')}")
+    return 1 if report["error_rate"] > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
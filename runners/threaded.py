@@ -0,0 +1,185 @@
+"""
+ThreadedRunner Module
+
+This module runs many registration flow sessions from a thread pool inside one
+interpreter. Each thread owns its own DriverManager and browser session, so
+Python, Selenium and PIL are imported once instead of once per xdist worker -
+useful where memory, not CPU, limits the number of concurrent browsers.
+
+Every Selenium driver has its own RemoteConnection (and urllib3 pool), so each
+thread talks to its browser over its own keep-alive connections.
+
+Usage:
+    python -m runners.threaded --sessions 20 --workers 8 --stand-in
+    python -m runners.threaded --sessions 4 --workers 4 --screenshots
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+from config.settings import Config
+from flows.registration_flow import FlowContext, FlowStep, REGISTRATION_FLOW, load_test_data, run_flow
+from utils.driver_manager import DriverManager
+from utils.logger import setup_logger
+from utils.run_context import new_run_timestamp
+from utils.screenshot_helper import ScreenshotHelper
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class SessionResult:
+    """Outcome of one flow session."""
+
+    index: int
+    thread: str
+    passed: bool
+    duration: float
+    error: Optional[str] = None
+
+
+class ThreadedRunner:
+    """Run flow sessions concurrently, one browser per pool thread."""
+
+    def __init__(self, config, workers: int, test_data_path: str = Config.TEST_DATA_PATH,
+                 steps: Optional[List[FlowStep]] = None, screenshots_dir: Optional[str] = None):
+        """
+        Initialize the runner.
+
+        Args:
+            config: Config class shared (read-only) by all sessions
+            workers: Number of threads, i.e. concurrent browser sessions
+            test_data_path: Test data JSON; every session gets its own copy and unique email
+            steps: Flow steps to run (defaults to REGISTRATION_FLOW)
+            screenshots_dir: Root folder for screenshots (one subfolder per session)
+        """
+        self.config = config
+        self.workers = workers
+        self.test_data_path = test_data_path
+        self.steps = steps or REGISTRATION_FLOW
+        self.screenshots_dir = screenshots_dir
+
+    def run_session(self, index: int) -> SessionResult:
+        """
+        Run one flow session in a fresh browser on the calling thread.
+
+        Args:
+            index: Session number (used for the screenshot subfolder)
+
+        Returns:
+            SessionResult
+        """
+        thread = threading.current_thread().name
+        start = time.perf_counter()
+        driver_manager = DriverManager(
+            browser=self.config.BROWSER,
+            headless=self.config.HEADLESS,
+            replay_mode=self.config.REPLAY_MODE,
+            replay_archive=self.config.REPLAY_ARCHIVE,
+            page_load_strategy=self.config.PAGE_LOAD_STRATEGY
+        )
+        try:
+            driver = driver_manager.get_driver()
+            driver.set_page_load_timeout(self.config.PAGE_LOAD_TIMEOUT)
+            screenshot_helper = None
+            if self.screenshots_dir:
+                screenshot_helper = ScreenshotHelper(
+                    driver, os.path.join(self.screenshots_dir, f"session_{index:03d}")
+                )
+            ctx = FlowContext(
+                driver=driver,
+                config=self.config,
+                data=load_test_data(self.test_data_path),
+                screenshot_helper=screenshot_helper,
+            )
+            run_flow(ctx, self.steps)
+        except Exception as e:
+            logger.error(f"Session {index} ({thread}) failed: {e}")
+            logger.debug(traceback.format_exc())
+            return SessionResult(index, thread, False, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+        finally:
+            driver_manager.quit_driver()
+
+        duration = time.perf_counter() - start
+        logger.info(f"Session {index} ({thread}) passed in {duration:.2f}s")
+        return SessionResult(index, thread, True, duration)
+
+    def run(self, sessions: int) -> List[SessionResult]:
+        """
+        Run sessions on the thread pool.
+
+        Args:
+            sessions: Total number of flow sessions
+
+        Returns:
+            Results ordered by session index
+        """
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="session") as pool:
+            return list(pool.map(self.run_session, range(1, sessions + 1)))
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point.
+
+    Returns:
+        Process exit code (0 = all sessions passed)
+    """
+    parser = argparse.ArgumentParser(prog="python -m runners.threaded",
+                                     description="Run flow sessions from a thread pool in one process")
+    parser.add_argument("--sessions", type=int, default=4, help="Total number of flow sessions")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent browser sessions (threads)")
+    parser.add_argument("--stand-in", action="store_true", help="Run against the local stand-in site")
+    parser.add_argument("--browser", default=Config.BROWSER, help="chrome, firefox, edge")
+    parser.add_argument("--headed", action="store_true", help="Run with visible browsers")
+    parser.add_argument("--screenshots", action="store_true", help="Capture step screenshots per session")
+    parser.add_argument("--test-data", default=Config.TEST_DATA_PATH, help="Test data JSON path")
+    args = parser.parse_args(argv)
+
+    stand_in_server = None
+    base_url = Config.BASE_URL
+    if args.stand_in:
+        from stand_in.server import ensure_running
+        stand_in_server = ensure_running(Config.STAND_IN_URL)
+        base_url = Config.STAND_IN_URL
+
+    config = type("ThreadedRunConfig", (Config,), {
+        "BASE_URL": base_url,
+        "BROWSER": args.browser,
+        "HEADLESS": not args.headed,
+        "ENABLE_SCREENSHOTS": args.screenshots,
+    })
+    screenshots_dir = None
+    if args.screenshots:
+        screenshots_dir = os.path.join(Config.REPORT_PATH, f"threaded_run_{new_run_timestamp()}", "screenshots")
+
+    runner = ThreadedRunner(config, args.workers, args.test_data, screenshots_dir=screenshots_dir)
+    start = time.perf_counter()
+    try:
+        results = runner.run(args.sessions)
+    finally:
+        if stand_in_server:
+            stand_in_server.shutdown()
+            stand_in_server.server_close()
+    elapsed = time.perf_counter() - start
+
+    failed = [r for r in results if not r.passed]
+    for result in failed:
+        print(f"FAILED session {result.index} ({result.thread}): {result.error}")
+    print(f"{len(results) - len(failed)}/{len(results)} sessions passed "
+          f"with {args.workers} threads in {elapsed:.1f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
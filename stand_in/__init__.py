@@ -0,0 +1 @@
+"""Stand-in site package initialization."""
@@ -0,0 +1,92 @@
+"""
+Stand-in Site Entry Point
+
+Serve the local stand-in for the dutch.com registration flow.
+
+Usage:
+    python -m stand_in
+    python -m stand_in --port 8000 --delay 150 --delay issues=600 --tracker-delay 3000
+    python -m stand_in --variant cta=random --variant pet_name=b --variant modal=hide --seed 7
+
+Point the framework at it with:
+    USE_STAND_IN=true pytest tests/
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import sys
+
+from stand_in.server import StandInServer, StandInSettings, VARIANTS
+
+
+def parse_delays(values):
+    """Split --delay values into a default delay and per-page delays (milliseconds)."""
+    default_delay = 0
+    page_delays = {}
+    for value in values or []:
+        if "=" in value:
+            page, ms = value.split("=", 1)
+            page_delays[page] = int(ms)
+        else:
+            default_delay = int(value)
+    return default_delay, page_delays
+
+
+def parse_variants(values):
+    """Parse --variant name=value pairs, validating against VARIANTS."""
+    variants = {name: choices[0] for name, choices in VARIANTS.items()}
+    for value in values or []:
+        name, _, choice = value.partition("=")
+        if name not in VARIANTS or choice not in VARIANTS[name] + ("random",):
+            raise argparse.ArgumentTypeError(
+                f"Invalid variant '{value}'. Valid: "
+                + ", ".join(f"{n}={'|'.join(c + ('random',))}" for n, c in VARIANTS.items())
+            )
+        variants[name] = choice
+    return variants
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m stand_in", description="Local stand-in for dutch.com")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8000, help="Bind port")
+    parser.add_argument("--delay", action="append", metavar="[PAGE=]MS",
+                        help="Response delay: default for all pages, or per page "
+                             "(home, pet_info, issues, registration, registration_submit, checkout, order_summary)")
+    parser.add_argument("--tracker-delay", type=int, default=0, metavar="MS",
+                        help="Delay of the third-party tracker script (holds back the 'load' event)")
+    parser.add_argument("--variant", action="append", metavar="NAME=VALUE", help="A/B variant selection")
+    parser.add_argument("--seed", type=int, help="Seed for 'random' variant assignment")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args(argv)
+
+    try:
+        variants = parse_variants(args.variant)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    default_delay, page_delays = parse_delays(args.delay)
+
+    settings = StandInSettings(
+        host=args.host,
+        port=args.port,
+        default_delay_ms=default_delay,
+        page_delays_ms=page_delays,
+        tracker_delay_ms=args.tracker_delay,
+        variants=variants,
+        seed=args.seed,
+    )
+    server = StandInServer(settings, verbose=args.verbose)
+    print(f"Dutch stand-in serving on {server.url} (variants: {variants})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
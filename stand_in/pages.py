@@ -0,0 +1,342 @@
+"""
+StandInPages Module
+
+This module renders the HTML served by the local stand-in site. Each page
+reproduces the DOM contract (IDs, classes, data-testid attributes and text)
+that the matching page object relies on, so locators resolve exactly as they
+do on dutch.com. As on the site, the pet info Continue and the Register
+buttons are visible but disabled until their form is valid.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from html import escape
+from typing import Dict
+
+from utils.enums import USState
+
+# Issue cards shown on the issues page (IDs match IssuesPage locators)
+ISSUES = [
+    "Allergy", "Anxiety", "Skin", "Digestive", "Ears", "Eyes", "Behavioral", "Preventive care",
+]
+
+PLANS = [
+    {"id": "product-7034225590448", "name": "Dutch Membership - 1 Year", "price": "$132.00"},
+    {"id": "product-7705825673392", "name": "Dutch Membership - 2 Years", "price": "$228.00"},
+]
+
+_STYLE = """
+body { font-family: sans-serif; margin: 0; }
+.hidden { display: none !important; }
+.vfm { position: fixed; inset: 0; background: rgba(0, 0, 0, 0.4); display: flex;
+       align-items: center; justify-content: center; }
+.vfm__content { background: #fff; padding: 24px; border-radius: 12px; }
+.vfm-bounce-back { animation: vfm-bounce-back 0.3s ease-out; }
+@keyframes vfm-bounce-back { 0% { transform: scale(0.9); opacity: 0; } 100% { transform: scale(1); opacity: 1; } }
+.plan input[type=radio] { position: absolute; opacity: 0; width: 1px; height: 1px; }
+.issue-card { list-style: none; cursor: pointer; padding: 8px; border: 1px solid #000; margin: 4px; }
+iframe { border: 0; height: 40px; width: 100%; }
+"""
+
+
+def layout(title: str, body: str, scripts: str = "", tracker: bool = True) -> str:
+    """
+    Wrap page content in the shared document shell.
+
+    Args:
+        title: Document title
+        body: Inner body HTML
+        scripts: Inline JavaScript appended at the end of the body
+        tracker: Include the (optionally delayed) third-party tracker script
+
+    Returns:
+        Complete HTML document
+    """
+    tracker_tag = '<script src="/assets/tracker.js" async></script>' if tracker else ""
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{escape(title)}</title>
+<style>{_STYLE}</style>
+{tracker_tag}
+</head>
+<body>
+{body}
+<script>{scripts}</script>
+</body>
+</html>
+"""
+
+
+def home_page(cta_href: str) -> str:
+    """Render the home page (HomePage)."""
+    body = f"""
+<header id="header">
+  <a href="https://www.dutch.com"><img alt="Dutch" src="/assets/logo.svg"></a>
+  <a href="/account/login">Log in</a>
+  <a href="/account/register" class="button signup">Sign up</a>
+  <a href="{escape(cta_href)}" class="button px-4 rounded-full">Join Now</a>
+</header>
+<main>
+  <h1>Vet care for your pet, from home</h1>
+  <a href="/account/register" class="rounded-full bg-black">Get started</a>
+</main>
+<footer>
+  <input id="newsletter_footer-email" type="email" placeholder="Email">
+  <button id="Subscribe" type="button">Subscribe</button>
+</footer>
+"""
+    return layout("Dutch | Online Vet", body)
+
+
+def pet_info_page(pet_name_id: str) -> str:
+    """Render the pet information form (PetInfoPage, NeedInfoComponent)."""
+    options = "\n".join(
+        f'    <option value="{state.value}">{state.value}</option>' for state in USState
+    )
+    body = f"""
+<form id="reg-flow-register">
+  <fieldset>
+    <input type="radio" id="dog" name="pet_type" value="dog"><label for="dog">Dog</label>
+    <input type="radio" id="cat" name="pet_type" value="cat"><label for="cat">Cat</label>
+  </fieldset>
+  <input id="{pet_name_id}" name="petName" type="text" placeholder="Pet name">
+  <select id="state" name="state">
+    <option value="">Select state</option>
+{options}
+  </select>
+  <button type="submit" class="rounded-full bg-black" disabled>Continue</button>
+</form>
+<div id="need-info-modal" class="vfm hidden">
+  <div class="vfm__content">
+    <div class="bg-cream border-b border-black p-4">
+      <button title="Close" type="button" id="need-info-close">&times;</button>
+      <h2>We need your vet's info</h2>
+    </div>
+    <div class="space-y-4 p-6 md:space-y-8">
+      <img src="/assets/image_missing_vet_info.png" alt="">
+      <div class="max-w-md text-center text-lg leading-snug">
+        <p class="mb-3 lg:mb-6">Washington requires a prior vet visit before we can prescribe.</p>
+        <p>You can still continue and talk to a Dutch vet.</p>
+      </div>
+      <button type="button" class="bg-black rounded-full" id="need-info-continue">Continue</button>
+    </div>
+  </div>
+</div>
+"""
+    scripts = f"""
+const form = document.getElementById('reg-flow-register');
+const modal = document.getElementById('need-info-modal');
+function nextPage() {{ window.location.href = '/register/issues'; }}
+function readPet() {{
+  const type = form.querySelector('input[name=pet_type]:checked');
+  return {{
+    type: type ? type.value : '',
+    name: document.getElementById('{pet_name_id}').value.trim(),
+    state: document.getElementById('state').value
+  }};
+}}
+function validate() {{
+  const pet = readPet();
+  form.querySelector('button[type=submit]').disabled = !(pet.type && pet.name && pet.state);
+}}
+form.addEventListener('input', validate);
+form.addEventListener('change', validate);
+form.addEventListener('submit', function (event) {{
+  event.preventDefault();
+  const pet = readPet();
+  localStorage.setItem('reg_pet', JSON.stringify(pet));
+  sessionStorage.setItem('reg_step', 'issues');
+  if (pet.state === 'WA') {{ modal.classList.remove('hidden'); return; }}
+  nextPage();
+}});
+document.getElementById('need-info-continue').addEventListener('click', nextPage);
+document.getElementById('need-info-close').addEventListener('click', function () {{
+  modal.classList.add('hidden');
+}});
+"""
+    return layout("Tell us about your pet | Dutch", body, scripts)
+
+
+def issues_page(show_modal: bool) -> str:
+    """Render the issues selection page (IssuesPage, WeCanHelpComponent)."""
+    cards = "\n".join(
+        f'    <li id="{escape(issue)}" class="issue-card">'
+        f'<input type="checkbox" id="checkbox-{escape(issue)}" name="issues" value="{escape(issue)}">'
+        f'<span>{escape(issue)}</span></li>'
+        for issue in ISSUES
+    )
+    body = f"""
+<form id="reg-flow-issues-form">
+  <ul>
+{cards}
+  </ul>
+  <button type="submit" class="rounded-full bg-black">Continue</button>
+</form>
+<div id="we-can-help-modal" class="vfm hidden">
+  <div class="vfm__content vfm-bounce-back">
+    <div class="flex cursor-pointer gap-3" id="we-can-help-back">&larr; Back</div>
+    <img class="h-[180px] w-[172px]" src="/assets/we_can_help.png" alt="">
+    <svg class="lucide-circle-check" width="24" height="24"><circle cx="12" cy="12" r="10"></circle></svg>
+    <h3 class="text-[28px] leading-none" id="we-can-help-heading">We can help!</h3>
+    <p class="text-pretty leading-tight md:text-xl">Dutch vets treat these conditions every day.</p>
+    <button type="button" class="rounded-full bg-black">Continue</button>
+  </div>
+</div>
+"""
+    scripts = f"""
+const SHOW_MODAL = {str(show_modal).lower()};
+document.querySelectorAll('.issue-card').forEach(function (card) {{
+  card.addEventListener('click', function (event) {{
+    const box = card.querySelector('input[type=checkbox]');
+    if (event.target !== box) {{ box.checked = !box.checked; }}
+  }});
+}});
+function nextPage() {{ window.location.href = '/register/account'; }}
+document.getElementById('reg-flow-issues-form').addEventListener('submit', function (event) {{
+  event.preventDefault();
+  const selected = Array.from(document.querySelectorAll('input[name=issues]:checked')).map(function (b) {{ return b.value; }});
+  localStorage.setItem('reg_issues', JSON.stringify(selected));
+  sessionStorage.setItem('reg_step', 'registration');
+  if (!SHOW_MODAL) {{ nextPage(); return; }}
+  const pet = JSON.parse(localStorage.getItem('reg_pet') || '{{}}');
+  document.getElementById('we-can-help-heading').textContent = 'We can help ' + (pet.name || 'your pet') + '!';
+  document.getElementById('we-can-help-modal').classList.remove('hidden');
+}});
+document.querySelector('#we-can-help-modal button').addEventListener('click', nextPage);
+document.getElementById('we-can-help-back').addEventListener('click', function () {{
+  document.getElementById('we-can-help-modal').classList.add('hidden');
+}});
+"""
+    return layout("What brings you to Dutch? | Dutch", body, scripts)
+
+
+def registration_page() -> str:
+    """Render the account registration page (RegistrationPage)."""
+    body = """
+<form id="input_0" method="post" action="/register/account">
+  <input id="input_1" name="email" type="email" placeholder="Email" required>
+  <input id="input_2" name="password" type="password" placeholder="Password" required>
+  <button type="submit" class="rounded-full bg-black" disabled>Register</button>
+</form>
+<a role="link" href="/account/google"><span>Google</span></a>
+<p>
+  <a href="/pages/terms-and-conditions">Terms</a>
+  <a href="/pages/privacy-policy">Privacy</a>
+</p>
+"""
+    scripts = """
+const form = document.getElementById('input_0');
+function validate() { form.querySelector('button[type=submit]').disabled = !form.checkValidity(); }
+form.addEventListener('input', validate);
+"""
+    return layout("Create your account | Dutch", body, scripts)
+
+
+def checkout_page() -> str:
+    """Render the plan selection page (CheckoutPage)."""
+    plans = "\n".join(
+        f"""  <div class="plan">
+    <input type="radio" id="{plan['id']}" name="plan" value="{plan['id']}"{' checked' if i == 0 else ''}>
+    <label for="{plan['id']}">{escape(plan['name'])} &mdash; {plan['price']}</label>
+  </div>"""
+        for i, plan in enumerate(PLANS)
+    )
+    body = f"""
+<div id="pencil-banner-wrapper">Use code WELCOME20 for 20% off</div>
+<form id="plan-selection-form" method="get" action="/checkout/pay">
+{plans}
+  <button type="submit" id="register-plan-selection-cta" class="rounded-full bg-black">Continue</button>
+</form>
+<section>
+  <button id="radix-vue-accordion-trigger-v-0" type="button">What's included in vet calls?</button>
+  <button id="radix-vue-accordion-trigger-v-2" type="button">How much does medication cost?</button>
+</section>
+"""
+    return layout("Choose your plan | Dutch", body)
+
+
+def order_summary_page(email: str, plan: Dict[str, str]) -> str:
+    """Render the Stripe-style order summary page (OrderSummaryPage, PaymentComponent, DetailsComponent)."""
+    frames = "\n".join(
+        f'      <iframe name="__privateStripeFrame{i}" title="{title}" src="/stripe/frame?field={field}"></iframe>'
+        for i, (title, field) in enumerate([
+            ("Secure card number input frame", "cardnumber"),
+            ("Secure expiration date input frame", "exp-date"),
+            ("Secure CVC input frame", "cvc"),
+        ], start=1)
+    )
+    body = f"""
+<header>
+  <img alt="Dutch Pet logo" src="/assets/logo.svg">
+  <button type="button" data-testid="header-view-details">Details</button>
+</header>
+<section data-testid="order-details-mobile">
+  <button class="u-screenReaderOnly" type="button">Close</button>
+  <div data-testid="line-item-image"><img class="LineItem-image" src="/assets/logo.svg" alt=""></div>
+  <div class="LineItem-productName" data-testid="line-item-product-name">{escape(plan['name'])}</div>
+  <span data-testid="line-item-billing-interval">Billed annually</span>
+  <div data-testid="line-item-total-amount">{plan['price']}</div>
+  <div class="LineItem-productName" data-testid="line-item-product-name">Initiation fee</div>
+  <div data-testid="line-item-total-amount">$0.00</div>
+  <div class="Subtotal"><span class="Text-fontWeight--500">Subtotal</span>
+    <span data-testid="order-details-footer-subtotal-amount">{plan['price']}</span></div>
+  <div class="PromotionCodeEntry-label">Add promotion code</div>
+  <input id="promotionCode" type="text">
+  <div class="OrderDetailsSubtotalItem">
+    <span class="OrderDetails-subtotalItemLabel-Text">Tax<svg class="Icon" width="8" height="8"></svg></span>
+    <span class="Text-color--gray400 Text--tabularNumbers">Enter address to calculate</span>
+  </div>
+  <div class="OrderDetails-total"><span class="Text-fontWeight--500">Total due today</span>
+    <span id="OrderDetails-TotalAmount">{plan['price']}</span></div>
+</section>
+<main>
+  <span data-testid="product-summary-name">{escape(plan['name'])}</span>
+  <span id="ProductSummary-totalAmount">{plan['price']}</span>
+  <div class="ReadOnlyFormField-title">{escape(email)}</div>
+  <button class="ReadOnlyFormField-actionButton" type="button">Change</button>
+  <input id="phoneNumber" type="tel" placeholder="(201) 555-0123">
+  <span class="PhoneNumberInput-tooltipIcon">?</span>
+  <select id="cstm_fld_TGJZYOzkWaUTMh"><option>Yes</option><option>No</option></select>
+  <h2 class="PaymentMethod-Heading">Payment method</h2>
+  <div>
+    <input type="radio" id="payment-method-accordion-item-title-card" name="payment-method" value="card">
+    <button type="button" aria-label="Pay with card" data-testid="card-accordion-item-button">Card</button>
+    <div id="card-fields" class="hidden">
+{frames}
+      <input id="billingPostalCode" type="text" placeholder="ZIP">
+    </div>
+    <input type="radio" id="payment-method-accordion-item-title-klarna" name="payment-method" value="klarna">
+    <input type="radio" id="payment-method-accordion-item-title-amazon_pay" name="payment-method" value="amazon_pay">
+  </div>
+  <input type="checkbox" id="termsOfServiceConsentCheckbox">
+  <a href="https://www.dutchpet.com/pages/terms-and-conditions">Terms of Service</a>
+  <a href="https://www.dutch.com/pages/privacy-policy">Privacy Policy</a>
+  <p class="D_NDnqWc__ConfirmTerms--item">You authorize Dutch to charge you automatically.</p>
+  <button type="submit" data-testid="hosted-payment-submit-button" disabled>Subscribe</button>
+</main>
+<footer>
+  <a href="https://stripe.com">Powered by Stripe</a>
+  <a href="https://stripe.com/legal/end-users">Terms</a>
+  <a href="https://stripe.com/privacy">Privacy</a>
+</footer>
+"""
+    scripts = """
+document.querySelector('[data-testid=card-accordion-item-button]').addEventListener('click', function () {
+  document.getElementById('payment-method-accordion-item-title-card').checked = true;
+  document.getElementById('card-fields').classList.remove('hidden');
+});
+"""
+    return layout("Dutch | Checkout", body, scripts, tracker=False)
+
+
+def stripe_frame(field: str) -> str:
+    """Render a single Stripe-style iframe document with one input."""
+    return layout("Secure input", f'<input name="{escape(field)}" type="text" autocomplete="off">', tracker=False)
+
+
+def login_page() -> str:
+    """Render a minimal login page."""
+    return layout("Log in | Dutch", '<form><input id="email" type="email"><button type="submit">Log in</button></form>')
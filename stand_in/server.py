@@ -0,0 +1,256 @@
+"""
+StandInServer Module
+
+This module serves the local stand-in for the dutch.com registration flow.
+
+Routes follow the real journey:
+    /                       Home page (HomePage)
+    /account/register       Pet info form (CTA variant A)
+    /register/              Pet info form (CTA variant B, stands in for register.dutch.com)
+    /register/issues        Issues selection + 'We Can Help' modal
+    /register/account       Registration form (POST sets the session cookie)
+    /register/plans         Plan selection (requires session)
+    /checkout/pay           Stripe-style order summary (requires session)
+    /stripe/frame           Card field iframe documents
+    /assets/tracker.js      Third-party stand-in script (delay blocks the 'load' event)
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import random
+import secrets
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from stand_in import pages
+
+# A/B experiments and their allowed values ('random' picks one per browser session)
+VARIANTS = {
+    "cta": ("a", "b"),            # a: /account/register, b: /register/
+    "pet_name": ("a", "b"),       # a: id="pet-name", b: id="petName"
+    "modal": ("show", "hide"),    # 'We Can Help' modal after issue selection
+}
+
+SESSION_COOKIE = "dutch_session"
+
+
+@dataclass
+class StandInSettings:
+    """Runtime settings for the stand-in site."""
+
+    host: str = "127.0.0.1"
+    port: int = 8000
+    default_delay_ms: int = 0
+    page_delays_ms: Dict[str, int] = field(default_factory=dict)
+    tracker_delay_ms: int = 0
+    variants: Dict[str, str] = field(default_factory=lambda: {"cta": "a", "pet_name": "a", "modal": "show"})
+    seed: Optional[int] = None
+
+    def delay_for(self, page: str) -> float:
+        """Response delay in seconds for a page key."""
+        return self.page_delays_ms.get(page, self.default_delay_ms) / 1000.0
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Request handler rendering stand-in pages."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "DutchStandIn/1.0"
+
+    # Page key used for delay lookups, keyed by path
+    ROUTES = {
+        "/": "home",
+        "/account/register": "pet_info",
+        "/register/": "pet_info",
+        "/register": "pet_info",
+        "/register/issues": "issues",
+        "/register/account": "registration",
+        "/register/plans": "checkout",
+        "/checkout/pay": "order_summary",
+        "/stripe/frame": "stripe_frame",
+        "/account/login": "login",
+    }
+
+    def log_message(self, format, *args):
+        """Route access logs through the server (silent unless verbose)."""
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    # ==================== REQUEST HANDLING ====================
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path
+        query = parse_qs(parsed.query)
+
+        if path == "/assets/tracker.js":
+            time.sleep(self.server.settings.tracker_delay_ms / 1000.0)
+            self._send(200, "window.__dutchTracker = Date.now();", "application/javascript")
+            return
+        if path.startswith("/assets/"):
+            self._send(200, "", "image/svg+xml" if path.endswith(".svg") else "image/png")
+            return
+        if path == "/favicon.ico":
+            self._send(204, "")
+            return
+
+        page = self.ROUTES.get(path)
+        if page is None:
+            self._send(404, pages.layout("Not found", "<h1>404</h1>", tracker=False))
+            return
+
+        time.sleep(self.server.settings.delay_for(page))
+        cookies = self._cookies()
+        variants, new_cookies = self._session_variants(cookies)
+
+        if page in ("checkout", "order_summary") and SESSION_COOKIE not in cookies:
+            self._redirect("/register/account", new_cookies)
+            return
+
+        if page == "home":
+            cta_href = "/account/register" if variants["cta"] == "a" else "/register/"
+            html = pages.home_page(cta_href)
+        elif page == "pet_info":
+            html = pages.pet_info_page("pet-name" if variants["pet_name"] == "a" else "petName")
+        elif page == "issues":
+            html = pages.issues_page(variants["modal"] == "show")
+        elif page == "registration":
+            html = pages.registration_page()
+        elif page == "checkout":
+            html = pages.checkout_page()
+        elif page == "order_summary":
+            plan_id = query.get("plan", [pages.PLANS[0]["id"]])[0]
+            plan = next((p for p in pages.PLANS if p["id"] == plan_id), pages.PLANS[0])
+            email = self.server.sessions.get(cookies[SESSION_COOKIE], "")
+            html = pages.order_summary_page(email, plan)
+        elif page == "stripe_frame":
+            html = pages.stripe_frame(query.get("field", ["cardnumber"])[0])
+        else:
+            html = pages.login_page()
+
+        self._send(200, html, cookies=new_cookies)
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        form = parse_qs(self.rfile.read(length).decode("utf-8"))
+
+        if parsed.path != "/register/account":
+            self._send(404, "")
+            return
+
+        time.sleep(self.server.settings.delay_for("registration_submit"))
+        token = secrets.token_hex(16)
+        self.server.sessions[token] = form.get("email", [""])[0]
+        self._redirect("/register/plans", {SESSION_COOKIE: token})
+
+    # ==================== HELPERS ====================
+
+    def _cookies(self) -> Dict[str, str]:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return {key: morsel.value for key, morsel in cookie.items()}
+
+    def _session_variants(self, cookies: Dict[str, str]):
+        """Resolve A/B variants; 'random' experiments stick per browser via cookies."""
+        variants = {}
+        new_cookies = {}
+        for name, configured in self.server.settings.variants.items():
+            if configured != "random":
+                variants[name] = configured
+                continue
+            cookie_name = f"ab_{name}"
+            if cookies.get(cookie_name) in VARIANTS[name]:
+                variants[name] = cookies[cookie_name]
+            else:
+                variants[name] = self.server.rng.choice(VARIANTS[name])
+                new_cookies[cookie_name] = variants[name]
+        return variants, new_cookies
+
+    def _redirect(self, location: str, cookies: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(303)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self._send_cookies(cookies)
+        self.end_headers()
+
+    def _send(self, status: int, body: str, content_type: str = "text/html; charset=utf-8",
+              cookies: Optional[Dict[str, str]] = None) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Cache-Control", "no-store" if content_type.startswith("text/html") else "max-age=3600")
+        self._send_cookies(cookies)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_cookies(self, cookies: Optional[Dict[str, str]]) -> None:
+        for name, value in (cookies or {}).items():
+            self.send_header("Set-Cookie", f"{name}={value}; Path=/; SameSite=Lax")
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding stand-in settings and session state."""
+
+    daemon_threads = True
+    request_queue_size = 512  # Many parallel browser sessions connect at once
+
+    def __init__(self, settings: StandInSettings, verbose: bool = False):
+        """
+        Initialize the server and bind the configured address.
+
+        Args:
+            settings: Stand-in settings
+            verbose: Log every request to stderr
+        """
+        super().__init__((settings.host, settings.port), StandInHandler)
+        self.settings = settings
+        self.verbose = verbose
+        self.sessions: Dict[str, str] = {}
+        self.rng = random.Random(settings.seed)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the bound server (uses the real port when started on port 0)."""
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+
+def start_in_background(settings: StandInSettings) -> StandInServer:
+    """
+    Start the stand-in site on a daemon thread.
+
+    Args:
+        settings: Stand-in settings
+
+    Returns:
+        Running server (call shutdown() to stop)
+    """
+    server = StandInServer(settings)
+    thread = threading.Thread(target=server.serve_forever, name="stand-in-site", daemon=True)
+    thread.start()
+    return server
+
+
+def ensure_running(base_url: str) -> Optional[StandInServer]:
+    """
+    Start the stand-in on the port of base_url unless something already listens there.
+
+    Args:
+        base_url: Stand-in URL from Config (e.g., 'http://dutch.com.localhost:8000')
+
+    Returns:
+        The started server, or None if one was already running
+    """
+    port = urlparse(base_url).port or 80
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+            return None
+    except OSError:
+        return start_in_background(StandInSettings(port=port))
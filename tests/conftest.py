@@ -10,41 +10,207 @@ Date: 2025-10-19
 import pytest
 import json
 import os
-from datetime import datetime
-from utils.driver_manager import DriverManager
 from utils.logger import setup_logger
-from utils.screenshot_helper import ScreenshotHelper
+from utils.run_context import get_worker_id, is_xdist_worker, new_run_timestamp
+from utils.variant_locator import drain_served_variants
 
 
-# Global variable to store test run timestamp
-TEST_RUN_TIMESTAMP = datetime.now().strftime("%Y%m%d_%H%M%S")
+# Global variable to store test run timestamp (workers receive the controller's value)
+TEST_RUN_TIMESTAMP = new_run_timestamp()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """Use PARALLEL_WORKERS as the default xdist worker count when -n is not given."""
+    from config.settings import Config
+    # Workers must not start workers of their own
+    if is_xdist_worker(config) or getattr(config.option, "numprocesses", None) is not None:
+        return
+    if Config.PARALLEL_WORKERS == "auto":
+        config.option.numprocesses = "auto"  # Resolved by pytest_xdist_auto_num_workers
+    elif int(Config.PARALLEL_WORKERS) > 1:
+        config.option.numprocesses = int(Config.PARALLEL_WORKERS)
+
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Size -n auto / PARALLEL_WORKERS=auto from host capacity and the browser footprint."""
+    from config.settings import Config
+    from utils.worker_sizing import auto_workers
+    return auto_workers(Config)
 
 
 def pytest_configure(config):
     """
     Pytest hook to configure test run settings.
     Creates timestamped folder structure for this test run.
+
+    Under pytest-xdist the controller creates the run folder and hands its
+    timestamp to every worker; each worker writes screenshots into its own
+    namespace (screenshots/<worker_id>/).
     """
     global TEST_RUN_TIMESTAMP
 
+    if is_xdist_worker(config):
+        TEST_RUN_TIMESTAMP = config.workerinput["test_run_timestamp"]
+
     # Create timestamped test run folder
     test_run_dir = os.path.join("reports", f"test_run_{TEST_RUN_TIMESTAMP}")
     os.makedirs(test_run_dir, exist_ok=True)
 
-    # Create screenshots folder within this test run
+    # Create screenshots folder within this test run (one namespace per xdist worker)
     screenshots_dir = os.path.join(test_run_dir, "screenshots")
+    if is_xdist_worker(config):
+        screenshots_dir = os.path.join(screenshots_dir, get_worker_id())
     os.makedirs(screenshots_dir, exist_ok=True)
 
     # Store paths in config for access by fixtures
     config.test_run_dir = test_run_dir
     config.screenshots_dir = screenshots_dir
 
+    if not is_xdist_worker(config):
+        config.pluginmanager.register(RunResults(config), "run_results")
+
+    # Prefix-sharing scheduler for tests marked with flow_path
+    from plugins import flow_prefix
+    if not config.pluginmanager.is_registered(flow_prefix):
+        config.pluginmanager.register(flow_prefix, "flow_prefix")
+
+    # Test impact analysis (IMPACT_MODE=record|select)
+    from plugins import impact
+    if not config.pluginmanager.is_registered(impact):
+        config.pluginmanager.register(impact, "impact")
+
+    # Test history database, failure-first ordering and quarantine lane
+    from plugins import history
+    if not config.pluginmanager.is_registered(history):
+        config.pluginmanager.register(history, "history")
+
+    # Duration-aware (LPT) scheduling of xdist workers
+    from plugins import lpt_scheduler
+    if not config.pluginmanager.is_registered(lpt_scheduler):
+        config.pluginmanager.register(lpt_scheduler, "lpt_scheduler")
+
+    # Web performance samples, per-page percentiles and budgets (WEB_PERF=warn|fail)
+    from plugins import web_perf
+    if not config.pluginmanager.is_registered(web_perf):
+        config.pluginmanager.register(web_perf, "web_perf")
+
+    # Browser process tree CPU/RSS per test and step (RESOURCE_MONITOR=on)
+    from plugins import resources
+    if not config.pluginmanager.is_registered(resources):
+        config.pluginmanager.register(resources, "resources")
+
     # Configure HTML report path if --html option was used
     if config.option.htmlpath:
         # Override HTML report path to be in timestamped folder
         htmlpath = os.path.join(test_run_dir, "report.html")
         config.option.htmlpath = htmlpath
 
+    # Start the local stand-in site once (in the controller when running under xdist)
+    from config.settings import Config
+    config.stand_in_server = None
+    if Config.USE_STAND_IN and not is_xdist_worker(config):
+        from stand_in.server import ensure_running
+        config.stand_in_server = ensure_running(Config.STAND_IN_URL)
+
+    # One record/replay proxy for the run: one archive write, one miss report (workers inherit REPLAY_PROXY)
+    config.replay_proxy = None
+    if Config.REPLAY_MODE != "off" and not is_xdist_worker(config):
+        from replay.proxy import PROXY_ENV, acquire_proxy
+        host, port = acquire_proxy(Config.REPLAY_MODE, Config.REPLAY_ARCHIVE)
+        os.environ[PROXY_ENV] = config.replay_proxy = f"{host}:{port}"
+
+
+def pytest_sessionstart(session):
+    """Lint page object locators against HTML snapshots before any browser starts (LOCATOR_LINT)."""
+    from config.settings import Config
+    if Config.LOCATOR_LINT == "off" or is_xdist_worker(session.config) or session.config.option.collectonly:
+        return
+    from utils.locator_lint import format_report, run_lint
+    report = run_lint(str(session.config.rootpath))
+    logger = setup_logger(__name__)
+    log = logger.warning if report.findings or report.skipped else logger.info
+    for line in format_report(report):
+        log(line)
+    if Config.LOCATOR_LINT == "fail" and report.errors():
+        pytest.exit(f"Locator lint found {len(report.errors())} broken locators", returncode=1)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """xdist controller hook: share the run timestamp so all workers use one run folder."""
+    node.workerinput["test_run_timestamp"] = TEST_RUN_TIMESTAMP
+
+
+class RunResults:
+    """
+    Collect per-test results and write them to results.json in the run folder.
+
+    Registered in the controller (or the only process without xdist), which
+    receives the reports of every worker - so the file covers the whole run.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.tests = []
+        self.variants = {}  # VariantLocator name -> {variant: times served}
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call" or (report.when == "setup" and not report.passed):
+            result = {
+                "nodeid": report.nodeid,
+                "outcome": report.outcome,
+                "phase": report.when,
+                "duration": round(report.duration, 3),
+                "worker": getattr(report, "worker_id", get_worker_id()),
+            }
+            retries = dict(report.user_properties).get("step_retries")
+            if retries:
+                result["step_retries"] = retries
+            self.tests.append(result)
+        for name, labels in dict(report.user_properties).get("variants", {}).items():
+            for label, count in labels.items():
+                served = self.variants.setdefault(name, {})
+                served[label] = served.get(label, 0) + count
+
+    def pytest_terminal_summary(self, terminalreporter):
+        retried = [t for t in self.tests if t.get("step_retries")]
+        if retried:
+            terminalreporter.write_sep("-", "step retries")
+            for test in retried:
+                steps = ", ".join(f"{r['step']} ({r['error']})" for r in test["step_retries"])
+                terminalreporter.write_line(f"{test['outcome'].upper()} {test['nodeid']}: {steps}")
+        if self.variants:
+            terminalreporter.write_sep("-", "A/B variants served")
+            for name, served in sorted(self.variants.items()):
+                counts = ", ".join(f"{label} x{count}" for label, count in sorted(served.items()))
+                terminalreporter.write_line(f"{name}: {counts}")
+
+    def pytest_sessionfinish(self, session):
+        if not self.tests:
+            return
+        results_path = os.path.join(self.config.test_run_dir, "results.json")
+        with open(results_path, "w") as f:
+            json.dump({
+                "run": TEST_RUN_TIMESTAMP,
+                "exit_status": int(session.exitstatus),
+                "tests": self.tests,
+                "variants": self.variants,
+            }, f, indent=2)
+
+
+def pytest_unconfigure(config):
+    """Stop the stand-in site and the replay proxy if this process started them."""
+    server = getattr(config, "stand_in_server", None)
+    if server:
+        server.shutdown()
+        server.server_close()
+    if getattr(config, "replay_proxy", None):
+        from replay.proxy import PROXY_ENV, release_proxy
+        os.environ.pop(PROXY_ENV, None)
+        release_proxy()
+
 
 @pytest.fixture(scope="session")
 def test_run_dir(request):
@@ -57,6 +223,18 @@ def test_run_dir(request):
     return request.config.test_run_dir
 
 
+@pytest.fixture(scope="session")
+def checkpoint_store(request):
+    """
+    Get the flow checkpoint store for this run (shared by all xdist workers).
+
+    Returns:
+        CheckpointStore writing into <run folder>/checkpoints
+    """
+    from flows.checkpoints import CheckpointStore
+    return CheckpointStore(os.path.join(request.config.test_run_dir, "checkpoints"))
+
+
 @pytest.fixture(scope="session")
 def config():
     """
@@ -70,26 +248,41 @@ def config():
 
 
 @pytest.fixture(scope="session")
-def test_data():
+def base_test_data():
     """
-    Load test data from JSON file and generate unique email for each test run.
+    Load test data from JSON file once per session.
 
     Returns:
-        Test data dictionary with unique email
+        Test data dictionary (shared - tests get copies through test_data)
     """
     test_data_path = os.path.join("config", "test_data.json")
     with open(test_data_path, 'r') as f:
-        data = json.load(f)
+        return json.load(f)
+
 
-    # Generate unique email with timestamp using + notation (alias)
-    if 'test_users' in data and len(data['test_users']) > 0:
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        original_email = data['test_users'][0]['email']
-        # Insert timestamp with + before @
-        email_parts = original_email.split('@')
-        data['test_users'][0]['email'] = f"{email_parts[0]}+{timestamp}@{email_parts[1]}"
+@pytest.fixture(scope="session")
+def data_factory(base_test_data):
+    """
+    Get the unique test data factory for this session.
 
-    return data
+    Returns:
+        DataFactory generating emails based on the configured test user
+    """
+    from utils.data_factory import DataFactory
+    return DataFactory.for_test_data(base_test_data)
+
+
+@pytest.fixture(scope="function")
+def test_data(base_test_data, data_factory):
+    """
+    Get test data with a unique user and phone number for each test.
+
+    Uniqueness holds across xdist workers and repeated runs (see DataFactory).
+
+    Returns:
+        Copy of the test data with generated email and phone
+    """
+    return data_factory.test_data(base_test_data)
 
 
 @pytest.fixture(scope="function")
@@ -109,10 +302,17 @@ def setup(request, config):
     logger.info(f"Starting test: {request.node.name}")
     logger.info("=" * 80)
 
+    # Imported here so collection and worker startup do not load Selenium's drivers and PIL
+    from utils.driver_manager import DriverManager
+    from utils.screenshot_helper import ScreenshotHelper
+
     # Initialize driver
     driver_manager = DriverManager(
         browser=config.BROWSER,
-        headless=config.HEADLESS
+        headless=config.HEADLESS,
+        replay_mode=config.REPLAY_MODE,
+        replay_archive=config.REPLAY_ARCHIVE,
+        page_load_strategy=config.PAGE_LOAD_STRATEGY
     )
     driver = driver_manager.get_driver()
 
@@ -126,6 +326,19 @@ def setup(request, config):
     # Make screenshot helper available to test
     request.node.screenshot_helper = screenshot_helper
 
+    # Sample the browser process tree (CPU/RSS per test and step)
+    monitor = None
+    if config.RESOURCE_MONITOR == "on":
+        from utils import resource_monitor
+        root_pid = resource_monitor.driver_root_pid(driver)
+        if resource_monitor.available() and root_pid:
+            monitor = resource_monitor.ResourceMonitor(
+                root_pid, config.RESOURCE_SAMPLE_INTERVAL, session=driver.session_id
+            ).start()
+        else:
+            logger.debug("Resource monitor unavailable (needs /proc and a local driver service)")
+    request.node.resource_monitor = monitor
+
     yield driver
 
     # Teardown
@@ -137,9 +350,41 @@ def setup(request, config):
     if hasattr(request.node, 'rep_call') and request.node.rep_call.failed:
         screenshot_helper.capture_on_failure(request.node.name)
 
+    if monitor:
+        monitor.stop()
     driver_manager.quit_driver()
 
 
+@pytest.fixture(scope="function")
+def step_runner(request, setup, config, test_data, screenshot_helper):
+    """
+    Get a StepRunner for the registration flow with retryable steps.
+
+    Failed attempts are added to the HTML report and results.json. With
+    WEB_PERF=warn|fail every page of the flow is also sampled for web
+    performance metrics (plugins/web_perf.py); with RESOURCE_MONITOR=on
+    browser CPU/RSS is accounted per step (plugins/resources.py).
+
+    Yields:
+        StepRunner bound to this test's driver and test data
+    """
+    from flows.registration_flow import FlowContext
+    from flows.step_runner import StepRunner
+    ctx = FlowContext(driver=setup, config=config, data=test_data, screenshot_helper=screenshot_helper)
+    perf = None
+    if config.WEB_PERF != "off":
+        from utils.web_perf import WebPerfCollector
+        perf = WebPerfCollector(
+            os.path.join(request.config.test_run_dir, f"web_perf_{get_worker_id()}.jsonl"),
+            request.config.web_perf_budgets, test=request.node.nodeid, worker=get_worker_id()
+        )
+    runner = StepRunner(ctx, retries=config.STEP_RETRIES, perf=perf, monitor=request.node.resource_monitor)
+    request.node.step_runner = runner
+    yield runner
+    if perf:
+        perf.flush()
+
+
 @pytest.fixture(scope="function")
 def screenshot_helper(request):
     """
@@ -169,46 +414,55 @@ def pytest_runtest_makereport(item, call):
     extra = getattr(rep, 'extra', [])
 
     if rep.when == 'call':
-        # Add screenshots to report if test has screenshot helper
+        # Record step retries so flaky steps stay visible even when the test passes
+        runner = getattr(item, 'step_runner', None)
+        if runner and runner.summary():
+            rep.user_properties.append(("step_retries", runner.summary()))
+            if hasattr(pytest, 'html'):
+                extra.append(pytest.html.div(
+                    pytest.html.strong("Step retries: "),
+                    pytest.html.ul(*[
+                        pytest.html.li(f"{r['step']} attempt {r['attempt']}: {r['error']}")
+                        for r in runner.summary()
+                    ]),
+                    className="step-retries"
+                ))
+
+        # A/B variants this test was served (aggregated into results.json by RunResults)
+        served = drain_served_variants()
+        if served:
+            rep.user_properties.append(("variants", served))
+
+        # Add screenshots captured by this test's helper to the report
         if hasattr(item, 'screenshot_helper'):
-            screenshots_dir = item.config.screenshots_dir
-
-            # Find all screenshots for this test (if any were captured)
-            if os.path.exists(screenshots_dir):
-                screenshots = [
-                    f for f in os.listdir(screenshots_dir)
-                    if f.endswith('.png') and not f.startswith('FAILED_')
-                ]
+            test_run_dir = item.config.test_run_dir
+            helper = item.screenshot_helper
 
-                # Add screenshots to HTML report
-                for screenshot in sorted(screenshots):
-                    screenshot_path = os.path.join(screenshots_dir, screenshot)
-                    # Use relative path for HTML report
-                    relative_path = os.path.join("screenshots", screenshot)
+            for screenshot_path in helper.captured:
+                if not screenshot_path.endswith('.png') or os.path.basename(screenshot_path).startswith('FAILED_'):
+                    continue
+                # Use path relative to the run folder (report.html lives there)
+                relative_path = os.path.relpath(screenshot_path, test_run_dir)
 
-                    if hasattr(pytest, 'html'):
-                        extra.append(pytest.html.div(
-                            pytest.html.img(src=relative_path),
-                            className="screenshot"
-                        ))
+                if hasattr(pytest, 'html'):
+                    extra.append(pytest.html.div(
+                        pytest.html.img(src=relative_path),
+                        className="screenshot"
+                    ))
 
             # Add HTML source files for failures
-            failures_dir = os.path.join(screenshots_dir, "failures")
-            if rep.failed and os.path.exists(failures_dir):
-                html_files = [
-                    f for f in os.listdir(failures_dir)
-                    if f.endswith('.html')
-                ]
+            if rep.failed:
+                html_files = [f for f in helper.captured if f.endswith('.html')]
 
                 # Add HTML source files as links in report
-                for html_file in sorted(html_files):
-                    relative_path = os.path.join("screenshots", "failures", html_file)
+                for html_path in html_files:
+                    relative_path = os.path.relpath(html_path, test_run_dir)
 
                     if hasattr(pytest, 'html'):
                         extra.append(pytest.html.div(
                             pytest.html.p(
                                 pytest.html.strong("HTML Source at Failure: "),
-                                pytest.html.a(html_file, href=relative_path, target="_blank")
+                                pytest.html.a(os.path.basename(html_path), href=relative_path, target="_blank")
                             ),
                             className="html-source"
                         ))
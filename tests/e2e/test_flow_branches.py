@@ -0,0 +1,59 @@
+"""
+Test Flow Branches
+
+This module checks the pages at the branch points of the registration flow.
+Each test declares the flow path it starts after; the flow_prefix plugin runs
+the shared steps once per worker and restores checkpoints for the rest.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import pytest
+from pages.issues_page import IssuesPage
+from pages.order_summary_page import OrderSummaryPage
+from pages.registration_page import RegistrationPage
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@pytest.mark.regression
+@pytest.mark.e2e
+@pytest.mark.registration
+class TestFlowBranches:
+    """Tests for pages reached by different flow paths."""
+
+    @pytest.mark.flow_path(until="pet_info")
+    def test_issues_page_after_pet_info(self, flow_session):
+        """Select an issue card on the issues page."""
+        issues_page = flow_session.page(IssuesPage)
+        assert issues_page.verify_issues_page_loaded(), "Issues page did not load"
+
+        issues_page.select_issue_by_id(flow_session.data['issues'][0])
+        assert issues_page.is_issue_selected(flow_session.data['issues'][0]), "Issue was not selected"
+        assert issues_page.is_continue_enabled(), "Continue button is disabled"
+
+    @pytest.mark.flow_path(until="modal")
+    def test_registration_page_after_issues(self, flow_session):
+        """Registration page is shown after the issues and modal steps."""
+        registration_page = flow_session.page(RegistrationPage)
+        assert registration_page.verify_registration_page_loaded(), "Registration page did not load"
+
+    @pytest.mark.flow_path(until="plan")
+    def test_order_summary_with_1year_plan(self, flow_session):
+        """Order summary shows the selected 1-year plan."""
+        order_summary_page = flow_session.page(OrderSummaryPage)
+        assert order_summary_page.verify_order_summary_page_loaded(), "Order summary page did not load"
+        plan_name = order_summary_page.get_plan_name()
+        logger.info(f"Plan: {plan_name} - {order_summary_page.get_plan_price()}")
+        assert "1 Year" in plan_name, f"Expected the 1-year plan, got '{plan_name}'"
+
+    @pytest.mark.flow_path("plan_2year", until="registration")
+    def test_order_summary_with_2year_plan(self, flow_session):
+        """Order summary shows the selected 2-year plan."""
+        order_summary_page = flow_session.page(OrderSummaryPage)
+        assert order_summary_page.verify_order_summary_page_loaded(), "Order summary page did not load"
+        plan_name = order_summary_page.get_plan_name()
+        logger.info(f"Plan: {plan_name} - {order_summary_page.get_plan_price()}")
+        assert "2 Year" in plan_name, f"Expected the 2-year plan, got '{plan_name}'"
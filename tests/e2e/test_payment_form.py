@@ -0,0 +1,47 @@
+"""
+Test Payment Form
+
+This module tests the checkout payment form. The browser is brought to the
+payment step from a flow checkpoint (or by replaying the flow once per run).
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import pytest
+from flows.checkpoints import advance_to
+from flows.registration_flow import FlowContext
+from pages.order_summary_page import OrderSummaryPage
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@pytest.mark.regression
+@pytest.mark.e2e
+@pytest.mark.payment
+class TestPaymentForm:
+    """Tests for the payment form on the order summary page."""
+
+    def test_payment_form_accepts_contact_and_terms(self, setup, config, test_data, screenshot_helper,
+                                                    checkpoint_store):
+        """
+        Fill phone, select card payment and accept terms (DO NOT SUBMIT ORDER).
+
+        Args:
+            setup: WebDriver fixture
+            config: Configuration fixture
+            test_data: Test data fixture
+            screenshot_helper: Screenshot helper fixture
+            checkpoint_store: Flow checkpoint store fixture
+        """
+        ctx = FlowContext(driver=setup, config=config, data=test_data, screenshot_helper=screenshot_helper)
+        restored = advance_to(ctx, "payment", checkpoint_store)
+        logger.info(f"At payment step ({'restored from checkpoint' if restored else 'replayed flow'})")
+
+        order_summary_page = ctx.page(OrderSummaryPage)
+        assert order_summary_page.verify_order_summary_page_loaded(), "Order summary page did not load"
+
+        order_summary_page.payment.enter_phone_number(ctx.data['contact_info']['phone'])
+        order_summary_page.payment.select_card_payment()
+        order_summary_page.payment.accept_terms()
@@ -0,0 +1,45 @@
+"""
+Test Registration Scenarios
+
+This module runs the registration flow over a pairwise (or t-wise, see
+SCENARIO_STRENGTH) covering array of pet type, state and health issues.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import pytest
+from config.settings import Config
+from flows.registration_flow import FlowContext, REGISTRATION_FLOW, run_flow
+from utils.logger import setup_logger
+from utils.scenarios import apply_scenario, registration_scenarios, scenario_params
+
+logger = setup_logger(__name__)
+
+SCENARIOS = registration_scenarios(strength=Config.SCENARIO_STRENGTH)
+
+
+@pytest.mark.regression
+@pytest.mark.e2e
+@pytest.mark.registration
+@pytest.mark.slow
+class TestRegistrationScenarios:
+    """Registration flow across combinatorial scenarios."""
+
+    @pytest.mark.parametrize("scenario", scenario_params(SCENARIOS))
+    def test_registration_scenario(self, setup, config, test_data, screenshot_helper, scenario):
+        """
+        Run the registration flow (stopping before order submission) for one scenario.
+
+        Args:
+            setup: WebDriver fixture
+            config: Configuration fixture
+            test_data: Test data fixture
+            screenshot_helper: Screenshot helper fixture
+            scenario: Scenario from the covering array
+        """
+        data = apply_scenario(test_data, scenario)
+        logger.info(f"Scenario {scenario.id}: {data['pet_info']} issues={data['issues']}")
+
+        ctx = FlowContext(driver=setup, config=config, data=data, screenshot_helper=screenshot_helper)
+        run_flow(ctx, REGISTRATION_FLOW)
@@ -0,0 +1,159 @@
+"""
+Test AsyncWebDriver
+
+This module contains tests for the asyncio HTTP/1.1 client of the async
+WebDriver and the XPath literal helper, against a local asyncio server.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from utils.async_webdriver import AsyncHTTPClient, xpath_literal
+
+
+class FakeDriverServer:
+    """
+    Driver server answering with scripted raw responses.
+
+    Each request gets the next response from the script; None closes the
+    connection without answering (what a driver does to an idle keep-alive
+    connection it already dropped).
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.connections = 0
+        self.handlers = []
+        self.server = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self.handlers.append(asyncio.current_task())
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = int(next((line.split(b":")[1] for line in head.split(b"\r\n")
+                                   if line.lower().startswith(b"content-length")), b"0"))
+                body = await reader.readexactly(length)
+                self.requests.append((head.split(b" ")[0].decode(), body))
+                response = self.responses.pop(0)
+                if response is None:
+                    break
+                writer.write(response)
+                await writer.drain()
+                if b"Connection: close" in response:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass  # Client closed the connection
+        finally:
+            writer.close()
+
+    async def stop(self):
+        self.server.close()
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        await self.server.wait_closed()
+
+
+def json_response(value, close: bool = False) -> bytes:
+    body = json.dumps({"value": value}).encode()
+    return (f"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+            f"{'Connection: close' if close else 'Connection: keep-alive'}\r\n\r\n").encode() + body
+
+
+def chunked_response(value, chunk_size: int = 5) -> bytes:
+    body = json.dumps({"value": value}).encode()
+    chunks = b"".join(f"{len(body[i:i + chunk_size]):x};ext=1\r\n".encode() + body[i:i + chunk_size] + b"\r\n"
+                      for i in range(0, len(body), chunk_size))
+    return b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n" + chunks + b"0\r\n\r\n"
+
+
+def exchange(responses, calls):
+    """Run calls(client) against a FakeDriverServer; returns (results or exception, server, client)."""
+
+    async def run():
+        server = FakeDriverServer(responses)
+        client = AsyncHTTPClient(await server.start(), timeout=5)
+        try:
+            return await calls(client), server, client
+        except Exception as e:
+            return e, server, client
+        finally:
+            await client.close()
+            await server.stop()
+
+    return asyncio.run(run())
+
+
+class TestAsyncHTTPClient:
+    """Tests for HTTP/1.1 parsing, keep-alive reuse and retries."""
+
+    def test_content_length_and_chunked_bodies_on_one_kept_alive_connection(self):
+        async def calls(client):
+            return [await client.request("GET", "/status"),
+                    await client.request("POST", "/session", {"capabilities": {}}),
+                    await client.request("GET", "/status")]
+
+        results, server, client = exchange(
+            [json_response("ready"), chunked_response({"sessionId": "abc"}), json_response(["x" * 40])], calls)
+        assert results == [(200, {"value": "ready"}), (200, {"value": {"sessionId": "abc"}}),
+                           (200, {"value": ["x" * 40]})]
+        assert client.connections_opened == server.connections == 1
+        assert server.requests[1] == ("POST", b'{"capabilities": {}}')
+
+    def test_connection_close_is_not_reused(self):
+        async def calls(client):
+            return [await client.request("GET", "/a"), await client.request("GET", "/b")]
+
+        results, server, client = exchange([json_response(1, close=True), json_response(2)], calls)
+        assert [value for _, value in results] == [{"value": 1}, {"value": 2}]
+        assert client.connections_opened == 2
+
+    def test_idempotent_request_is_resent_after_the_server_drops_a_reused_connection(self):
+        async def calls(client):
+            await client.request("GET", "/a")
+            return await client.request("GET", "/b")
+
+        result, server, client = exchange([json_response(1), None, json_response(2)], calls)
+        assert result == (200, {"value": 2})
+        assert [method for method, _ in server.requests] == ["GET", "GET", "GET"]
+        assert client.connections_opened == 2
+
+    def test_post_is_not_resent_once_it_went_out(self):
+        async def calls(client):
+            await client.request("GET", "/a")
+            return await client.request("POST", "/element/1/click", {})
+
+        result, server, client = exchange([json_response(1), None, json_response(2)], calls)
+        assert isinstance(result, ConnectionError)
+        assert [method for method, _ in server.requests] == ["GET", "POST"]  # The click ran once
+
+    def test_truncated_body_raises(self):
+        async def calls(client):
+            return await client.request("GET", "/a")
+
+        truncated = b"HTTP/1.1 200 OK\r\nContent-Length: 50\r\nConnection: close\r\n\r\n{\"value\": 1"
+        result, _, _ = exchange([truncated], calls)
+        assert isinstance(result, asyncio.IncompleteReadError)
+
+
+class TestXPathLiteral:
+    """Tests for quoting option values and labels in XPath."""
+
+    @pytest.mark.parametrize("value, literal", [
+        ("Dog", "'Dog'"),
+        ("Dog's food", '"Dog\'s food"'),
+        ('Say "hi"', "'Say \"hi\"'"),
+        ("It's \"x\"", "concat('It', \"'\", 's \"x\"')"),
+    ])
+    def test_quotes(self, value, literal):
+        assert xpath_literal(value) == literal
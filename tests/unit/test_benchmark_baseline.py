@@ -0,0 +1,49 @@
+"""
+Test Benchmark Baseline
+
+This module contains tests for benchmark statistics and baseline regression gating.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import pytest
+from benchmarks.baseline import find_regressions, load_baseline, save_results
+from utils.timing import TimingRecorder, percentile
+
+
+class TestBenchmarkBaseline:
+    """Tests for timing summaries and baseline comparison."""
+
+    def test_percentile_interpolates_between_ranks(self):
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 50) == 3.0
+        assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 95) == pytest.approx(4.8)
+        assert percentile([], 95) == 0.0
+
+    def test_recorder_summary(self):
+        recorder = TimingRecorder()
+        for value in (0.1, 0.2, 0.3):
+            recorder.record("step:home", value)
+        summary = recorder.summary()["step:home"]
+        assert summary["count"] == 3
+        assert summary["median"] == pytest.approx(0.2)
+
+    def test_regression_requires_relative_and_absolute_slowdown(self):
+        baseline = {"metrics": {
+            "step:home": {"median": 1.0, "p95": 1.2},
+            "page:HomePage.click_primary_cta": {"median": 0.010, "p95": 0.012},
+        }}
+        current = {
+            "step:home": {"median": 1.5, "p95": 1.3},
+            "page:HomePage.click_primary_cta": {"median": 0.030, "p95": 0.040},
+        }
+        regressions = find_regressions(baseline, current, threshold=0.20, min_delta=0.05)
+        assert [(r.key, r.statistic) for r in regressions] == [("step:home", "median")]
+
+    def test_save_and_load_round_trip(self, tmp_path):
+        path = str(tmp_path / "baseline.json")
+        assert load_baseline(path) is None
+        save_results(path, {"step:home": {"median": 1.0}}, browser="chrome")
+        loaded = load_baseline(path)
+        assert loaded["browser"] == "chrome"
+        assert loaded["metrics"]["step:home"]["median"] == 1.0
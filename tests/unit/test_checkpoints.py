@@ -0,0 +1,167 @@
+"""
+Test Checkpoints
+
+This module contains tests for flow checkpoints: the store, restore validation
+and the advance_to fallback, against a fake driver.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import json
+import os
+import threading
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from flows import checkpoints
+from flows.checkpoints import Checkpoint, CheckpointStore, advance_to, restore_checkpoint
+from flows.registration_flow import FlowContext, FlowStep
+
+CONFIG = SimpleNamespace(PAGE_LOAD_STRATEGY="normal", PAGE_LOAD_TIMEOUT=5)
+
+
+class FakeDriver:
+    """Browser with per-host cookies, web storage and optional server redirects."""
+
+    def __init__(self, redirects=None, fail_on=None):
+        self.current_url = "about:blank"
+        self.redirects = redirects or {}
+        self.fail_on = fail_on
+        self.cookies = []
+        self.storage = ({}, {})
+        self.visited = []
+
+    def get(self, url):
+        if url == self.fail_on:
+            raise WebDriverException("net::ERR_CONNECTION_REFUSED")
+        self.visited.append(url)
+        self.current_url = self.redirects.get(url, url)
+
+    def delete_all_cookies(self):
+        self.cookies = []
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def get_cookies(self):
+        return list(self.cookies)
+
+    def execute_script(self, script, *args):
+        if script == checkpoints.RESTORE_STORAGE_SCRIPT:
+            self.storage = (dict(args[0]), dict(args[1]))
+            return None
+        return [dict(self.storage[0]), dict(self.storage[1])]
+
+
+def plan_checkpoint(**kwargs) -> Checkpoint:
+    values = dict(step="registration", url="https://www.dutch.com/register/plans",
+                  cookies=[{"name": "dutch_session", "value": "s1", "domain": ".dutch.com", "path": "/"},
+                           {"name": "ads", "value": "x", "domain": "tracker.example", "path": "/"}],
+                  local_storage={"reg_pet": "{}"}, session_storage={"reg_step": "plan"},
+                  data={"email": "qa+1@yopmail.com"})
+    values.update(kwargs)
+    return Checkpoint(**values)
+
+
+def context(driver) -> FlowContext:
+    return FlowContext(driver=driver, config=CONFIG, data={"email": "fresh@yopmail.com"})
+
+
+class TestCheckpoints:
+    """Tests for CheckpointStore, restore_checkpoint and advance_to."""
+
+    def test_store_persists_atomically_and_expires(self, tmp_path, monkeypatch):
+        store = CheckpointStore(str(tmp_path))
+        store.put(plan_checkpoint())
+        assert os.listdir(tmp_path) == ["registration-registration.json"]
+
+        # Another worker's store reads the file
+        other = CheckpointStore(str(tmp_path))
+        assert other.get("registration") == plan_checkpoint(created=other.get("registration").created)
+        assert CheckpointStore(str(tmp_path), max_age=-1).get("registration") is None
+
+        # A failed write never leaves a partial file behind the real name
+        def broken_dump(obj, f, **kwargs):
+            f.write("{")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(checkpoints.json, "dump", broken_dump)
+        with pytest.raises(OSError):
+            CheckpointStore(str(tmp_path)).put(plan_checkpoint(data={"email": "other@yopmail.com"}))
+        monkeypatch.undo()
+        assert os.listdir(tmp_path) == ["registration-registration.json"]
+        with open(store.path("registration")) as f:
+            assert json.load(f)["data"] == {"email": "qa+1@yopmail.com"}
+
+        store.invalidate("registration")
+        assert store.get("registration") is None and not os.path.exists(store.path("registration"))
+
+    def test_concurrent_puts_leave_one_complete_file(self, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        threads = [threading.Thread(target=store.put, args=(plan_checkpoint(data={"n": n}),)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert os.listdir(tmp_path) == ["registration-registration.json"]
+        with open(store.path("registration")) as f:
+            assert json.load(f)["data"]["n"] in range(8)
+
+    def test_restore_sets_origin_cookies_and_storage_then_loads_the_url(self):
+        driver = FakeDriver()
+        assert restore_checkpoint(context(driver), plan_checkpoint())
+        assert driver.visited == ["https://www.dutch.com/robots.txt", "https://www.dutch.com/register/plans"]
+        assert [cookie["name"] for cookie in driver.cookies] == ["dutch_session"]  # Other domains skipped
+        assert driver.storage == ({"reg_pet": "{}"}, {"reg_step": "plan"})
+
+    def test_restore_is_invalid_after_redirect_unready_page_or_driver_error(self):
+        redirected = FakeDriver(redirects={"https://www.dutch.com/register/plans": "https://www.dutch.com/register/account"})
+        assert not restore_checkpoint(context(redirected), plan_checkpoint())
+
+        unready = FlowStep("plan", "Select plan", lambda ctx: None, lambda ctx: False)
+        ready = FlowStep("plan", "Select plan", lambda ctx: None, lambda ctx: True)
+        assert not restore_checkpoint(context(FakeDriver()), plan_checkpoint(), unready)
+        assert restore_checkpoint(context(FakeDriver()), plan_checkpoint(), ready)
+
+        offline = FakeDriver(fail_on="https://www.dutch.com/robots.txt")
+        assert not restore_checkpoint(context(offline), plan_checkpoint())
+
+    def test_advance_to_restores_or_falls_back_to_replay(self, tmp_path):
+        ran = []
+
+        def step(name, ready=None):
+            def action(ctx):
+                ran.append(name)
+                ctx.driver.get(f"https://www.dutch.com/{name}")
+            return FlowStep(name, name, action, ready)
+
+        page_ok = {"plan": True}
+        steps = [step("home"), step("registration"), step("plan", lambda ctx: page_ok["plan"])]
+        store = CheckpointStore(str(tmp_path))
+
+        # Nothing cached: the steps before 'plan' are replayed and checkpointed
+        ctx = context(FakeDriver())
+        assert advance_to(ctx, "plan", store, steps) is False
+        assert ran == ["home", "registration"]
+        assert urlsplit(store.get("registration").url).path == "/registration"
+
+        # Cached and valid: restored with the checkpoint's data, no step runs
+        ran.clear()
+        ctx = context(FakeDriver())
+        store.put(plan_checkpoint(url="https://www.dutch.com/registration"))
+        assert advance_to(ctx, "plan", store, steps) is True
+        assert ran == [] and ctx.data == {"email": "qa+1@yopmail.com"}
+
+        # Cached but the page is not ready: checkpoint dropped, flow replayed
+        page_ok["plan"] = False
+        ctx = context(FakeDriver())
+        assert advance_to(ctx, "plan", store, steps) is False
+        assert ran == ["home", "registration"] and ctx.data == {"email": "fresh@yopmail.com"}
+
+        assert advance_to(context(FakeDriver()), "home", store, steps) is False
+        with pytest.raises(KeyError):
+            advance_to(context(FakeDriver()), "payment", store, steps)
@@ -0,0 +1,97 @@
+"""
+Test DataFactory
+
+This module contains tests for unique test data: the persistent counter,
+emails across processes, phone numbers and the test_data fixture.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.data_factory import DataFactory, PersistentCounter
+
+BASE_DATA = {
+    "test_users": [{"email": "qa@yopmail.com", "password": "TestPass123!@#"}],
+    "contact_info": {"phone": "5551234567"},
+    "pet_info": {"pet_name": "BUDDY"},
+}
+
+# NANP: area code and exchange start with 2-9 and are not N11
+NANP_PHONE = re.compile(r"^[2-9](?!11)\d{2}[2-9](?!11)\d{2}\d{4}$")
+
+
+def emails_of_worker(worker_id: str, counter_path: str, count: int) -> list:
+    """Generate emails in a separate process, as an xdist worker would."""
+    os.environ["PYTEST_XDIST_WORKER"] = worker_id
+    factory = DataFactory("qa@yopmail.com", counter=PersistentCounter(counter_path, block_size=7))
+    return [factory.user()["email"] for _ in range(count)]
+
+
+class TestDataFactory:
+    """Tests for DataFactory and PersistentCounter."""
+
+    def test_counter_reserves_blocks_under_the_file_lock(self, tmp_path):
+        path = str(tmp_path / "counter")
+        counters = [PersistentCounter(path, block_size=5) for _ in range(4)]
+        values = []
+        lock = threading.Lock()
+
+        def draw(counter):
+            for _ in range(12):
+                value = counter.next()
+                with lock:
+                    values.append(value)
+
+        threads = [threading.Thread(target=draw, args=(counter,)) for counter in counters for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(values) == len(set(values)) == 96
+        # Every counter took whole blocks: the file holds the end of the last block handed out
+        with open(path) as f:
+            reserved = int(f.read())
+        assert reserved % 5 == 0 and reserved > max(values)
+
+        # A new counter (next run) continues after the reserved blocks
+        assert PersistentCounter(path, block_size=5).next() > max(values)
+
+    def test_emails_are_unique_across_processes(self, tmp_path):
+        path = str(tmp_path / "counter")
+        with ProcessPoolExecutor(max_workers=3) as pool:
+            batches = list(pool.map(emails_of_worker, ["gw0", "gw1", "main"], [path] * 3, [20] * 3))
+
+        emails = [email for batch in batches for email in batch]
+        assert len(set(emails)) == 60
+        assert all(re.fullmatch(r"qa\+[0-9a-z]+@yopmail\.com", email) for email in emails)
+        assert all("gw0n" in email for email in batches[0]) and all("mn" in email for email in batches[2])
+
+    def test_phone_numbers_are_valid_and_unique(self, tmp_path):
+        factory = DataFactory(seed=7, counter=PersistentCounter(str(tmp_path / "counter"), block_size=10000))
+        phones = [factory.phone() for _ in range(20050)]  # Crosses into a second area code / exchange
+        assert all(NANP_PHONE.match(phone) for phone in phones)
+        assert len(set(phones)) == len(phones)
+
+    def test_test_data_copies_base_with_a_unique_user_and_phone(self, tmp_path):
+        factory = DataFactory.for_test_data(BASE_DATA, counter=PersistentCounter(str(tmp_path / "counter")))
+        first, second = factory.test_data(BASE_DATA), factory.test_data(BASE_DATA)
+
+        assert factory.local_part == "qa" and factory.domain == "yopmail.com"
+        assert first["test_users"][0]["email"] != second["test_users"][0]["email"]
+        assert first["test_users"][0]["email"].startswith("qa+")
+        assert first["test_users"][0]["password"] == "TestPass123!@#"  # Known to satisfy the site's rules
+        assert first["contact_info"]["phone"] != second["contact_info"]["phone"]
+        assert first["pet_info"] is not BASE_DATA["pet_info"]
+        assert BASE_DATA["test_users"][0]["email"] == "qa@yopmail.com"  # Base left untouched
+
+    def test_fixture_gives_each_test_its_own_copy(self, test_data, base_test_data):
+        assert test_data is not base_test_data
+        assert test_data["test_users"][0]["email"] != base_test_data["test_users"][0]["email"]
+        test_data["pet_info"]["pet_name"] = "CHANGED"
+        assert base_test_data["pet_info"]["pet_name"] != "CHANGED"
@@ -0,0 +1,95 @@
+"""
+Test Flow Prefix
+
+This module contains tests for flow path grouping and checkpoint fallback in
+the flow prefix plugin.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from flows import checkpoints
+from flows.checkpoints import Checkpoint
+from plugins import flow_prefix
+from plugins.flow_prefix import SharedFlowSession, assign_groups, resolve_path
+
+
+class FakeDriver:
+    """Driver whose cookies are only ever cleared."""
+
+    def __init__(self):
+        self.cleared = 0
+
+    def delete_all_cookies(self):
+        self.cleared += 1
+
+
+def checkpoint(step: str, email: str) -> Checkpoint:
+    return Checkpoint(step, f"https://www.dutch.com/{step}", [], {}, {}, data={"email": email})
+
+
+def shared_session(monkeypatch, broken_steps):
+    """SharedFlowSession with a fake browser; steps record their name, checkpoints of broken_steps fail."""
+    session = SharedFlowSession("screenshots")
+    session.driver_manager = SimpleNamespace(driver=FakeDriver())
+    session.screenshot_helper = SimpleNamespace(captured=[])
+    session.ran = []
+    monkeypatch.setattr(flow_prefix, "get_step", lambda name: SimpleNamespace(
+        name=name, description=name, action=lambda ctx: session.ran.append(name)))
+    monkeypatch.setattr(checkpoints, "restore_checkpoint", lambda ctx, cp, next_step: cp.step not in broken_steps)
+    monkeypatch.setattr(checkpoints, "capture_checkpoint", lambda ctx, step: checkpoint(step, ctx.data["email"]))
+    return session
+
+
+class TestFlowPrefix:
+    """Tests for flow path resolution, prefix groups and shared session restores."""
+
+    def test_resolve_path_expands_until(self):
+        mark = pytest.mark.flow_path("plan_2year", until="registration").mark
+        assert resolve_path(mark) == ("home", "cta", "pet_info", "issues", "modal", "registration", "plan_2year")
+
+        with pytest.raises(KeyError):
+            resolve_path(pytest.mark.flow_path("no_such_step").mark)
+
+    def test_groups_split_at_first_branch(self):
+        trunk = ("home", "cta", "pet_info", "issues", "modal", "registration")
+        paths = [trunk + ("plan",), trunk + ("plan", "payment"), trunk + ("plan_2year",)]
+        groups = assign_groups(paths)
+        assert groups[paths[0]] == groups[paths[1]] == "flow:" + ">".join(trunk + ("plan",))
+        assert groups[paths[2]] == "flow:" + ">".join(trunk + ("plan_2year",))
+
+        # A test ending on the trunk keeps the trunk in its own group
+        groups = assign_groups([trunk[:3]] + paths)
+        assert groups[trunk[:3]] == "flow:home>cta>pet_info"
+        assert len(set(groups.values())) == 2
+
+        assert set(assign_groups(paths, depth=2).values()) == {"flow:home>cta"}
+
+    def test_failed_restore_falls_back_to_the_next_shorter_checkpoint(self, monkeypatch):
+        session = shared_session(monkeypatch, broken_steps={"issues"})
+        for path in [("home",), ("home", "cta"), ("home", "cta", "pet_info"), ("home", "cta", "pet_info", "issues")]:
+            session.checkpoints[path] = checkpoint(path[-1], f"{path[-1]}@yopmail.com")
+
+        ctx, steps_run, restored = session.prepare(("home", "cta", "pet_info", "issues", "modal"),
+                                                   {"email": "fresh@yopmail.com"})
+
+        assert (steps_run, restored) == (2, True)
+        assert session.ran == ["issues", "modal"]
+        assert ctx.data == {"email": "pet_info@yopmail.com"}  # Data of the restored checkpoint
+        assert session.checkpoints[("home", "cta", "pet_info", "issues")].data == {"email": "pet_info@yopmail.com"}
+
+    def test_without_a_valid_checkpoint_the_flow_starts_from_home_with_fresh_data(self, monkeypatch):
+        session = shared_session(monkeypatch, broken_steps={"home", "cta"})
+        session.checkpoints[("home",)] = checkpoint("home", "old@yopmail.com")
+        session.checkpoints[("home", "cta")] = checkpoint("cta", "old@yopmail.com")
+
+        ctx, steps_run, restored = session.prepare(("home", "cta"), {"email": "fresh@yopmail.com"})
+
+        assert (steps_run, restored) == (2, False)
+        assert session.ran == ["home", "cta"]
+        assert ctx.data == {"email": "fresh@yopmail.com"}
+        assert session.driver_manager.driver.cleared == 1
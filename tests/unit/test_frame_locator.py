@@ -0,0 +1,165 @@
+"""
+Test FrameLocator
+
+This module contains tests for frame locators and BasePage.in_frame.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import pickle
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from pages.components.payment_component import PaymentComponent
+from utils.frame_locator import FrameLocator
+from utils.locator_lint import run_lint
+
+CARD_FRAME = PaymentComponent.payment_component_card_number_frame
+EXPIRY_FRAME = PaymentComponent.payment_component_card_expiry_frame
+CVC_FRAME = PaymentComponent.payment_component_card_cvc_frame
+
+
+class FakeElement:
+    """Element (or frame element) that records what is typed into it."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.typed = ""
+        self.stale = False
+
+    def is_displayed(self):
+        return True
+
+    def clear(self):
+        self.typed = ""
+
+    def send_keys(self, text):
+        self.typed += text
+
+
+class FakeSwitchTo:
+    """Records switch commands and tracks the frame the driver is in."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def frame(self, element):
+        if element.stale:
+            raise StaleElementReferenceException("stale element reference")
+        self.driver.commands.append(f"frame:{element.name}")
+        self.driver.path.append(element.name)
+
+    def parent_frame(self):
+        self.driver.commands.append("parent")
+        self.driver.path.pop()
+
+    def default_content(self):
+        self.driver.commands.append("default")
+        self.driver.path.clear()
+
+
+class FakeDriver:
+    """Documents per frame path (frame element names), elements found by locator value."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.path = []
+        self.commands = []
+        self.switch_to = FakeSwitchTo(self)
+
+    def find_element(self, by, value):
+        self.commands.append(f"find:{value}")
+        element = self.documents.get(tuple(self.path), {}).get(value)
+        if element is None:
+            raise NoSuchElementException(value)
+        return element
+
+
+def stripe_driver() -> FakeDriver:
+    return FakeDriver({
+        (): {CARD_FRAME[1]: FakeElement("card"), EXPIRY_FRAME[1]: FakeElement("expiry"),
+             CVC_FRAME[1]: FakeElement("cvc")},
+        ("card",): {"cardnumber": FakeElement("cardnumber")},
+        ("expiry",): {"exp-date": FakeElement("exp-date")},
+        ("cvc",): {"cvc": FakeElement("cvc")},
+    })
+
+
+class TestFrameLocator:
+    """Tests for FrameLocator and frame switching in BasePage."""
+
+    def test_is_the_element_tuple_and_pickles(self):
+        locator = PaymentComponent.payment_component_card_number_input
+        assert locator == (By.NAME, "cardnumber") and locator.frames == (CARD_FRAME,)
+        assert pickle.loads(pickle.dumps(locator)).frames == (CARD_FRAME,)
+        with pytest.raises(ValueError):
+            FrameLocator((By.NAME, "cardnumber"))
+
+    def test_card_fields_cost_one_switch_in_and_out_with_cached_frames(self):
+        driver = stripe_driver()
+        payment = PaymentComponent(driver)
+        payment.fill_card_details("4242424242424242", "12", "2030", "123")
+        assert driver.documents[("card",)]["cardnumber"].typed == "4242424242424242"
+        assert driver.documents[("expiry",)]["exp-date"].typed == "12/30"
+        assert driver.path == []
+
+        driver.commands.clear()
+        payment.fill_card_details("4000056655665556", "01", "2031", "456")
+        assert driver.commands == [
+            "frame:card", "find:cardnumber", "parent",
+            "frame:expiry", "find:exp-date", "parent",
+            "frame:cvc", "find:cvc", "parent",
+        ]
+
+    def test_in_frame_block_sends_no_switch_and_restores_on_error(self):
+        driver = stripe_driver()
+        payment = PaymentComponent(driver)
+        with pytest.raises(RuntimeError):
+            with payment.in_frame(CARD_FRAME):
+                driver.commands.clear()
+                payment.enter_text(payment.payment_component_card_number_input, "4242")
+                assert driver.commands == ["find:cardnumber"]
+                raise RuntimeError("typing failed")
+        assert driver.path == [] and payment._frame_path == ()
+
+    def test_stale_frame_is_found_again_and_navigation_resets(self):
+        driver = stripe_driver()
+        payment = PaymentComponent(driver)
+        cvc_input = payment.payment_component_card_cvc_input
+        payment.enter_text(cvc_input, "1")
+        driver.documents[()][CVC_FRAME[1]].stale = True  # The frame was re-rendered
+        driver.documents[()][CVC_FRAME[1]] = FakeElement("cvc")
+        payment.enter_text(cvc_input, "2")
+        assert driver.commands.count(f"find:{CVC_FRAME[1]}") == 2
+        assert driver.documents[("cvc",)]["cvc"].typed == "2"
+
+        driver.get = lambda url: None
+        payment.navigate_to("https://www.dutch.com/")
+        assert payment._frame_handles == {}
+
+    def test_nested_frames_and_missing_frame(self):
+        outer, inner, other = (By.ID, "outer"), (By.ID, "inner"), (By.ID, "other")
+        driver = FakeDriver({
+            (): {"outer": FakeElement("outer")},
+            ("outer",): {"inner": FakeElement("inner"), "other": FakeElement("other")},
+            ("outer", "inner"): {"a": FakeElement("a")},
+            ("outer", "other"): {"b": FakeElement("b")},
+        })
+        page = BasePage(driver)
+        with page.in_frame(outer, inner):
+            driver.commands.clear()
+            assert page.is_element_present(FrameLocator((By.ID, "b"), outer, other))
+            assert driver.commands == ["parent", "find:other", "frame:other", "find:b", "parent", "frame:inner"]
+        assert driver.path == []
+        assert page.is_element_visible(FrameLocator((By.ID, "a"), (By.ID, "missing")), timeout=0) is False
+        assert driver.path == []
+
+    def test_lint_checks_frame_elements_against_frame_snapshots(self):
+        report = run_lint(snapshot_dir="no-snapshots", stand_in=True)
+        names = {locator.name for locator in report.locators if locator.page == "PaymentComponent"}
+        assert {"payment_component_card_number_input", "payment_component_card_number_frame"} <= names
+        assert not [f for f in report.findings if f.locator.page == "PaymentComponent"]
@@ -0,0 +1,82 @@
+"""
+Test History
+
+This module contains tests for test history statistics.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import os
+from types import SimpleNamespace
+
+from plugins import history
+from plugins.history import HistoryDB, failing_locator
+
+
+class FakeItem:
+    """Collected test with its fixture closure."""
+
+    def __init__(self, nodeid: str, *fixtures: str):
+        self.nodeid = nodeid
+        self.fixturenames = list(fixtures)
+
+    def get_closest_marker(self, name):
+        return None
+
+
+def fake_config(tmp_path, collectonly: bool = False):
+    return SimpleNamespace(option=SimpleNamespace(collectonly=collectonly),
+                           test_run_dir=str(tmp_path / "reports" / "test_run_1"), history_db=None)
+
+
+class TestHistory:
+    """Tests for flake rates, failure likelihood and quarantine."""
+
+    def test_flaky_test_is_quarantined(self, tmp_path):
+        db = HistoryDB(os.path.join(tmp_path, "history.sqlite3"))
+        for run, (stable, flaky) in enumerate([("passed", "passed"), ("passed", "failed"), ("passed", "passed"),
+                                               ("passed", "failed"), ("passed", "passed"), ("failed", "passed")]):
+            db.add_result(f"run{run}", "test_stable", stable, "call", 1.0)
+            db.add_result(f"run{run}", "test_old_failure", "failed" if run == 0 else "passed", "call", 1.0)
+            db.add_result(f"run{run}", "test_flaky", flaky, "call", 2.0,
+                          failing_step="payment" if flaky == "failed" else None)
+        stats = db.stats()
+        db.close()
+
+        assert stats["test_flaky"].flip_rate == 0.8 and stats["test_flaky"].quarantined
+        assert stats["test_flaky"].last_step == "payment"
+        assert not stats["test_stable"].quarantined
+        # A recent failure weighs more than an old one
+        assert stats["test_stable"].likelihood > stats["test_old_failure"].likelihood
+
+    def test_only_browser_tests_open_and_enter_the_history(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "history.sqlite3")
+        monkeypatch.setattr(history.Config, "HISTORY_DB", path)
+        unit = FakeItem("tests/unit/test_a.py::test_unit", "tmp_path")
+        browser = FakeItem("tests/e2e/test_b.py::test_flow", "flow_session", "test_data")
+
+        # Unit-only runs and --collect-only never touch the database
+        runs = [(fake_config(tmp_path), [unit]), (fake_config(tmp_path, collectonly=True), [unit, browser])]
+        for config, items in runs:
+            history.pytest_collection_modifyitems(config, items)
+            assert config.history_db is None
+        assert not os.path.exists(path)
+
+        db = HistoryDB(path)
+        db.add_result("run0", browser.nodeid, "failed", "call", 1.0)
+        db.close()
+        config = fake_config(tmp_path)
+        items = [unit, FakeItem("tests/e2e/test_b.py::test_new", "setup"), browser]
+        history.pytest_collection_modifyitems(config, items)
+        try:
+            # Browser tests ordered by failure likelihood around the unit test, which stays in place
+            assert [item.nodeid for item in items] == [unit.nodeid, browser.nodeid, "tests/e2e/test_b.py::test_new"]
+            assert history.uses_browser(browser) and not history.uses_browser(unit)
+        finally:
+            config.history_db.close()
+
+    def test_failing_locator_from_message(self):
+        message = "TimeoutException: Element ('id', 'phoneNumber') not visible after 10s"
+        assert failing_locator(message) == "id=phoneNumber"
+        assert failing_locator("AssertionError: Home page did not load") is None
@@ -0,0 +1,124 @@
+"""
+Test Impact
+
+This module contains tests for diff-to-symbol mapping and test selection.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import sys
+from types import SimpleNamespace
+
+from flows.checkpoints import capture_checkpoint, restore_checkpoint
+from flows.registration_flow import FlowContext
+from pages.home_page import HomePage
+from plugins.impact import FileChange, ImpactTracer, changed_symbols, select_tests
+
+PAGE_SOURCE = '''"""Payment component."""
+from selenium.webdriver.common.by import By
+
+
+class PaymentComponent:
+    """Payment form."""
+
+    card_radio = (By.ID, "card")
+    terms_checkbox = (By.ID, "terms")
+
+    def select_card_payment(self):
+        # Card is the default tab
+        self.click_element(self.card_radio)
+'''
+
+PAYMENT = "pages/components/payment_component.py"
+
+
+class FakeDriver:
+    """Driver that stays on the last URL loaded and accepts any cookie or script."""
+
+    def __init__(self, url: str = "about:blank"):
+        self.current_url = url
+
+    def get(self, url):
+        self.current_url = url
+
+    def execute_script(self, script, *args):
+        return [{}, {}]
+
+    def get_cookies(self):
+        return []
+
+    def delete_all_cookies(self):
+        pass
+
+    def add_cookie(self, cookie):
+        pass
+
+
+class TestImpact:
+    """Tests for impact analysis."""
+
+    def test_changed_lines_map_to_symbols(self):
+        assert changed_symbols(PAGE_SOURCE, {8}) == ({"PaymentComponent.card_radio"}, False)
+        assert changed_symbols(PAGE_SOURCE, {12, 13}) == ({"PaymentComponent.select_card_payment"}, False)
+        # Docstrings and blank lines don't count, imports affect the whole file
+        assert changed_symbols(PAGE_SOURCE, {1, 6, 7}) == (set(), False)
+        assert changed_symbols(PAGE_SOURCE, {2}) == (set(), True)
+
+    def test_selects_tests_touching_changed_symbols(self):
+        impact_map = {"tests": {
+            "tests/e2e/test_a.py::test_card": [f"{PAYMENT}::PaymentComponent.card_radio"],
+            "tests/e2e/test_a.py::test_home": ["pages/home_page.py::HomePage.click_primary_cta"],
+        }}
+        nodeids = list(impact_map["tests"]) + ["tests/e2e/test_b.py::test_new"]
+
+        changes = {PAYMENT: FileChange(PAYMENT, {"PaymentComponent.card_radio"}), "README.md": FileChange("README.md")}
+        selected, _ = select_tests(impact_map, changes, nodeids)
+        assert selected == {"tests/e2e/test_a.py::test_card", "tests/e2e/test_b.py::test_new"}
+
+        # Changes outside the traced page objects run everything
+        selected, _ = select_tests(impact_map, {"utils/logger.py": FileChange("utils/logger.py")}, nodeids)
+        assert selected is None
+
+    def test_restored_checkpoint_passes_on_the_symbols_of_its_steps(self):
+        tracer = ImpactTracer()
+        config = SimpleNamespace(PAGE_LOAD_STRATEGY="normal")
+        producer = FlowContext(driver=FakeDriver("https://www.dutch.com/plan"), config=config, data={})
+        tracer.start()
+        try:
+            tracer.symbols.add("pages/pet_info_page.py::PetInfoPage.fill_pet_info_form")
+            checkpoint = capture_checkpoint(producer, "plan")
+        finally:
+            tracer.stop()
+        assert "pages/pet_info_page.py::PetInfoPage.fill_pet_info_form" in checkpoint.symbols
+
+        tracer.start()
+        try:
+            assert restore_checkpoint(FlowContext(driver=FakeDriver(), config=config, data={}), checkpoint)
+        finally:
+            symbols = tracer.stop()
+        assert set(checkpoint.symbols) <= set(symbols)
+
+    def test_tracer_records_page_methods_where_they_are_defined(self):
+        page = HomePage(FakeDriver("https://www.dutch.com/"))
+        tracer = ImpactTracer()
+        calls = []
+
+        def profile(frame, event, arg):
+            tracer._profile(frame, event, arg)
+            code = frame.f_code
+            if event == "call" and tracer._relative(code.co_filename):
+                calls.append((ImpactTracer._method_qualname(frame, code), getattr(code, "co_qualname", None)))
+
+        sys.setprofile(profile)
+        try:
+            assert page.verify_home_page_loaded()
+        finally:
+            sys.setprofile(None)
+
+        assert {"pages/home_page.py::HomePage.verify_home_page_loaded",
+                "pages/base_page.py::BasePage.verify_url_contains"} <= tracer.symbols
+        # Without co_qualname (Python < 3.11) the tracer names the same symbols
+        assert calls
+        if sys.version_info >= (3, 11):
+            assert all(fallback == qualname for fallback, qualname in calls)
@@ -0,0 +1,36 @@
+"""
+Test LazyImport
+
+This module contains tests for deferred imports and the import-light
+collection path.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import sys
+
+import pytest
+
+from benchmarks.import_benchmark import loaded_deferred_modules
+from utils.lazy_import import LazyModule, lazy_module
+
+
+class TestLazyImport:
+    """Tests for LazyModule and the modules kept out of collection."""
+
+    def test_module_is_imported_on_first_attribute(self, monkeypatch):
+        monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+        module = lazy_module("colorsys")
+        assert isinstance(module, LazyModule)
+        assert "colorsys" not in sys.modules
+        assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+        assert "colorsys" in sys.modules
+        with pytest.raises(AttributeError):
+            module.no_such_function
+
+    def test_imported_module_is_returned_as_is(self):
+        assert lazy_module("json") is __import__("json")
+
+    def test_collection_does_not_import_selenium_webdriver_or_pil(self):
+        assert loaded_deferred_modules() == []
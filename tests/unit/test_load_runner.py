@@ -0,0 +1,68 @@
+"""
+Test LoadRunner
+
+This module contains tests for the load runner's VU scheduling and report.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import time
+
+import pytest
+
+from runners import load
+from runners.load import BROWSER_START_STEP, LoadSettings, ramp_offsets, split_vus, summarize
+
+
+def iteration(vu: int, steps: dict, failed_step=None, error=None) -> dict:
+    return {"vu": vu, "started": 0.0, "duration": sum(steps.values()), "passed": failed_step is None,
+            "steps": steps, "failed_step": failed_step, "error": error}
+
+
+class TestLoadRunner:
+    """Tests for ramp-up, process split and summary."""
+
+    def test_ramp_offsets_spread_over_ramp_up(self):
+        assert ramp_offsets(5, 20.0) == [0.0, 5.0, 10.0, 15.0, 20.0]
+        assert ramp_offsets(1, 20.0) == [0.0]
+
+    def test_split_vus_round_robin(self):
+        assert split_vus(5, 2) == [[0, 2, 4], [1, 3]]
+        assert split_vus(2, 4) == [[0], [1]]
+
+    def test_summarize_throughput_percentiles_and_errors(self):
+        iterations = [iteration(vu, {"home": 1.0 + vu, "cta": 0.5}) for vu in range(3)]
+        iterations.append(iteration(3, {"home": 2.0, "cta": 9.0}, "cta", "TimeoutException: Message: cta"))
+
+        report = summarize(iterations, ["home", "cta"], window=60.0)
+
+        assert (report["iterations"], report["passed"], report["error_rate"]) == (4, 3, 0.25)
+        assert report["throughput_per_min"] == 3.0
+        assert report["steps"]["home"]["count"] == 4
+        assert report["steps"]["home"]["error_rate"] == 0.0
+        assert report["steps"]["cta"]["error_rate"] == 0.25
+        assert report["flow"]["count"] == 3
+        assert report["flow"]["p50"] == pytest.approx(2.5)
+        assert report["errors"] == {"cta: TimeoutException": 1}
+
+    def test_browser_start_failure_is_a_failed_iteration_with_backoff(self, monkeypatch):
+        def start_browser(config):
+            raise RuntimeError("session not created")
+
+        monkeypatch.setattr(load, "_start_browser", start_browser)
+        monkeypatch.setattr(load, "BROWSER_START_BACKOFF", 0.05)
+        settings = LoadSettings(base_url="http://127.0.0.1:1", browser="chrome", headless=True, steps=["home"],
+                                concurrency=1, ramp_up=0.0, duration=0.3, start_at=time.time())
+
+        iterations = load._run_vu(0, settings)
+
+        # Backoff doubles (0.05, 0.1, 0.2 ...), so a 0.3s run makes a few attempts, not a busy loop
+        assert 2 <= len(iterations) <= 4
+        assert all(not it.passed and it.failed_step == BROWSER_START_STEP for it in iterations)
+        assert iterations[0].error == "RuntimeError: session not created"
+
+    def test_replay_mode_is_rejected(self, monkeypatch):
+        monkeypatch.setattr(load.Config, "REPLAY_MODE", "replay")
+        with pytest.raises(SystemExit):
+            load.main(["--concurrency", "1"])
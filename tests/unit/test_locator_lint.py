@@ -0,0 +1,55 @@
+"""
+Test Locator Lint
+
+This module contains tests for the offline locator lint.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from utils.locator_lint import Locator, discover_locators, format_report, lint, page_keys, run_lint
+
+SNAPSHOT = """
+<html><body>
+  <input id="phoneNumber" name="phone">
+  <a class="button nav" href="/account/register">Join</a>
+  <a class="button cta" href="/account/register">Join Now</a>
+</body></html>
+"""
+
+
+def locator(name: str, strategy: str, value: str) -> Locator:
+    return Locator("CheckoutPage", name, strategy, value, "pages/checkout_page.py", 1)
+
+
+class TestLocatorLint:
+    """Tests for locator discovery and evaluation."""
+
+    def test_discovers_page_object_locators(self):
+        locators = {l.qualname: l for l in discover_locators()}
+        assert locators["PaymentComponent.payment_component_phone_input"].value == "phoneNumber"
+        assert locators["PetInfoPage.pet_info_page_pet_name_input[b]"].value == "petName"
+        assert page_keys("OrderSummaryPage") == ["order_summary"]
+
+    def test_reports_zero_multi_ambiguous_and_invalid(self):
+        report = lint([
+            locator("phone", "id", "phoneNumber"),
+            locator("phone_by_name", "name", "phone"),
+            locator("join_links", "css selector", "a.button"),
+            locator("missing", "class name", "PhoneNumberInput-tooltipIcon"),
+            locator("broken", "xpath", "//a[@href="),
+        ], {"checkout": SNAPSHOT})
+
+        kinds = {(f.kind, f.locator.name) for f in report.findings}
+        assert kinds == {("ambiguous", "phone"), ("multi-match", "join_links"),
+                         ("zero-match", "missing"), ("invalid", "broken")}
+        assert {f.locator.name for f in report.errors()} == {"missing", "broken"}
+
+    def test_without_snapshots_the_lint_is_skipped_not_clean(self, tmp_path):
+        report = run_lint(snapshot_dir=str(tmp_path))
+        assert report.skipped and not report.findings
+        assert format_report(report)[-1].endswith(f"no snapshots in {tmp_path}, lint skipped")
+
+        report = run_lint(snapshot_dir=str(tmp_path), stand_in=True)
+        assert report.source == "stand-in" and report.snapshots > 0
+        assert "stand-in pages (not the live DOM)" in format_report(report)[-1]
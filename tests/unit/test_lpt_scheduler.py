@@ -0,0 +1,138 @@
+"""
+Test LPT Scheduler
+
+This module contains tests for duration-aware work planning and for driving
+the xdist scheduler through small runs: stealing, crashed workers, re-queued
+tests and pauses under memory pressure.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from types import SimpleNamespace
+
+from config.settings import Config
+from plugins import lpt_scheduler
+from plugins.lpt_scheduler import LPTScheduling, build_units, lpt_plan
+
+# gw0 is planned a, b; gw1 the flow group, c, d; new1 and new2 have no history
+COLLECTION = ["t.py::a", "t.py::b", "t.py::c", "t.py::d", "t.py::x@flow", "t.py::y@flow", "t.py::new1", "t.py::new2"]
+DURATIONS = {"t.py::a": 8.0, "t.py::b": 7.0, "t.py::c": 2.0, "t.py::d": 1.0, "t.py::x": 4.0}
+
+
+class FakeConfig:
+    """Just enough pytest config for xdist's LoadScheduling."""
+
+    def getvalue(self, name):
+        return ["2*popen"]
+
+    def getoption(self, name):
+        return None
+
+
+class FakeNode:
+    """xdist WorkerController stand-in recording the tests it was sent."""
+
+    def __init__(self, worker: str):
+        self.gateway = SimpleNamespace(id=worker)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def start(collection=COLLECTION, durations=DURATIONS, pressure=lambda: 0.0):
+    """Schedule a collection on two fake workers."""
+    scheduler = LPTScheduling(FakeConfig(), durations=durations, pressure=pressure)
+    nodes = [FakeNode("gw0"), FakeNode("gw1")]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+    scheduler.schedule()
+    return scheduler, nodes
+
+
+def finish(scheduler, node) -> int:
+    """Complete the test the worker is running; returns its index."""
+    index = scheduler.node2pending[node][0]
+    scheduler.mark_test_complete(node, index)
+    return index
+
+
+def finish_all(scheduler, nodes) -> None:
+    while any(scheduler.node2pending.get(node) for node in nodes):
+        for node in nodes:
+            if scheduler.node2pending.get(node):
+                finish(scheduler, node)
+
+
+class TestLPTScheduler:
+    """Tests for work units, the LPT plan and the xdist scheduler."""
+
+    def test_groups_form_one_unit(self):
+        collection = ["t.py::a@flow:x", "t.py::b@flow:x", "t.py::c", "t.py::new"]
+        units = build_units(collection, {"t.py::a": 10.0, "t.py::c": 4.0})
+
+        assert [(u.scope, u.indices) for u in units] == [("flow:x", [0, 1]), ("t.py::c", [2]), ("t.py::new", [3])]
+        # b has no history: estimated at the median known duration
+        assert units[0].estimate == 17.0
+        assert units[2].estimate is None
+
+    def test_plan_balances_longest_first(self):
+        collection = [f"t.py::{name}" for name in "abcdefg"]
+        durations = dict(zip(collection, [8.0, 7.0, 6.0, 5.0, 4.0, 3.0, 3.0]))
+        plan = lpt_plan(build_units(collection, durations), ["gw0", "gw1", "gw2"])
+
+        loads = sorted(sum(u.estimate for u in units) for units in plan.values())
+        assert loads == [11.0, 11.0, 14.0]  # LPT bound: within 4/3 of the optimum (12)
+        assert all(units == sorted(units, key=lambda u: -u.estimate) for units in plan.values())
+
+    def test_idle_worker_takes_the_pool_then_steals_the_shortest_planned_unit(self):
+        scheduler, (gw0, gw1) = start()
+        assert (gw0.sent, gw1.sent) == ([0, 1], [4, 5])  # The group is sent whole
+
+        finish(scheduler, gw0)
+        finish(scheduler, gw0)
+        finish(scheduler, gw0)
+        # a, b, then the pool (new1, new2), then d stolen from gw1's queue [c, d]
+        assert gw0.sent == [0, 1, 6, 7, 3] and scheduler.stolen == 1
+
+        finish_all(scheduler, [gw0, gw1])
+        assert sorted(gw0.sent + gw1.sent) == list(range(len(COLLECTION)))
+        assert gw0.shutting_down and gw1.shutting_down and not scheduler.pending
+
+    def test_crashed_worker_returns_its_test_and_hands_back_the_rest(self):
+        scheduler, (gw0, gw1) = start()
+        assert scheduler.remove_node(gw1) == "t.py::x@flow"  # Reported as the crashing test
+
+        finish_all(scheduler, [gw0])
+        # y (sent but never run) and gw1's queued c, d move to gw0; x is not run again
+        assert sorted(gw0.sent) == [0, 1, 2, 3, 5, 6, 7]
+        assert gw0.shutting_down and not scheduler.pending
+
+    def test_pending_test_is_sent_next(self):
+        scheduler, (gw0, gw1) = start()
+        scheduler.mark_test_pending("t.py::c")
+        finish(scheduler, gw0)
+        assert gw0.sent == [0, 1, 2]
+
+    def test_scheduler_pauses_and_resumes_workers_under_pressure(self, monkeypatch):
+        monkeypatch.setattr(Config, "WORKER_PRESSURE_THRESHOLD", 0.9)
+        monkeypatch.setattr(lpt_scheduler, "PRESSURE_CHECK_INTERVAL", 0.0)
+        readings = [0.95, 0.95, 0.5]
+        scheduler, nodes = start([f"t.py::t{i}" for i in range(8)], {}, lambda: readings.pop(0))
+
+        scheduler.mark_test_complete(nodes[1], nodes[1].sent[0])
+        assert scheduler.paused == {"gw1"}
+        assert len(nodes[1].sent) == 2  # No new work while paused
+
+        scheduler.mark_test_complete(nodes[0], nodes[0].sent[0])
+        assert scheduler.paused == {"gw1"}  # Never pauses the last active worker
+
+        scheduler.mark_test_complete(nodes[0], nodes[0].sent[1])
+        assert scheduler.paused == set()
+        assert len(nodes[1].sent) > 2
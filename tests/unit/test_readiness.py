@@ -0,0 +1,86 @@
+"""
+Test Readiness
+
+This module contains tests for page readiness and page load strategies.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from config.settings import Config
+from pages.order_summary_page import OrderSummaryPage
+from pages.registration_page import RegistrationPage
+from utils.driver_manager import DriverManager
+from utils.readiness import check_ready, wait_until_ready
+
+
+class FakeDriver:
+    """Answers readiness scripts from a list of results (the last one repeats)."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append(args)
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+
+def result(pending=(), dom=True, fresh=True, quiet_for=None) -> dict:
+    return {"dom": dom, "fresh": fresh, "pending": list(pending), "quietFor": quiet_for}
+
+
+class TestReadiness:
+    """Tests for check_ready / wait_until_ready."""
+
+    def test_ready_needs_dom_elements_and_quiet_network(self):
+        checks = {"continue": (By.ID, "register-plan-selection-cta")}
+        assert check_ready(FakeDriver(result()), checks).ready
+        assert not check_ready(FakeDriver(result(dom=False)), checks).ready
+
+        state = check_ready(FakeDriver(result(pending=["continue"], quiet_for=120.0)), checks, network_quiet_ms=500)
+        assert not state.ready
+        assert state.describe() == "not visible: continue; network quiet for 120 ms only"
+        assert check_ready(FakeDriver(result(quiet_for=600.0)), checks, network_quiet_ms=500).ready
+
+    def test_waits_until_ready_in_one_script_per_poll(self):
+        driver = FakeDriver(result(pending=["continue"]), result(fresh=False), result())
+        state = wait_until_ready(driver, {"continue": (By.ID, "x")}, timeout=5, poll_interval=0)
+        assert state.ready and len(driver.calls) == 3
+
+        state = wait_until_ready(FakeDriver(result(pending=["continue"])), {"continue": (By.ID, "x")}, timeout=0)
+        assert not state.ready and state.pending == ["continue"]
+
+    def test_page_checks_its_ready_locators(self):
+        driver = FakeDriver(result())
+        assert OrderSummaryPage(driver, config=Config).wait_until_ready(timeout=1)
+        checks = dict(driver.calls[0][0])
+        assert set(checks) == {"order_summary_page_plan_name_text", "payment.payment_component_phone_input"}
+        assert checks["payment.payment_component_phone_input"] == [["css selector", '[id="phoneNumber"]']]
+
+    def test_navigation_leaves_readiness_to_the_page(self, monkeypatch):
+        driver = FakeDriver(result(pending=["registration_page_email_input"]))
+        driver.get = lambda url: None
+        RegistrationPage(driver, config=Config).navigate_to("https://www.dutch.com/register/")
+        assert driver.calls == []  # 'eager': driver.get already waited for the document
+
+        # 'none': only the new document is awaited, not the page's ready_locators
+        monkeypatch.setattr(Config, "PAGE_LOAD_STRATEGY", "none")
+        driver = FakeDriver(1000.0, result())
+        driver.get = lambda url: None
+        RegistrationPage(driver, config=Config).navigate_to("https://www.dutch.com/register/")
+        (checks, _, _, since), = driver.calls[1:]
+        assert checks == [] and since == 1000.0
+
+
+class TestPageLoadStrategy:
+    """Tests for DriverManager page load strategies."""
+
+    def test_strategy_is_set_on_browser_options(self):
+        assert DriverManager("chrome", page_load_strategy="eager").get_chrome_options().page_load_strategy == "eager"
+        assert DriverManager("firefox", page_load_strategy="none").get_firefox_options().page_load_strategy == "none"
+        with pytest.raises(ValueError):
+            DriverManager("chrome", page_load_strategy="lazy")
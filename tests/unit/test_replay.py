@@ -0,0 +1,134 @@
+"""
+Test Replay
+
+This module contains tests for replay match rules, the archive format and the
+run-wide record/replay proxy.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import http.client
+import json
+import os
+import threading
+
+from replay import proxy as replay_proxy
+from replay.archive import MatchRules, RecordedResponse, ReplayArchive
+from replay.certs import CertificateAuthority
+from replay.proxy import PROXY_ENV, ReplayProxy, acquire_proxy, release_proxy
+
+
+def response(body: bytes, content_type: str = "text/html") -> RecordedResponse:
+    return RecordedResponse(200, "OK", [("Content-Type", content_type)], body)
+
+
+class TestMatchRules:
+    """Tests for request keys."""
+
+    def test_volatile_params_are_dropped_and_query_is_sorted(self):
+        rules = MatchRules()
+        assert rules.key("get", "https://WWW.Dutch.com/api?b=2&_=123&a=1&utm_source=x") == \
+            "GET https://www.dutch.com/api?a=1&b=2"
+        assert rules.key("GET", "https://www.dutch.com") == "GET https://www.dutch.com/"
+        assert MatchRules.path_key("GET", "https://www.dutch.com/api?a=1") == "GET https://www.dutch.com/api"
+
+    def test_post_body_is_matched_only_when_enabled(self):
+        url = "https://api.dutch.com/graphql"
+        assert MatchRules().key("POST", url, b"{}") == MatchRules().key("POST", url, b"[]")
+        strict = MatchRules(match_post_body=True)
+        assert strict.key("POST", url, b"{}") != strict.key("POST", url, b"[]")
+
+    def test_extra_volatile_patterns(self):
+        rules = MatchRules(volatile_params=[r"^v$"])
+        assert rules.key("GET", "https://x.test/a?v=9&t=1") == "GET https://x.test/a?t=1"
+
+
+class TestReplayArchive:
+    """Tests for saving, loading and looking up recordings."""
+
+    def test_round_trip_keeps_order_dedupes_bodies_and_reports(self, tmp_path):
+        path = str(tmp_path / "flow.zip")
+        archive = ReplayArchive(path)
+        archive.add("GET", "https://x.test/poll", response(b"pending"))
+        archive.add("GET", "https://x.test/poll", response(b"done"))
+        archive.add("GET", "https://x.test/logo.png?ts=1", response(b"PNG", "image/png"))
+        archive.add("GET", "https://x.test/copy", response(b"done"))
+        archive.save()
+        assert os.listdir(tmp_path) == ["flow.zip"]  # No temp file left behind
+
+        replay = ReplayArchive(path).load()
+        assert len(replay.index) == 3
+        assert [replay.lookup("GET", "https://x.test/poll").body for _ in range(3)] == [b"pending", b"done", b"done"]
+        assert replay.lookup("GET", "https://x.test/logo.png?ts=2").body == b"PNG"
+        assert replay.lookup("GET", "https://x.test/copy?page=2").body == b"done"  # Same path, other query
+        assert replay.lookup("GET", "https://x.test/missing") is None
+
+        report = replay.report()
+        assert (report["entries"], report["hits"]) == (3, 4)
+        assert report["fuzzy_hits"] == ["GET https://x.test/copy?page=2 -> GET https://x.test/copy"]
+        assert report["misses"] == ["GET https://x.test/missing"]
+        replay.close()
+
+    def test_rerecording_a_key_replaces_it_and_keeps_other_keys(self, tmp_path):
+        path = str(tmp_path / "flow.zip")
+        first = ReplayArchive(path)
+        first.add("GET", "https://x.test/a", response(b"old"))
+        first.add("GET", "https://x.test/b", response(b"b"))
+        first.save()
+
+        second = ReplayArchive(path).load()
+        second.add("GET", "https://x.test/a", response(b"new"))
+        second.save()
+
+        replay = ReplayArchive(path).load()
+        assert replay.lookup("GET", "https://x.test/a").body == b"new"
+        assert replay.lookup("GET", "https://x.test/b").body == b"b"
+        replay.close()
+
+
+class TestReplayProxy:
+    """Tests for the proxy shared by every session of a run."""
+
+    def test_replays_plain_http_and_writes_one_report(self, tmp_path):
+        path = str(tmp_path / "flow.zip")
+        archive = ReplayArchive(path)
+        archive.add("GET", "http://x.test/page", response(b"<html></html>"))
+        archive.save()
+
+        proxy = ReplayProxy("replay", ReplayArchive(path).load(), ca=CertificateAuthority(str(tmp_path / "certs")))
+        proxy.start()
+        statuses = []
+
+        def fetch(url):
+            conn = http.client.HTTPConnection(*proxy.server_address[:2], timeout=5)
+            conn.request("GET", url)
+            statuses.append(conn.getresponse().status)
+            conn.close()
+
+        threads = [threading.Thread(target=fetch, args=(url,))
+                   for url in ("http://x.test/page", "http://x.test/page?utm_source=a", "http://x.test/gone")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        proxy.stop()
+
+        assert sorted(statuses) == [200, 200, 404]
+        with open(f"{path}.report.json") as f:
+            assert json.load(f)["misses"] == ["GET http://x.test/gone"]
+
+    def test_sessions_of_a_process_share_one_proxy(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv(PROXY_ENV, raising=False)
+        path = str(tmp_path / "flow.zip")
+        first, second = acquire_proxy("record", path), acquire_proxy("record", path)
+        assert first == second
+        assert release_proxy() is None
+        assert release_proxy()["archive"] == path  # The last session stops it and saves the archive
+        assert os.path.exists(path) and replay_proxy._shared is None
+
+    def test_run_proxy_address_is_used_as_is(self, monkeypatch):
+        monkeypatch.setenv(PROXY_ENV, "127.0.0.1:8899")
+        assert acquire_proxy("replay", "unused.zip") == ("127.0.0.1", 8899)
+        assert release_proxy() is None and replay_proxy._shared is None
@@ -0,0 +1,67 @@
+"""
+Test ResourceMonitor
+
+This module contains tests for browser process tree discovery and accounting.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from plugins.resources import summarize_usage
+from utils.resource_monitor import ProcStat, ResourceMonitor, available, memory_growth, process_tree, read_stat
+
+linux_only = pytest.mark.skipif(not available(), reason="needs Linux /proc")
+
+
+def stat(pid: int, ppid: int, rss_kb: int = 1024) -> ProcStat:
+    return ProcStat(pid, ppid, f"proc{pid}", rss_kb, 0.5)
+
+
+class TestResourceMonitor:
+    """Tests for process trees, growth detection and usage summaries."""
+
+    def test_process_tree_follows_descendants_only(self):
+        processes = {s.pid: s for s in (stat(1, 0), stat(10, 1), stat(11, 10), stat(12, 10), stat(20, 1))}
+        assert sorted(s.pid for s in process_tree(10, processes)) == [10, 11, 12]
+        assert process_tree(99, processes) == []
+
+    def test_memory_growth(self):
+        assert memory_growth([400, 450, 520, 610], threshold_mb=100) == 210
+        assert memory_growth([400, 650, 380, 410], threshold_mb=100) is None  # Spike, not growth
+        assert memory_growth([400, 600], threshold_mb=100) is None            # Too few tests
+
+    @linux_only
+    def test_monitor_accounts_child_processes_per_step(self):
+        assert read_stat(os.getpid()).rss_kb > 0
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        try:
+            monitor = ResourceMonitor(os.getpid(), interval=0.05, session="s1").start()
+            monitor.mark("busy")
+            sum(i * i for i in range(300_000))
+            monitor.mark(None)
+            monitor.stop()
+        finally:
+            child.kill()
+            child.wait()
+
+        report = monitor.report()
+        assert report["session"] == "s1"
+        assert report["max_processes"] >= 2
+        assert report["peak_rss_mb"] >= report["steps"]["busy"]["peak_rss_mb"] > 0
+        assert report["cpu_s"] >= report["steps"]["busy"]["cpu_s"] >= 0
+
+    def test_summarize_usage_per_session_and_step(self):
+        tests = {
+            f"t{i}": {"peak_rss_mb": 300.0 + 100 * i, "cpu_s": 2.0, "max_processes": 6,
+                      "steps": {"payment": {"peak_rss_mb": 250.0 + 100 * i, "cpu_s": 0.5, "max_processes": 6}}}
+            for i in range(3)
+        }
+        summary = summarize_usage(tests)
+        assert summary["sessions"]["peak_rss_mb"] == {"p50": 400.0, "p95": 490.0, "max": 500.0}
+        assert summary["steps"]["payment"]["peak_rss_mb"]["max"] == 450.0
@@ -0,0 +1,89 @@
+"""
+Test RunContext
+
+This module contains tests for run timestamps, xdist worker ids and how
+workers share the controller's run folder.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import os
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+from tests import conftest
+from utils import run_context
+from utils.run_context import MAIN_WORKER_ID, get_worker_id, is_xdist_worker, plain_nodeid, unique_stamp
+
+
+class FrozenDatetime(datetime):
+    """datetime whose clock never advances."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2026, 10, 19, 12, 0, 0)
+
+
+class TestRunContext:
+    """Tests for run_context and the run timestamp handed to xdist workers."""
+
+    def test_worker_id_and_worker_config(self, monkeypatch):
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        assert get_worker_id() == MAIN_WORKER_ID
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+        assert get_worker_id() == "gw2"
+
+        assert is_xdist_worker(SimpleNamespace(workerinput={"workerid": "gw2"}))
+        assert not is_xdist_worker(SimpleNamespace(option=None))
+
+    def test_plain_nodeid_strips_only_the_xdist_group(self):
+        test = "tests/e2e/test_a.py::test_b"
+        assert plain_nodeid(f"{test}@flow-plan") == test
+        # An '@' in the parameters is part of the test id
+        assert plain_nodeid(f"{test}[qa@yopmail.com]@flow") == f"{test}[qa@yopmail.com]"
+        assert plain_nodeid(f"{test}[qa@yopmail.com]") == f"{test}[qa@yopmail.com]"
+
+    def test_stamps_increase_when_the_clock_does_not(self, monkeypatch):
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        monkeypatch.setattr(run_context, "datetime", FrozenDatetime)
+        stamps = [unique_stamp() for _ in range(50)]
+        assert stamps == sorted(stamps) and len(set(stamps)) == 50
+        assert all(len(stamp) == 20 and stamp.isdigit() for stamp in stamps)
+
+    def test_stamps_are_unique_across_threads_and_carry_the_worker_id(self, monkeypatch):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        batches = [[] for _ in range(8)]
+
+        def draw(batch):
+            batch.extend(unique_stamp() for _ in range(200))
+
+        threads = [threading.Thread(target=draw, args=(batch,)) for batch in batches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(batch == sorted(batch) for batch in batches)
+        stamps = [stamp for batch in batches for stamp in batch]
+        assert len(set(stamps)) == 1600
+        assert all(stamp.endswith("gw3") and stamp[:-3].isdigit() for stamp in stamps)
+
+    def test_workers_write_into_the_controller_run_folder(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(conftest, "TEST_RUN_TIMESTAMP", "20261019_120000")
+        node = SimpleNamespace(workerinput={})
+        conftest.pytest_configure_node(node)
+        assert node.workerinput["test_run_timestamp"] == "20261019_120000"
+
+        # The worker imported conftest a few seconds later and computed its own timestamp
+        monkeypatch.setattr(conftest, "TEST_RUN_TIMESTAMP", "20261019_120004")
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+        worker = SimpleNamespace(workerinput=node.workerinput, option=SimpleNamespace(htmlpath=None),
+                                 pluginmanager=SimpleNamespace(is_registered=lambda plugin: True))
+        conftest.pytest_configure(worker)
+
+        assert conftest.TEST_RUN_TIMESTAMP == "20261019_120000"
+        assert worker.test_run_dir == os.path.join("reports", "test_run_20261019_120000")
+        assert worker.screenshots_dir == os.path.join(worker.test_run_dir, "screenshots", "gw1")
+        assert os.listdir(tmp_path / "reports") == ["test_run_20261019_120000"]
@@ -0,0 +1,39 @@
+"""
+Test Scenarios
+
+This module contains tests for the combinatorial scenario generator.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from itertools import combinations
+from utils.enums import PetType, USState
+from utils.scenarios import Parameter, covering_array, forbid, registration_parameters, registration_scenarios
+
+
+class TestScenarios:
+    """Tests for covering array generation."""
+
+    def test_pairwise_covers_every_pair(self):
+        parameters = registration_parameters()
+        scenarios = registration_scenarios()
+        for a, b in combinations(parameters, 2):
+            for value_a in a.values:
+                for value_b in b.values:
+                    assert any(s[a.name] == value_a and s[b.name] == value_b for s in scenarios), \
+                        f"{a.name}={value_a} / {b.name}={value_b} not covered"
+        # Far fewer rows than the cross product (2 * 5 * 2^8)
+        assert len(scenarios) <= 15
+
+    def test_constraints_are_respected(self):
+        scenarios = registration_scenarios(constraints=[forbid(pet_type=PetType.CAT, state=USState.WA)])
+        assert not any(s["pet_type"] == PetType.CAT and s["state"] == USState.WA for s in scenarios)
+        assert all(any(v for k, v in s.values.items() if k.startswith("issue:")) for s in scenarios)
+
+    def test_generation_is_deterministic(self):
+        parameters = [Parameter("a", [1, 2, 3]), Parameter("b", ["x", "y"]), Parameter("c", [True, False])]
+        first = covering_array(parameters, strength=3, seed=7)
+        second = covering_array(parameters, strength=3, seed=7)
+        assert [s.values for s in first] == [s.values for s in second]
+        assert len(first) == 12
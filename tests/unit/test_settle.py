@@ -0,0 +1,55 @@
+"""
+Test Settle
+
+This module contains tests for settle detection and the hard-coded sleep scanner.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.settle import scan_sleeps, wait_until_settled
+
+
+class FakeDriver:
+    """Answers the async settle script with a fixed result (or error)."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.args = None
+
+    def execute_async_script(self, script, *args):
+        self.args = args
+        if self.error:
+            raise self.error
+        return self.result
+
+
+class TestSettle:
+    """Tests for wait_until_settled and scan_sleeps."""
+
+    def test_reports_the_script_result(self):
+        driver = FakeDriver({"settled": True, "frames": 2, "ms": 33.4, "animations": 0})
+        result = wait_until_settled(driver, ["element"], stable_frames=2, timeout=1.5)
+        assert result.settled and result.frames == 2
+        assert driver.args == (["element"], 2, 1500.0)
+
+    def test_never_raises(self):
+        result = wait_until_settled(FakeDriver(error=WebDriverException("no async scripts")))
+        assert not result.settled
+
+    def test_scanner_finds_literal_sleeps_only(self, tmp_path):
+        (tmp_path / "pages").mkdir()
+        (tmp_path / "pages" / "page.py").write_text(
+            "import time\nfrom asyncio import sleep\n\n"
+            "def a():\n    time.sleep(0.5)\n\n"
+            "async def b(interval):\n    await sleep(2)\n    await sleep(interval)\n"
+        )
+        calls = scan_sleeps(str(tmp_path), packages=("pages",))
+        assert [(c.path, c.line, c.call, c.seconds) for c in calls] == [
+            ("pages/page.py", 5, "time.sleep", "0.5"), ("pages/page.py", 8, "sleep", "2")]
+
+    def test_page_objects_have_no_hard_coded_sleeps(self):
+        assert scan_sleeps() == []
@@ -0,0 +1,100 @@
+"""
+Test StandIn
+
+This module contains tests for the local stand-in site: routes, A/B variants
+and the registration session.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import http.client
+from http.cookies import SimpleCookie
+
+import pytest
+from lxml import html
+
+from stand_in.server import SESSION_COOKIE, StandInSettings, start_in_background
+
+
+@pytest.fixture
+def stand_in():
+    """Start a stand-in on a free port for one test; yields a request(method, path, ...) helper."""
+    servers = []
+
+    def request(method: str, path: str, body: str = "", cookies: dict = None, **settings):
+        if not servers:
+            servers.append(start_in_background(StandInSettings(port=0, **settings)))
+        host, port = servers[0].server_address[:2]
+        conn = http.client.HTTPConnection(host, port, timeout=5)
+        headers = {"Content-Type": "application/x-www-form-urlencoded"} if body else {}
+        if cookies:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in cookies.items())
+        conn.request(method, path, body=body or None, headers=headers)
+        response = conn.getresponse()
+        content = response.read().decode("utf-8")
+        conn.close()
+        set_cookies = SimpleCookie()
+        for header in response.headers.get_all("Set-Cookie") or []:
+            set_cookies.load(header)
+        return response, content, {name: morsel.value for name, morsel in set_cookies.items()}
+
+    yield request
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class TestStandIn:
+    """Tests for the stand-in server and its DOM contract."""
+
+    def test_routes(self, stand_in):
+        for path, title in [("/", "Online Vet"), ("/account/register", "Tell us about your pet"),
+                            ("/register/issues", "What brings you"), ("/register/account", "Create your account"),
+                            ("/stripe/frame?field=cvc", "Secure input")]:
+            response, content, _ = stand_in("GET", path)
+            assert response.status == 200 and title in html.fromstring(content).findtext(".//title"), path
+        assert stand_in("GET", "/nowhere")[0].status == 404
+        assert stand_in("POST", "/nowhere", "a=1")[0].status == 404
+
+    def test_forms_match_the_site_and_submit_stays_disabled_until_valid(self, stand_in):
+        pet_info = html.fromstring(stand_in("GET", "/account/register")[1])
+        form = pet_info.get_element_by_id("reg-flow-register")
+        assert {radio.get("name") for radio in form.xpath(".//input[@type='radio']")} == {"pet_type"}
+        assert form.xpath(".//button[@type='submit']")[0].get("disabled") is not None
+
+        registration = html.fromstring(stand_in("GET", "/register/account")[1])
+        assert registration.xpath("//button[@type='submit' and contains(text(), 'Register')]")[0] \
+            .get("disabled") is not None
+
+    def test_fixed_variants(self, stand_in):
+        variants = {"cta": "b", "pet_name": "b", "modal": "hide"}
+        home = html.fromstring(stand_in("GET", "/", variants=variants)[1])
+        assert home.xpath("//a[text()='Join Now']/@href") == ["/register/"]
+        assert html.fromstring(stand_in("GET", "/register/")[1]).xpath("//input[@id='petName']")
+        assert "SHOW_MODAL = false" in stand_in("GET", "/register/issues")[1]
+
+    def test_random_variants_stick_to_the_browser(self, stand_in):
+        variants = {"cta": "random", "pet_name": "a", "modal": "show"}
+        _, content, cookies = stand_in("GET", "/", variants=variants, seed=1)
+        assert set(cookies) == {"ab_cta"}
+        href = "/account/register" if cookies["ab_cta"] == "a" else "/register/"
+        assert f'href="{href}"' in content
+
+        for _ in range(5):
+            response, content, new_cookies = stand_in("GET", "/", cookies=cookies)
+            assert not new_cookies and f'href="{href}"' in content
+
+    def test_plans_and_payment_need_the_session_from_registration(self, stand_in):
+        for path in ("/register/plans", "/checkout/pay"):
+            response, _, _ = stand_in("GET", path)
+            assert (response.status, response.headers["Location"]) == (303, "/register/account")
+
+        response, _, cookies = stand_in("POST", "/register/account", "email=ann%2B1%40yopmail.com&password=x")
+        assert (response.status, response.headers["Location"]) == (303, "/register/plans")
+        assert SESSION_COOKIE in cookies
+
+        assert stand_in("GET", "/register/plans", cookies=cookies)[0].status == 200
+        response, content, _ = stand_in("GET", "/checkout/pay?plan=product-7705825673392", cookies=cookies)
+        assert response.status == 200
+        assert "ann+1@yopmail.com" in content and "2 Years" in content
@@ -0,0 +1,121 @@
+"""
+Test Step Runner
+
+This module contains tests for step-level retries.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from flows import step_runner
+from flows.registration_flow import FlowContext, FlowStep
+from flows.step_runner import StepRunner
+
+
+class FakeDriver:
+    """Browser on the page after the previous step; storage capture can be made to fail."""
+
+    def __init__(self, capture_fails: bool = False):
+        self.current_url = "https://www.dutch.com/register/account"
+        self.capture_fails = capture_fails
+
+    def get_cookies(self):
+        return [{"name": "dutch_session", "value": "s1", "domain": ".dutch.com", "path": "/"}]
+
+    def execute_script(self, script, *args):
+        if self.capture_fails:
+            raise WebDriverException("no such window")
+        return [{"reg_step": "plan"}, {}]
+
+
+def flaky_action(failures: int):
+    """Step action failing the first `failures` calls."""
+    calls = []
+
+    def action(ctx):
+        calls.append(1)
+        assert len(calls) > failures, "Stripe iframe not loaded"
+    return action
+
+
+@pytest.fixture
+def restores(monkeypatch):
+    """Replace restore_checkpoint; returns the (checkpoint, step) calls and a switch for its result."""
+    calls = []
+    result = {"ok": True}
+
+    def restore(ctx, checkpoint, step=None):
+        calls.append((checkpoint, step))
+        return result["ok"]
+
+    monkeypatch.setattr(step_runner, "restore_checkpoint", restore)
+    return calls, result
+
+
+def two_steps(payment_action):
+    return [FlowStep("registration", "Register", lambda ctx: None),
+            FlowStep("payment", "Fill payment form", payment_action)]
+
+
+class TestStepRunner:
+    """Tests for StepRunner retry budgets and restores."""
+
+    def test_failed_step_is_retried_and_reported(self):
+        runner = StepRunner(FlowContext(driver=None, config=None, data={}), retries=2)
+        runner.run([FlowStep("payment", "Fill payment form", flaky_action(2))])
+
+        assert runner.retried_steps() == ["payment"]
+        assert [(a.attempt, a.passed) for a in runner.attempts] == [(1, False), (2, False), (3, True)]
+        assert runner.summary()[0]["error"] == "AssertionError: Stripe iframe not loaded"
+
+    def test_step_budget_overrides_default(self):
+        runner = StepRunner(FlowContext(driver=None, config=None, data={}), retries=3)
+        with pytest.raises(AssertionError):
+            runner.run([FlowStep("registration", "Submit once", flaky_action(1), retries=0)])
+        assert len(runner.attempts) == 1
+
+    def test_failed_step_is_retried_from_the_state_before_it(self, restores):
+        calls, _ = restores
+        seen = []
+
+        def payment(ctx):
+            seen.append(dict(ctx.data))
+            ctx.data["email"] = "dirty@yopmail.com"
+            assert len(seen) > 1, "Stripe iframe not loaded"
+
+        ctx = FlowContext(driver=FakeDriver(), config=None, data={"email": "qa+1@yopmail.com"})
+        runner = StepRunner(ctx, retries=1)
+        steps = two_steps(payment)
+        runner.run(steps)
+
+        # Only the failed step ran again, from the state captured after 'registration'
+        assert [(a.step, a.attempt, a.passed) for a in runner.attempts] == \
+            [("registration", 1, True), ("payment", 1, False), ("payment", 2, True)]
+        (checkpoint, step), = calls
+        assert step is steps[1]
+        assert (checkpoint.step, checkpoint.url) == ("registration", "https://www.dutch.com/register/account")
+        assert checkpoint.local_storage == {"reg_step": "plan"}
+
+        # The retry started from the data captured before the step, not the failed attempt's changes
+        assert seen == [{"email": "qa+1@yopmail.com"}, {"email": "qa+1@yopmail.com"}]
+        assert checkpoint.data == {"email": "qa+1@yopmail.com"}
+
+    def test_failed_restore_reraises_the_step_error(self, restores):
+        calls, result = restores
+        result["ok"] = False
+        runner = StepRunner(FlowContext(driver=FakeDriver(), config=None, data={}), retries=2)
+        with pytest.raises(AssertionError, match="Stripe iframe not loaded"):
+            runner.run(two_steps(flaky_action(1)))
+        assert len(calls) == 1
+        assert [(a.step, a.passed) for a in runner.attempts] == [("registration", True), ("payment", False)]
+
+    def test_capture_failure_disables_retries(self, restores):
+        calls, _ = restores
+        runner = StepRunner(FlowContext(driver=FakeDriver(capture_fails=True), config=None, data={}), retries=2)
+        with pytest.raises(AssertionError):
+            runner.run(two_steps(flaky_action(1)))
+        assert calls == []
+        assert [(a.step, a.attempt) for a in runner.attempts] == [("registration", 1), ("payment", 1)]
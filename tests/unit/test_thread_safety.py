@@ -0,0 +1,132 @@
+"""
+Test ThreadSafety
+
+This module contains tests for state shared by sessions running on several
+threads: the screenshot counter, the driver binary cache and logger handlers.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pages.base_page import BasePage
+from utils import logger as logger_module
+from utils.driver_manager import DriverManager
+from utils.logger import setup_logger
+
+THREADS = 8
+
+
+def run_threads(target, count: int = THREADS) -> list:
+    """Run target(index) on count threads released together; return one result per thread."""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def run(index):
+        barrier.wait()
+        results[index] = target(index)
+
+    threads = [threading.Thread(target=run, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    """Switch threads every few microseconds so unguarded read-modify-writes interleave."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+class FakeScreenshotHelper:
+    """Records screenshot names instead of asking a browser."""
+
+    def __init__(self):
+        self.names = []
+
+    def capture(self, name: str) -> str:
+        self.names.append(name)
+        return name
+
+
+class FakeInstaller:
+    """webdriver_manager stand-in that counts downloads."""
+
+    installs = 0
+
+    def install(self) -> str:
+        FakeInstaller.installs += 1
+        time.sleep(0.01)  # Long enough for every thread to reach the cache
+        return f"/drivers/chromedriver-{FakeInstaller.installs}"
+
+
+class TestThreadSafety:
+    """Tests for the locks guarding process-wide state used by the threaded runner."""
+
+    def test_screenshot_numbers_are_unique_across_threads(self, monkeypatch):
+        monkeypatch.setattr(BasePage, "_screenshot_counter", 0)
+        config = SimpleNamespace(EXPLICIT_WAIT=1, PAGE_LOAD_TIMEOUT=1, ENABLE_SCREENSHOTS=True)
+        helpers = [FakeScreenshotHelper() for _ in range(THREADS)]
+
+        def click(index):
+            page = BasePage(SimpleNamespace(), helpers[index], config)
+            for _ in range(200):
+                page._auto_screenshot("click", "button")
+
+        run_threads(click)
+        batches = [[int(name.split("_")[0]) for name in helper.names] for helper in helpers]
+        assert all(batch == sorted(batch) for batch in batches)
+        assert sorted(number for batch in batches for number in batch) == list(range(1, THREADS * 200 + 1))
+
+    def test_driver_binary_is_installed_once_per_browser(self, monkeypatch):
+        monkeypatch.setattr(DriverManager, "_driver_paths", {})
+        monkeypatch.setattr(FakeInstaller, "installs", 0)
+
+        paths = run_threads(lambda index: DriverManager("chrome")._driver_path(FakeInstaller))
+        assert FakeInstaller.installs == 1
+        assert set(paths) == {"/drivers/chromedriver-1"}
+
+        # Another browser resolves its own binary
+        assert DriverManager("edge")._driver_path(FakeInstaller) == "/drivers/chromedriver-2"
+        assert DriverManager._driver_paths == {"chrome": "/drivers/chromedriver-1", "edge": "/drivers/chromedriver-2"}
+
+    def test_loggers_configured_concurrently_share_handlers(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        monkeypatch.setattr(logger_module, "_console_handlers", {})
+        monkeypatch.setattr(logger_module, "_file_handlers", {})
+        names = [f"tests.thread_safety.{index % 3}" for index in range(THREADS * 4)]
+
+        loggers = run_threads(lambda index: setup_logger(names[index], "DEBUG" if index % 2 else "INFO"),
+                              len(names))
+        file_handlers = set(logger_module._file_handlers.values())
+        try:
+            assert len(file_handlers) == 1
+            assert all(len(logger.handlers) == 2 and logger.handlers[1] in file_handlers for logger in loggers)
+            assert len(logger_module._console_handlers) == 2  # One per level
+            assert not os.path.exists("logs")  # File created with the first record
+
+            run_threads(lambda index: loggers[index].warning("thread %d", index), len(loggers))
+            (log_file,) = os.listdir("logs")
+            with open(os.path.join("logs", log_file)) as f:
+                lines = f.read().splitlines()
+            assert len(lines) == len(loggers)  # Every record written once, none interleaved
+            assert {line.rsplit(" ", 1)[1] for line in lines} == {str(index) for index in range(len(loggers))}
+        finally:
+            for name in set(names):
+                logging.getLogger(name).handlers = []
+            for handler in file_handlers:
+                handler.close()
@@ -0,0 +1,71 @@
+"""
+Test VariantLocator
+
+This module contains tests for multi-variant locators and BasePage.wait_for_first_of.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from lxml import etree, html
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from pages.base_page import BasePage
+from pages.pet_info_page import PetInfoPage
+from stand_in import pages
+from utils.variant_locator import VariantLocator, drain_served_variants, located
+
+
+class FakeDriver:
+    """Answers the injected resolve script with a fixed result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.scripts = 0
+
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        return self.result
+
+
+class TestVariantLocator:
+    """Tests for VariantLocator."""
+
+    def test_is_a_union_xpath_tuple_matching_every_variant(self):
+        locator = PetInfoPage.pet_info_page_pet_name_input
+        by, union = locator
+        assert by == By.XPATH and locator.name == "PetInfoPage.pet_info_page_pet_name_input"
+        for pet_name_id in ("pet-name", "petName"):
+            matches = etree.XPath(union)(html.document_fromstring(pages.pet_info_page(pet_name_id)))
+            assert [element.get("id") for element in matches] == [pet_name_id]
+
+    def test_resolve_is_one_script_and_counts_the_served_variant(self):
+        drain_served_variants()
+        locator = VariantLocator((By.ID, "pet-name"), (By.CSS_SELECTOR, "input[name='petName']"),
+                                 labels=("id", "name"))
+        assert locator.queries == [["css selector", '[id="pet-name"]'], ["css selector", "input[name='petName']"]]
+
+        driver = FakeDriver(["element", 1])
+        assert located(locator, "visible")(driver) == "element"
+        assert driver.scripts == 1
+        assert located(locator)(FakeDriver(None)) is False
+        assert drain_served_variants() == {repr(locator.variants): {"name": 1}}
+        assert drain_served_variants() == {}
+
+    def test_plain_tuples_use_selenium_conditions(self):
+        assert located((By.ID, "dog"), "clickable").__qualname__.startswith(EC.element_to_be_clickable.__name__)
+
+
+class TestWaitForFirstOf:
+    """Tests for BasePage.wait_for_first_of."""
+
+    def test_returns_the_outcome_of_the_matching_query(self):
+        modal = VariantLocator((By.ID, "modal-a"), (By.ID, "modal-b"))
+        page = BasePage(FakeDriver(["element", 2]))
+        assert page.wait_for_first_of({"modal": modal, "next_page": (By.ID, "input_1")}) == "next_page"
+        assert page.driver.scripts == 1
+
+    def test_returns_none_when_nothing_appears(self):
+        page = BasePage(FakeDriver(None))
+        assert page.wait_for_first_of({"modal": (By.ID, "modal")}, timeout=0) is None
@@ -0,0 +1,57 @@
+"""
+Test WebPerf
+
+This module contains tests for web performance sampling, budgets and summaries.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from utils.run_context import MAIN_WORKER_ID
+from utils.web_perf import WebPerfCollector, check_budget, load_samples, summarize_samples
+
+
+class FakeDriver:
+    """Returns queued metric dictionaries from the collect script."""
+
+    def __init__(self, *metrics):
+        self.metrics = list(metrics)
+
+    def execute_script(self, script, *args):
+        return self.metrics.pop(0)
+
+
+def metrics(url: str, origin: float, lcp: float, hits: int = 0, measurable: int = 4) -> dict:
+    return {"url": url, "origin": origin, "ttfb_ms": 120.0, "lcp_ms": lcp, "cls": 0.02,
+            "tbt_ms": 0, "cache_hits": hits, "cache_measurable": measurable}
+
+
+class TestWebPerf:
+    """Tests for WebPerfCollector and summaries."""
+
+    def test_samples_pages_and_labels_cache_state(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+        driver = FakeDriver(metrics("https://dutch.com/", 1.0, 900.0),
+                            metrics("https://dutch.com/", 1.0, 1100.0),
+                            metrics("https://dutch.com/register/", 2.0, 700.0, hits=3))
+        perf = WebPerfCollector(str(tmp_path / "web_perf_main.jsonl"), test="test_x")
+        for step in ("home", "modal", "cta"):
+            perf.sample(driver, step)
+
+        # The second sample of the same document replaces the first
+        assert [(s["page"], s["step"], s["lcp_ms"], s["cache"]) for s in perf.samples] == [
+            ("/", "home", 1100.0, "cold"), ("/register", "cta", 700.0, "warm")]
+        assert {s["worker"] for s in perf.samples} == {MAIN_WORKER_ID}
+        perf.flush()
+        assert len(load_samples(str(tmp_path))) == 2
+
+    def test_budgets_and_percentiles(self):
+        budgets = {"*": {"lcp_ms": 4000, "cls": 0.25}, "/": {"lcp_ms": 1000}}
+        home = {"page": "/", "cache": "cold", "lcp_ms": 1100.0, "cls": 0.02}
+        assert check_budget(home, budgets) == ["/ (cold): lcp_ms 1100 > 1000"]
+        assert check_budget({**home, "page": "/register"}, budgets) == []
+
+        samples = [{**home, "lcp_ms": float(value)} for value in (100, 200, 300, 400, 500)]
+        summary = summarize_samples(samples)
+        assert summary["/"]["cold"]["count"] == 5
+        assert summary["/"]["cold"]["lcp_ms"] == {"p50": 300.0, "p75": 400.0, "p95": 480.0}
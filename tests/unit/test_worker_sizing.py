@@ -0,0 +1,82 @@
+"""
+Test WorkerSizing
+
+This module contains tests for worker auto-sizing.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import json
+
+from config.settings import Config
+from utils import driver_manager, resource_monitor
+from utils.worker_sizing import (HostCapacity, SessionFootprint, cgroup_cpu_limit, cgroup_memory,
+                                 calibrate, choose_workers, footprint_from_history, session_footprint)
+
+
+class TestWorkerSizing:
+    """Tests for capacity, footprint and the worker count."""
+
+    def test_cgroup_v2_and_v1_limits(self, tmp_path):
+        v2 = tmp_path / "v2"
+        v2.mkdir()
+        (v2 / "cpu.max").write_text("250000 100000\n")
+        (v2 / "memory.max").write_text(str(4 * 2 ** 30))
+        (v2 / "memory.current").write_text(str(3 * 2 ** 30))
+        (v2 / "memory.stat").write_text(f"anon 1\ninactive_file {2 ** 30}\n")
+        assert cgroup_cpu_limit(str(v2)) == 2.5
+        assert cgroup_memory(str(v2)) == (4096.0, 2048.0)  # Reclaimable cache is not usage
+
+        v1 = tmp_path / "v1"
+        (v1 / "cpu").mkdir(parents=True)
+        (v1 / "memory").mkdir()
+        (v1 / "cpu" / "cpu.cfs_quota_us").write_text("-1")
+        (v1 / "cpu" / "cpu.cfs_period_us").write_text("100000")
+        (v1 / "memory" / "memory.limit_in_bytes").write_text(str(2 ** 63 - 4096))
+        assert cgroup_cpu_limit(str(v1)) is None
+        assert cgroup_memory(str(v1)) is None
+
+    def test_choose_workers_by_tightest_limit(self):
+        footprint = SessionFootprint(rss_mb=850.0, cpu_cores=0.5, source="history")
+        assert choose_workers(HostCapacity(8, 16384, 12024), footprint, reserve_mb=1024) == (11, "memory")
+        assert choose_workers(HostCapacity(2, 65536, 60000), footprint) == (4, "cpu")
+        assert choose_workers(HostCapacity(64, 262144, 250000), footprint, max_workers=16) == (16, "max")
+        assert choose_workers(HostCapacity(1, 2048, 900), footprint) == (1, "memory")
+
+    def test_footprint_from_newest_history_of_browser(self, tmp_path):
+        for run, browser, rss in (("20261001_000000", "chrome", 700.0), ("20261002_000000", "firefox", 900.0)):
+            run_dir = tmp_path / f"test_run_{run}"
+            run_dir.mkdir()
+            (run_dir / "resources_summary.json").write_text(json.dumps({
+                "browser": browser,
+                "sessions": {"peak_rss_mb": {"p50": rss - 100, "p95": rss, "max": rss}},
+                "tests": {"t": {"cpu_s": 6.0, "elapsed_s": 12.0}},
+            }))
+        assert footprint_from_history(str(tmp_path), "chrome") == SessionFootprint(700.0, 0.5, "history")
+        assert footprint_from_history(str(tmp_path), "edge") is None
+
+    def test_calibration_is_opt_in_and_uses_the_replay_proxy(self, tmp_path, monkeypatch):
+        started = []
+
+        class FakeDriverManager:
+            def __init__(self, **kwargs):
+                started.append(kwargs)
+
+            def get_driver(self):
+                raise RuntimeError("no browser here")
+
+            def quit_driver(self):
+                pass
+
+        monkeypatch.setattr(driver_manager, "DriverManager", FakeDriverManager)
+        monkeypatch.setattr(resource_monitor, "available", lambda: True)
+        config = type("SizingConfig", (Config,), {"REPORT_PATH": str(tmp_path), "BROWSER": "chrome",
+                                                   "USE_STAND_IN": False, "REPLAY_MODE": "replay"})
+
+        assert session_footprint(type("Off", (config,), {"WORKER_CALIBRATION": "off"})).source == "default"
+        assert started == []
+
+        assert calibrate(config, seconds=0) is None
+        assert started[0]["replay_mode"] == "replay"
+        assert started[0]["replay_archive"] == Config.REPLAY_ARCHIVE
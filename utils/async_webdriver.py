@@ -0,0 +1,464 @@
+"""
+AsyncWebDriver Module
+
+This module contains a minimal asyncio client for the W3C WebDriver protocol.
+
+It speaks HTTP/1.1 to chromedriver/geckodriver/msedgedriver over pooled
+keep-alive connections, so one event loop can drive dozens of browser
+sessions concurrently without a thread per session. Only the commands the
+async page objects need are implemented; errors are raised as the same
+Selenium exception classes the synchronous framework uses.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    NoSuchFrameException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+
+# W3C web element identifier
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+# W3C error codes mapped to the exceptions BasePage already handles
+W3C_ERRORS = {
+    "no such element": NoSuchElementException,
+    "no such frame": NoSuchFrameException,
+    "stale element reference": StaleElementReferenceException,
+    "element click intercepted": ElementClickInterceptedException,
+    "element not interactable": ElementNotInteractableException,
+    "invalid selector": InvalidSelectorException,
+    "javascript error": JavascriptException,
+    "timeout": TimeoutException,
+    "script timeout": TimeoutException,
+}
+
+# Methods safe to resend when a reused connection fails after the request went out
+IDEMPOTENT_METHODS = ("GET", "HEAD", "DELETE", "OPTIONS", "PUT")
+
+
+def to_w3c_locator(locator: Tuple) -> Tuple[str, str]:
+    """
+    Convert a page object locator to a W3C locator strategy.
+
+    W3C drivers only accept css selector, xpath, link text, partial link text and
+    tag name; ID, NAME and CLASS_NAME are rewritten to CSS the way Selenium does.
+
+    Args:
+        locator: Tuple of (By.TYPE, "value")
+
+    Returns:
+        Tuple of (strategy, value)
+    """
+    by, value = locator
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{_css_escape(value)}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{_css_escape(value)}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    return by, value
+
+
+def _css_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def xpath_literal(value: str) -> str:
+    """
+    Quote a string as an XPath 1.0 literal.
+
+    XPath has no escape characters, so a value containing both quote types is
+    built with concat().
+
+    Args:
+        value: Text to match, e.g. an option value or label
+
+    Returns:
+        XPath expression evaluating to the value, e.g. "'Dog'" or concat('It', "'", 's')
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+class AsyncHTTPClient:
+    """HTTP/1.1 JSON client with a pool of keep-alive connections to one driver server."""
+
+    def __init__(self, server_url: str, max_connections: int = 64, timeout: float = 120):
+        """
+        Initialize the client (connections are opened on demand).
+
+        Args:
+            server_url: Driver server URL, e.g. http://127.0.0.1:9515
+            max_connections: Maximum concurrent connections
+            timeout: Timeout for one request/response exchange in seconds
+        """
+        parts = urlsplit(server_url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(max_connections)
+        self.connections_opened = 0
+
+    async def request(self, method: str, path: str, payload: Optional[dict] = None) -> Tuple[int, dict]:
+        """
+        Send a request, reusing an idle connection when one is available.
+
+        Idle connections the server already closed are dropped before use. If a
+        reused connection still fails, the request is only resent when it
+        never went out or the method is idempotent - a POST may already have
+        run (clicked, typed) on the browser.
+
+        Args:
+            method: HTTP method
+            path: Path below the server URL
+            payload: JSON body (POST requests)
+
+        Returns:
+            Tuple of (status code, decoded JSON body)
+        """
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        head = (
+            f"{method} {self.base_path}{path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Accept: application/json\r\n"
+            "Content-Type: application/json;charset=UTF-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode("ascii")
+
+        async with self._slots:
+            while True:
+                reader, writer = self._pop_idle()
+                reused = reader is not None
+                if not reused:
+                    reader, writer = await asyncio.open_connection(self.host, self.port)
+                    self.connections_opened += 1
+                sent = False
+                try:
+                    writer.write(head + body)
+                    await writer.drain()
+                    sent = True
+                    status, data, keep_alive = await asyncio.wait_for(self._read_response(reader), self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused and (not sent or method in IDEMPOTENT_METHODS):
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                break
+
+        if keep_alive:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        return status, json.loads(data) if data else {}
+
+    def _pop_idle(self) -> Tuple[Optional[asyncio.StreamReader], Optional[asyncio.StreamWriter]]:
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not reader.at_eof() and not writer.is_closing():
+                return reader, writer
+            writer.close()  # Closed by the server while idle
+        return None, None
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader) -> Tuple[int, bytes, bool]:
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed by driver server")
+        status = int(status_line.split()[1])
+
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b"".join(chunks)
+        else:
+            data = await reader.readexactly(int(headers.get("content-length", 0)))
+
+        return status, data, headers.get("connection", "").lower() != "close"
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+class AsyncWebElement:
+    """Reference to an element in an AsyncWebDriver session."""
+
+    def __init__(self, driver: "AsyncWebDriver", element_id: str):
+        self.driver = driver
+        self.id = element_id
+
+    def to_json(self) -> dict:
+        """W3C element reference (for script arguments)."""
+        return {ELEMENT_KEY: self.id}
+
+    async def _command(self, method: str, command: str, payload: Optional[dict] = None):
+        return await self.driver.execute(method, f"/element/{self.id}{command}", payload)
+
+    async def find_element(self, locator: Tuple) -> "AsyncWebElement":
+        """Find a descendant element."""
+        using, value = to_w3c_locator(locator)
+        result = await self._command("POST", "/element", {"using": using, "value": value})
+        return AsyncWebElement(self.driver, result[ELEMENT_KEY])
+
+    async def click(self) -> None:
+        await self._command("POST", "/click", {})
+
+    async def clear(self) -> None:
+        await self._command("POST", "/clear", {})
+
+    async def send_keys(self, text: str) -> None:
+        await self._command("POST", "/value", {"text": text, "value": list(text)})
+
+    async def is_displayed(self) -> bool:
+        return await self._command("GET", "/displayed")
+
+    async def is_enabled(self) -> bool:
+        return await self._command("GET", "/enabled")
+
+    async def is_selected(self) -> bool:
+        return await self._command("GET", "/selected")
+
+    async def text(self) -> str:
+        return await self._command("GET", "/text")
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        return await self._command("GET", f"/attribute/{name}")
+
+    async def get_property(self, name: str):
+        return await self._command("GET", f"/property/{name}")
+
+
+class AsyncWebDriver:
+    """One W3C WebDriver session driven from asyncio."""
+
+    def __init__(self, client: AsyncHTTPClient, session_id: str, capabilities: dict):
+        """
+        Initialize with an existing session (use AsyncWebDriver.start to create one).
+
+        Args:
+            client: HTTP client connected to the driver server
+            session_id: W3C session id
+            capabilities: Capabilities returned by the driver
+        """
+        self.client = client
+        self.session_id = session_id
+        self.capabilities = capabilities
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    async def start(cls, client: AsyncHTTPClient, capabilities: dict) -> "AsyncWebDriver":
+        """
+        Create a new browser session.
+
+        Args:
+            client: HTTP client connected to the driver server
+            capabilities: alwaysMatch capabilities (e.g. options.to_capabilities())
+
+        Returns:
+            AsyncWebDriver for the new session
+        """
+        status, response = await client.request("POST", "/session", {
+            "capabilities": {"firstMatch": [{}], "alwaysMatch": capabilities}
+        })
+        value = cls._check(status, response)
+        return cls(client, value["sessionId"], value.get("capabilities", {}))
+
+    @staticmethod
+    def _check(status: int, response: dict):
+        value = response.get("value")
+        if status >= 400:
+            error = value.get("error", "unknown error") if isinstance(value, dict) else "unknown error"
+            message = value.get("message", "") if isinstance(value, dict) else str(value)
+            raise W3C_ERRORS.get(error, WebDriverException)(f"{error}: {message}")
+        return value
+
+    async def execute(self, method: str, command: str, payload: Optional[dict] = None):
+        """
+        Run a session command.
+
+        Args:
+            method: HTTP method
+            command: Command path below /session/<id>
+            payload: JSON body
+
+        Returns:
+            The response 'value'
+
+        Raises:
+            WebDriverException: (or a subclass) when the driver reports an error
+        """
+        status, response = await self.client.request(method, f"/session/{self.session_id}{command}", payload)
+        return self._check(status, response)
+
+    # ==================== NAVIGATION ====================
+
+    async def get(self, url: str) -> None:
+        await self.execute("POST", "/url", {"url": url})
+
+    async def current_url(self) -> str:
+        return await self.execute("GET", "/url")
+
+    async def title(self) -> str:
+        return await self.execute("GET", "/title")
+
+    async def refresh(self) -> None:
+        await self.execute("POST", "/refresh", {})
+
+    async def set_timeouts(self, page_load: Optional[float] = None, script: Optional[float] = None,
+                           implicit: Optional[float] = None) -> None:
+        """Set session timeouts (seconds)."""
+        timeouts = {"pageLoad": page_load, "script": script, "implicit": implicit}
+        await self.execute("POST", "/timeouts",
+                           {k: int(v * 1000) for k, v in timeouts.items() if v is not None})
+
+    # ==================== ELEMENTS ====================
+
+    async def find_element(self, locator: Tuple) -> AsyncWebElement:
+        using, value = to_w3c_locator(locator)
+        result = await self.execute("POST", "/element", {"using": using, "value": value})
+        return AsyncWebElement(self, result[ELEMENT_KEY])
+
+    async def find_elements(self, locator: Tuple) -> List[AsyncWebElement]:
+        using, value = to_w3c_locator(locator)
+        result = await self.execute("POST", "/elements", {"using": using, "value": value})
+        return [AsyncWebElement(self, item[ELEMENT_KEY]) for item in result]
+
+    async def execute_script(self, script: str, *args):
+        """
+        Run synchronous JavaScript (AsyncWebElement arguments are passed as element references).
+
+        Returns:
+            Script result (element references are returned as AsyncWebElement)
+        """
+        result = await self.execute("POST", "/execute/sync", {
+            "script": script,
+            "args": [arg.to_json() if isinstance(arg, AsyncWebElement) else arg for arg in args],
+        })
+        return self._wrap(result)
+
+    def _wrap(self, value):
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return AsyncWebElement(self, value[ELEMENT_KEY])
+        if isinstance(value, list):
+            return [self._wrap(item) for item in value]
+        return value
+
+    # ==================== SESSION ====================
+
+    async def quit(self) -> None:
+        """End the session (errors are logged, not raised)."""
+        try:
+            await self.execute("DELETE", "")
+        except (WebDriverException, OSError) as e:
+            self.logger.warning(f"Failed to end session {self.session_id}: {e}")
+
+
+class AsyncSessionFactory:
+    """
+    Start driver services and create async sessions for one browser type.
+
+    chromedriver and msedgedriver host many sessions per process, so a single
+    service (and connection pool) is shared; geckodriver allows one session per
+    process, so Firefox gets a service per session.
+    """
+
+    def __init__(self, driver_manager, max_connections: int = 64):
+        """
+        Initialize the factory.
+
+        Args:
+            driver_manager: DriverManager providing options, services and the replay proxy
+            max_connections: Connection pool size per driver service
+        """
+        self.driver_manager = driver_manager
+        self.max_connections = max_connections
+        self._services = []
+        self._clients: List[AsyncHTTPClient] = []
+        self._shared_client: Optional[AsyncHTTPClient] = None
+        self._lock = asyncio.Lock()
+
+    async def _start_client(self) -> AsyncHTTPClient:
+        service = self.driver_manager.get_service()
+        # Service.start() blocks until the driver answers - keep it off the event loop
+        await asyncio.to_thread(service.start)
+        self._services.append(service)
+        client = AsyncHTTPClient(service.service_url, self.max_connections)
+        self._clients.append(client)
+        return client
+
+    async def new_session(self, page_load_timeout: Optional[float] = None) -> AsyncWebDriver:
+        """
+        Create a browser session.
+
+        Args:
+            page_load_timeout: Page load timeout in seconds
+
+        Returns:
+            AsyncWebDriver
+        """
+        self.driver_manager.start_replay_proxy()
+        if self.driver_manager.browser == "firefox":
+            client = await self._start_client()
+        else:
+            async with self._lock:
+                if self._shared_client is None:
+                    self._shared_client = await self._start_client()
+            client = self._shared_client
+
+        driver = await AsyncWebDriver.start(client, self.driver_manager.get_options().to_capabilities())
+        if page_load_timeout:
+            await driver.set_timeouts(page_load=page_load_timeout)
+        return driver
+
+    async def close(self) -> None:
+        """Close connections and stop all driver services (sessions should be quit first)."""
+        for client in self._clients:
+            await client.close()
+        for service in self._services:
+            await asyncio.to_thread(service.stop)
+        self._clients.clear()
+        self._services.clear()
+        self._shared_client = None
+        self.driver_manager.quit_driver()
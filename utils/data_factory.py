@@ -0,0 +1,236 @@
+"""
+DataFactory Module
+
+This module generates unique, valid test data (users, pets, phone numbers) on
+demand, one record per test.
+
+Uniqueness holds across tests, pytest-xdist workers and repeated runs:
+every record gets a unique id built from a run token, the worker id and a
+counter persisted on disk (reserved in blocks under a file lock). Faker is
+imported lazily and records are produced by generators, so collecting
+thousands of parametrized tests costs nothing until a record is requested.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import copy
+import os
+import random
+import string
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+from utils.enums import PetName, PetType, USState
+from utils.file_lock import locked_file
+from utils.run_context import get_worker_id, MAIN_WORKER_ID
+
+DEFAULT_COUNTER_PATH = os.path.join(".data_factory", "counter")
+
+
+class PersistentCounter:
+    """Counter shared by all processes through a locked file, reserved in blocks."""
+
+    def __init__(self, path: str = DEFAULT_COUNTER_PATH, block_size: int = 100):
+        """
+        Initialize the counter (no I/O until the first value is requested).
+
+        Args:
+            path: Counter file
+            block_size: Values reserved per file access
+        """
+        self.path = path
+        self.block_size = block_size
+        self._next = 0
+        self._end = 0
+        self._lock = threading.Lock()
+
+    def _reserve_block(self) -> None:
+        with locked_file(self.path) as f:
+            f.seek(0)
+            content = f.read().strip()
+            start = int(content) if content else 0
+            f.seek(0)
+            f.truncate()
+            f.write(str(start + self.block_size))
+            f.flush()
+        self._next, self._end = start, start + self.block_size
+
+    def next(self) -> int:
+        """
+        Get the next value (unique across processes using the same file).
+
+        Returns:
+            Counter value
+        """
+        with self._lock:
+            if self._next >= self._end:
+                self._reserve_block()
+            value = self._next
+            self._next += 1
+            return value
+
+
+def _base36(number: int) -> str:
+    digits = string.digits + string.ascii_lowercase
+    result = ""
+    while True:
+        number, remainder = divmod(number, 36)
+        result = digits[remainder] + result
+        if number == 0:
+            return result
+
+
+class DataFactory:
+    """
+    Lazy generator of unique test data.
+
+    Example:
+        factory = DataFactory()
+        user = factory.user()                # one record
+        for pet in factory.pets():           # endless stream
+            ...
+    """
+
+    def __init__(self, email_template: str = "test_dutch_auto_2025@yopmail.com", seed: Optional[int] = None,
+                 counter: Optional[PersistentCounter] = None, locale: str = "en_US"):
+        """
+        Initialize the factory.
+
+        Args:
+            email_template: Email whose local part and domain generated emails reuse (plus-alias)
+            seed: Seed for reproducible names/passwords (ids stay unique regardless)
+            counter: Shared counter (defaults to the persistent file counter)
+            locale: Faker locale
+        """
+        self.local_part, _, self.domain = email_template.partition("@")
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.counter = counter or PersistentCounter()
+        self.locale = locale
+        worker_id = get_worker_id()
+        self.namespace = "m" if worker_id == MAIN_WORKER_ID else worker_id
+        self.run_token = _base36(int(time.time()))
+        self._faker = None
+
+    @classmethod
+    def for_test_data(cls, base: dict, **kwargs) -> "DataFactory":
+        """
+        Create a factory whose emails alias the first test user of test_data.json.
+
+        Args:
+            base: Test data dictionary
+            **kwargs: Other DataFactory arguments (seed, counter, locale)
+
+        Returns:
+            DataFactory
+        """
+        users = base.get('test_users') or [{}]
+        return cls(email_template=users[0].get('email', "test_dutch_auto_2025@yopmail.com"), **kwargs)
+
+    @property
+    def faker(self):
+        """Faker instance (imported on first use to keep test collection fast)."""
+        if self._faker is None:
+            from faker import Faker
+            self._faker = Faker(self.locale)
+        return self._faker
+
+    def unique_id(self) -> str:
+        """
+        Get an id unique across tests, workers and runs.
+
+        Returns:
+            Id such as 'k3x9a1gw0n17' (run token + worker namespace + counter)
+        """
+        return f"{self.run_token}{self.namespace}n{self.counter.next()}"
+
+    # ==================== RECORDS ====================
+
+    def user(self) -> Dict[str, str]:
+        """
+        Generate a user (email alias, strong password, names).
+
+        Returns:
+            Dictionary with email, password, first_name, last_name
+        """
+        uid = self.unique_id()
+        self.faker.seed_instance(f"{self.seed}-{uid}")
+        return {
+            "email": f"{self.local_part}+{uid}@{self.domain}",
+            "password": self.faker.password(length=14, special_chars=True, digits=True,
+                                            upper_case=True, lower_case=True),
+            "first_name": self.faker.first_name(),
+            "last_name": self.faker.last_name(),
+        }
+
+    def pet(self) -> Dict[str, str]:
+        """
+        Generate pet info in the test_data.json format (enum names).
+
+        Returns:
+            Dictionary with pet_name, pet_type, state
+        """
+        rng = random.Random(f"{self.seed}-{self.unique_id()}")
+        return {
+            "pet_name": rng.choice(list(PetName)).name,
+            "pet_type": rng.choice(list(PetType)).value,
+            "state": rng.choice(list(USState)).name,
+        }
+
+    def phone(self) -> str:
+        """
+        Generate a unique, valid 10-digit US (NANP) phone number.
+
+        Area code and exchange start with 2-9 and are never N11; they change
+        every 10,000 numbers and the line number comes from the unique counter.
+
+        Returns:
+            Phone number digits, e.g. '4155550123'
+        """
+        value = self.counter.next()
+        rng = random.Random(f"{self.seed}-{value // 10000}")
+
+        def nxx() -> str:
+            while True:
+                code = f"{rng.randint(2, 9)}{rng.randint(0, 9)}{rng.randint(0, 9)}"
+                if code[1:] != "11":
+                    return code
+
+        return f"{nxx()}{nxx()}{value % 10000:04d}"
+
+    def test_data(self, base: dict) -> dict:
+        """
+        Copy test data with a unique first-user email and contact phone.
+
+        The configured password is kept (it is known to satisfy the site's rules).
+
+        Args:
+            base: Test data dictionary (not modified)
+
+        Returns:
+            Test data for one test or flow run
+        """
+        data = copy.deepcopy(base)
+        if data.get('test_users'):
+            data['test_users'][0]['email'] = self.user()['email']
+        if 'contact_info' in data:
+            data['contact_info']['phone'] = self.phone()
+        return data
+
+    # ==================== STREAMS ====================
+
+    def users(self) -> Iterator[Dict[str, str]]:
+        """Endless stream of unique users."""
+        while True:
+            yield self.user()
+
+    def pets(self) -> Iterator[Dict[str, str]]:
+        """Endless stream of pets."""
+        while True:
+            yield self.pet()
+
+    def phones(self) -> Iterator[str]:
+        """Endless stream of unique phone numbers."""
+        while True:
+            yield self.phone()
@@ -7,15 +7,15 @@ Author: Claude AI
 Date: 2025-10-19
 """
 
+# Annotations stay strings: webdriver.Chrome etc. would import every browser at module import
+from __future__ import annotations
+
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from typing import Optional
+from typing import Dict, Optional
 import logging
+import threading
+
+from utils.readiness import PAGE_LOAD_STRATEGIES
 
 
 class DriverManager:
@@ -23,27 +23,94 @@ class DriverManager:
     WebDriver Manager for multi-browser support.
 
     Supports Chrome, Firefox, and Edge browsers with automatic driver management.
+    Safe to use from several threads (one DriverManager per session).
     """
 
-    def __init__(self, browser: str = "chrome", headless: bool = False):
+    # Driver binaries resolved by webdriver_manager, shared by all sessions in this process
+    _driver_paths: Dict[str, str] = {}
+    _install_lock = threading.Lock()
+
+    def __init__(self, browser: str = "chrome", headless: bool = False,
+                 replay_mode: str = "off", replay_archive: Optional[str] = None,
+                 page_load_strategy: str = "normal"):
         """
         Initialize DriverManager.
 
         Args:
             browser: Browser type ('chrome', 'firefox', 'edge')
             headless: Run browser in headless mode
+            replay_mode: 'off', 'record' or 'replay' - route browser traffic through the replay proxy
+            replay_archive: Archive file the proxy records into or replays from
+            page_load_strategy: 'normal' (driver.get waits for 'load'), 'eager' (DOMContentLoaded)
+                or 'none' (returns at once; pages check readiness, see utils/readiness.py)
+
+        Raises:
+            ValueError: If page_load_strategy is unknown
         """
+        if page_load_strategy.lower() not in PAGE_LOAD_STRATEGIES:
+            raise ValueError(
+                f"Unsupported page load strategy: {page_load_strategy}. "
+                f"Supported strategies: {', '.join(PAGE_LOAD_STRATEGIES)}"
+            )
         self.browser = browser.lower()
+        self.page_load_strategy = page_load_strategy.lower()
         self.headless = headless
+        self.replay_mode = replay_mode.lower()
+        self.replay_archive = replay_archive
+        self.replay_proxy = None  # (host, port) while this session uses the replay proxy
         self.driver: Optional[webdriver.Remote] = None
         self.logger = logging.getLogger(__name__)
 
-    def get_chrome_driver(self) -> webdriver.Chrome:
+    def start_replay_proxy(self) -> None:
+        """Use the run's record/replay proxy for this session (no-op when replay_mode is 'off')."""
+        if self.replay_mode == "off" or self.replay_proxy:
+            return
+        from replay.proxy import acquire_proxy
+        self.replay_proxy = acquire_proxy(self.replay_mode, self.replay_archive)
+
+    def _apply_proxy(self, options) -> None:
         """
-        Get Chrome WebDriver instance.
+        Route browser traffic through the replay proxy (if running).
+
+        Args:
+            options: Browser options object
+        """
+        if not self.replay_proxy:
+            return
+        # Proxy terminates HTTPS with its own CA
+        options.accept_insecure_certs = True
+        if self.browser == "firefox":
+            host, port = self.replay_proxy
+            options.set_preference("network.proxy.type", 1)
+            options.set_preference("network.proxy.http", host)
+            options.set_preference("network.proxy.http_port", port)
+            options.set_preference("network.proxy.ssl", host)
+            options.set_preference("network.proxy.ssl_port", port)
+            options.set_preference("network.proxy.no_proxies_on", "")
+        else:
+            options.add_argument(f"--proxy-server=http://{self.replay_proxy[0]}:{self.replay_proxy[1]}")
+
+    def _driver_path(self, installer) -> str:
+        """
+        Resolve the driver binary once per process (concurrent installs would race on the cache).
+
+        Args:
+            installer: webdriver_manager manager class (e.g. ChromeDriverManager)
 
         Returns:
-            Configured Chrome WebDriver
+            Path to the driver executable
+        """
+        with DriverManager._install_lock:
+            if self.browser not in DriverManager._driver_paths:
+                DriverManager._driver_paths[self.browser] = installer().install()
+            return DriverManager._driver_paths[self.browser]
+
+    def get_chrome_options(self) -> webdriver.ChromeOptions:
+        """
+        Build Chrome options.
+
+        Returns:
+            Configured ChromeOptions
         """
         options = webdriver.ChromeOptions()
 
@@ -58,18 +125,16 @@ class DriverManager:
         options.add_experimental_option("excludeSwitches", ["enable-logging"])
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
+        options.page_load_strategy = self.page_load_strategy
+        self._apply_proxy(options)
+        return options
 
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.implicitly_wait(10)
-        return driver
-
-    def get_firefox_driver(self) -> webdriver.Firefox:
+    def get_firefox_options(self) -> webdriver.FirefoxOptions:
         """
-        Get Firefox WebDriver instance.
+        Build Firefox options.
 
         Returns:
-            Configured Firefox WebDriver
+            Configured FirefoxOptions
         """
         options = webdriver.FirefoxOptions()
 
@@ -78,19 +143,16 @@ class DriverManager:
 
         options.add_argument("--width=1920")
         options.add_argument("--height=1080")
+        options.page_load_strategy = self.page_load_strategy
+        self._apply_proxy(options)
+        return options
 
-        service = FirefoxService(GeckoDriverManager().install())
-        driver = webdriver.Firefox(service=service, options=options)
-        driver.maximize_window()
-        driver.implicitly_wait(10)
-        return driver
-
-    def get_edge_driver(self) -> webdriver.Edge:
+    def get_edge_options(self) -> webdriver.EdgeOptions:
         """
-        Get Edge WebDriver instance.
+        Build Edge options.
 
         Returns:
-            Configured Edge WebDriver
+            Configured EdgeOptions
         """
         options = webdriver.EdgeOptions()
 
@@ -101,9 +163,90 @@ class DriverManager:
         options.add_argument("--start-maximized")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
+        options.page_load_strategy = self.page_load_strategy
+        self._apply_proxy(options)
+        return options
 
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        driver = webdriver.Edge(service=service, options=options)
+    def get_options(self):
+        """
+        Build options for the configured browser.
+
+        Returns:
+            Browser options object
+
+        Raises:
+            ValueError: If unsupported browser specified
+        """
+        if self.browser == "chrome":
+            return self.get_chrome_options()
+        if self.browser == "firefox":
+            return self.get_firefox_options()
+        if self.browser == "edge":
+            return self.get_edge_options()
+        raise ValueError(
+            f"Unsupported browser: {self.browser}. "
+            f"Supported browsers: chrome, firefox, edge"
+        )
+
+    def get_service(self):
+        """
+        Create a (not yet started) driver service for the configured browser.
+
+        Returns:
+            Selenium Service for chromedriver, geckodriver or msedgedriver
+
+        Raises:
+            ValueError: If unsupported browser specified
+        """
+        # Only the configured browser's service and webdriver_manager backend are imported
+        if self.browser == "chrome":
+            from selenium.webdriver.chrome.service import Service as ChromeService
+            from webdriver_manager.chrome import ChromeDriverManager
+            return ChromeService(self._driver_path(ChromeDriverManager))
+        if self.browser == "firefox":
+            from selenium.webdriver.firefox.service import Service as FirefoxService
+            from webdriver_manager.firefox import GeckoDriverManager
+            return FirefoxService(self._driver_path(GeckoDriverManager))
+        if self.browser == "edge":
+            from selenium.webdriver.edge.service import Service as EdgeService
+            from webdriver_manager.microsoft import EdgeChromiumDriverManager
+            return EdgeService(self._driver_path(EdgeChromiumDriverManager))
+        raise ValueError(
+            f"Unsupported browser: {self.browser}. "
+            f"Supported browsers: chrome, firefox, edge"
+        )
+
+    def get_chrome_driver(self) -> webdriver.Chrome:
+        """
+        Get Chrome WebDriver instance.
+
+        Returns:
+            Configured Chrome WebDriver
+        """
+        driver = webdriver.Chrome(service=self.get_service(), options=self.get_chrome_options())
+        driver.implicitly_wait(10)
+        return driver
+
+    def get_firefox_driver(self) -> webdriver.Firefox:
+        """
+        Get Firefox WebDriver instance.
+
+        Returns:
+            Configured Firefox WebDriver
+        """
+        driver = webdriver.Firefox(service=self.get_service(), options=self.get_firefox_options())
+        driver.maximize_window()
+        driver.implicitly_wait(10)
+        return driver
+
+    def get_edge_driver(self) -> webdriver.Edge:
+        """
+        Get Edge WebDriver instance.
+
+        Returns:
+            Configured Edge WebDriver
+        """
+        driver = webdriver.Edge(service=self.get_service(), options=self.get_edge_options())
         driver.implicitly_wait(10)
         return driver
 
@@ -118,6 +261,7 @@ class DriverManager:
             ValueError: If unsupported browser specified
         """
         self.logger.info(f"Initializing {self.browser} driver (headless={self.headless})")
+        self.start_replay_proxy()
 
         if self.browser == "chrome":
             self.driver = self.get_chrome_driver()
@@ -135,8 +279,12 @@ class DriverManager:
         return self.driver
 
     def quit_driver(self) -> None:
-        """Quit the WebDriver instance."""
+        """Quit the WebDriver instance and release the replay proxy (the last session stops it)."""
         if self.driver:
             self.logger.info("Quitting WebDriver")
             self.driver.quit()
             self.driver = None
+        if self.replay_proxy:
+            from replay.proxy import release_proxy
+            release_proxy()
+            self.replay_proxy = None
@@ -0,0 +1,40 @@
+"""
+FileLock Module
+
+This module provides an exclusive lock across processes (xdist workers, load
+runner processes) through a lock file: fcntl.flock on POSIX, msvcrt.locking on
+Windows.
+
+Example:
+    with locked_file(".data_factory/counter") as f:
+        value = int(f.read() or 0)
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import os
+from contextlib import contextmanager
+
+
+@contextmanager
+def locked_file(path: str):
+    """Open a file exclusively locked across processes (created if missing, opened 'a+')."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a+") as f:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield f
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield f
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
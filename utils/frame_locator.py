@@ -0,0 +1,58 @@
+"""
+FrameLocator Module
+
+This module contains the FrameLocator type for elements inside iframes (the
+Stripe card number, expiry and CVC inputs).
+
+A FrameLocator is an element locator plus the path of frame locators leading to
+it, outermost first. BasePage methods given a FrameLocator run inside
+BasePage.in_frame: frame elements are found once per page object and cached,
+only the switches between the current and the wanted frame are sent, and the
+previous context is restored afterwards, also when the action fails. Inside an
+in_frame block for the same path a FrameLocator costs no switch at all.
+
+A FrameLocator is also a regular (By.X, "value") tuple of the inner element,
+so the locator lint checks it against the frame snapshots and code that
+already switched into the frame can unpack it.
+
+Example:
+    card_frame = (By.CSS_SELECTOR, "iframe[title*='card number']")
+    card_number_input = FrameLocator((By.NAME, "cardnumber"), card_frame)
+    page.enter_text(card_number_input, "4242 4242 4242 4242")
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+from typing import Tuple
+
+
+class FrameLocator(tuple):
+    """Locator of an element inside one or more (nested) iframes."""
+
+    def __new__(cls, locator: Tuple, *frames: Tuple):
+        """
+        Create a frame locator.
+
+        Args:
+            locator: (By.TYPE, "value") or VariantLocator of the element inside the innermost frame
+            *frames: Frame element locators, outermost first
+
+        Raises:
+            ValueError: If no frame is given or the locator is itself a FrameLocator
+        """
+        if not frames:
+            raise ValueError("FrameLocator needs at least one frame locator")
+        if isinstance(locator, FrameLocator) or any(isinstance(frame, FrameLocator) for frame in frames):
+            raise ValueError("Nest frames through the frame path, not by wrapping FrameLocators")
+        self = super().__new__(cls, tuple(locator))
+        self.locator = locator
+        self.frames = tuple(frames)
+        return self
+
+    def __reduce__(self):
+        return FrameLocator, (self.locator, *self.frames)
+
+    def __repr__(self):
+        path = " > ".join(repr(tuple(frame)) for frame in self.frames)
+        return f"FrameLocator({path} > {self.locator!r})"
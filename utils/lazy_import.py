@@ -0,0 +1,59 @@
+"""
+LazyImport Module
+
+This module defers heavy imports to their first use.
+
+Importing selenium.webdriver.support.ui or expected_conditions pulls in the
+remote WebDriver with its BiDi modules (the bulk of Selenium's import time).
+Page objects only need them once a test drives a browser, not while pytest
+collects tests, filters markers or starts xdist workers.
+
+Example:
+    ui = lazy_module("selenium.webdriver.support.ui")
+    ui.WebDriverWait(driver, 10)       # selenium.webdriver.support.ui is imported here
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    """
+    Module stand-in that imports the real module on first attribute access.
+
+    After the import the module's namespace is copied in, so later attribute
+    lookups cost the same as on the real module.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def __getattr__(self, attr: str):
+        # Only called for attributes not in the namespace yet, i.e. before the import
+        with self._lazy_lock:
+            if attr not in self.__dict__:
+                module = importlib.import_module(self.__name__)
+                self.__dict__.update(vars(module))
+                if attr not in self.__dict__:
+                    raise AttributeError(f"module '{self.__name__}' has no attribute '{attr}'")
+        return self.__dict__[attr]
+
+
+def lazy_module(name: str) -> ModuleType:
+    """
+    Get a module that is imported on first use.
+
+    Args:
+        name: Dotted module name
+
+    Returns:
+        The module itself if it is already imported, else a LazyModule
+    """
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
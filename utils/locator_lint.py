@@ -0,0 +1,431 @@
+"""
+LocatorLint Module
+
+This module checks page object locators against saved HTML snapshots without
+a browser.
+
+Every `name = (By.X, "...")` class attribute in pages/ and pages/components/
+is discovered from the source (ast, nothing is imported) - each alternative
+of a `VariantLocator(...)` is checked on its own as 'name[label]', and the element
+locator of a `FrameLocator(...)` like a plain one (its page's snapshots include the
+frame documents) - and evaluated with lxml (XPath 1.0, cssselect for CSS) against
+the snapshots of the page it belongs to. Per page it reports:
+
+- zero-match: no element in any snapshot of the page (broken locator)
+- multi-match: several elements in one snapshot (find_element takes the first)
+- ambiguous: the same element is matched by two locators of the page
+- invalid: the expression does not parse (or uses CSS lxml cannot evaluate)
+- unseen-variant: a VariantLocator alternative matches no snapshot (warning:
+  the snapshots may only cover the other A/B variants)
+
+Snapshots are HTML files named '<page>[__<variant>].html' (e.g. 'pet_info__b.html')
+in LOCATOR_SNAPSHOTS; save live pages there with ScreenshotHelper.capture_html_source
+or the browser. Without snapshots the lint is skipped and reported as such - a
+clean result would claim locators were checked against the live DOM. --stand-in
+(run_lint(stand_in=True)) lints against the local stand-in pages instead, which
+only checks the page objects against the stand-in's copy of the DOM contract.
+
+Usage:
+    python -m utils.locator_lint                        # report, exit 1 on zero-match/invalid
+    python -m utils.locator_lint --strict               # also fail on multi-match/ambiguous
+    python -m utils.locator_lint --stand-in             # no snapshots: lint the stand-in pages
+    python -m utils.locator_lint --save-stand-in        # write stand-in pages as snapshots
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import ast
+import glob
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree, html
+from lxml.cssselect import CSSSelector, SelectorError
+
+from config.settings import Config
+
+# Selenium By constant -> strategy (kept here so linting needs no selenium import)
+BY_STRATEGIES = {
+    "ID": "id", "XPATH": "xpath", "LINK_TEXT": "link text", "PARTIAL_LINK_TEXT": "partial link text",
+    "NAME": "name", "TAG_NAME": "tag name", "CLASS_NAME": "class name", "CSS_SELECTOR": "css selector",
+}
+
+# Pages whose snapshots a page object is checked against (default: snake_case name without Page/Component)
+PAGE_SNAPSHOTS = {
+    "NeedInfoComponent": ["pet_info"],
+    "WeCanHelpComponent": ["issues"],
+    "DetailsComponent": ["order_summary"],
+    "PaymentComponent": ["order_summary", "stripe_frame"],
+}
+
+SEVERITY = {"invalid": "error", "zero-match": "error", "multi-match": "warning", "ambiguous": "warning",
+            "unseen-variant": "warning"}
+
+
+@dataclass
+class Locator:
+    """A page object locator found in the source."""
+
+    page: str
+    name: str
+    strategy: str
+    value: str
+    path: str
+    line: int
+    variant: str = ""  # VariantLocator label ('' for plain tuples)
+
+    @property
+    def qualname(self) -> str:
+        return f"{self.page}.{self.name}"
+
+
+@dataclass
+class Finding:
+    """One lint result."""
+
+    kind: str
+    locator: Locator
+    detail: str
+
+    @property
+    def severity(self) -> str:
+        return SEVERITY[self.kind]
+
+
+@dataclass
+class LintReport:
+    """Lint results for all locators."""
+
+    locators: List[Locator]
+    findings: List[Finding] = field(default_factory=list)
+    snapshots: int = 0
+    seconds: float = 0.0
+    source: str = "snapshots"        # 'snapshots' or 'stand-in'
+    skipped: Optional[str] = None    # Why nothing was checked
+
+    def errors(self, strict: bool = False) -> List[Finding]:
+        return [f for f in self.findings if strict or f.severity == "error"]
+
+
+# ==================== DISCOVERY ====================
+
+def _by_tuple(node) -> Optional[Tuple[str, str]]:
+    # (By.X, "...") -> (strategy, value)
+    if not (isinstance(node, ast.Tuple) and len(node.elts) == 2):
+        return None
+    by, value = node.elts
+    if not (isinstance(by, ast.Attribute) and isinstance(by.value, ast.Name) and by.value.id == "By"
+            and by.attr in BY_STRATEGIES and isinstance(value, ast.Constant) and isinstance(value.value, str)):
+        return None
+    return BY_STRATEGIES[by.attr], value.value
+
+
+def _variants(node) -> List[Tuple[str, str, str]]:
+    # VariantLocator((By.X, "..."), ..., labels=(...)) -> [(label, strategy, value)]
+    if not (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "VariantLocator"):
+        return []
+    labels = [chr(ord("a") + i) for i in range(len(node.args))]
+    for keyword in node.keywords:
+        if keyword.arg == "labels" and isinstance(keyword.value, (ast.Tuple, ast.List)):
+            labels = [elt.value for elt in keyword.value.elts if isinstance(elt, ast.Constant)]
+    return [(label, *parsed) for label, parsed in zip(labels, map(_by_tuple, node.args)) if parsed]
+
+
+def _frame_element(node):
+    # FrameLocator(<element locator>, <frame>, ...) -> the element locator (frames are attributes of their own)
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "FrameLocator"
+            and node.args):
+        return node.args[0]
+    return node
+
+
+def discover_locators(root: str = ".", packages=("pages",)) -> List[Locator]:
+    """
+    Find `(By.X, "...")`, `VariantLocator(...)` and `FrameLocator(...)` class attributes by parsing page object sources.
+
+    Args:
+        root: Repository root
+        packages: Folders to scan (recursively)
+
+    Returns:
+        Locators in source order (one per VariantLocator alternative)
+    """
+    locators = []
+    for package in packages:
+        for path in sorted(glob.glob(os.path.join(root, package, "**", "*.py"), recursive=True)):
+            with open(path, "r", encoding="utf-8") as f:
+                tree = ast.parse(f.read(), path)
+            relative = os.path.relpath(path, root).replace(os.sep, "/")
+            for cls in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+                for node in cls.body:
+                    if not isinstance(node, ast.Assign):
+                        continue
+                    value = _frame_element(node.value)
+                    parsed = _by_tuple(value)
+                    variants = [("", *parsed)] if parsed else _variants(value)
+                    for target in node.targets:
+                        if not isinstance(target, ast.Name):
+                            continue
+                        for label, strategy, value in variants:
+                            name = f"{target.id}[{label}]" if label else target.id
+                            locators.append(Locator(cls.name, name, strategy, value, relative, node.lineno, label))
+    return locators
+
+
+def page_keys(page_class: str) -> List[str]:
+    """Snapshot page keys for a page object class ('OrderSummaryPage' -> ['order_summary'])."""
+    if page_class in PAGE_SNAPSHOTS:
+        return PAGE_SNAPSHOTS[page_class]
+    name = page_class
+    for suffix in ("Page", "Component"):
+        if name.endswith(suffix) and name != suffix:
+            name = name[:-len(suffix)]
+    return ["".join(f"_{c.lower()}" if c.isupper() else c for c in name).lstrip("_")]
+
+
+# ==================== SNAPSHOTS ====================
+
+def stand_in_snapshots() -> Dict[str, str]:
+    """
+    Render every stand-in page and A/B variant.
+
+    Returns:
+        Mapping snapshot name -> HTML
+    """
+    from stand_in import pages
+    return {
+        "home__a": pages.home_page("/account/register"),
+        "home__b": pages.home_page("/register/"),
+        "pet_info__a": pages.pet_info_page("pet-name"),
+        "pet_info__b": pages.pet_info_page("petName"),
+        "issues": pages.issues_page(True),
+        "registration": pages.registration_page(),
+        "checkout": pages.checkout_page(),
+        "order_summary": pages.order_summary_page("test@yopmail.com", pages.PLANS[0]),
+        "stripe_frame__cardnumber": pages.stripe_frame("cardnumber"),
+        "stripe_frame__exp-date": pages.stripe_frame("exp-date"),
+        "stripe_frame__cvc": pages.stripe_frame("cvc"),
+    }
+
+
+def load_snapshots(directory: Optional[str]) -> Dict[str, str]:
+    """
+    Load saved HTML snapshots.
+
+    Args:
+        directory: Snapshot folder (searched recursively for *.html)
+
+    Returns:
+        Mapping snapshot name -> HTML (empty when none are saved)
+    """
+    snapshots = {}
+    if directory and os.path.isdir(directory):
+        for path in sorted(glob.glob(os.path.join(directory, "**", "*.html"), recursive=True)):
+            name = os.path.splitext(os.path.relpath(path, directory))[0].replace(os.sep, "/")
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                snapshots[name] = f.read()
+    return snapshots
+
+
+def snapshot_page(name: str) -> str:
+    """Page key of a snapshot name ('live/pet_info__b' -> 'pet_info')."""
+    return os.path.basename(name).split("__")[0]
+
+
+# ==================== EVALUATION ====================
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def compile_locator(strategy: str, value: str):
+    """
+    Compile a locator into a callable returning matching elements.
+
+    Raises:
+        ValueError: If the expression is invalid or unsupported
+    """
+    literal = _xpath_literal(value)
+    try:
+        if strategy == "css selector":
+            return CSSSelector(value)
+        expression = {
+            "xpath": value,
+            "id": f"//*[@id={literal}]",
+            "name": f"//*[@name={literal}]",
+            "tag name": f"//{value}",
+            "class name": f"//*[contains(concat(' ', normalize-space(@class), ' '), {_xpath_literal(f' {value} ')})]",
+            "link text": f"//a[normalize-space(.)={literal}]",
+            "partial link text": f"//a[contains(., {literal})]",
+        }[strategy]
+        return etree.XPath(expression)
+    except (SelectorError, etree.XPathSyntaxError, KeyError) as e:
+        raise ValueError(f"{type(e).__name__}: {e}")
+
+
+def lint(locators: List[Locator], snapshots: Dict[str, str]) -> LintReport:
+    """
+    Evaluate locators against snapshots.
+
+    Args:
+        locators: Locators from discover_locators
+        snapshots: Snapshot name -> HTML
+
+    Returns:
+        LintReport
+    """
+    start = time.perf_counter()
+    report = LintReport(locators=locators, snapshots=len(snapshots))
+    documents = {name: html.document_fromstring(source) for name, source in snapshots.items()}
+    by_page: Dict[str, List[str]] = {}
+    for name in documents:
+        by_page.setdefault(snapshot_page(name), []).append(name)
+
+    # (snapshot, element) -> locators matching it
+    claimed: Dict[Tuple[str, object], List[Locator]] = {}
+
+    for locator in locators:
+        names = [name for key in page_keys(locator.page) for name in by_page.get(key, [])]
+        if not names:
+            continue  # No snapshot of this page: nothing to check against
+        try:
+            select = compile_locator(locator.strategy, locator.value)
+        except ValueError as e:
+            report.findings.append(Finding("invalid", locator, str(e)))
+            continue
+
+        total = 0
+        for name in names:
+            try:
+                elements = [e for e in select(documents[name]) if isinstance(e, etree.ElementBase)]
+            except etree.XPathEvalError as e:
+                report.findings.append(Finding("invalid", locator, f"XPathEvalError: {e}"))
+                break
+            total += len(elements)
+            if len(elements) > 1:
+                report.findings.append(Finding("multi-match", locator, f"{len(elements)} elements in '{name}'"))
+            for element in elements[:1]:
+                claimed.setdefault((name, element), []).append(locator)
+        else:
+            if total == 0:
+                kind = "unseen-variant" if locator.variant else "zero-match"
+                report.findings.append(Finding(kind, locator, f"no element in {', '.join(names)}"))
+
+    reported = set()
+    for (name, element), matches in claimed.items():
+        pages = {}
+        for locator in matches:
+            pages.setdefault(locator.page, []).append(locator)
+        for same_page in pages.values():
+            key = tuple(sorted(l.name for l in same_page))
+            if len(same_page) > 1 and key not in reported:
+                reported.add(key)
+                others = ", ".join(l.name for l in same_page[1:])
+                report.findings.append(Finding("ambiguous", same_page[0], f"same <{element.tag}> as {others}"))
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def run_lint(root: str = ".", snapshot_dir: Optional[str] = None, stand_in: bool = False) -> LintReport:
+    """
+    Discover, load snapshots and lint (timing covers the whole check).
+
+    Args:
+        root: Repository root
+        snapshot_dir: Snapshot folder (default: LOCATOR_SNAPSHOTS)
+        stand_in: Lint against the stand-in pages when no snapshots are saved
+
+    Returns:
+        LintReport (skipped set when there was nothing to check against)
+    """
+    start = time.perf_counter()
+    snapshot_dir = snapshot_dir or Config.LOCATOR_SNAPSHOTS
+    locators = discover_locators(root)
+    snapshots = load_snapshots(snapshot_dir)
+    if snapshots:
+        report = lint(locators, snapshots)
+    elif stand_in:
+        report = lint(locators, stand_in_snapshots())
+        report.source = "stand-in"
+    else:
+        report = LintReport(locators=locators, skipped=f"no snapshots in {snapshot_dir}, lint skipped")
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def format_report(report: LintReport) -> List[str]:
+    """
+    Human-readable report lines grouped by page.
+
+    Returns:
+        Lines (without trailing newlines)
+    """
+    if report.skipped:
+        return [f"{len(report.locators)} locators: {report.skipped}"]
+    lines = []
+    by_page: Dict[str, List[Finding]] = {}
+    for finding in report.findings:
+        by_page.setdefault(finding.locator.page, []).append(finding)
+    for page in sorted(by_page):
+        lines.append(f"{page}:")
+        for finding in sorted(by_page[page], key=lambda f: (f.locator.line, f.kind)):
+            loc = finding.locator
+            lines.append(f"  {finding.severity.upper():7} {finding.kind:14} {loc.name} "
+                         f"({loc.path}:{loc.line}) - {finding.detail}")
+    errors = len(report.errors())
+    source = "stand-in pages (not the live DOM)" if report.source == "stand-in" else "snapshots"
+    lines.append(f"{len(report.locators)} locators, {report.snapshots} {source}: {errors} errors, "
+                 f"{len(report.findings) - errors} warnings in {report.seconds * 1000:.0f} ms")
+    return lines
+
+
+def save_stand_in_snapshots(directory: str) -> List[str]:
+    """Write the stand-in pages to a snapshot folder (returns written paths)."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for name, source in stand_in_snapshots().items():
+        path = os.path.join(directory, f"{name}.html")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None) -> int:
+    """
+    Command line entry point.
+
+    Returns:
+        Process exit code (1 if errors were found)
+    """
+    parser = argparse.ArgumentParser(prog="python -m utils.locator_lint",
+                                     description="Check page object locators against saved HTML snapshots")
+    parser.add_argument("--snapshots", default=Config.LOCATOR_SNAPSHOTS, help="Snapshot folder")
+    parser.add_argument("--strict", action="store_true", help="Fail on warnings too")
+    parser.add_argument("--stand-in", action="store_true", help="Lint the stand-in pages when no snapshots are saved")
+    parser.add_argument("--save-stand-in", action="store_true", help="Write stand-in pages into the snapshot folder")
+    args = parser.parse_args(argv)
+
+    if args.save_stand_in:
+        for path in save_stand_in_snapshots(os.path.join(args.snapshots, "stand_in")):
+            print(path)
+        return 0
+
+    report = run_lint(snapshot_dir=args.snapshots, stand_in=args.stand_in)
+    for line in format_report(report):
+        print(line)
+    return 1 if report.errors(args.strict) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
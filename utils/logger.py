@@ -3,14 +3,39 @@ Logger Module
 
 This module provides logging configuration with colorlog support.
 
+Every logger of a process shares one file handler and one console handler per
+level, so setup_logger is cheap enough to call at module import. The log file
+is only created when the first record is written.
+
 Author: Claude AI
 Date: 2025-10-19
 """
 
 import logging
+import threading
 import colorlog
 import os
 from datetime import datetime
+from typing import Dict
+from utils.run_context import get_worker_id, MAIN_WORKER_ID
+
+# Serializes handler replacement when sessions are set up from several threads
+_setup_lock = threading.Lock()
+
+# Handlers shared by all loggers of this process
+_console_handlers: Dict[str, logging.Handler] = {}  # Level -> handler
+_file_handlers: Dict[str, logging.Handler] = {}     # xdist worker id -> handler
+
+
+class _DeferredFileHandler(logging.FileHandler):
+    """FileHandler that creates its folder and file with the first record."""
+
+    def __init__(self, filename: str):
+        super().__init__(filename, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
 
 
 def setup_logger(name: str = __name__, log_level: str = "INFO") -> logging.Logger:
@@ -24,49 +49,64 @@ def setup_logger(name: str = __name__, log_level: str = "INFO") -> logging.Logge
     Returns:
         Configured logger instance
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper()))
-
-    # Remove existing handlers
-    if logger.handlers:
-        logger.handlers.clear()
-
-    # Console handler with color support
-    console_handler = colorlog.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-
-    # Color formatter
-    color_formatter = colorlog.ColoredFormatter(
-        "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        }
-    )
-
-    console_handler.setFormatter(color_formatter)
-    logger.addHandler(console_handler)
-
-    # File handler (optional)
-    log_dir = "logs"
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_file = os.path.join(log_dir, f"test_run_{timestamp}.log")
-
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setLevel(logging.DEBUG)
-
-    file_formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    with _setup_lock:
+        return _configure_logger(logging.getLogger(name), log_level)
+
+
+def _console_handler(log_level: str) -> logging.Handler:
+    if log_level not in _console_handlers:
+        # Console handler with color support
+        console_handler = colorlog.StreamHandler()
+        console_handler.setLevel(getattr(logging, log_level))
+
+        # Color formatter
+        color_formatter = colorlog.ColoredFormatter(
+            "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+            log_colors={
+                'DEBUG': 'cyan',
+                'INFO': 'green',
+                'WARNING': 'yellow',
+                'ERROR': 'red',
+                'CRITICAL': 'red,bg_white',
+            }
+        )
+
+        console_handler.setFormatter(color_formatter)
+        _console_handlers[log_level] = console_handler
+    return _console_handlers[log_level]
+
+
+def _file_handler() -> logging.Handler:
+    # Separate log file per xdist worker so parallel processes never share a file
+    worker_id = get_worker_id()
+    if worker_id not in _file_handlers:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        worker_suffix = "" if worker_id == MAIN_WORKER_ID else f"_{worker_id}"
+        log_file = os.path.join("logs", f"test_run_{timestamp}{worker_suffix}.log")
+
+        file_handler = _DeferredFileHandler(log_file)
+        file_handler.setLevel(logging.DEBUG)
+
+        file_formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+        file_handler.setFormatter(file_formatter)
+        _file_handlers[worker_id] = file_handler
+    return _file_handlers[worker_id]
+
+
+def _configure_logger(logger: logging.Logger, log_level: str) -> logging.Logger:
+    log_level = log_level.upper()
+    logger.setLevel(getattr(logging, log_level))
+
+    # Swap handlers in one assignment so other threads never log through a half-configured logger
+    old_handlers = logger.handlers
+    logger.handlers = [_console_handler(log_level), _file_handler()]
+    shared = set(_console_handlers.values()) | set(_file_handlers.values())
+    for handler in old_handlers:
+        if handler not in shared:
+            handler.close()
 
     return logger
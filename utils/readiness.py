@@ -0,0 +1,168 @@
+"""
+Readiness Module
+
+This module decides when a page is usable, for the 'eager' and 'none' page-load
+strategies (PAGE_LOAD_STRATEGY) where driver.get no longer waits for the full
+'load' event and its slow third-party scripts.
+
+A page is ready when, in one injected script per poll:
+
+- the document is past 'loading' (DOMContentLoaded has fired)
+- it is the document navigated to (performance.timeOrigin after the navigation
+  started - needed for 'none', where driver.get returns immediately)
+- every declared element is visible (submit buttons of the real site stay
+  disabled until their form is valid, so being enabled is not required)
+- optionally, the network has been quiet for NETWORK_QUIET_MS: no resource
+  finished recently according to a PerformanceObserver on Resource Timing
+  entries, ignoring NETWORK_QUIET_IGNORE URLs (analytics, trackers)
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.variant_locator import to_queries
+
+PAGE_LOAD_STRATEGIES = ("normal", "eager", "none")
+
+# arguments: checks [[name, queries]], quiet ms, ignored URL parts, time origin floor (or null)
+_READY_SCRIPT = """
+const checks = arguments[0], quietMs = arguments[1], ignore = arguments[2], since = arguments[3];
+const find = (by, value) => by === 'xpath'
+  ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+  : document.querySelector(value);
+const visible = (el) => {
+  if (!el) return false;
+  const style = window.getComputedStyle(el);
+  return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+};
+const pending = checks.filter(([name, queries]) => !queries.some(([by, value]) => visible(find(by, value))))
+  .map(([name]) => name);
+let quietFor = null;
+if (quietMs > 0) {
+  const counted = (entry) => !ignore.some((part) => entry.name.includes(part));
+  if (!window.__pageReadiness) {
+    const state = {last: 0};
+    for (const entry of performance.getEntriesByType('resource')) {
+      if (counted(entry)) state.last = Math.max(state.last, entry.responseEnd);
+    }
+    new PerformanceObserver((list) => {
+      for (const entry of list.getEntries()) {
+        if (counted(entry)) state.last = Math.max(state.last, entry.responseEnd);
+      }
+    }).observe({type: 'resource'});
+    window.__pageReadiness = state;
+  }
+  quietFor = performance.now() - window.__pageReadiness.last;
+}
+return {
+  dom: document.readyState !== 'loading',
+  fresh: since === null || performance.timeOrigin > since,
+  pending: pending,
+  quietFor: quietFor,
+};
+"""
+
+
+@dataclass
+class ReadyState:
+    """Result of one readiness check."""
+
+    dom_content_loaded: bool = False
+    navigated: bool = False
+    pending: List[str] = field(default_factory=list)  # Declared elements not visible yet
+    quiet_for_ms: Optional[float] = None
+    network_quiet: bool = True
+
+    @property
+    def ready(self) -> bool:
+        return self.dom_content_loaded and self.navigated and not self.pending and self.network_quiet
+
+    def describe(self) -> str:
+        """Why the page is not ready (empty when it is)."""
+        reasons = []
+        if not self.dom_content_loaded:
+            reasons.append("DOMContentLoaded not fired")
+        if not self.navigated:
+            reasons.append("navigation not started")
+        if self.pending:
+            reasons.append(f"not visible: {', '.join(self.pending)}")
+        if not self.network_quiet:
+            reasons.append(f"network quiet for {self.quiet_for_ms or 0:.0f} ms only")
+        return "; ".join(reasons)
+
+
+def check_ready(driver, checks: Dict[str, Tuple], network_quiet_ms: int = 0,
+                ignore: Sequence[str] = (), since: Optional[float] = None) -> ReadyState:
+    """
+    Check page readiness with one injected script.
+
+    Args:
+        driver: Selenium WebDriver instance
+        checks: Name -> locator (tuple or VariantLocator) that must be visible
+        network_quiet_ms: Required network quiet time (0 = do not check)
+        ignore: URL parts of requests that do not count as network activity
+        since: performance.timeOrigin of the previous document (None = any document)
+
+    Returns:
+        ReadyState
+    """
+    result = driver.execute_script(
+        _READY_SCRIPT, [[name, to_queries(locator)] for name, locator in checks.items()],
+        network_quiet_ms, list(ignore), since
+    )
+    quiet_for = result.get("quietFor")
+    return ReadyState(
+        dom_content_loaded=bool(result["dom"]),
+        navigated=bool(result["fresh"]),
+        pending=list(result["pending"]),
+        quiet_for_ms=quiet_for,
+        network_quiet=network_quiet_ms <= 0 or (quiet_for is not None and quiet_for >= network_quiet_ms),
+    )
+
+
+def wait_until_ready(driver, checks: Dict[str, Tuple], timeout: float, network_quiet_ms: int = 0,
+                     ignore: Sequence[str] = (), since: Optional[float] = None,
+                     poll_interval: float = 0.1) -> ReadyState:
+    """
+    Poll check_ready until the page is ready or the timeout expires.
+
+    Script errors while the next document replaces the current one are retried.
+
+    Args:
+        driver: Selenium WebDriver instance
+        checks: Name -> locator that must be visible
+        timeout: Maximum wait in seconds
+        network_quiet_ms: Required network quiet time (0 = do not check)
+        ignore: URL parts of requests that do not count as network activity
+        since: performance.timeOrigin of the previous document (None = any document)
+        poll_interval: Seconds between checks
+
+    Returns:
+        Last ReadyState (its .ready is False on timeout)
+    """
+    deadline = time.monotonic() + timeout
+    state = ReadyState()
+    while True:
+        try:
+            state = check_ready(driver, checks, network_quiet_ms, ignore, since)
+            if state.ready:
+                return state
+        except WebDriverException:
+            pass  # Document replaced mid-check
+        if time.monotonic() >= deadline:
+            return state
+        time.sleep(poll_interval)
+
+
+def time_origin(driver) -> Optional[float]:
+    """performance.timeOrigin of the current document (None if there is none yet)."""
+    try:
+        return driver.execute_script("return window.performance ? performance.timeOrigin : null;")
+    except WebDriverException:
+        return None
@@ -0,0 +1,285 @@
+"""
+ResourceMonitor Module
+
+This module measures what a browser session costs the host: the memory, CPU
+time and process count of the driver process tree (chromedriver/geckodriver
+and the browser processes it starts), read from /proc on Linux.
+
+A ResourceMonitor samples the tree of one session on a background thread every
+RESOURCE_SAMPLE_INTERVAL seconds. The tree is rediscovered on every sample, so
+renderer and GPU processes started later are included. Results cover the whole
+test and each flow step (StepRunner marks step boundaries):
+
+- peak RSS of the tree (MB). Shared pages are counted once per process, so this
+  is an upper bound of the real footprint
+- CPU time (user + system) used by the tree
+- the largest number of processes in the tree
+
+memory_growth() flags a session whose memory keeps rising when one session runs
+many tests or iterations (e.g. runners/load.py reuses browsers).
+
+On other platforms, and for remote drivers without a local service process,
+monitoring is unavailable and the callers skip it.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import os
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+PROC = "/proc"
+
+
+@dataclass
+class ProcStat:
+    """One process read from /proc/<pid>/stat."""
+
+    pid: int
+    ppid: int
+    name: str
+    rss_kb: int
+    cpu_s: float
+
+
+@dataclass
+class Usage:
+    """Resource usage of a session tree over a period (whole test or one step)."""
+
+    peak_rss_mb: float = 0.0
+    cpu_s: float = 0.0
+    max_processes: int = 0
+    samples: int = 0
+
+
+def available() -> bool:
+    """Whether process trees can be read (Linux /proc)."""
+    return sys.platform.startswith("linux") and os.path.isdir(PROC)
+
+
+def read_stat(pid: int) -> Optional[ProcStat]:
+    """
+    Read one process.
+
+    Args:
+        pid: Process id
+
+    Returns:
+        ProcStat, or None if the process is gone
+    """
+    try:
+        with open(os.path.join(PROC, str(pid), "stat"), "r") as f:
+            data = f.read()
+    except OSError:
+        return None
+    # The name is in parentheses and may contain spaces: split after the last ')'
+    name = data[data.index("(") + 1:data.rindex(")")]
+    fields = data[data.rindex(")") + 2:].split()
+    # fields[0] is field 3 (state) of proc(5): ppid = 4, utime = 14, stime = 15, rss = 24
+    ticks = os.sysconf("SC_CLK_TCK")
+    return ProcStat(
+        pid=pid,
+        ppid=int(fields[1]),
+        name=name,
+        rss_kb=int(fields[21]) * os.sysconf("SC_PAGE_SIZE") // 1024,
+        cpu_s=(int(fields[11]) + int(fields[12])) / ticks,
+    )
+
+
+def scan_processes() -> Dict[int, ProcStat]:
+    """All readable processes by pid."""
+    processes = {}
+    for entry in os.listdir(PROC):
+        if entry.isdigit():
+            stat = read_stat(int(entry))
+            if stat:
+                processes[stat.pid] = stat
+    return processes
+
+
+def process_tree(root_pid: int, processes: Optional[Dict[int, ProcStat]] = None) -> List[ProcStat]:
+    """
+    A process and all its descendants.
+
+    Args:
+        root_pid: Root of the tree (e.g. the chromedriver pid)
+        processes: Result of scan_processes (scanned when omitted)
+
+    Returns:
+        Processes of the tree (empty if the root is gone)
+    """
+    processes = processes if processes is not None else scan_processes()
+    if root_pid not in processes:
+        return []
+    children: Dict[int, List[int]] = {}
+    for stat in processes.values():
+        children.setdefault(stat.ppid, []).append(stat.pid)
+    tree, pending = [], [root_pid]
+    while pending:
+        pid = pending.pop()
+        tree.append(processes[pid])
+        pending.extend(children.get(pid, []))
+    return tree
+
+
+def driver_root_pid(driver) -> Optional[int]:
+    """Pid of a local driver's service process (None for remote drivers)."""
+    process = getattr(getattr(driver, "service", None), "process", None)
+    return getattr(process, "pid", None)
+
+
+def tree_rss_mb(root_pid: int) -> float:
+    """Current RSS of a process tree in MB."""
+    return sum(stat.rss_kb for stat in process_tree(root_pid)) / 1024
+
+
+def memory_growth(values: List[float], threshold_mb: float, min_points: int = 3) -> Optional[float]:
+    """
+    Detect memory that keeps rising across the tests/iterations of one session.
+
+    Args:
+        values: RSS (MB) of the session after each test, oldest first
+        threshold_mb: Minimum rise from the first to the last value
+        min_points: Values needed before growth is reported
+
+    Returns:
+        The rise in MB when the session grows (most steps up and above threshold), else None
+    """
+    if len(values) < min_points:
+        return None
+    growth = values[-1] - values[0]
+    rises = sum(1 for before, after in zip(values, values[1:]) if after > before)
+    if growth >= threshold_mb and rises * 2 >= len(values) - 1:
+        return growth
+    return None
+
+
+class ResourceMonitor:
+    """
+    Sample a session's process tree on a background thread.
+
+    Example:
+        monitor = ResourceMonitor(driver_root_pid(driver), interval=0.5).start()
+        monitor.mark("pet_info")           # Following samples count for step 'pet_info'
+        monitor.stop()
+        monitor.report()                   # {'peak_rss_mb': ..., 'steps': {'pet_info': {...}}}
+    """
+
+    def __init__(self, root_pid: int, interval: float = 0.5, session: str = ""):
+        """
+        Initialize the monitor.
+
+        Args:
+            root_pid: Pid of the driver service process
+            interval: Seconds between samples
+            session: Session id the report is labelled with
+        """
+        self.root_pid = root_pid
+        self.interval = interval
+        self.session = session
+        self.total = Usage()
+        self.steps: Dict[str, Usage] = {}
+        self.start_rss_mb: Optional[float] = None
+        self.last_rss_mb = 0.0
+        self._started: Optional[float] = None
+        self._step: Optional[str] = None
+        self._cpu: Dict[int, float] = {}   # Last CPU time seen per pid (exited processes keep theirs)
+        self._cpu_at_start = 0.0
+        self._cpu_at_mark = 0.0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _cpu_total(self) -> float:
+        return sum(self._cpu.values())
+
+    def sample(self) -> None:
+        """Take one sample of the tree."""
+        tree = process_tree(self.root_pid)
+        if not tree:
+            return
+        rss_mb = sum(stat.rss_kb for stat in tree) / 1024
+        with self._lock:
+            for stat in tree:
+                self._cpu[stat.pid] = max(stat.cpu_s, self._cpu.get(stat.pid, 0.0))
+            if self.start_rss_mb is None:
+                self.start_rss_mb = rss_mb
+                self._cpu_at_start = self._cpu_at_mark = self._cpu_total()
+            self.last_rss_mb = rss_mb
+            periods = [self.total] + ([self.steps[self._step]] if self._step else [])
+            for usage in periods:
+                usage.peak_rss_mb = max(usage.peak_rss_mb, rss_mb)
+                usage.max_processes = max(usage.max_processes, len(tree))
+                usage.samples += 1
+            self.total.cpu_s = self._cpu_total() - self._cpu_at_start
+            if self._step:
+                self.steps[self._step].cpu_s = self._cpu_total() - self._cpu_at_mark
+
+    def mark(self, step: Optional[str]) -> None:
+        """
+        Start a new step: following samples count for it (None ends the current step).
+
+        A step that runs again (a retry) adds to its earlier usage.
+
+        Args:
+            step: Step name
+        """
+        self.sample()
+        with self._lock:
+            self._step = step
+            self._cpu_at_mark = self._cpu_total() - (self.steps[step].cpu_s if step in self.steps else 0.0)
+            if step:
+                self.steps.setdefault(step, Usage())
+        self.sample()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:  # Never let the sampler thread take a test down
+                logger.debug(f"Resource sample failed: {e}")
+
+    def start(self) -> "ResourceMonitor":
+        """Take a first sample and start sampling in the background."""
+        self._started = time.monotonic()
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name=f"resources-{self.root_pid}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Take a last sample and stop the background thread."""
+        self._stopped.set()
+        if self._thread:
+            self._thread.join()
+        self.sample()
+
+    def report(self) -> dict:
+        """
+        Usage so far.
+
+        Returns:
+            {'session', 'peak_rss_mb', 'cpu_s', 'max_processes', 'samples', 'start_rss_mb',
+             'end_rss_mb', 'elapsed_s', 'steps': {step: usage}} (MB and seconds rounded)
+        """
+        with self._lock:
+            def rounded(usage: Usage) -> dict:
+                return {key: round(value, 2) if isinstance(value, float) else value
+                        for key, value in asdict(usage).items()}
+
+            return {
+                "session": self.session,
+                **rounded(self.total),
+                "start_rss_mb": round(self.start_rss_mb or 0.0, 2),
+                "end_rss_mb": round(self.last_rss_mb, 2),
+                "elapsed_s": round(time.monotonic() - self._started, 2) if self._started else 0.0,
+                "steps": {step: rounded(usage) for step, usage in self.steps.items()},
+            }
@@ -0,0 +1,85 @@
+"""
+RunContext Module
+
+This module identifies the current test run and pytest-xdist worker so that
+artifacts (run folders, screenshots, logs, test data) stay unique when tests
+run in parallel.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import os
+import threading
+from datetime import datetime, timedelta
+
+# Worker id used when tests are not distributed with pytest-xdist
+MAIN_WORKER_ID = "main"
+
+# Last stamp handed out; keeps stamps strictly increasing across threads
+_last_stamp_time = datetime.min
+_stamp_lock = threading.Lock()
+
+
+def get_worker_id() -> str:
+    """
+    Get the pytest-xdist worker id of this process.
+
+    Returns:
+        Worker id such as 'gw0', or 'main' outside xdist workers
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", MAIN_WORKER_ID)
+
+
+def is_xdist_worker(config) -> bool:
+    """
+    Check if a pytest config belongs to an xdist worker process.
+
+    Args:
+        config: Pytest config object
+
+    Returns:
+        True inside a worker, False in the controller or a non-distributed run
+    """
+    return hasattr(config, "workerinput")
+
+
+def plain_nodeid(nodeid: str) -> str:
+    """
+    Strip the xdist load group suffix from a node id.
+
+    Args:
+        nodeid: Node id, with '@<group>' appended by --dist loadgroup
+
+    Returns:
+        Node id as collected, e.g. 'tests/e2e/test_a.py::test_b[p@1]'
+    """
+    # An '@' inside the parameter brackets belongs to the test id
+    at = nodeid.rfind("@")
+    return nodeid[:at] if at > nodeid.rfind("]") else nodeid
+
+
+def new_run_timestamp() -> str:
+    """
+    Create a run timestamp (second resolution, used in run folder names).
+
+    Returns:
+        Timestamp string YYYYmmdd_HHMMSS
+    """
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+def unique_stamp() -> str:
+    """
+    Create a timestamp unique across workers, threads and fast repeated calls.
+
+    Returns:
+        Timestamp with microseconds plus the worker id suffix, e.g. '20251020173638123456gw0'
+    """
+    global _last_stamp_time
+    with _stamp_lock:
+        now = max(datetime.now(), _last_stamp_time + timedelta(microseconds=1))
+        _last_stamp_time = now
+    worker_id = get_worker_id()
+    suffix = "" if worker_id == MAIN_WORKER_ID else worker_id
+    return f"{now.strftime('%Y%m%d%H%M%S%f')}{suffix}"
@@ -0,0 +1,265 @@
+"""
+Scenarios Module
+
+This module generates combinatorial test scenarios (pairwise or t-wise covering
+arrays) over the inputs the registration flow branches on: pet type, state
+(WA triggers NeedInfoComponent) and the health issue cards.
+
+A t-wise covering array contains every combination of values for every t
+parameters at least once, which exercises all t-way interactions in a small
+fraction of the full cross product. Generation is greedy (AETG-style) and
+seeded, so every pytest-xdist worker collects the same scenarios.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import copy
+import random
+from dataclasses import dataclass
+from enum import Enum
+from itertools import combinations, product
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from utils.enums import PetName, PetType, USState
+
+# Partial scenario -> False when the assignment is not allowed
+Constraint = Callable[[Dict[str, object]], bool]
+
+
+@dataclass
+class Parameter:
+    """A scenario input and its candidate values (higher weight = preferred when filling free slots)."""
+
+    name: str
+    values: Sequence
+    weights: Optional[Sequence[float]] = None
+
+    def __post_init__(self):
+        if not self.values:
+            raise ValueError(f"Parameter '{self.name}' has no values")
+        if self.weights is None:
+            self.weights = [1.0] * len(self.values)
+        if len(self.weights) != len(self.values):
+            raise ValueError(f"Parameter '{self.name}' needs one weight per value")
+
+
+@dataclass
+class Scenario:
+    """One generated combination of parameter values."""
+
+    values: Dict[str, object]
+    index: int = 0
+
+    @property
+    def id(self) -> str:
+        """Readable pytest id, e.g. 's03-dog-WA-Allergy+Skin'."""
+        parts = []
+        for name, value in self.values.items():
+            if isinstance(value, bool):
+                continue
+            parts.append(value.value if isinstance(value, Enum) else str(value))
+        issues = [name.split(":", 1)[1] for name, value in self.values.items()
+                  if name.startswith("issue:") and value]
+        if issues:
+            parts.append("+".join(issue.replace(" ", "_") for issue in issues))
+        return f"s{self.index:02d}-" + "-".join(parts)
+
+    def __getitem__(self, name: str):
+        return self.values[name]
+
+
+# ==================== CONSTRAINT BUILDERS ====================
+
+def forbid(**assignment) -> Constraint:
+    """
+    Forbid a combination of values.
+
+    Example:
+        forbid(pet_type=PetType.CAT, state=USState.WA)
+    """
+    def constraint(partial: Dict[str, object]) -> bool:
+        return not all(name in partial and partial[name] == value for name, value in assignment.items())
+    return constraint
+
+
+def at_least_one(names: Sequence[str]) -> Constraint:
+    """Require at least one of the boolean parameters to be True."""
+    def constraint(partial: Dict[str, object]) -> bool:
+        if not all(name in partial for name in names):
+            return True
+        return any(partial[name] for name in names)
+    return constraint
+
+
+# ==================== COVERING ARRAY ====================
+
+def covering_array(parameters: List[Parameter], strength: int = 2, constraints: Sequence[Constraint] = (),
+                   seed: int = 0, candidates: int = 30) -> List[Scenario]:
+    """
+    Build a t-wise covering array.
+
+    Args:
+        parameters: Scenario parameters
+        strength: Interaction strength t (2 = pairwise); capped at the parameter count
+        constraints: Callables rejecting invalid (partial) assignments
+        seed: Random seed (same seed -> same scenarios)
+        candidates: Candidate rows tried per generated row (more = fewer rows, slower)
+
+    Returns:
+        Scenarios covering every feasible t-way value combination
+    """
+    rng = random.Random(seed)
+    strength = max(1, min(strength, len(parameters)))
+
+    def allowed(partial: Dict[str, object]) -> bool:
+        return all(constraint(partial) for constraint in constraints)
+
+    uncovered = set()
+    for group in combinations(range(len(parameters)), strength):
+        for values in product(*(range(len(parameters[i].values)) for i in group)):
+            partial = {parameters[i].name: parameters[i].values[v] for i, v in zip(group, values)}
+            if allowed(partial):
+                uncovered.add(tuple(zip(group, values)))
+
+    def newly_covered(row: Dict[int, int]) -> int:
+        return sum(
+            1 for group in combinations(sorted(row), strength)
+            if tuple((i, row[i]) for i in group) in uncovered
+        )
+
+    def tuple_weight(t: Tuple) -> float:
+        return sum(parameters[i].weights[v] for i, v in t)
+
+    rows: List[Dict[int, int]] = []
+    while uncovered:
+        best_row, best_gain = None, 0
+        # Seed candidates with the heaviest uncovered tuples
+        heaviest = max(tuple_weight(t) for t in uncovered)
+        seed_tuples = sorted(t for t in uncovered if tuple_weight(t) == heaviest)
+        for _ in range(candidates):
+            seed_tuple = rng.choice(seed_tuples)
+            row = dict(seed_tuple)
+            order = [i for i in range(len(parameters)) if i not in row]
+            rng.shuffle(order)
+            for i in order:
+                scored = []
+                for v in range(len(parameters[i].values)):
+                    trial = {**row, i: v}
+                    if not allowed({parameters[k].name: parameters[k].values[x] for k, x in trial.items()}):
+                        continue
+                    scored.append((newly_covered(trial), parameters[i].weights[v], rng.random(), v))
+                if not scored:
+                    row = None
+                    break
+                row[i] = max(scored)[3]
+            if row is None:
+                continue
+            gain = newly_covered(row)
+            if gain > best_gain:
+                best_row, best_gain = row, gain
+
+        if best_row is None:
+            # Remaining tuples cannot be completed into a valid row
+            break
+        rows.append(best_row)
+        uncovered -= {
+            tuple((i, best_row[i]) for i in group)
+            for group in combinations(sorted(best_row), strength)
+        }
+
+    return [
+        Scenario({p.name: p.values[row[i]] for i, p in enumerate(parameters)}, index)
+        for index, row in enumerate(rows, start=1)
+    ]
+
+
+# ==================== REGISTRATION FLOW SCENARIOS ====================
+
+# Issue cards with locators in IssuesPage
+ISSUE_CARDS = ["Allergy", "Anxiety", "Skin", "Digestive", "Ears", "Eyes", "Behavioral", "Preventive care"]
+
+# WA shows NeedInfoComponent; the other states share one branch, so a few
+# representatives (weighted towards the largest markets) stand in for all 50
+DEFAULT_STATES = [USState.WA, USState.CA, USState.TX, USState.NY, USState.FL]
+DEFAULT_STATE_WEIGHTS = [3.0, 2.0, 1.5, 1.5, 1.0]
+
+
+def registration_parameters(states: Sequence[USState] = DEFAULT_STATES,
+                            state_weights: Optional[Sequence[float]] = DEFAULT_STATE_WEIGHTS,
+                            issues: Sequence[str] = ISSUE_CARDS) -> List[Parameter]:
+    """
+    Parameters the registration flow branches on.
+
+    Args:
+        states: States to cover
+        state_weights: Weights for states (None = equal)
+        issues: Issue cards, each modelled as a selected/not selected parameter
+
+    Returns:
+        List of Parameter
+    """
+    if state_weights is not None and len(state_weights) != len(states):
+        state_weights = None
+    parameters = [
+        Parameter("pet_type", list(PetType)),
+        Parameter("state", list(states), state_weights),
+    ]
+    parameters += [Parameter(f"issue:{issue}", [True, False], [1.0, 1.0]) for issue in issues]
+    return parameters
+
+
+def registration_scenarios(strength: int = 2, seed: int = 0,
+                           constraints: Sequence[Constraint] = (), **parameter_options) -> List[Scenario]:
+    """
+    Covering array for the registration flow.
+
+    At least one issue is always selected (the issues form cannot continue otherwise).
+
+    Args:
+        strength: Interaction strength (2 = pairwise)
+        seed: Random seed
+        constraints: Extra constraints
+        **parameter_options: Passed to registration_parameters
+
+    Returns:
+        List of Scenario
+    """
+    parameters = registration_parameters(**parameter_options)
+    issue_names = [p.name for p in parameters if p.name.startswith("issue:")]
+    return covering_array(parameters, strength, [at_least_one(issue_names), *constraints], seed)
+
+
+def apply_scenario(test_data: dict, scenario: Scenario) -> dict:
+    """
+    Create test data for a scenario (the original dictionary is not modified).
+
+    Args:
+        test_data: Base test data (config/test_data.json)
+        scenario: Scenario from registration_scenarios
+
+    Returns:
+        New test data dictionary
+    """
+    data = copy.deepcopy(test_data)
+    pet_names = list(PetName)
+    data['pet_info']['pet_type'] = scenario['pet_type'].value
+    data['pet_info']['state'] = scenario['state'].name
+    data['pet_info']['pet_name'] = pet_names[scenario.index % len(pet_names)].name
+    data['issues'] = [name.split(":", 1)[1] for name, value in scenario.values.items()
+                      if name.startswith("issue:") and value]
+    return data
+
+
+def scenario_params(scenarios: List[Scenario]) -> list:
+    """
+    Wrap scenarios as pytest parameters with readable ids.
+
+    Args:
+        scenarios: Generated scenarios
+
+    Returns:
+        List of pytest.param
+    """
+    import pytest
+    return [pytest.param(scenario, id=scenario.id) for scenario in scenarios]
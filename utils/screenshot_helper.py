@@ -7,13 +7,16 @@ Author: Claude AI
 Date: 2025-10-19
 """
 
+from __future__ import annotations
+
 import os
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.remote.webelement import WebElement
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 import logging
-from PIL import Image, ImageDraw
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.remote.webelement import WebElement
 
 
 class ScreenshotHelper:
@@ -30,10 +33,10 @@ class ScreenshotHelper:
         self.driver = driver
         self.screenshots_dir = screenshots_dir
         self.logger = logging.getLogger(__name__)
+        self.captured: List[str] = []  # Artifacts saved by this helper (used for the HTML report)
 
         # Create screenshots directory if it doesn't exist
-        if not os.path.exists(self.screenshots_dir):
-            os.makedirs(self.screenshots_dir)
+        os.makedirs(self.screenshots_dir, exist_ok=True)
 
     def capture(self, name: str, subfolder: Optional[str] = None, element: Optional[WebElement] = None) -> str:
         """
@@ -47,14 +50,13 @@ class ScreenshotHelper:
         Returns:
             Full path to saved screenshot
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         filename = f"{name}_{timestamp}.png"
 
         # Determine save path
         if subfolder:
             save_dir = os.path.join(self.screenshots_dir, subfolder)
-            if not os.path.exists(save_dir):
-                os.makedirs(save_dir)
+            os.makedirs(save_dir, exist_ok=True)
             filepath = os.path.join(save_dir, filename)
         else:
             filepath = os.path.join(self.screenshots_dir, filename)
@@ -67,6 +69,7 @@ class ScreenshotHelper:
             if element:
                 self._add_element_highlight(filepath, element)
 
+            self.captured.append(filepath)
             self.logger.info(f"Screenshot saved: {filepath}")
             return filepath
         except Exception as e:
@@ -92,7 +95,8 @@ class ScreenshotHelper:
             right = left + size['width']
             bottom = top + size['height']
 
-            # Open image with PIL
+            # Open image with PIL (imported here: only highlighted screenshots need it)
+            from PIL import Image, ImageDraw
             img = Image.open(image_path)
             draw = ImageDraw.Draw(img)
 
@@ -138,13 +142,12 @@ class ScreenshotHelper:
         Returns:
             Full path to saved HTML file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         filename = f"FAILED_{test_name}_{timestamp}.html"
 
         # Create failures subfolder if doesn't exist
         failures_dir = os.path.join(self.screenshots_dir, "failures")
-        if not os.path.exists(failures_dir):
-            os.makedirs(failures_dir)
+        os.makedirs(failures_dir, exist_ok=True)
 
         filepath = os.path.join(failures_dir, filename)
 
@@ -156,6 +159,7 @@ class ScreenshotHelper:
             with open(filepath, 'w', encoding='utf-8') as f:
                 f.write(page_source)
 
+            self.captured.append(filepath)
             self.logger.info(f"HTML source saved: {filepath}")
             return filepath
         except Exception as e:
@@ -173,12 +177,13 @@ class ScreenshotHelper:
         Returns:
             Full path to saved screenshot
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         filename = f"{name}_{timestamp}.png"
         filepath = os.path.join(self.screenshots_dir, filename)
 
         try:
             element.screenshot(filepath)
+            self.captured.append(filepath)
             self.logger.info(f"Element screenshot saved: {filepath}")
             return filepath
         except Exception as e:
@@ -0,0 +1,183 @@
+"""
+Settle Module
+
+This module waits for the page to stop moving instead of sleeping a fixed time
+after scrolls and animations.
+
+One async script samples, on every animation frame, the scroll position, the
+bounding rects of the elements of interest and the number of running finite
+CSS animations/transitions (e.g. the 'vfm-bounce-back' modal). The page is
+settled when the sample stays unchanged for SETTLE_FRAMES consecutive frames
+with no animation running - a frame or two when nothing moves. Infinite
+animations (spinners) are ignored, and SETTLE_TIMEOUT bounds the wait.
+
+It also contains a scanner for hard-coded sleeps left in page objects and flows.
+
+Usage:
+    python -m utils.settle                 # list hard-coded sleeps in pages/ and flows/, exit 1 if any
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import argparse
+import ast
+import glob
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# arguments: elements, stable frames, timeout (ms), callback
+_SETTLE_SCRIPT = """
+const elements = arguments[0], stableFrames = arguments[1], timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const start = performance.now();
+const running = () => (document.getAnimations ? document.getAnimations() : []).filter((a) => {
+  if (a.playState !== 'running' || !a.effect) return false;
+  return a.effect.getComputedTiming().endTime !== Infinity;
+}).length;
+const sample = () => JSON.stringify([window.scrollX, window.scrollY, elements.map((el) => {
+  const r = el.getBoundingClientRect();
+  return [r.x, r.y, r.width, r.height];
+})]);
+// requestAnimationFrame does not fire in background tabs: fall back to a timer
+const nextFrame = (callback) => {
+  let called = false;
+  const once = () => { if (!called) { called = true; callback(); } };
+  requestAnimationFrame(once);
+  setTimeout(once, 50);
+};
+let previous = null, stable = 0, frames = 0;
+const tick = () => {
+  frames += 1;
+  const current = sample(), animations = running();
+  stable = current === previous && animations === 0 ? stable + 1 : (animations === 0 ? 1 : 0);
+  previous = current;
+  const elapsed = performance.now() - start;
+  if (stable >= stableFrames) return done({settled: true, frames: frames, ms: elapsed, animations: 0});
+  if (elapsed >= timeoutMs) return done({settled: false, frames: frames, ms: elapsed, animations: animations});
+  nextFrame(tick);
+};
+nextFrame(tick);
+"""
+
+# Calls reported by the sleep scanner
+SLEEP_CALLS = {("time", "sleep"), ("asyncio", "sleep")}
+
+
+@dataclass
+class SettleResult:
+    """Outcome of one settle wait."""
+
+    settled: bool
+    frames: int
+    ms: float
+    animations: int = 0
+
+
+def wait_until_settled(driver, elements: Sequence = (), stable_frames: int = 2,
+                       timeout: float = 2.0) -> SettleResult:
+    """
+    Wait until scroll position, element rects and CSS animations stop changing.
+
+    Never raises: a page that does not settle within the timeout (or a driver
+    without async script support) is logged and the caller continues.
+
+    Args:
+        driver: Selenium WebDriver instance
+        elements: WebElements whose bounding rects must be stable
+        stable_frames: Consecutive unchanged frames required
+        timeout: Maximum wait in seconds
+
+    Returns:
+        SettleResult
+    """
+    start = time.perf_counter()
+    try:
+        result = driver.execute_async_script(_SETTLE_SCRIPT, list(elements), stable_frames, timeout * 1000)
+    except WebDriverException as e:
+        logger.debug(f"Settle check unavailable: {e.msg}")
+        return SettleResult(False, 0, (time.perf_counter() - start) * 1000)
+    settle = SettleResult(bool(result["settled"]), int(result["frames"]), float(result["ms"]),
+                          int(result.get("animations", 0)))
+    if not settle.settled:
+        logger.debug(f"Page still moving after {settle.ms:.0f} ms ({settle.animations} animations running)")
+    return settle
+
+
+# ==================== SLEEP SCANNER ====================
+
+@dataclass
+class SleepCall:
+    """A hard-coded sleep found in the source."""
+
+    path: str
+    line: int
+    call: str
+    seconds: str
+
+
+def _call_name(func) -> str:
+    if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+        return f"{func.value.id}.{func.attr}"
+    if isinstance(func, ast.Name):
+        return func.id
+    return ""
+
+
+def scan_sleeps(root: str = ".", packages=("pages", "flows")) -> List[SleepCall]:
+    """
+    Find sleep calls in page objects and flows.
+
+    Reports `time.sleep(<literal>)`, `asyncio.sleep(<literal>)` and bare
+    `sleep(<literal>)` imported from either module. Sleeps by a named interval
+    (e.g. a polling loop's POLL_INTERVAL) are not hard-coded and are skipped.
+
+    Args:
+        root: Repository root
+        packages: Folders to scan (recursively)
+
+    Returns:
+        Sleep calls in source order
+    """
+    calls = []
+    for package in packages:
+        for path in sorted(glob.glob(os.path.join(root, package, "**", "*.py"), recursive=True)):
+            with open(path, "r", encoding="utf-8") as f:
+                tree = ast.parse(f.read(), path)
+            relative = os.path.relpath(path, root).replace(os.sep, "/")
+            imported = {alias.asname or alias.name for node in ast.walk(tree) if isinstance(node, ast.ImportFrom)
+                        and node.module in {module for module, _ in SLEEP_CALLS} for alias in node.names
+                        if alias.name == "sleep"}
+            for node in ast.walk(tree):
+                if not isinstance(node, ast.Call):
+                    continue
+                name = _call_name(node.func)
+                hard_coded = bool(node.args) and isinstance(node.args[0], ast.Constant)
+                if hard_coded and (tuple(name.split(".")) in SLEEP_CALLS or name in imported):
+                    calls.append(SleepCall(relative, node.lineno, name, ast.unparse(node.args[0])))
+    return sorted(calls, key=lambda c: (c.path, c.line))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Report hard-coded sleeps in page objects and flows")
+    parser.add_argument("packages", nargs="*", default=["pages", "flows"], help="Folders to scan")
+    args = parser.parse_args(argv)
+
+    calls = scan_sleeps(packages=args.packages)
+    for call in calls:
+        print(f"{call.path}:{call.line}: {call.call}({call.seconds})")
+    print(f"{len(calls)} hard-coded sleeps in {', '.join(args.packages)}")
+    return 1 if calls else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Timing Module
+
+This module records wall-clock timings for flow steps and page object methods
+and summarizes them as median/p95 statistics.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import functools
+import statistics
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List
+
+from pages.base_page import BasePage
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Compute a percentile using linear interpolation between closest ranks.
+
+    Args:
+        values: Sample values (any order)
+        pct: Percentile in range 0-100
+
+    Returns:
+        Percentile value (0.0 for an empty sample)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """
+    Summarize a timing sample.
+
+    Args:
+        values: Durations in seconds
+
+    Returns:
+        Dictionary with count, median, p95, min and max
+    """
+    return {
+        "count": len(values),
+        "median": statistics.median(values) if values else 0.0,
+        "p95": percentile(values, 95),
+        "min": min(values) if values else 0.0,
+        "max": max(values) if values else 0.0,
+    }
+
+
+class TimingRecorder:
+    """
+    Collect duration samples keyed by name.
+
+    Keys follow a 'kind:name' convention:
+    - 'step:<step name>' for flow steps
+    - 'page:<PageClass>.<method>' for page object methods
+    - 'flow:<flow name>' for complete flow runs
+    """
+
+    def __init__(self):
+        """Initialize an empty recorder."""
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+
+    def record(self, key: str, seconds: float) -> None:
+        """
+        Record one duration sample.
+
+        Args:
+            key: Sample key
+            seconds: Duration in seconds
+        """
+        self.samples[key].append(seconds)
+
+    @contextmanager
+    def measure(self, key: str):
+        """
+        Context manager timing the enclosed block under the given key.
+
+        Args:
+            key: Sample key
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(key, time.perf_counter() - start)
+
+    def step(self, name: str):
+        """
+        Context manager timing a flow step.
+
+        Args:
+            name: Step name
+        """
+        return self.measure(f"step:{name}")
+
+    def instrument(self, page_object) -> None:
+        """
+        Time every public method call on a page object instance.
+
+        Wrappers are installed on the instance only, so other instances of the
+        same class are unaffected. Nested calls (e.g. fill_pet_info_form calling
+        click_element) are each recorded with inclusive time.
+
+        Args:
+            page_object: BasePage instance to instrument
+        """
+        class_name = type(page_object).__name__
+        for name in dir(type(page_object)):
+            if name.startswith("_"):
+                continue
+            attr = getattr(page_object, name)
+            if not callable(attr):
+                continue
+            setattr(page_object, name, self._wrap(f"page:{class_name}.{name}", attr))
+
+        # Instrument composed components (e.g. OrderSummaryPage.payment)
+        for value in list(vars(page_object).values()):
+            if isinstance(value, BasePage) and value is not page_object:
+                self.instrument(value)
+
+    def _wrap(self, key: str, method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with self.measure(key):
+                return method(*args, **kwargs)
+        return wrapper
+
+    def merge(self, other: "TimingRecorder") -> None:
+        """
+        Merge another recorder's samples into this one.
+
+        Args:
+            other: Recorder to merge from
+        """
+        for key, values in other.samples.items():
+            self.samples[key].extend(values)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summarize all recorded keys.
+
+        Returns:
+            Mapping of key to summary statistics
+        """
+        return {key: summarize(values) for key, values in sorted(self.samples.items())}
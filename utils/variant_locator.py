@@ -0,0 +1,278 @@
+"""
+VariantLocator Module
+
+This module contains the VariantLocator type for elements the site serves in
+several A/B variants (pet name input ids, the home page CTA URL, the payment
+method accordion).
+
+A VariantLocator is an ordered list of named alternatives. BasePage resolves it
+with one injected script per poll that tries every alternative in order and
+returns the first match together with the variant that matched - a missing
+variant never costs a find_element timeout. Which variant was served is counted
+per run (see served_variants / drain_served_variants); the conftest adds the
+counts to results.json.
+
+A VariantLocator is also a regular (By.XPATH, "<union of all variants>") tuple,
+so code that unpacks it (driver.find_element(*locator), expected conditions,
+AsyncBasePage) still finds the element in one call, only without the priority
+order and the stats.
+
+Example:
+    pet_name_input = VariantLocator((By.ID, "pet-name"), (By.ID, "petName"))
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from selenium.webdriver.common.by import By
+
+from utils.frame_locator import FrameLocator
+from utils.lazy_import import lazy_module
+
+EC = lazy_module("selenium.webdriver.support.expected_conditions")
+
+# Tries each [strategy, value] in order; returns [element, index] of the first match in the wanted state
+_RESOLVE_SCRIPT = """
+const variants = arguments[0], state = arguments[1];
+const usable = (el) => {
+  if (state === 'present') return true;
+  const style = window.getComputedStyle(el);
+  const visible = el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+  return visible && (state !== 'clickable' || !el.disabled);
+};
+for (let i = 0; i < variants.length; i++) {
+  const [by, value] = variants[i];
+  const el = by === 'xpath'
+    ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+    : document.querySelector(value);
+  if (el && usable(el)) return [el, i];
+}
+return null;
+"""
+
+# Selenium expected condition per state (attribute names: EC is imported on first use)
+_EXPECTED_CONDITIONS = {
+    "present": "presence_of_element_located",
+    "visible": "visibility_of_element_located",
+    "clickable": "element_to_be_clickable",
+}
+
+_served: Counter = Counter()
+_served_lock = threading.Lock()
+
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def _css_literal(value: str) -> str:
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def to_query(by: str, value: str) -> Tuple[str, str]:
+    """
+    Express a locator as a CSS selector or XPath the injected script can evaluate.
+
+    Args:
+        by: Selenium By strategy
+        value: Locator value
+
+    Returns:
+        ('css selector' | 'xpath', expression)
+    """
+    if by in (By.CSS_SELECTOR, By.XPATH):
+        return by, value
+    if by == By.ID:
+        return By.CSS_SELECTOR, f"[id={_css_literal(value)}]"
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f"[name={_css_literal(value)}]"
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f"[class~={_css_literal(value)}]"
+    if by == By.TAG_NAME:
+        return By.CSS_SELECTOR, value
+    if by == By.LINK_TEXT:
+        return By.XPATH, f"//a[normalize-space(.)={_xpath_literal(value)}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return By.XPATH, f"//a[contains(., {_xpath_literal(value)})]"
+    raise ValueError(f"Unsupported locator strategy: {by}")
+
+
+def to_xpath(by: str, value: str) -> str:
+    """
+    Express a locator as XPath 1.0 (CSS is translated with cssselect).
+
+    Args:
+        by: Selenium By strategy
+        value: Locator value
+
+    Returns:
+        XPath expression
+    """
+    by, value = to_query(by, value)
+    if by == By.XPATH:
+        return value
+    from cssselect import GenericTranslator
+    return GenericTranslator().css_to_xpath(value, prefix="//")
+
+
+class VariantLocator(tuple):
+    """
+    Ordered A/B alternatives for one element, resolved in a single round trip.
+
+    Example:
+        locator = VariantLocator((By.ID, "pet-name"), (By.ID, "petName"), labels=("a", "b"))
+        element = locator.resolve(driver, "visible")   # None when no variant is there (yet)
+    """
+
+    def __new__(cls, *variants: Tuple[str, str], labels: Optional[Sequence[str]] = None):
+        """
+        Create a variant locator.
+
+        Args:
+            *variants: (By.TYPE, "value") alternatives, preferred first
+            labels: Optional variant names for stats (default 'a', 'b', ...)
+
+        Raises:
+            ValueError: If there are no variants or labels do not match them
+        """
+        if not variants:
+            raise ValueError("VariantLocator needs at least one variant")
+        labels = tuple(labels) if labels else tuple(chr(ord("a") + i) for i in range(len(variants)))
+        if len(labels) != len(variants):
+            raise ValueError(f"{len(labels)} labels for {len(variants)} variants")
+        union = " | ".join(f"({to_xpath(by, value)})" for by, value in variants)
+        self = super().__new__(cls, (By.XPATH, union))
+        self.variants = tuple(tuple(variant) for variant in variants)
+        self.labels = labels
+        self.queries = [list(to_query(by, value)) for by, value in self.variants]
+        self.name = None
+        return self
+
+    def __set_name__(self, owner, name):
+        # First owner wins: pages that reuse another page's locator keep its name in the stats
+        if self.name is None:
+            self.name = f"{owner.__name__}.{name}"
+
+    def __reduce__(self):
+        return _rebuild, (self.variants, self.labels, self.name)
+
+    def __repr__(self):
+        variants = ", ".join(f"{label}={variant!r}" for label, variant in zip(self.labels, self.variants))
+        return f"VariantLocator({self.name or 'unnamed'}: {variants})"
+
+    def resolve(self, driver, state: str = "present"):
+        """
+        Find the first variant in the wanted state with one injected script.
+
+        Args:
+            driver: Selenium WebDriver instance
+            state: 'present', 'visible' or 'clickable'
+
+        Returns:
+            WebElement, or None if no variant matches
+        """
+        result = resolve_first(driver, self.queries, state)
+        if result is None:
+            return None
+        element, index = result
+        with _served_lock:
+            _served[(self.name or repr(self.variants), self.labels[index])] += 1
+        return element
+
+
+def to_queries(locator: Tuple) -> List[List[str]]:
+    """
+    Queries of a locator for the injected script.
+
+    Args:
+        locator: Tuple of (By.TYPE, "value") or VariantLocator
+
+    Returns:
+        [[strategy, expression], ...] in priority order
+
+    Raises:
+        ValueError: For a FrameLocator (the script only searches the current document)
+    """
+    if isinstance(locator, FrameLocator):
+        raise ValueError(f"{locator!r} is inside a frame: resolve it with BasePage.in_frame")
+    if isinstance(locator, VariantLocator):
+        return [list(query) for query in locator.queries]
+    return [list(to_query(*locator))]
+
+
+def resolve_first(driver, queries: List[List[str]], state: str = "present") -> Optional[Tuple[object, int]]:
+    """
+    Run the injected script once: the first query with an element in the wanted state wins.
+
+    Args:
+        driver: Selenium WebDriver instance
+        queries: [[strategy, expression], ...] from to_queries
+        state: 'present', 'visible' or 'clickable'
+
+    Returns:
+        (WebElement, query index), or None if nothing matches
+    """
+    result = driver.execute_script(_RESOLVE_SCRIPT, queries, state)
+    if not result:
+        return None
+    element, index = result
+    return element, int(index)
+
+
+def _rebuild(variants, labels, name) -> VariantLocator:
+    locator = VariantLocator(*variants, labels=labels)
+    locator.name = name
+    return locator
+
+
+def located(locator: Tuple, state: str = "present"):
+    """
+    Expected condition for a locator in a state, for WebDriverWait.
+
+    VariantLocators poll with their injected script; plain tuples use the
+    matching Selenium expected condition.
+
+    Args:
+        locator: Tuple of (By.TYPE, "value") or VariantLocator
+        state: 'present', 'visible' or 'clickable'
+
+    Returns:
+        Callable(driver) returning the element or False
+    """
+    if isinstance(locator, VariantLocator):
+        return lambda driver: locator.resolve(driver, state) or False
+    return getattr(EC, _EXPECTED_CONDITIONS[state])(locator)
+
+
+def _group(items) -> Dict[str, Dict[str, int]]:
+    stats: Dict[str, Dict[str, int]] = {}
+    for (name, label), count in sorted(items):
+        stats.setdefault(name, {})[label] = count
+    return stats
+
+
+def served_variants() -> Dict[str, Dict[str, int]]:
+    """
+    Variants served in this process so far.
+
+    Returns:
+        Locator name -> {variant label: times resolved}
+    """
+    with _served_lock:
+        return _group(_served.items())
+
+
+def drain_served_variants() -> Dict[str, Dict[str, int]]:
+    """Return served_variants() and reset the counts (used per test report)."""
+    with _served_lock:
+        stats = _group(_served.items())
+        _served.clear()
+    return stats
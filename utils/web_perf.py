@@ -0,0 +1,246 @@
+"""
+WebPerf Module
+
+This module turns flow runs into web performance samples.
+
+After every flow step StepRunner asks the collector to sample the current
+document with one injected script: Navigation Timing (TTFB, DOMContentLoaded,
+load), Resource Timing totals, first contentful paint, LCP, CLS and long tasks.
+LCP, CLS and long tasks are read from buffered PerformanceObservers, so entries
+from before the sample are included. A document sampled again (a step that does
+not navigate) keeps its latest reading.
+
+Each sample is labelled 'cold' or 'warm' cache: warm when at least half of the
+same-origin (or Timing-Allow-Origin) resources came from the HTTP cache.
+Samples are appended per worker to web_perf_<worker>.jsonl in the run folder
+(a time series of the run) and summarized per page and cache state as
+p50/p75/p95 in web_perf_summary.json (see plugins/web_perf.py).
+
+Budgets (WEB_PERF_BUDGETS, JSON) map a URL path - or '*' for every page - to
+metric limits, e.g. {"*": {"lcp_ms": 4000, "cls": 0.25}, "/": {"ttfb_ms": 800}}.
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import glob
+import json
+import os
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger import setup_logger
+from utils.run_context import get_worker_id
+from utils.timing import percentile
+
+logger = setup_logger(__name__)
+
+# Metrics summarized and budgeted (lower is better for all of them)
+METRICS = ("ttfb_ms", "fcp_ms", "dcl_ms", "load_ms", "lcp_ms", "cls", "tbt_ms", "long_tasks",
+           "resources", "transfer_kb")
+
+_COLLECT_SCRIPT = """
+const buffered = (type) => {
+  try {
+    const observer = new PerformanceObserver(() => {});
+    observer.observe({type: type, buffered: true});
+    const entries = observer.takeRecords();
+    observer.disconnect();
+    return entries;
+  } catch (e) {
+    return [];
+  }
+};
+const nav = performance.getEntriesByType('navigation')[0] || null;
+const fcp = performance.getEntriesByType('paint').find((e) => e.name === 'first-contentful-paint');
+const lcp = buffered('largest-contentful-paint').pop();
+
+// CLS: largest session window (shifts < 1s apart, window <= 5s), ignoring shifts after input
+let cls = 0, current = 0, first = 0, last = 0;
+for (const shift of buffered('layout-shift')) {
+  if (shift.hadRecentInput) continue;
+  if (current && shift.startTime - last < 1000 && shift.startTime - first < 5000) {
+    current += shift.value;
+  } else {
+    current = shift.value;
+    first = shift.startTime;
+  }
+  last = shift.startTime;
+  cls = Math.max(cls, current);
+}
+
+const longTasks = buffered('longtask');
+const resources = performance.getEntriesByType('resource');
+const measurable = resources.filter((r) => r.transferSize > 0 || r.encodedBodySize > 0);
+const cached = measurable.filter((r) => r.transferSize === 0).length;
+const positive = (value) => (value && value > 0 ? value : null);
+return {
+  url: location.href,
+  origin: performance.timeOrigin,
+  ttfb_ms: nav ? positive(nav.responseStart) : null,
+  fcp_ms: fcp ? fcp.startTime : null,
+  dcl_ms: nav ? positive(nav.domContentLoadedEventEnd) : null,
+  load_ms: nav ? positive(nav.loadEventEnd) : null,
+  lcp_ms: lcp ? lcp.startTime : null,
+  cls: cls,
+  long_tasks: longTasks.length,
+  tbt_ms: longTasks.reduce((total, task) => total + Math.max(0, task.duration - 50), 0),
+  resources: resources.length,
+  transfer_kb: (resources.reduce((total, r) => total + (r.transferSize || 0), 0)
+                + (nav ? nav.transferSize || 0 : 0)) / 1024,
+  cache_hits: cached,
+  cache_measurable: measurable.length,
+};
+"""
+
+
+def page_key(url: str) -> str:
+    """Page a sample belongs to: the URL path ('/' for the home page)."""
+    return urlsplit(url).path.rstrip("/") or "/"
+
+
+def cache_state(sample: dict) -> str:
+    """'warm' when at least half of the measurable resources were cache hits, else 'cold'."""
+    measurable = sample.get("cache_measurable") or 0
+    return "warm" if measurable and sample.get("cache_hits", 0) / measurable >= 0.5 else "cold"
+
+
+def load_budgets(path: Optional[str]) -> Dict[str, Dict[str, float]]:
+    """
+    Load per-page budgets.
+
+    Args:
+        path: Budget JSON file (missing file = no budgets)
+
+    Returns:
+        URL path (or '*') -> {metric: limit}
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def check_budget(sample: dict, budgets: Dict[str, Dict[str, float]]) -> List[str]:
+    """
+    Compare a sample with its page budget ('*' limits apply unless the page overrides them).
+
+    Args:
+        sample: Sample from WebPerfCollector
+        budgets: Budgets from load_budgets
+
+    Returns:
+        Violation messages (empty when within budget)
+    """
+    limits = {**budgets.get("*", {}), **budgets.get(sample["page"], {})}
+    return [
+        f"{sample['page']} ({sample['cache']}): {metric} {sample[metric]:.4g} > {limit:g}"
+        for metric, limit in limits.items()
+        if sample.get(metric) is not None and sample[metric] > limit
+    ]
+
+
+class WebPerfCollector:
+    """
+    Sample web performance metrics at flow step boundaries.
+
+    Example:
+        perf = WebPerfCollector("reports/test_run_x/web_perf_gw0.jsonl", budgets, test="tests/...::test_x")
+        perf.sample(driver, "pet_info")
+        perf.flush()
+    """
+
+    def __init__(self, path: str, budgets: Optional[Dict[str, Dict[str, float]]] = None,
+                 test: str = "", worker: Optional[str] = None):
+        """
+        Initialize the collector.
+
+        Args:
+            path: JSON lines file the samples are appended to
+            budgets: Budgets from load_budgets
+            test: Test node id stored with every sample
+            worker: xdist worker id stored with every sample (default: this process's)
+        """
+        self.path = path
+        self.budgets = budgets or {}
+        self.test = test
+        self.worker = worker or get_worker_id()
+        self.samples: List[dict] = []
+
+    def sample(self, driver, step: str) -> Optional[dict]:
+        """
+        Sample the current document (never raises).
+
+        Args:
+            driver: Selenium WebDriver instance
+            step: Flow step that just finished
+
+        Returns:
+            The sample, or None if the page could not be measured
+        """
+        try:
+            metrics = driver.execute_script(_COLLECT_SCRIPT)
+        except WebDriverException as e:
+            logger.debug(f"Web performance sample after '{step}' failed: {e.msg}")
+            return None
+        sample = {"ts": time.time(), "test": self.test, "worker": self.worker, "step": step,
+                  "page": page_key(metrics["url"]), **metrics}
+        sample["cache"] = cache_state(sample)
+        if self.samples and self.samples[-1]["origin"] == sample["origin"]:
+            sample["step"] = self.samples[-1]["step"]  # Same document: keep the step that reached it
+            self.samples[-1] = sample
+        else:
+            self.samples.append(sample)
+        return sample
+
+    def violations(self) -> List[str]:
+        """Budget violations of the samples taken so far."""
+        return [message for sample in self.samples for message in check_budget(sample, self.budgets)]
+
+    def flush(self) -> None:
+        """Append the samples to the JSON lines file."""
+        if not self.samples:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a") as f:
+            for sample in self.samples:
+                f.write(json.dumps(sample) + "\n")
+        self.samples = []
+
+
+def load_samples(run_dir: str) -> List[dict]:
+    """Samples of a run folder (all workers), oldest first."""
+    samples = []
+    for path in sorted(glob.glob(os.path.join(run_dir, "web_perf_*.jsonl"))):
+        with open(path, "r") as f:
+            samples.extend(json.loads(line) for line in f if line.strip())
+    return sorted(samples, key=lambda s: s["ts"])
+
+
+def summarize_samples(samples: List[dict]) -> Dict[str, Dict[str, dict]]:
+    """
+    Per-page percentiles.
+
+    Args:
+        samples: Samples (e.g. from load_samples)
+
+    Returns:
+        Page -> cache state -> {'count': n, metric: {'p50', 'p75', 'p95'}}
+    """
+    groups: Dict[str, Dict[str, List[dict]]] = {}
+    for sample in samples:
+        groups.setdefault(sample["page"], {}).setdefault(sample["cache"], []).append(sample)
+
+    summary: Dict[str, Dict[str, dict]] = {}
+    for page, states in sorted(groups.items()):
+        for state, group in sorted(states.items()):
+            entry = {"count": len(group)}
+            for metric in METRICS:
+                values = [s[metric] for s in group if s.get(metric) is not None]
+                if values:
+                    entry[metric] = {f"p{pct}": round(percentile(values, pct), 4) for pct in (50, 75, 95)}
+            summary.setdefault(page, {})[state] = entry
+    return summary
@@ -0,0 +1,295 @@
+"""
+WorkerSizing Module
+
+This module picks the number of xdist workers from what the host can run
+instead of a fixed PARALLEL_WORKERS.
+
+- Host capacity: usable CPUs (CPU affinity, cgroup CPU quota) and memory
+  (MemAvailable, cgroup memory limit minus its current usage), read from /proc
+  and /sys/fs/cgroup (v2, or v1 as a fallback).
+- Session footprint of the configured browser: peak RSS (p95) and CPU cores
+  per session from the newest resources_summary.json of the same browser
+  (RESOURCE_MONITOR=on, see plugins/resources.py). Without history,
+  conservative defaults are used, or one calibration session is measured
+  when WORKER_CALIBRATION=on (it costs a browser start before every run
+  until a monitored run leaves history).
+
+Workers = min(CPUs / cores per session, (free memory - WORKER_MEMORY_RESERVE_MB)
+/ memory per worker, WORKER_MAX), at least 1. memory_pressure() is checked
+during the run by the LPT scheduler (plugins/lpt_scheduler.py), which pauses
+workers while memory in use exceeds WORKER_PRESSURE_THRESHOLD.
+
+Usage:
+    python -m utils.worker_sizing          # print capacity, footprint and the chosen worker count
+
+Author: Claude AI
+Date: 2026-10-19
+"""
+
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+CGROUP = "/sys/fs/cgroup"
+
+# Memory of the pytest worker process itself, on top of its browser session
+WORKER_OVERHEAD_MB = 150
+
+# Footprint assumed without history or calibration (MB peak RSS, CPU cores while a flow runs)
+DEFAULT_FOOTPRINTS = {"chrome": (800.0, 1.0), "edge": (800.0, 1.0), "firefox": (900.0, 1.0)}
+
+
+@dataclass
+class HostCapacity:
+    """What the host (or container) can give the workers."""
+
+    cpus: float
+    memory_mb: float     # Total usable memory (host, or cgroup limit)
+    available_mb: float  # Free for new sessions now
+    cgroup_limited: bool = False
+
+
+@dataclass
+class SessionFootprint:
+    """Resources of one browser session."""
+
+    rss_mb: float
+    cpu_cores: float
+    source: str  # 'history', 'calibration' or 'default'
+
+
+def _read(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def meminfo() -> Dict[str, float]:
+    """/proc/meminfo in MB (empty off Linux)."""
+    text = _read("/proc/meminfo") or ""
+    values = {}
+    for line in text.splitlines():
+        name, _, rest = line.partition(":")
+        parts = rest.split()
+        if parts:
+            values[name] = int(parts[0]) / 1024  # kB
+    return values
+
+
+def cgroup_cpu_limit(root: str = CGROUP) -> Optional[float]:
+    """CPU quota of this cgroup in cores (None = unlimited)."""
+    cpu_max = _read(os.path.join(root, "cpu.max"))  # v2: "<quota|max> <period>"
+    if cpu_max:
+        quota, _, period = cpu_max.partition(" ")
+        return None if quota == "max" else int(quota) / int(period or 100000)
+    quota = _read(os.path.join(root, "cpu", "cpu.cfs_quota_us"))  # v1
+    period = _read(os.path.join(root, "cpu", "cpu.cfs_period_us"))
+    if quota and period and int(quota) > 0:
+        return int(quota) / int(period)
+    return None
+
+
+def cgroup_memory(root: str = CGROUP) -> Optional[Tuple[float, float]]:
+    """
+    Memory limit and usage of this cgroup in MB.
+
+    Reclaimable page cache (inactive_file) does not count as usage.
+
+    Returns:
+        (limit, usage), or None when memory is not limited
+    """
+    limit = _read(os.path.join(root, "memory.max"))
+    if limit is not None:
+        usage, stat = _read(os.path.join(root, "memory.current")), _read(os.path.join(root, "memory.stat"))
+    else:  # v1
+        limit = _read(os.path.join(root, "memory", "memory.limit_in_bytes"))
+        usage = _read(os.path.join(root, "memory", "memory.usage_in_bytes"))
+        stat = _read(os.path.join(root, "memory", "memory.stat"))
+    # v1 reports "no limit" as a huge number
+    if not limit or limit == "max" or int(limit) >= 1 << 60:
+        return None
+    inactive = 0
+    for line in (stat or "").splitlines():
+        name, _, value = line.partition(" ")
+        if name in ("inactive_file", "total_inactive_file"):
+            inactive = int(value)
+    return int(limit) / 2 ** 20, max(0, int(usage or 0) - inactive) / 2 ** 20
+
+
+def host_capacity() -> HostCapacity:
+    """CPUs and memory available to this process, honouring cgroup limits."""
+    cpus = float(len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1)
+    quota = cgroup_cpu_limit()
+    info = meminfo()
+    total = info.get("MemTotal", 0.0)
+    available = info.get("MemAvailable", total)
+    limited = False
+    if quota:
+        cpus, limited = min(cpus, quota), True
+    memory = cgroup_memory()
+    if memory:
+        limit, usage = memory
+        total = min(total, limit) if total else limit
+        available = min(available, limit - usage)
+        limited = True
+    return HostCapacity(cpus=cpus, memory_mb=total, available_mb=max(0.0, available), cgroup_limited=limited)
+
+
+def memory_pressure() -> float:
+    """Share of usable memory in use (0-1), for the host or this cgroup, whichever is higher."""
+    info = meminfo()
+    pressure = 0.0
+    if info.get("MemTotal"):
+        pressure = 1 - info.get("MemAvailable", info["MemTotal"]) / info["MemTotal"]
+    memory = cgroup_memory()
+    if memory:
+        pressure = max(pressure, memory[1] / memory[0])
+    return pressure
+
+
+def footprint_from_history(reports_dir: str, browser: str) -> Optional[SessionFootprint]:
+    """
+    Footprint from the newest resources_summary.json of the browser.
+
+    Args:
+        reports_dir: Folder with test_run_* folders
+        browser: Browser name
+
+    Returns:
+        SessionFootprint (p95 peak RSS, median CPU cores), or None without history
+    """
+    paths = sorted(glob.glob(os.path.join(reports_dir, "test_run_*", "resources_summary.json")), reverse=True)
+    for path in paths:
+        with open(path, "r") as f:
+            summary = json.load(f)
+        if summary.get("browser") != browser or not summary.get("sessions"):
+            continue
+        cores = [t["cpu_s"] / t["elapsed_s"] for t in summary.get("tests", {}).values() if t.get("elapsed_s")]
+        return SessionFootprint(
+            rss_mb=summary["sessions"]["peak_rss_mb"]["p95"],
+            cpu_cores=statistics.median(cores) if cores else DEFAULT_FOOTPRINTS.get(browser, (0, 1.0))[1],
+            source="history",
+        )
+    return None
+
+
+def calibrate(config, seconds: float = 5.0) -> Optional[SessionFootprint]:
+    """
+    Measure one browser session loading the home page.
+
+    Args:
+        config: Config class (browser, headless, base URL, replay mode)
+        seconds: Time the session is sampled after the page load
+
+    Returns:
+        SessionFootprint, or None if the session could not be measured
+    """
+    from utils import resource_monitor
+    from utils.driver_manager import DriverManager
+
+    if not resource_monitor.available():
+        return None
+    stand_in_server = None
+    if config.USE_STAND_IN:
+        from stand_in.server import ensure_running
+        stand_in_server = ensure_running(config.STAND_IN_URL)
+    # Same proxy route as the tests, so a replay run measures a browser that never reaches the network
+    driver_manager = DriverManager(browser=config.BROWSER, headless=config.HEADLESS,
+                                   replay_mode=config.REPLAY_MODE, replay_archive=config.REPLAY_ARCHIVE,
+                                   page_load_strategy=config.PAGE_LOAD_STRATEGY)
+    try:
+        driver = driver_manager.get_driver()
+        root_pid = resource_monitor.driver_root_pid(driver)
+        if not root_pid:
+            return None
+        monitor = resource_monitor.ResourceMonitor(root_pid, interval=0.25).start()
+        try:
+            driver.get(config.BASE_URL)
+        except Exception as e:
+            logger.debug(f"Calibration page load failed: {e}")
+        time.sleep(seconds)
+        monitor.stop()
+        usage = monitor.report()
+        return SessionFootprint(usage["peak_rss_mb"], usage["cpu_s"] / max(usage["elapsed_s"], 0.01), "calibration")
+    except Exception as e:
+        logger.warning(f"Worker calibration failed: {e}")
+        return None
+    finally:
+        driver_manager.quit_driver()
+        if stand_in_server:
+            stand_in_server.shutdown()
+            stand_in_server.server_close()
+
+
+def session_footprint(config) -> SessionFootprint:
+    """Footprint of the configured browser: history, then calibration, then defaults."""
+    footprint = footprint_from_history(config.REPORT_PATH, config.BROWSER)
+    if footprint is None and config.WORKER_CALIBRATION == "on":
+        footprint = calibrate(config)
+    if footprint is None:
+        rss_mb, cores = DEFAULT_FOOTPRINTS.get(config.BROWSER, DEFAULT_FOOTPRINTS["chrome"])
+        footprint = SessionFootprint(rss_mb, cores, "default")
+    return footprint
+
+
+def choose_workers(capacity: HostCapacity, footprint: SessionFootprint, reserve_mb: float = 1024,
+                   max_workers: int = 16) -> Tuple[int, str]:
+    """
+    Workers that fit the host.
+
+    Args:
+        capacity: Host capacity
+        footprint: Session footprint
+        reserve_mb: Memory kept free for the OS and the controller
+        max_workers: Upper bound
+
+    Returns:
+        (workers, what limited the count: 'cpu', 'memory' or 'max')
+    """
+    by_cpu = int(capacity.cpus / max(footprint.cpu_cores, 0.1))
+    by_memory = int((capacity.available_mb - reserve_mb) / (footprint.rss_mb + WORKER_OVERHEAD_MB))
+    workers, limit = min((by_cpu, "cpu"), (by_memory, "memory"), (max_workers, "max"))
+    return max(1, workers), limit
+
+
+def auto_workers(config) -> int:
+    """
+    Worker count for PARALLEL_WORKERS=auto / -n auto.
+
+    Args:
+        config: Config class
+
+    Returns:
+        Number of workers (at least 1)
+    """
+    capacity = host_capacity()
+    footprint = session_footprint(config)
+    workers, limit = choose_workers(capacity, footprint, config.WORKER_MEMORY_RESERVE_MB, config.WORKER_MAX)
+    logger.info(
+        f"Auto-sized {workers} workers (limited by {limit}): {capacity.cpus:g} CPUs, "
+        f"{capacity.available_mb:.0f}/{capacity.memory_mb:.0f} MB free"
+        f"{' (cgroup)' if capacity.cgroup_limited else ''}; {config.BROWSER} session "
+        f"{footprint.rss_mb:.0f} MB, {footprint.cpu_cores:.2f} cores ({footprint.source})"
+    )
+    return workers
+
+
+def main() -> int:
+    from config.settings import Config
+    print(f"{auto_workers(Config)} workers")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())